@@ -0,0 +1,158 @@
+"""
+Database contention benchmark.
+
+Replays the database traffic of a busy research run against a throwaway
+database: worker threads emit run events (queries and search results) and
+update tasks while dashboard pollers read statistics and the event log.
+It runs once per configuration:
+
+    legacy  per-event writes from every thread, synchronous=FULL and
+            SQLite's default cache/mmap (the database layer before the
+            single writer and event batching)
+    tuned   the defaults: batched events, one writer thread, read-only
+            connection pool, synchronous=NORMAL, larger cache, mmap
+
+and reports write/read throughput, latency percentiles and lock errors.
+
+Usage:
+    python benchmarks/bench_db_contention.py [--workers 16] [--readers 4]
+        [--seconds 10] [--events-per-op 5] [--poll-ms 100] [--mode both]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config.settings import Config, set_config  # noqa: E402
+from src.config.types import ResearchTask, TaskStatus  # noqa: E402
+from src.infra._database import DatabaseManager  # noqa: E402
+
+MODES = {
+    "legacy": {
+        "event_batching": False,
+        "single_writer": False,
+        "synchronous": "FULL",
+        "cache_size": -2000,
+        "mmap_size": 0,
+    },
+    "tuned": {},
+}
+
+
+def _percentile(samples, pct):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_mode(mode: str, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        config = Config()
+        config.database.path = str(Path(tmp) / "bench.db")
+        for key, value in MODES[mode].items():
+            setattr(config.database, key, value)
+        set_config(config)
+        db = DatabaseManager()
+
+        session = db.create_session("contention benchmark")
+        tasks = db.add_tasks_bulk([
+            ResearchTask(topic=f"task {i}", description="benchmark", file_path=f"/tmp/{i}.md")
+            for i in range(args.workers)
+        ], session_id=session.id)
+
+        stop = threading.Event()
+        lock = threading.Lock()
+        write_ms, read_ms, errors = [], [], []
+
+        def _worker(task):
+            local, n = [], 0
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    for _ in range(args.events_per_op):
+                        db.add_run_event(
+                            session_id=session.id, task_id=task.id, event_type="result",
+                            query_group="bench", url=f"https://example.com/{task.id}/{n}",
+                            title="result", snippet="x" * 200, quality_score=0.5,
+                        )
+                    db.update_task(task.id, status=TaskStatus.IN_PROGRESS.value, word_count=n)
+                except Exception as e:
+                    with lock:
+                        errors.append(str(e))
+                local.append((time.perf_counter() - started) * 1000)
+                n += 1
+            with lock:
+                write_ms.extend(local)
+
+        def _reader():
+            local = []
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    db.get_statistics(session_id=session.id)
+                    db.get_run_events_paginated(session_id=session.id, limit=100)
+                except Exception as e:
+                    with lock:
+                        errors.append(str(e))
+                local.append((time.perf_counter() - started) * 1000)
+                stop.wait(args.poll_ms / 1000)
+            with lock:
+                read_ms.extend(local)
+
+        threads = [threading.Thread(target=_worker, args=(t,)) for t in tasks]
+        threads += [threading.Thread(target=_reader) for _ in range(args.readers)]
+        started = time.perf_counter()
+        for t in threads:
+            t.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        db.flush_run_events()
+        elapsed = time.perf_counter() - started
+        events = len(db.get_run_events(session.id))
+        db.close()
+
+    return {
+        "mode": mode,
+        "write_ops_per_s": len(write_ms) / elapsed,
+        "events_per_s": events / elapsed,
+        "write_p50_ms": statistics.median(write_ms) if write_ms else 0.0,
+        "write_p99_ms": _percentile(write_ms, 99),
+        "reads_per_s": len(read_ms) / elapsed,
+        "read_p50_ms": statistics.median(read_ms) if read_ms else 0.0,
+        "read_p99_ms": _percentile(read_ms, 99),
+        "errors": len(errors),
+        "locked_errors": sum(1 for e in errors if "locked" in e),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=16, help="writer threads (research tasks)")
+    parser.add_argument("--readers", type=int, default=4, help="polling reader threads (dashboards)")
+    parser.add_argument("--seconds", type=float, default=10.0, help="duration per mode")
+    parser.add_argument("--events-per-op", type=int, default=5, help="run events per task update")
+    parser.add_argument("--poll-ms", type=int, default=100, help="reader poll interval")
+    parser.add_argument("--mode", choices=["legacy", "tuned", "both"], default="both")
+    args = parser.parse_args()
+
+    modes = ["legacy", "tuned"] if args.mode == "both" else [args.mode]
+    results = [run_mode(mode, args) for mode in modes]
+
+    columns = list(results[0])
+    print("  ".join(f"{c:>15}" for c in columns))
+    for row in results:
+        print("  ".join(
+            f"{v:>15.1f}" if isinstance(v, float) else f"{v:>15}" for v in row.values()
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ book-length reports with citations on any topic.
 Usage:
     python3 -m src "Your research query here"
     python3 -m src --resume
+    python3 -m src research-worker --wait
     python3 -m src --help
 """
 
@@ -360,10 +360,93 @@ def model_smoke(
     print_success("All model probes passed.")
 
 
+@app.command("research-worker")
+def research_worker(
+    session_id: Optional[int] = typer.Option(
+        None,
+        "--session", "-s",
+        help="Session to work on (default: the current running session started with executor: workers)"
+    ),
+    concurrency: Optional[int] = typer.Option(
+        None,
+        "--concurrency", "-n",
+        help="Tasks to run at once (default: workers.concurrency)"
+    ),
+    wait_for_work: bool = typer.Option(
+        False,
+        "--wait",
+        help="Keep polling for new sessions/tasks instead of exiting when idle"
+    ),
+    config_file: str = typer.Option(
+        "config.yaml",
+        "--config", "-c",
+        help="Path to configuration file"
+    ),
+):
+    """
+    Run research tasks claimed from the shared database.
+
+    Start any number of workers (on this or other hosts sharing the
+    database) for sessions run with research.executor: workers.
+    """
+    from src.pipeline.worker import ResearchWorker
+
+    settings = get_env_settings()
+    if not _validate_api_keys(settings):
+        raise typer.Exit(1)
+    set_config(load_config(config_file))
+
+    worker = ResearchWorker(
+        session_id=session_id,
+        concurrency=concurrency,
+        exit_when_idle=not wait_for_work,
+    )
+    print_info(f"Research worker {worker.worker_id} starting...")
+    try:
+        completed = worker.run()
+    except KeyboardInterrupt:
+        worker.stop()
+        print_info("\nWorker interrupted. Unstarted tasks were returned to the queue.")
+        raise typer.Exit(0)
+    print_success(f"Worker finished: {completed} task(s) completed, {worker.failed} failed")
+
+
+@app.command("compact-db")
+def compact_db(
+    batch_size: int = typer.Option(500, "--batch-size", help="Rows converted per transaction"),
+):
+    """
+    Move inline page text and notes into the compressed blob store, drop
+    unreferenced blobs, rebuild the full-text index and shrink the database
+    file.
+    """
+    config = load_config()
+    db_path = Path(config.database.path)
+    if not db_path.exists():
+        print_info("No database found.")
+        return
+
+    db = get_database()
+    size_before = db_path.stat().st_size
+    moved = db.migrate_content_to_blobs(batch_size=batch_size)
+    pruned = db.prune_blobs()
+    db.rebuild_corpus_index()
+    db.vacuum()
+    size_after = db_path.stat().st_size
+
+    print_success(
+        f"Moved {moved['sources']} page texts and {moved['notes']} notes into blobs; "
+        f"pruned {pruned} unused blobs"
+    )
+    console.print(f"[cyan]Database size:[/cyan] {size_before / 1e6:.1f} MB -> {size_after / 1e6:.1f} MB")
+
+
 @app.command("mcp-serve")
 def mcp_serve():
     """Start the MCP server (stdio transport) for agent integration."""
     from src.adapters.mcp import mcp as mcp_server
+    from src.pipeline.service import get_service
+    get_service().start_dispatcher()  # admit runs left queued by a previous server
     mcp_server.run()
 
 
@@ -376,7 +459,10 @@ def serve(
     import uvicorn
     from src.adapters.web.app import create_app
 
+    from src.pipeline.service import get_service
+
     print_info(f"Starting web dashboard at http://{host}:{port}")
+    get_service().start_dispatcher()  # admit runs left queued by a previous server
     uvicorn.run(create_app(), host=host, port=port)
 
 
@@ -107,36 +107,69 @@ def research_status(run_id: Optional[int] = None) -> dict:
 def research_start(
     query: str,
     preset: Optional[str] = None,
+    user: Optional[str] = None,
+    priority: int = 0,
 ) -> dict:
-    """Start a new research session.
+    """Submit a new research run to the run queue.
+
+    Runs are admitted as run slots and API budget free up: highest priority
+    first, users served in turn. Submitting while other runs are active is
+    fine; the run waits in line instead of being rejected.
 
     Args:
         query: The research topic or question to investigate.
         preset: Optional preset name (quick, standard, deep, exhaustive)
                 that controls research depth and output length.
                 Call research_presets() to see available options.
+        user: Who is submitting, for fair sharing between users.
+        priority: Queue priority; higher runs are admitted first.
 
     Returns a dict with:
-        - status: "started" or "already_running"
-        - run_id: session ID (when started), for use with research_status()
+        - status: "started" or "queued"
+        - queue_id: queue entry id, for use with research_queue()
+        - position: 1-based place in line (when queued)
+        - eta_seconds: estimated wait before the run starts (when queued; null
+          when no run slot is configured)
+        - estimated: expected llm_calls, search_calls and cost (USD)
+        - run_id: session ID once the run has started (see research_queue())
     """
     if not query or not query.strip():
         return {"status": "error", "error": "Query is required"}
 
     service = get_service()
-    result = service.start_run(query.strip(), mode=preset, blocking=False)
+    result = service.start_run(
+        query.strip(), mode=preset, blocking=False, user=user, priority=priority,
+    )
+    return {
+        "status": result.get("status"),
+        "queue_id": result.get("run_id"),
+        "position": result.get("position"),
+        "eta_seconds": result.get("eta_seconds"),
+        "estimated": result.get("estimated"),
+        "run_id": result.get("session_id"),
+    }
 
-    if result.get("status") == "already_running":
-        return {"status": "already_running"}
 
-    # Return run_id so the caller can poll research_status()
-    from src.infra._database import get_database
+@mcp.tool()
+def research_queue(queue_id: Optional[str] = None) -> dict:
+    """Return the run queue, or one entry of it.
 
-    db = get_database()
-    session = db.get_current_session()
-    run_id = session.id if session else None
+    Args:
+        queue_id: Entry id returned by research_start(). If omitted,
+                  returns the whole queue.
 
-    return {"status": "started", "run_id": run_id}
+    Returns either the entry (status queued/running/finished/failed/
+    cancelled/interrupted, position and eta_seconds while queued, and
+    session_id once started — pass it as run_id to research_status()), or
+    the queue: slots, running entries and queued entries in admission order.
+    """
+    service = get_service()
+    if queue_id is None:
+        return service.get_queue()
+    entry = service.get_queue_entry(queue_id)
+    if entry is None:
+        return {"status": "not_found", "queue_id": queue_id}
+    return entry
 
 
 @mcp.tool()
@@ -228,7 +261,7 @@ def research_result(run_id: Optional[int] = None) -> dict:
     ]
 
     # Add sources
-    sources = db.get_sources_for_session(session_id)
+    sources = db.get_sources_for_session(session_id, include_content=False)
     source_list = [
         {
             "url": s.url,
@@ -255,6 +288,41 @@ def research_result(run_id: Optional[int] = None) -> dict:
     }
 
 
+@mcp.tool()
+def research_search(
+    query: str,
+    run_id: Optional[int] = None,
+    limit: int = 10,
+) -> dict:
+    """Search sources and report sections gathered by earlier runs.
+
+    Matches every word of the query against source titles, extracted notes
+    and page text, and against synthesized section content, without
+    running new web searches.
+
+    Args:
+        query: Words to search for.
+        run_id: Session ID to search within. If omitted, searches all runs.
+        limit: Maximum results (1-50, default 10).
+
+    Returns a dict with:
+        - query: the query searched
+        - results: best match first; each has kind ("source" or "section"),
+          id, title, url (sources), session_id (sections), a snippet with
+          matched words in [brackets], score (0-1 within its kind, higher is
+          better) and the raw bm25 value
+    """
+    if not query or not query.strip():
+        return {"status": "error", "error": "Query is required"}
+
+    from src.infra._database import get_database
+
+    results = get_database().search_corpus(
+        query, session_id=run_id, limit=max(1, min(limit, 50)),
+    )
+    return {"query": query, "results": results}
+
+
 # =========================================================================
 # MCP Resources — read-only data access
 # =========================================================================
@@ -318,7 +386,7 @@ def resource_run_sources(run_id: int) -> str:
     from src.infra._database import get_database
 
     db = get_database()
-    sources = db.get_sources_for_session(run_id)
+    sources = db.get_sources_for_session(run_id, include_content=False)
     return json.dumps([
         {
             "url": s.url,
@@ -23,19 +23,36 @@ def is_research_running() -> bool:
 
 def start_research_background(query: str, overrides: dict = None,
                               refined_brief: str = None,
-                              refinement_qa: str = None) -> bool:
+                              refinement_qa: str = None,
+                              user: str = None, priority: int = 0) -> dict:
     """
-    Launch a research run in a daemon thread.
-    Returns False if research is already running.
+    Submit a research run to the run queue.
+    Returns its queue entry: status "started" or "queued" (with position and ETA).
     """
-    result = get_service().start_run(
+    return get_service().start_run(
         query,
         overrides=overrides,
         refined_brief=refined_brief,
         refinement_qa=refinement_qa,
         blocking=False,
+        user=user,
+        priority=priority,
     )
-    return result.get("status") == "started"
+
+
+def get_run_queue() -> dict:
+    """Run slots, running runs, and queued runs with position and ETA."""
+    return get_service().get_queue()
+
+
+def get_queue_entry(run_id: str):
+    """One run's queue entry, or None if unknown."""
+    return get_service().get_queue_entry(run_id)
+
+
+def cancel_queued_run(run_id: str) -> dict:
+    """Withdraw a queued run, or cancel it if it is already running."""
+    return get_service().cancel_run(run_id=run_id)
 
 
 def get_current_phase() -> str:
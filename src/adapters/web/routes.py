@@ -67,6 +67,16 @@ def _is_running() -> bool:
     return _app().is_research_running()
 
 
+def _submitter(request: Request, fields) -> tuple:
+    """(user, priority) for a run submission, from the body or X-Research-User."""
+    user = (fields.get("user") or request.headers.get("x-research-user") or "").strip() or None
+    try:
+        priority = int(fields.get("priority") or 0)
+    except (TypeError, ValueError):
+        raise HTTPException(400, "priority must be an integer")
+    return user, priority
+
+
 def _resolve_session(session_param: Optional[int] = None) -> Optional[ResearchSession]:
     """Resolve session: explicit ID > running session > most recent."""
     db = _db()
@@ -362,10 +372,8 @@ async def sessions_page(request: Request):
     db = _db()
     all_sessions = db.get_all_sessions()
     # Enrich with task counts
-    session_rows = []
-    for s in all_sessions:
-        stats = db.get_statistics(session_id=s.id)
-        session_rows.append({"session": s, "stats": stats})
+    all_stats = db.get_statistics_by_session([s.id for s in all_sessions])
+    session_rows = [{"session": s, "stats": all_stats[s.id]} for s in all_sessions]
     return templates.TemplateResponse("sessions.html", {
         "request": request,
         "session_rows": session_rows,
@@ -379,12 +387,8 @@ async def dashboard(request: Request, session: Optional[int] = None):
     resolved = _resolve_session(session)
     sid = resolved.id if resolved else None
     all_sessions = db.get_all_sessions()
-    session_rows = []
-    for s in all_sessions:
-        session_rows.append({
-            "session": s,
-            "stats": db.get_statistics(session_id=s.id),
-        })
+    all_stats = db.get_statistics_by_session([s.id for s in all_sessions])
+    session_rows = [{"session": s, "stats": all_stats[s.id]} for s in all_sessions]
     stats = db.get_statistics(session_id=sid)
     running = _is_running()
 
@@ -434,16 +438,17 @@ async def sources_page(request: Request, session: Optional[int] = None):
     return RedirectResponse(url=f"/research{sq}", status_code=302)
 
 
-def _build_source_groups(db, sid, task_id=None, include_rejected=False):
+def _build_source_groups(db, sid, task_id=None, include_rejected=False, include_content=True):
     """Build grouped source list for research/sources pages.
 
     If task_id is given, return only sources for that task.
     If include_rejected is True, append quality-rejected search results.
+    If include_content is False, page text and extracted notes are not loaded.
     """
     if sid is not None:
-        source_list = db.get_sources_for_session(sid)
+        source_list = db.get_sources_for_session(sid, include_content=include_content)
     else:
-        source_list = db.get_all_sources()
+        source_list = db.get_all_sources(include_content=include_content)
 
     task_topics = {}
     if sid:
@@ -523,7 +528,7 @@ async def research_page(request: Request, session: Optional[int] = None):
     task_list = db.get_all_tasks(session_id=sid)
 
     # Build source count per task (accepted only for the count)
-    source_groups_accepted, _ = _build_source_groups(db, sid)
+    source_groups_accepted, _ = _build_source_groups(db, sid, include_content=False)
     task_source_counts = {}
     for g in source_groups_accepted:
         if g["task_id"] is not None:
@@ -568,7 +573,7 @@ def _build_report_sections(session_id: int = None):
 
         sections = []
         for sec in sorted(synthesized, key=lambda s: s.position):
-            section_sources = db.get_sources_for_section(sec.id)
+            section_sources = db.get_sources_for_section(sec.id, include_content=False)
 
             local_to_global = {}
             for local_idx, source in enumerate(section_sources, 1):
@@ -620,7 +625,7 @@ def _build_report_sections(session_id: int = None):
 
     sections = []
     for section in raw_sections:
-        task_sources = db.get_sources_for_task(section["id"])
+        task_sources = db.get_sources_for_task(section["id"], include_content=False)
 
         local_to_global = {}
         for local_idx, source in enumerate(task_sources, 1):
@@ -792,6 +797,13 @@ async def api_sources(session: Optional[int] = None):
     return [s.model_dump() for s in db.get_all_sources()]
 
 
+@router.get("/api/search")
+async def api_search(q: str = "", session: Optional[int] = None, limit: int = 20):
+    """Full-text search over gathered sources and synthesized sections."""
+    db = _db()
+    return db.search_corpus(q, session_id=session, limit=max(1, min(limit, 100)))
+
+
 @router.get("/api/glossary")
 async def api_glossary():
     db = _db()
@@ -827,9 +839,11 @@ async def api_research_start(request: Request):
             if "." in key:
                 # Take last value for each key (hidden-field checkbox trick)
                 raw_fields[key] = form.getlist(key)[-1]
+        raw_fields.update({k: form.get(k) for k in ("user", "priority") if form.get(k)})
 
     if not query:
         raise HTTPException(400, "Query is required")
+    user, priority = _submitter(request, raw_fields)
 
     # Build overrides: start from preset, layer individual fields on top
     overrides = {}
@@ -841,11 +855,36 @@ async def api_research_start(request: Request):
         if "." in key and key.split(".")[0] in ("research", "search"):
             overrides[key] = value
 
-    started = _app().start_research_background(query, overrides=overrides or None)
-    if not started:
-        raise HTTPException(409, "Research is already running")
+    entry = _app().start_research_background(
+        query, overrides=overrides or None, user=user, priority=priority,
+    )
+    return {
+        "status": entry["status"],
+        "query": query,
+        "run_id": entry["run_id"],
+        "position": entry.get("position"),
+        "eta_seconds": entry.get("eta_seconds"),
+    }
+
+
+@router.get("/api/research/queue")
+async def api_research_queue():
+    """Run slots, running runs, and queued runs with position and ETA."""
+    return _app().get_run_queue()
 
-    return {"status": "started", "query": query}
+
+@router.get("/api/research/queue/{run_id}")
+async def api_research_queue_entry(run_id: str):
+    entry = _app().get_queue_entry(run_id)
+    if entry is None:
+        raise HTTPException(404, "Run not found")
+    return entry
+
+
+@router.delete("/api/research/queue/{run_id}")
+async def api_research_queue_cancel(run_id: str):
+    """Withdraw a queued run, or cancel it if it is already running."""
+    return _app().cancel_queued_run(run_id)
 
 
 @router.post("/api/research/stop")
@@ -1020,19 +1059,19 @@ async def api_research_start_refined(request: Request):
     # Build refinement_qa JSON string
     refinement_qa = json.dumps(data.get("answers") or [])
 
-    started = _app().start_research_background(
+    user, priority = _submitter(request, form)
+    _app().start_research_background(
         query,
         overrides=overrides,
         refined_brief=brief,
         refinement_qa=refinement_qa,
+        user=user,
+        priority=priority,
     )
 
     # Clean up token
     _refine_tokens.pop(token, None)
 
-    if not started:
-        raise HTTPException(409, "Research is already running")
-
     return RedirectResponse(url="/dashboard", status_code=303)
 
 
@@ -1126,7 +1165,7 @@ async def fragment_research_tasks(request: Request, session: Optional[int] = Non
     task_list = db.get_all_tasks(session_id=sid)
 
     # Source count per task
-    source_groups, _ = _build_source_groups(db, sid)
+    source_groups, _ = _build_source_groups(db, sid, include_content=False)
     task_source_counts = {}
     for g in source_groups:
         if g["task_id"] is not None:
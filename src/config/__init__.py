@@ -22,6 +22,7 @@ from .settings import (  # noqa: F401
     get_config,
     get_env_settings,
     set_config,
+    config_scope,
     apply_overrides,
 )
 from .presets import RESEARCH_PRESETS  # noqa: F401
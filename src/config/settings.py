@@ -1,10 +1,12 @@
 """
 Configuration classes, singletons, and loaders for Deep Research Agent.
 """
+import contextvars
 import copy
 import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterator, Optional, List
 
 import yaml
 from pydantic import BaseModel, Field
@@ -55,6 +57,7 @@ class LLMConfig(BaseModel):
     models: LLMModelsConfig = Field(default_factory=LLMModelsConfig)
     max_tokens: LLMMaxTokensConfig = Field(default_factory=LLMMaxTokensConfig)
     temperature: LLMTemperatureConfig = Field(default_factory=LLMTemperatureConfig)
+    request_timeout: float = 600.0  # seconds; bounds a hung or abandoned call
 
 
 class SearchConfig(BaseModel):
@@ -66,6 +69,9 @@ class SearchConfig(BaseModel):
     gap_fill_queries: int = 2
     gap_fill_max_results: int = 3
     min_tavily_score: float = 0.1
+    max_sources_per_task: int = 0  # 0 = queries_per_task * results_per_query
+    min_sources_per_query: int = 1  # coverage floor when fusing query results
+    rrf_k: int = 60  # reciprocal rank fusion constant
     include_domains: List[str] = Field(default_factory=list)
     exclude_domains: List[str] = Field(default_factory=lambda: [
         "pinterest.com", "quora.com",
@@ -78,12 +84,15 @@ class ScrapingConfig(BaseModel):
     max_content_length: int = 15000
     timeout: int = 15
     rotate_user_agents: bool = True
+    source_freshness_hours: float = 24  # reuse stored pages fetched within this window (0 = always fetch)
 
 
 class GapAnalysisConfig(BaseModel):
     enabled: bool = True
     max_new_sections: int = 3
     max_gap_fill_tasks: int = 10
+    section_checks: bool = True  # review each section's notes for gaps before it is synthesized
+    max_tasks_per_section: int = 2  # follow-up tasks one section check may add
 
 
 class SynthesisConfig(BaseModel):
@@ -104,6 +113,10 @@ class ResearchConfig(BaseModel):
     max_runtime_hours: int = 24
     max_loops: int = -1  # -1 = infinite, 0 = do nothing
     max_concurrent_tasks: int = 3  # number of research tasks to run in parallel
+    pipelined_synthesis: bool = True  # synthesize each section as soon as its own tasks finish
+    executor: str = "local"  # local | workers (tasks run by separate research-worker processes)
+    checkpoint_steps: bool = True  # retries/resumes continue a task from its first incomplete step
+    scheduling_policy: str = "priority"  # priority | shortest_job_first | section_completion | round_robin
 
 
 class OutputConfig(BaseModel):
@@ -118,6 +131,48 @@ class OutputConfig(BaseModel):
 
 class QualityConfig(BaseModel):
     min_source_quality: float = 0.55
+    domain_lists_file: Optional[str] = None  # YAML with extra academic/high-quality/blocked entries
+    domain_lists_reload_seconds: int = 30  # how often to check the file for changes
+
+
+class ExtractionConfig(BaseModel):
+    cache_enabled: bool = True  # reuse per-source extractions across tasks/sessions
+    near_topic_reuse: bool = False  # also reuse extractions made for similar topics
+    near_topic_min_similarity: float = 0.8  # Jaccard similarity of topic terms
+    batch_enabled: bool = False  # pack several sources into one extraction call
+    batch_max_tokens: int = 8000  # approximate content tokens per packed call
+    batch_max_sources: int = 6
+    batch_max_output_tokens: int = 16000  # analyzer model's output limit; caps a packed call's max_tokens
+
+
+class ExecutorsConfig(BaseModel):
+    run_workers: int = 3  # research runs executing at once; more are queued
+    task_workers: int = 8  # research tasks in flight (also capped by research.max_concurrent_tasks)
+    io_workers: int = 16  # searches and scrapes
+    llm_workers: int = 8  # LLM calls
+    cpu_workers: int = 4  # report compilation
+
+
+class WorkersConfig(BaseModel):
+    concurrency: int = 3  # tasks each research-worker process runs at once
+    lease_seconds: int = 300  # a claimed task is reclaimable once its lease expires
+    heartbeat_seconds: int = 60  # how often a worker renews its leases
+    poll_seconds: float = 5.0  # idle polling interval (workers and coordinator)
+
+
+class DeadlineConfig(BaseModel):
+    enabled: bool = True  # degrade gracefully as research.max_runtime_hours approaches
+    safety_factor: float = 1.2  # multiplier on forecast durations
+    compile_reserve_seconds: int = 120  # kept free for report compilation
+    default_task_seconds: int = 300  # task duration estimate before any are observed
+    default_synthesis_seconds: int = 90  # per-section synthesis estimate before any are observed
+
+
+class QueueConfig(BaseModel):
+    poll_seconds: float = 2.0  # dispatcher admission/heartbeat interval
+    budget_minutes: float = 60  # admitted runs' estimated LLM/search calls must fit this much rate-limit time
+    stale_seconds: int = 120  # a running entry not heartbeated for this long is marked interrupted
+    default_run_seconds: int = 1800  # run duration used for ETAs until runs have completed
 
 
 class RateLimitsConfig(BaseModel):
@@ -137,6 +192,18 @@ class LoggingConfig(BaseModel):
 class DatabaseConfig(BaseModel):
     path: str = "data/research_state.db"
     wal_mode: bool = True
+    single_writer: bool = True  # all writes go through one writer thread
+    read_pool_size: int = 4  # read-only connections for queries (doubles under burst)
+    synchronous: str = "NORMAL"  # OFF | NORMAL | FULL | EXTRA
+    cache_size: int = -65536  # page cache: pages, or KiB when negative (64 MiB)
+    mmap_size: int = 268_435_456  # bytes of the file memory-mapped for reads (0 = off)
+    busy_timeout_ms: int = 5000  # wait this long for a lock before "database is locked"
+    event_batching: bool = True  # write run events in batches from one background thread
+    event_batch_size: int = 200  # flush once this many events are buffered...
+    event_flush_ms: int = 250  # ...or once the oldest buffered event is this old
+    event_queue_max: int = 10000  # emitters block while this many events are buffered
+    blob_store: bool = True  # page text and notes stored compressed, deduplicated by hash
+    blob_codec: str = "zstd"  # zstd (needs 'zstandard', else zlib) | zlib
 
 
 class QueryRefinementConfig(BaseModel):
@@ -155,7 +222,12 @@ class Config(BaseModel):
     synthesis: SynthesisConfig = Field(default_factory=SynthesisConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
     quality: QualityConfig = Field(default_factory=QualityConfig)
+    extraction: ExtractionConfig = Field(default_factory=ExtractionConfig)
     rate_limits: RateLimitsConfig = Field(default_factory=RateLimitsConfig)
+    executors: ExecutorsConfig = Field(default_factory=ExecutorsConfig)
+    workers: WorkersConfig = Field(default_factory=WorkersConfig)
+    deadline: DeadlineConfig = Field(default_factory=DeadlineConfig)
+    queue: QueueConfig = Field(default_factory=QueueConfig)
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
     database: DatabaseConfig = Field(default_factory=DatabaseConfig)
     query_refinement: QueryRefinementConfig = Field(default_factory=QueryRefinementConfig)
@@ -241,8 +313,40 @@ _config_lock = threading.Lock()
 _settings_lock = threading.Lock()
 
 
+class _RunConfig:
+    """Mutable holder for one run's config, shared by all of the run's threads."""
+
+    def __init__(self, config: Config):
+        self.config = config
+
+
+# Set for the duration of a run by ``config_scope``. The holder (not the
+# config) is what the executors' context copy hands to worker threads, so a
+# ``set_config`` inside the run is seen by all of its threads and no others.
+_run_config: contextvars.ContextVar[Optional[_RunConfig]] = contextvars.ContextVar(
+    "run_config", default=None
+)
+
+
+@contextmanager
+def config_scope(config: Config) -> Iterator[Config]:
+    """Use ``config`` instead of the global config for the enclosed run.
+
+    Concurrent runs each get their own scope, so per-run overrides (presets,
+    deadline degradation) never leak into each other or the global config.
+    """
+    reset = _run_config.set(_RunConfig(config))
+    try:
+        yield config
+    finally:
+        _run_config.reset(reset)
+
+
 def get_config() -> Config:
-    """Get global config instance, with env var overrides for model names."""
+    """Get the current run's config, else the global instance (with env var overrides for model names)."""
+    run = _run_config.get()
+    if run is not None:
+        return run.config
     global _config
     if _config is None:
         with _config_lock:
@@ -278,7 +382,11 @@ def get_env_settings() -> Settings:
 
 
 def set_config(config: Config) -> None:
-    """Replace the global config singleton (thread-safe)."""
+    """Replace the current run's config, or the global singleton outside a run (thread-safe)."""
+    run = _run_config.get()
+    if run is not None:
+        run.config = config
+        return
     global _config
     with _config_lock:
         _config = config
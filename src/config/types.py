@@ -28,6 +28,15 @@ class SectionStatus(str, Enum):
     COMPLETE = "complete"
 
 
+class QueueStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    INTERRUPTED = "interrupted"  # its dispatcher stopped heartbeating mid-run
+
+
 # =============================================================================
 # DATABASE MODELS (Pydantic representations)
 # =============================================================================
@@ -48,6 +57,7 @@ class ResearchTask(BaseModel):
     citation_count: int = 0
     is_gap_fill: bool = False
     created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None  # when the current/last attempt was claimed
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
     retry_count: int = 0
@@ -122,3 +132,30 @@ class ResearchSession(BaseModel):
     refined_brief: Optional[str] = None
     refinement_qa: Optional[str] = None
     cancel_requested_at: Optional[datetime] = None
+    executor: Optional[str] = None  # local | workers
+
+
+class QueuedRun(BaseModel):
+    """A research run submitted to the run queue"""
+    id: str  # run id
+    query: str
+    user: str = "anonymous"
+    priority: int = 0  # higher runs first
+    mode: Optional[str] = None  # preset name
+    overrides_json: Optional[str] = None
+    refined_brief: Optional[str] = None
+    refinement_qa: Optional[str] = None
+    est_llm_calls: int = 0
+    est_search_calls: int = 0
+    est_cost: float = 0.0  # USD
+    status: QueueStatus = QueueStatus.QUEUED
+    session_id: Optional[int] = None
+    owner: Optional[str] = None  # dispatcher that admitted the run
+    error_message: Optional[str] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+
+    class Config:
+        use_enum_values = True
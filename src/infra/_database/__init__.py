@@ -12,8 +12,13 @@ from .orm_models import (
     SourceModel,
     GlossaryModel,
     RunEventModel,
+    ExtractionCacheModel,
+    TaskCheckpointModel,
     SectionModel,
     SessionModel,
+    SessionStatsModel,
+    BlobModel,
+    RunQueueModel,
 )
 from .manager import DatabaseManager
 
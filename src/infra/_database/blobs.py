@@ -0,0 +1,105 @@
+"""Content-addressed, compressed storage for large text.
+
+Scraped page text (``sources.full_content``) and per-task extracted notes
+(``task_source_association.extracted_content``) make up most of the
+database. Stored inline they bloat every page SQLite reads, and the same
+page fetched for several sessions is stored again each time. Instead the
+text is compressed into the ``blobs`` table once per distinct content,
+keyed by its SHA-256, and rows keep only the hash. Readers resolve the
+hashes they need in one batched query, and only when content was asked for.
+
+zstd is used when the optional ``zstandard`` package is installed,
+otherwise zlib. Each blob records its codec, so both kinds can be read
+back, but zstd blobs need ``zstandard`` to decode.
+"""
+import hashlib
+import zlib
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from .orm_models import BlobModel
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+CODECS = ("zstd", "zlib")
+
+# One IN (...) lookup per this many hashes
+_LOAD_CHUNK = 500
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def is_blob_text(text: Optional[str]) -> bool:
+    """Whether ``text`` goes to the blob store; empty and blank text stays inline."""
+    return bool(text and text.strip())
+
+
+class BlobStore:
+    """Writes and reads ``blobs`` rows inside a caller's database session."""
+
+    def __init__(self, codec: str = "zstd", level: int = None):
+        codec = str(codec).lower()
+        if codec not in CODECS:
+            raise ValueError(f"database.blob_codec must be one of {', '.join(CODECS)}, got {codec!r}")
+        if codec == "zstd" and zstandard is None:
+            codec = "zlib"
+        self.codec = codec
+        self.level = level
+
+    def encode(self, text: str) -> dict:
+        """A ``blobs`` row for ``text``."""
+        raw = text.encode("utf-8")
+        if self.codec == "zstd":
+            data = zstandard.ZstdCompressor(level=self.level or 3).compress(raw)
+        else:
+            data = zlib.compress(raw, self.level or 6)
+        return {"hash": content_hash(text), "codec": self.codec, "size": len(raw), "data": data}
+
+    @staticmethod
+    def decode(codec: str, data: bytes) -> str:
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("Blob is zstd-compressed; install 'zstandard' to read it")
+            raw = zstandard.ZstdDecompressor().decompress(data)
+        elif codec == "zlib":
+            raw = zlib.decompress(data)
+        else:
+            raise ValueError(f"Unknown blob codec {codec!r}")
+        return raw.decode("utf-8")
+
+    def put(self, session, texts: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """Store ``texts`` (deduplicated) and return their hashes, None for inline text."""
+        rows: Dict[str, dict] = {}
+        hashes: List[Optional[str]] = []
+        for text in texts:
+            if not is_blob_text(text):
+                hashes.append(None)
+                continue
+            digest = content_hash(text)
+            if digest not in rows:
+                rows[digest] = self.encode(text)
+            hashes.append(digest)
+        if rows:
+            session.execute(
+                sqlite_insert(BlobModel).on_conflict_do_nothing(index_elements=["hash"]),
+                list(rows.values()),
+            )
+        return hashes
+
+    def load(self, session, hashes: Iterable[Optional[str]]) -> Dict[str, str]:
+        """{hash: text} for the given hashes (None entries are ignored)."""
+        wanted = list({h for h in hashes if h})
+        texts: Dict[str, str] = {}
+        for i in range(0, len(wanted), _LOAD_CHUNK):
+            rows = session.query(BlobModel.hash, BlobModel.codec, BlobModel.data).filter(
+                BlobModel.hash.in_(wanted[i:i + _LOAD_CHUNK])
+            ).all()
+            for digest, codec, data in rows:
+                texts[digest] = self.decode(codec, data)
+        return texts
@@ -0,0 +1,192 @@
+"""FTS5 full-text index over the research corpus.
+
+Three external-content FTS5 tables index what earlier runs already
+gathered, so it can be searched without new web searches:
+
+- ``sources_fts`` covers each source's title and page text, read through
+  the ``corpus_sources`` view.
+- ``notes_fts`` covers the notes every task extracted from a source, one
+  row per source, read through the ``corpus_notes`` view.
+- ``sections_fts`` covers report section titles and synthesized content.
+
+External content keeps a single copy of the text; the FTS tables hold only
+the inverted index. Page text and notes live partly as compressed blobs,
+which SQL can only read with the ``blob_text()`` function registered on
+DatabaseManager's connections. So the source and notes indexes are not kept
+in step by triggers (any other connection writing those tables would fail
+on the missing function); DatabaseManager's write methods update them in the
+writing transaction from the plain text they already hold. FTS5 removes an
+entry by being handed the exact values it indexed, so a write passes the
+old values as well. Page text and notes are indexed apart so that storing
+a task's notes never has to read the page back. Writes made outside
+DatabaseManager are picked up by ``rebuild_corpus_index``.
+
+Sections hold plain text, so ``sections_fts`` is maintained by triggers.
+"""
+import re
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from .blobs import BlobStore
+
+
+def blob_text(codec: Optional[str], data: Optional[bytes]) -> Optional[str]:
+    """SQL ``blob_text(codec, data)``: a blob's text, NULL for a missing blob."""
+    if data is None:
+        return None
+    return BlobStore.decode(codec, data)
+
+
+def register_functions(dbapi_connection) -> None:
+    dbapi_connection.create_function("blob_text", 2, blob_text, deterministic=True)
+
+
+def match_terms(query: str) -> List[str]:
+    """Every word of ``query`` as a quoted FTS5 term.
+
+    Quoting keeps user input from being read as FTS5 syntax (``AND``,
+    ``NEAR``, ``col:``, unbalanced quotes).
+    """
+    return [f'"{term}"' for term in re.findall(r"\w+", query or "")]
+
+
+def match_expression(query: str) -> Optional[str]:
+    """An FTS5 MATCH expression for free text requiring every word.
+
+    None when there are no words.
+    """
+    terms = match_terms(query)
+    return " ".join(terms) if terms else None
+
+
+def join_notes(notes: Iterable[Optional[str]]) -> Optional[str]:
+    """A source's indexed notes: its tasks' notes in task order, as
+    ``corpus_notes`` aggregates them (missing notes are skipped)."""
+    present = [n for n in notes if n is not None]
+    return "\n".join(present) if present else None
+
+
+CORPUS_VIEWS = {
+    # One row per source: title and page text
+    "corpus_sources": """
+        CREATE VIEW IF NOT EXISTS corpus_sources AS
+        SELECT
+            s.id AS id,
+            s.title AS title,
+            COALESCE(blob_text(b.codec, b.data), s.full_content) AS content
+        FROM sources s
+        LEFT JOIN blobs b ON b.hash = s.full_content_hash
+    """,
+    # One row per source with notes: all tasks' notes, in task order (see join_notes)
+    "corpus_notes": """
+        CREATE VIEW IF NOT EXISTS corpus_notes AS
+        SELECT n.source_id AS id, group_concat(n.notes, char(10)) AS notes
+        FROM (
+            SELECT a.source_id, COALESCE(blob_text(b.codec, b.data), a.extracted_content) AS notes
+            FROM task_source_association a
+            LEFT JOIN blobs b ON b.hash = a.extracted_hash
+            ORDER BY a.source_id, a.task_id
+        ) n
+        GROUP BY n.source_id
+        HAVING notes IS NOT NULL
+    """,
+}
+
+CORPUS_FTS_TABLES = {
+    "sources_fts": """
+        CREATE VIRTUAL TABLE IF NOT EXISTS sources_fts USING fts5(
+            title, content,
+            content='corpus_sources', content_rowid='id'
+        )
+    """,
+    "notes_fts": """
+        CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(
+            notes,
+            content='corpus_notes', content_rowid='id'
+        )
+    """,
+    "sections_fts": """
+        CREATE VIRTUAL TABLE IF NOT EXISTS sections_fts USING fts5(
+            title, synthesized_content,
+            content='sections', content_rowid='id'
+        )
+    """,
+}
+
+CORPUS_TRIGGERS = {
+    "trg_corpus_section_insert": """
+        CREATE TRIGGER IF NOT EXISTS trg_corpus_section_insert
+        AFTER INSERT ON sections
+        BEGIN
+            INSERT INTO sections_fts (rowid, title, synthesized_content)
+            VALUES (NEW.id, NEW.title, NEW.synthesized_content);
+        END
+    """,
+    "trg_corpus_section_update": """
+        CREATE TRIGGER IF NOT EXISTS trg_corpus_section_update
+        AFTER UPDATE OF title, synthesized_content ON sections
+        BEGIN
+            INSERT INTO sections_fts (sections_fts, rowid, title, synthesized_content)
+            VALUES ('delete', OLD.id, OLD.title, OLD.synthesized_content);
+            INSERT INTO sections_fts (rowid, title, synthesized_content)
+            VALUES (NEW.id, NEW.title, NEW.synthesized_content);
+        END
+    """,
+    "trg_corpus_section_delete": """
+        CREATE TRIGGER IF NOT EXISTS trg_corpus_section_delete
+        AFTER DELETE ON sections
+        BEGIN
+            INSERT INTO sections_fts (sections_fts, rowid, title, synthesized_content)
+            VALUES ('delete', OLD.id, OLD.title, OLD.synthesized_content);
+        END
+    """,
+}
+
+# Triggers of the earlier layout, which indexed sources through blob_text()
+LEGACY_CORPUS_TRIGGERS = (
+    "trg_corpus_source_insert", "trg_corpus_source_before_update",
+    "trg_corpus_source_update", "trg_corpus_source_delete",
+    "trg_corpus_notes_before_insert", "trg_corpus_notes_insert",
+    "trg_corpus_notes_before_update", "trg_corpus_notes_update",
+    "trg_corpus_notes_before_delete", "trg_corpus_notes_delete",
+)
+
+# Rebuilds every index from its content; run when the tables are first
+# created on a database that already has data, and on demand.
+CORPUS_REBUILD = tuple(
+    f"INSERT INTO {table} ({table}) VALUES ('rebuild')" for table in CORPUS_FTS_TABLES
+)
+
+_SOURCE_DELETE = text(
+    "INSERT INTO sources_fts (sources_fts, rowid, title, content) "
+    "VALUES ('delete', :id, :title, :content)"
+)
+_SOURCE_INSERT = text("INSERT INTO sources_fts (rowid, title, content) VALUES (:id, :title, :content)")
+_NOTES_DELETE = text("INSERT INTO notes_fts (notes_fts, rowid, notes) VALUES ('delete', :id, :notes)")
+_NOTES_INSERT = text("INSERT INTO notes_fts (rowid, notes) VALUES (:id, :notes)")
+
+# (source_id, old values or None when not indexed yet, new values)
+SourceEntry = Tuple[int, Optional[Tuple[Optional[str], Optional[str]]], Tuple[Optional[str], Optional[str]]]
+NotesEntry = Tuple[int, Optional[str], Optional[str]]
+
+
+def reindex_sources(session, entries: List[SourceEntry]) -> None:
+    """Replace the ``sources_fts`` rows of sources whose title or page text changed."""
+    deletes = [{"id": i, "title": old[0], "content": old[1]} for i, old, _ in entries if old is not None]
+    if deletes:
+        session.execute(_SOURCE_DELETE, deletes)
+    if entries:
+        session.execute(_SOURCE_INSERT, [
+            {"id": i, "title": new[0], "content": new[1]} for i, _, new in entries
+        ])
+
+
+def reindex_notes(session, entries: List[NotesEntry]) -> None:
+    """Replace the ``notes_fts`` rows of sources whose notes changed."""
+    deletes = [{"id": i, "notes": old} for i, old, new in entries if old is not None and old != new]
+    inserts = [{"id": i, "notes": new} for i, old, new in entries if new is not None and old != new]
+    if deletes:
+        session.execute(_NOTES_DELETE, deletes)
+    if inserts:
+        session.execute(_NOTES_INSERT, inserts)
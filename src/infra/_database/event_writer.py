@@ -0,0 +1,133 @@
+"""Buffered, batched writer for run events.
+
+Run events (queries, search results, phase changes, agent actions) are
+emitted from many worker threads. Writing each one in its own transaction
+makes every emitter wait on SQLite's single write lock and an fsync.
+``RunEventWriter`` buffers events in memory and one writer thread inserts
+them in batches, once ``batch_size`` events are buffered or the oldest has
+waited ``flush_seconds``.
+
+The buffer is bounded: when ``max_queue`` events are waiting, emitters
+block until the writer catches up (backpressure) instead of growing memory
+without limit. ``flush()`` returns once everything submitted before it is
+written; the database flushes before reading events back and after events
+that mark a run boundary, such as phase changes.
+
+The writer thread exits after a few idle seconds and is restarted by the
+next event.
+"""
+import atexit
+import queue
+import threading
+import time
+import weakref
+from typing import Callable, List
+
+from src.config.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Writer thread exits after this long without events
+_IDLE_EXIT_SECONDS = 5.0
+
+_writers: "weakref.WeakSet[RunEventWriter]" = weakref.WeakSet()
+
+
+class RunEventWriter:
+    """Queues event rows and inserts them in batches from one thread."""
+
+    def __init__(self, write_batch: Callable[[List[dict]], None], batch_size: int = 200,
+                 flush_seconds: float = 0.25, max_queue: int = 10000):
+        self.write_batch = write_batch
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = max(0.0, flush_seconds)
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_queue))
+        self._lock = threading.Lock()
+        self._thread = None
+        self.written = 0
+        self.dropped = 0
+        _writers.add(self)
+
+    def put(self, row: dict) -> None:
+        """Buffer one event row; blocks while the buffer is full."""
+        self._queue.put(row)
+        self._ensure_thread()
+
+    def flush(self, timeout: float = 30.0) -> bool:
+        """Wait until every event submitted so far is written. False on timeout."""
+        with self._lock:
+            if self._thread is None and self._queue.empty():
+                return True
+        barrier = threading.Event()
+        self._queue.put(barrier)
+        self._ensure_thread()
+        return barrier.wait(timeout)
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="run-event-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=_IDLE_EXIT_SECONDS)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+
+            batch: List[dict] = []
+            barriers: List[threading.Event] = []
+            self._take(item, batch, barriers)
+            deadline = time.monotonic() + self.flush_seconds
+            while len(batch) < self.batch_size and not barriers:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                self._take(item, batch, barriers)
+
+            if batch:
+                self._write(batch)
+            for barrier in barriers:
+                barrier.set()
+
+    @staticmethod
+    def _take(item, batch: List[dict], barriers: List[threading.Event]) -> None:
+        if isinstance(item, threading.Event):
+            barriers.append(item)
+        else:
+            batch.append(item)
+
+    def _write(self, batch: List[dict]) -> None:
+        for attempt in range(2):
+            try:
+                self.write_batch(batch)
+                self.written += len(batch)
+                return
+            except Exception as e:
+                if attempt == 0:
+                    time.sleep(0.1)
+                    continue
+                self.dropped += len(batch)
+                logger.error(f"Dropped {len(batch)} run events: {e}")
+
+
+def _flush_all() -> None:
+    for writer in list(_writers):
+        writer.flush(timeout=5.0)
+
+
+atexit.register(_flush_all)
@@ -1,21 +1,136 @@
-"""DatabaseManager class — all database operations."""
-from datetime import datetime, timezone
+"""DatabaseManager class — all database operations.
+
+Connections: one write engine, used only by the serialized writer (see
+``writer``), and a pool of read-only connections for queries. With WAL
+enabled readers never block on the writer. Every connection gets the
+pragmas from ``DatabaseConfig`` (synchronous, cache_size, mmap_size,
+busy_timeout); read connections are also ``query_only``.
+"""
+import json
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
-from sqlalchemy import create_engine, func, text, or_, and_
+from sqlalchemy import (
+    create_engine, event, func, insert, select, text, bindparam, case, or_, and_
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker
 
+from src.config.logger import get_logger
 from src.config.settings import get_config
 from src.config.types import (
     TaskStatus, SectionStatus, ResearchTask, ReportSection,
-    Source, GlossaryTerm, ResearchSession
+    Source, GlossaryTerm, ResearchSession, QueuedRun, QueueStatus
 )
 from .orm_models import (
     Base, task_source_association,
     TaskModel, SourceModel, GlossaryModel, RunEventModel,
-    SectionModel, SessionModel,
+    SectionModel, SessionModel, ExtractionCacheModel, TaskCheckpointModel,
+    RunQueueModel, SessionStatsModel, BlobModel,
+)
+from .blobs import BlobStore
+from .corpus_index import (
+    CORPUS_FTS_TABLES, CORPUS_REBUILD, CORPUS_TRIGGERS, CORPUS_VIEWS, LEGACY_CORPUS_TRIGGERS,
+    join_notes, match_terms, register_functions, reindex_notes, reindex_sources,
 )
+from .event_writer import RunEventWriter
+from .session_stats import SESSION_STATS_BACKFILL, SESSION_STATS_TRIGGERS
+from .writer import SerialWriter, writes
+
+logger = get_logger(__name__)
+
+# Events marking a run boundary are written before add_run_event returns
+SYNC_EVENT_TYPES = frozenset({"phase_changed", "cancellation_requested", "deadline_degradation"})
+
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+def _connection_pragmas(db_config) -> Dict[str, Any]:
+    synchronous = str(db_config.synchronous).upper()
+    if synchronous not in _SYNCHRONOUS_MODES:
+        raise ValueError(
+            f"database.synchronous must be one of {', '.join(_SYNCHRONOUS_MODES)}, got {db_config.synchronous!r}"
+        )
+    return {
+        "busy_timeout": int(db_config.busy_timeout_ms),
+        "synchronous": synchronous,
+        "cache_size": int(db_config.cache_size),
+        "mmap_size": int(db_config.mmap_size),
+    }
+
+
+def _on_connect(engine, pragmas: Dict[str, Any]) -> None:
+    """Apply ``pragmas`` and register SQL functions on every new DBAPI connection of ``engine``."""
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+        register_functions(dbapi_connection)
+
+
+# Source columns for listings; full page text is selected only on request
+_SOURCE_COLUMNS = (
+    SourceModel.id, SourceModel.url, SourceModel.title, SourceModel.domain,
+    SourceModel.snippet, SourceModel.quality_score, SourceModel.is_academic,
+    SourceModel.accessed_at,
+)
+_CONTENT_COLUMNS = (SourceModel.full_content, SourceModel.full_content_hash)
+_NOTES_COLUMNS = (
+    task_source_association.c.extracted_content, task_source_association.c.extracted_hash,
+)
+
+# Source fields that may be stored as a blob, and the column holding the hash
+_BLOB_REFS = {"full_content": "full_content_hash", "extracted_content": "extracted_hash"}
+
+
+def _source_columns(include_content: bool) -> tuple:
+    return _SOURCE_COLUMNS + (_CONTENT_COLUMNS if include_content else ())
+
+
+def _blob_refs(rows) -> set:
+    return {row._mapping.get(ref) for row in rows for ref in _BLOB_REFS.values()} - {None}
+
+
+def _row_text(row, field: str, texts: Dict[str, str]) -> Optional[str]:
+    """``field`` of a projection row: its blob when it has one, else the inline value.
+
+    A hash whose blob row is missing (a partial migration, a manual prune)
+    falls back to the inline column rather than failing the whole listing.
+    """
+    ref = row._mapping.get(_BLOB_REFS[field])
+    if ref:
+        if ref in texts:
+            return texts[ref]
+        logger.warning(f"Blob {ref} for {field} is missing; using the inline value")
+    return row._mapping.get(field)
+
+
+def _scaled_scores(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Add a 0-1 ``score`` to one index's results from their ``bm25`` (lower is better)."""
+    if results:
+        best = min(r["bm25"] for r in results)
+        worst = max(r["bm25"] for r in results)
+        spread = worst - best
+        for r in results:
+            r["score"] = (worst - r["bm25"]) / spread if spread else 1.0
+    return results
+
+
+def _source_from_row(row, texts: Dict[str, str] = None, **fields) -> Source:
+    """Build a Source from a column-projection row plus explicit ``fields``.
+
+    ``texts`` maps blob hashes referenced by the row to their text.
+    """
+    values = {k: v for k, v in row._mapping.items() if k in Source.model_fields}
+    for field in _BLOB_REFS:
+        if field in values:
+            values[field] = _row_text(row, field, texts or {})
+    values.update(fields)
+    return Source(**values)
 
 
 class DatabaseManager:
@@ -25,16 +140,49 @@ class DatabaseManager:
         config = get_config()
         self.db_path = db_path or config.database.path
         self.wal_mode = config.database.wal_mode
+        pragmas = _connection_pragmas(config.database)
 
-        # Create sync engine for initialization
+        # Write engine: migrations, then only the writer thread
         self.engine = create_engine(
             f"sqlite:///{self.db_path}",
             echo=False,
             connect_args={"check_same_thread": False}
         )
+        _on_connect(self.engine, pragmas)
 
-        # Session factory
+        # Read engine: a pool of query_only connections
+        read_pool_size = max(1, config.database.read_pool_size)
+        self.read_engine = create_engine(
+            f"sqlite:///{self.db_path}",
+            echo=False,
+            connect_args={"check_same_thread": False},
+            pool_size=read_pool_size,
+            max_overflow=read_pool_size,
+        )
+        _on_connect(self.read_engine, {**pragmas, "query_only": "ON"})
+
+        # Session factories
         self.Session = sessionmaker(bind=self.engine)
+        self.ReadSession = sessionmaker(bind=self.read_engine)
+
+        # Page text and notes are stored as compressed blobs (see blobs);
+        # existing blobs stay readable with the store turned off
+        self.blobs = BlobStore(config.database.blob_codec)
+        self.blob_store = config.database.blob_store
+
+        # Writes run one at a time on the writer thread (see writer)
+        self.writer = SerialWriter() if config.database.single_writer else None
+        self._local = threading.local()  # .writing: inside an inline write
+
+        # Run events are buffered and written in batches (see event_writer)
+        self.event_writer = None
+        if config.database.event_batching:
+            self.event_writer = RunEventWriter(
+                self._write_run_events,
+                batch_size=config.database.event_batch_size,
+                flush_seconds=config.database.event_flush_ms / 1000.0,
+                max_queue=config.database.event_queue_max,
+            )
 
         # Initialize database
         self._init_db()
@@ -63,6 +211,10 @@ class DatabaseManager:
         self._migrate_source_columns()
         self._migrate_run_events()
         self._migrate_cancel_requested_column()
+        self._migrate_blob_columns()
+        self._migrate_indexes()
+        self._migrate_session_stats()
+        self._migrate_corpus_index()
 
     def _migrate_session_columns(self):
         """Add missing columns to the sessions table for existing databases."""
@@ -71,6 +223,7 @@ class DatabaseManager:
             "conclusion": "TEXT",
             "report_markdown_path": "VARCHAR(500)",
             "report_html_path": "VARCHAR(500)",
+            "executor": "VARCHAR(20)",
         }
         with self.engine.connect() as conn:
             rows = conn.execute(text("PRAGMA table_info(sessions)")).fetchall()
@@ -113,15 +266,22 @@ class DatabaseManager:
                 conn.commit()
 
     def _migrate_task_columns(self):
-        """Add retry_count column to tasks table for existing databases."""
+        """Add retry_count, started_at and lease columns to tasks table for existing databases."""
+        new_columns = {
+            "retry_count": "INTEGER DEFAULT 0",
+            "started_at": "DATETIME",
+            "lease_owner": "VARCHAR(100)",
+            "lease_expires_at": "DATETIME",
+        }
         with self.engine.connect() as conn:
             rows = conn.execute(text("PRAGMA table_info(tasks)")).fetchall()
             existing = {row[1] for row in rows}
-            if "retry_count" not in existing:
-                conn.execute(text(
-                    "ALTER TABLE tasks ADD COLUMN retry_count INTEGER DEFAULT 0"
-                ))
-                conn.commit()
+            for col_name, col_type in new_columns.items():
+                if col_name not in existing:
+                    conn.execute(text(
+                        f"ALTER TABLE tasks ADD COLUMN {col_name} {col_type}"
+                    ))
+            conn.commit()
 
     def _migrate_section_tables(self):
         """Add section_id and is_gap_fill columns to tasks for existing databases."""
@@ -198,29 +358,110 @@ class DatabaseManager:
                 ))
                 conn.commit()
 
+    def _migrate_blob_columns(self):
+        """Add blob hash columns to sources and task_source_association for existing databases."""
+        with self.engine.connect() as conn:
+            for table, column in (("sources", "full_content_hash"),
+                                  ("task_source_association", "extracted_hash")):
+                rows = conn.execute(text(f"PRAGMA table_info({table})")).fetchall()
+                if column not in {row[1] for row in rows}:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} VARCHAR(64)"))
+            conn.commit()
+
+    def _migrate_indexes(self):
+        """Create indexes added to existing tables since the database was created.
+
+        ``create_all`` only builds indexes together with a new table. Runs after
+        the column migrations, since some indexes cover migrated columns.
+        """
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(self.engine, checkfirst=True)
+
+    def _migrate_session_stats(self):
+        """Install the session_stats triggers, backfilling counters on first install."""
+        with self.engine.begin() as conn:
+            installed = {
+                row[0] for row in conn.execute(text(
+                    "SELECT name FROM sqlite_master WHERE type='trigger'"
+                ))
+            }
+            if installed >= set(SESSION_STATS_TRIGGERS):
+                return
+            for ddl in SESSION_STATS_TRIGGERS.values():
+                conn.execute(text(ddl))
+            conn.execute(text(SESSION_STATS_BACKFILL))
+
+    def _migrate_corpus_index(self):
+        """Create the full-text index, indexing existing rows on first install.
+
+        Databases indexed by the earlier trigger-maintained layout have its
+        triggers, view and source index replaced.
+        """
+        with self.engine.begin() as conn:
+            existing = {
+                row[0] for row in conn.execute(text(
+                    "SELECT name FROM sqlite_master WHERE type IN ('table', 'view', 'trigger')"
+                ))
+            }
+            legacy = existing & set(LEGACY_CORPUS_TRIGGERS)
+            if not legacy and existing >= {*CORPUS_VIEWS, *CORPUS_FTS_TABLES, *CORPUS_TRIGGERS}:
+                return
+            if legacy:
+                for name in legacy:
+                    conn.execute(text(f"DROP TRIGGER {name}"))
+                conn.execute(text("DROP TABLE IF EXISTS sources_fts"))
+                conn.execute(text("DROP VIEW IF EXISTS corpus_sources"))
+            for ddl in (*CORPUS_VIEWS.values(), *CORPUS_FTS_TABLES.values(), *CORPUS_TRIGGERS.values()):
+                conn.execute(text(ddl))
+            for statement in CORPUS_REBUILD:
+                conn.execute(text(statement))
+
     def get_sync_session(self):
-        """Get a synchronous session"""
-        return self.Session()
+        """Session on the write connection inside write operations, otherwise read-only."""
+        return self.Session() if self._writing() else self.ReadSession()
+
+    def _writing(self) -> bool:
+        if self.writer is not None:
+            return self.writer.in_writer()
+        return getattr(self._local, "writing", False)
+
+    def _write_inline(self, fn, *args, **kwargs):
+        """Run a write in the calling thread (``database.single_writer`` off)."""
+        previous = getattr(self._local, "writing", False)
+        self._local.writing = True
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self._local.writing = previous
+
+    def close(self) -> None:
+        """Write buffered events and close every connection."""
+        self.flush_run_events()
+        self.engine.dispose()
+        self.read_engine.dispose()
 
     # =========================================================================
     # SESSION OPERATIONS
     # =========================================================================
 
-    def create_session(self, query: str) -> ResearchSession:
+    @writes
+    def create_session(self, query: str, executor: str = None) -> ResearchSession:
         """Create a new research session"""
         with self.get_sync_session() as session:
-            db_session = SessionModel(query=query)
+            db_session = SessionModel(query=query, executor=executor)
             session.add(db_session)
             session.commit()
             session.refresh(db_session)
             return db_session.to_pydantic()
 
-    def get_current_session(self) -> Optional[ResearchSession]:
-        """Get the current running session"""
+    def get_current_session(self, executor: str = None) -> Optional[ResearchSession]:
+        """Get the current running session, optionally only one run with ``executor``."""
         with self.get_sync_session() as session:
-            result = session.query(SessionModel).filter(
-                SessionModel.status == 'running'
-            ).order_by(SessionModel.started_at.desc()).first()
+            query = session.query(SessionModel).filter(SessionModel.status == 'running')
+            if executor is not None:
+                query = query.filter(SessionModel.executor == executor)
+            result = query.order_by(SessionModel.started_at.desc()).first()
             return result.to_pydantic() if result else None
 
     def get_session_by_id(self, session_id: int) -> Optional[ResearchSession]:
@@ -231,6 +472,7 @@ class DatabaseManager:
             ).first()
             return result.to_pydantic() if result else None
 
+    @writes
     def update_session(self, session_id: int, **kwargs) -> bool:
         """Update session fields"""
         with self.get_sync_session() as session:
@@ -252,6 +494,7 @@ class DatabaseManager:
     # TASK OPERATIONS
     # =========================================================================
 
+    @writes
     def add_task(self, task: ResearchTask, session_id: int = None) -> ResearchTask:
         """Add a new task"""
         with self.get_sync_session() as session:
@@ -273,6 +516,7 @@ class DatabaseManager:
             session.refresh(db_task)
             return db_task.to_pydantic()
 
+    @writes
     def add_tasks_bulk(self, tasks: List[ResearchTask], session_id: int = None) -> List[ResearchTask]:
         """Add multiple tasks at once"""
         with self.get_sync_session() as session:
@@ -336,6 +580,7 @@ class DatabaseManager:
             results = query.order_by(TaskModel.id).all()
             return [r.to_pydantic() for r in results]
 
+    @writes
     def update_task(self, task_id: int, **kwargs) -> bool:
         """Update task fields"""
         with self.get_sync_session() as session:
@@ -351,15 +596,19 @@ class DatabaseManager:
             return result > 0
 
     def mark_task_complete(self, task_id: int, word_count: int = 0, citation_count: int = 0):
-        """Mark a task as completed"""
+        """Mark a task as completed (its step checkpoints are no longer needed)."""
+        self.clear_task_checkpoints(task_id)
         self.update_task(
             task_id,
             status=TaskStatus.COMPLETED.value,
             completed_at=datetime.now(timezone.utc),
             word_count=word_count,
-            citation_count=citation_count
+            citation_count=citation_count,
+            lease_owner=None,
+            lease_expires_at=None,
         )
 
+    @writes
     def mark_task_failed(self, task_id: int, error_message: str):
         """Mark a task as failed and increment retry_count."""
         with self.get_sync_session() as session:
@@ -368,8 +617,24 @@ class DatabaseManager:
                 task.status = TaskStatus.FAILED.value
                 task.error_message = error_message
                 task.retry_count = (task.retry_count or 0) + 1
+                task.lease_owner = None
+                task.lease_expires_at = None
                 session.commit()
 
+    def release_task(self, task_id: int) -> bool:
+        """Return a claimed task to PENDING without counting an attempt.
+
+        For work that was abandoned rather than failed: a cancelled run or
+        a claim dropped before it started.
+        """
+        return self.update_task(
+            task_id,
+            status=TaskStatus.PENDING.value,
+            lease_owner=None,
+            lease_expires_at=None,
+        )
+
+    @writes
     def retry_failed_tasks(self, session_id: int, max_retries: int = 2) -> int:
         """Reset retryable FAILED tasks back to PENDING.
 
@@ -430,28 +695,167 @@ class DatabaseManager:
             results = query.order_by(TaskModel.id).all()
             return [r.to_pydantic() for r in results]
 
-    def get_next_tasks(self, count: int = 1, session_id: int = None) -> List[ResearchTask]:
+    @writes
+    def get_next_tasks(self, count: int = 1, session_id: int = None,
+                       owner: str = None, lease_seconds: int = None,
+                       candidate_ids: List[int] = None) -> List[ResearchTask]:
         """Atomically claim up to `count` pending tasks by marking them IN_PROGRESS.
 
-        Returns claimed tasks ordered by priority desc, depth asc, id asc.
+        Each claim is a conditional UPDATE (``... WHERE status = 'pending'``),
+        so concurrent claimers in other processes or hosts sharing the database
+        never get the same task. With ``owner``/``lease_seconds`` the claim is
+        leased: it must be renewed (``renew_task_leases``) or it is returned
+        to PENDING by ``reclaim_expired_tasks``.
+
+        ``candidate_ids`` (see ``src.pipeline.scheduling``) claims in that
+        order instead; ids that are no longer pending, or belong to another
+        session than ``session_id``, are skipped.
+
+        Returns claimed tasks ordered by priority desc, depth asc, id asc
+        (or in ``candidate_ids`` order).
         """
+        now = datetime.now(timezone.utc)
+        expires_at = None
+        if lease_seconds is not None:
+            expires_at = now + timedelta(seconds=lease_seconds)
+        claim_values = {
+            TaskModel.status: TaskStatus.IN_PROGRESS.value,
+            TaskModel.lease_owner: owner,
+            TaskModel.lease_expires_at: expires_at,
+            TaskModel.started_at: now,
+        }
+
+        claimed: List[int] = []
         with self.get_sync_session() as session:
-            query = session.query(TaskModel).filter(
-                TaskModel.status == 'pending'
-            )
-            if session_id is not None:
-                query = query.filter(TaskModel.session_id == session_id)
-            tasks = query.order_by(
+            if candidate_ids is not None:
+                for task_id in candidate_ids:
+                    if len(claimed) >= count:
+                        break
+                    claim = session.query(TaskModel).filter(
+                        TaskModel.id == task_id,
+                        TaskModel.status == TaskStatus.PENDING.value,
+                    )
+                    if session_id is not None:
+                        claim = claim.filter(TaskModel.session_id == session_id)
+                    won = claim.update(claim_values, synchronize_session=False)
+                    session.commit()
+                    if won:
+                        claimed.append(task_id)
+                rows = {t.id: t for t in session.query(TaskModel).filter(TaskModel.id.in_(claimed))}
+                return [rows[i].to_pydantic() for i in claimed]
+
+            while len(claimed) < count:
+                query = session.query(TaskModel.id).filter(
+                    TaskModel.status == TaskStatus.PENDING.value
+                )
+                if session_id is not None:
+                    query = query.filter(TaskModel.session_id == session_id)
+                if claimed:
+                    query = query.filter(TaskModel.id.notin_(claimed))
+                candidates = [row.id for row in query.order_by(
+                    TaskModel.priority.desc(),
+                    TaskModel.depth.asc(),
+                    TaskModel.id.asc()
+                ).limit(count - len(claimed)).all()]
+                if not candidates:
+                    break
+
+                for task_id in candidates:
+                    won = session.query(TaskModel).filter(
+                        TaskModel.id == task_id,
+                        TaskModel.status == TaskStatus.PENDING.value,
+                    ).update(claim_values, synchronize_session=False)
+                    session.commit()
+                    if won:
+                        claimed.append(task_id)
+
+            if not claimed:
+                return []
+            tasks = session.query(TaskModel).filter(TaskModel.id.in_(claimed)).order_by(
                 TaskModel.priority.desc(),
                 TaskModel.depth.asc(),
                 TaskModel.id.asc()
-            ).limit(count).all()
+            ).all()
+            return [t.to_pydantic() for t in tasks]
 
-            for task in tasks:
-                task.status = TaskStatus.IN_PROGRESS.value
+    @writes
+    def renew_task_leases(self, owner: str, lease_seconds: int) -> int:
+        """Extend the lease of every IN_PROGRESS task held by `owner` (heartbeat).
 
+        Returns the number of leases renewed.
+        """
+        with self.get_sync_session() as session:
+            renewed = session.query(TaskModel).filter(
+                TaskModel.lease_owner == owner,
+                TaskModel.status == TaskStatus.IN_PROGRESS.value,
+            ).update({
+                TaskModel.lease_expires_at:
+                    datetime.now(timezone.utc) + timedelta(seconds=lease_seconds),
+            }, synchronize_session=False)
             session.commit()
-            return [t.to_pydantic() for t in tasks]
+            return renewed
+
+    @writes
+    def reclaim_expired_tasks(self, session_id: int = None, max_retries: int = None,
+                              include_unleased: bool = False) -> int:
+        """Return orphaned IN_PROGRESS tasks (expired lease) to PENDING.
+
+        The owner is presumed dead, so each reclaimed task's retry_count is
+        bumped. With ``max_retries``, a task that has used them up (it keeps
+        killing its worker) is marked FAILED instead. ``include_unleased``
+        also reclaims IN_PROGRESS tasks with no lease at all — claims made
+        before leases existed — and must only be used when no other process
+        can be running the session (e.g. on resume).
+
+        Returns the number of tasks reclaimed (re-queued or failed).
+        """
+        now = datetime.now(timezone.utc)
+        orphaned = TaskModel.lease_expires_at < now
+        if include_unleased:
+            orphaned = or_(orphaned, TaskModel.lease_expires_at == None)  # noqa: E711
+
+        with self.get_sync_session() as session:
+            def _orphans():
+                query = session.query(TaskModel).filter(
+                    TaskModel.status == TaskStatus.IN_PROGRESS.value, orphaned,
+                )
+                if session_id is not None:
+                    query = query.filter(TaskModel.session_id == session_id)
+                return query
+
+            reclaimed = 0
+            if max_retries is not None:
+                reclaimed += _orphans().filter(
+                    func.coalesce(TaskModel.retry_count, 0) + 1 >= max_retries
+                ).update({
+                    TaskModel.status: TaskStatus.FAILED.value,
+                    TaskModel.error_message: "Lease expired: worker stopped responding (retries exhausted)",
+                    TaskModel.retry_count: func.coalesce(TaskModel.retry_count, 0) + 1,
+                    TaskModel.lease_owner: None,
+                    TaskModel.lease_expires_at: None,
+                }, synchronize_session=False)
+            reclaimed += _orphans().update({
+                TaskModel.status: TaskStatus.PENDING.value,
+                TaskModel.retry_count: func.coalesce(TaskModel.retry_count, 0) + 1,
+                TaskModel.lease_owner: None,
+                TaskModel.lease_expires_at: None,
+            }, synchronize_session=False)
+            session.commit()
+            return reclaimed
+
+    def get_task_durations(self, limit: int = 200) -> List[Tuple[ResearchTask, float]]:
+        """Most recent completed tasks (any session) with their last attempt's run time in seconds."""
+        with self.get_sync_session() as session:
+            rows = session.query(TaskModel).filter(
+                TaskModel.status == TaskStatus.COMPLETED.value,
+                TaskModel.started_at != None,  # noqa: E711
+                TaskModel.completed_at != None,  # noqa: E711
+            ).order_by(TaskModel.completed_at.desc()).limit(limit).all()
+            return [
+                (r.to_pydantic(), (r.completed_at - r.started_at).total_seconds())
+                for r in rows
+                if r.completed_at >= r.started_at
+            ]
 
     def get_recent_completed_tasks(self, limit: int = 5, session_id: int = None) -> List[ResearchTask]:
         """Get the most recently completed tasks, ordered newest first."""
@@ -468,6 +872,7 @@ class DatabaseManager:
     # SECTION OPERATIONS
     # =========================================================================
 
+    @writes
     def add_section(self, section: ReportSection, session_id: int = None) -> ReportSection:
         """Add a new report section"""
         with self.get_sync_session() as session:
@@ -485,6 +890,7 @@ class DatabaseManager:
             session.refresh(db_section)
             return db_section.to_pydantic()
 
+    @writes
     def add_sections_bulk(self, sections: List[ReportSection], session_id: int = None) -> List[ReportSection]:
         """Add multiple sections at once"""
         with self.get_sync_session() as session:
@@ -515,6 +921,7 @@ class DatabaseManager:
             results = query.order_by(SectionModel.position).all()
             return [r.to_pydantic() for r in results]
 
+    @writes
     def update_section(self, section_id: int, **kwargs) -> bool:
         """Update section fields"""
         with self.get_sync_session() as session:
@@ -546,15 +953,17 @@ class DatabaseManager:
             ).order_by(TaskModel.id).all()
             return [r.to_pydantic() for r in results]
 
-    def get_sources_for_section(self, section_id: int) -> List[Source]:
-        """Get all sources linked to tasks in a section, ordered by position"""
+    def get_sources_for_section(self, section_id: int, include_content: bool = True) -> List[Source]:
+        """Get all sources linked to tasks in a section, ordered by position.
+
+        Without ``include_content`` the page text and extracted notes are
+        not loaded.
+        """
+        columns = _source_columns(include_content) + (task_source_association.c.task_id,)
+        if include_content:
+            columns += _NOTES_COLUMNS
         with self.get_sync_session() as session:
-            rows = session.query(
-                SourceModel,
-                task_source_association.c.task_id,
-                task_source_association.c.position,
-                task_source_association.c.extracted_content,
-            ).join(
+            rows = session.query(*columns).join(
                 task_source_association,
                 SourceModel.id == task_source_association.c.source_id
             ).join(
@@ -568,17 +977,11 @@ class DatabaseManager:
             ).all()
 
             # Deduplicate by source ID while preserving first appearance order.
-            by_source: Dict[int, Source] = {}
-            ordered_ids: List[int] = []
-            for source_model, task_id, _position, assoc_extracted in rows:
-                if source_model.id in by_source:
-                    continue
-                src = source_model.to_pydantic()
-                src.task_ids = [task_id] if task_id is not None else []
-                src.extracted_content = assoc_extracted
-                by_source[source_model.id] = src
-                ordered_ids.append(source_model.id)
-            return [by_source[sid] for sid in ordered_ids]
+            first_rows: Dict[int, Any] = {}
+            for row in rows:
+                first_rows.setdefault(row.id, row)
+            texts = self.blobs.load(session, _blob_refs(first_rows.values()))
+        return [_source_from_row(row, texts, task_ids=[row.task_id]) for row in first_rows.values()]
 
     # =========================================================================
     # SOURCE OPERATIONS
@@ -586,91 +989,226 @@ class DatabaseManager:
 
     def add_source(self, source: Source, task_id: int = None, position: int = 0) -> Source:
         """Add a new source, linking it to a task with a presentation position."""
+        self.add_sources_bulk(task_id, [(source, position)])
+        return self.get_source_by_url(source.url)
+
+    @writes
+    def add_sources_bulk(self, task_id: Optional[int],
+                         sources: List[Tuple[Source, int]]) -> List[int]:
+        """Add sources and link them to a task in one transaction.
+
+        ``sources`` is a list of (source, position) pairs. A URL that is
+        already stored keeps its row. A new fetch of the page (a newer
+        ``accessed_at``) refreshes its freshness and quality score, and its
+        text when that changed; reused stored copies carry the stored
+        ``accessed_at`` and leave the row untouched. An existing task link
+        takes the new position. Returns the source IDs in input order.
+        """
+        if not sources:
+            return []
+        now = datetime.now(timezone.utc)
+        urls = list(dict.fromkeys(source.url for source, _ in sources))
         with self.get_sync_session() as session:
-            # Check if source already exists
-            existing = session.query(SourceModel).filter(
-                SourceModel.url == source.url
-            ).first()
-
-            if existing:
-                # Link to task if provided (with position for citation ordering)
-                if task_id:
-                    assoc_exists = session.execute(
-                        task_source_association.select().where(
-                            task_source_association.c.task_id == task_id,
-                            task_source_association.c.source_id == existing.id,
-                        )
-                    ).first()
-                    if not assoc_exists:
-                        session.execute(
-                            task_source_association.insert().values(
-                                task_id=task_id,
-                                source_id=existing.id,
-                                position=position,
-                            )
-                        )
-                    elif assoc_exists.position != position:
-                        # Keep latest prompt ordering stable across retries/re-runs.
-                        session.execute(
-                            task_source_association.update().where(
-                                task_source_association.c.task_id == task_id,
-                                task_source_association.c.source_id == existing.id,
-                            ).values(position=position)
-                        )
-                    session.commit()
-                return existing.to_pydantic()
-
-            # Create new source
-            db_source = SourceModel(
-                url=source.url,
-                title=source.title,
-                domain=source.domain,
-                snippet=source.snippet,
-                full_content=source.full_content,
-                quality_score=source.quality_score,
-                is_academic=source.is_academic,
-                accessed_at=datetime.now(timezone.utc)
+            before = self._source_index_rows(session, urls)
+            content_refs = self._put_texts(session, [source.full_content for source, _ in sources])
+            stmt = sqlite_insert(SourceModel)
+            excluded = stmt.excluded
+            text_changed = or_(
+                excluded.full_content_hash.is_distinct_from(SourceModel.full_content_hash),
+                excluded.full_content.is_distinct_from(SourceModel.full_content),
             )
-            session.add(db_source)
-            session.flush()  # get the id before inserting association
+            session.execute(stmt.on_conflict_do_update(
+                index_elements=["url"],
+                set_={
+                    "full_content": case(
+                        (text_changed, excluded.full_content), else_=SourceModel.full_content
+                    ),
+                    "full_content_hash": case(
+                        (text_changed, excluded.full_content_hash), else_=SourceModel.full_content_hash
+                    ),
+                    "title": func.coalesce(func.nullif(excluded.title, ""), SourceModel.title),
+                    "snippet": func.coalesce(func.nullif(excluded.snippet, ""), SourceModel.snippet),
+                    "quality_score": excluded.quality_score,
+                    "accessed_at": excluded.accessed_at,
+                },
+                where=and_(
+                    or_(
+                        excluded.full_content_hash.isnot(None),
+                        func.coalesce(excluded.full_content, "") != "",
+                    ),
+                    or_(
+                        SourceModel.accessed_at.is_(None),
+                        excluded.accessed_at > SourceModel.accessed_at,
+                    ),
+                ),
+            ), [
+                {
+                    "url": source.url,
+                    "title": source.title,
+                    "domain": source.domain,
+                    "snippet": source.snippet,
+                    "full_content": None if ref else source.full_content,
+                    "full_content_hash": ref,
+                    "quality_score": source.quality_score,
+                    "is_academic": source.is_academic,
+                    "accessed_at": source.accessed_at or now,
+                }
+                for (source, _), ref in zip(sources, content_refs)
+            ])
+
+            after = self._source_index_rows(session, urls)
+            self._reindex_changed_sources(session, before, after, {
+                ref: source.full_content for (source, _), ref in zip(sources, content_refs) if ref
+            })
+            ids = {url: row.id for url, row in after.items()}
 
-            # Link to task with position
             if task_id:
-                session.execute(
-                    task_source_association.insert().values(
-                        task_id=task_id,
-                        source_id=db_source.id,
-                        position=position,
-                    )
-                )
-
+                # Keep latest prompt ordering stable across retries/re-runs
+                link = sqlite_insert(task_source_association)
+                session.execute(link.on_conflict_do_update(
+                    index_elements=["task_id", "source_id"],
+                    set_={"position": link.excluded.position},
+                    where=task_source_association.c.position.is_distinct_from(link.excluded.position),
+                ), [
+                    {"task_id": task_id, "source_id": ids[source.url], "position": position}
+                    for source, position in sources
+                ])
             session.commit()
-            session.refresh(db_source)
-            return db_source.to_pydantic()
-
-    def get_all_sources(self) -> List[Source]:
-        """Get all sources"""
+            return [ids[source.url] for source, _ in sources]
+
+    @staticmethod
+    def _source_index_rows(session, urls: List[str]) -> Dict[str, Any]:
+        """{url: (url, id, title, full_content, full_content_hash)} for stored ``urls``."""
+        rows: Dict[str, Any] = {}
+        for i in range(0, len(urls), 500):
+            for row in session.query(SourceModel.url, SourceModel.id, SourceModel.title, *_CONTENT_COLUMNS).filter(
+                SourceModel.url.in_(urls[i:i + 500])
+            ):
+                rows[row.url] = row
+        return rows
+
+    def _reindex_changed_sources(self, session, before: Dict[str, Any], after: Dict[str, Any],
+                                 written: Dict[str, str]) -> None:
+        """Re-index the sources whose title or page text differs between two snapshots.
+
+        ``written`` maps the blob hashes this write stored to their text, so
+        only page text being replaced is read back from the blob store.
+        """
+        changed = [(before.get(url), row) for url, row in after.items() if before.get(url) != row]
+        if not changed:
+            return
+        refs = {row.full_content_hash for pair in changed for row in pair if row is not None}
+        texts = self.blobs.load(session, refs - written.keys() - {None})
+        texts.update(written)
+        reindex_sources(session, [
+            (
+                new.id,
+                (old.title, _row_text(old, "full_content", texts)) if old is not None else None,
+                (new.title, _row_text(new, "full_content", texts)),
+            )
+            for old, new in changed
+        ])
+
+    def get_all_sources(self, include_content: bool = True) -> List[Source]:
+        """Get all sources, with their task IDs from one grouped query."""
+        columns = _source_columns(include_content)
+        if include_content:
+            columns += (SourceModel.extracted_content,)
         with self.get_sync_session() as session:
-            results = session.query(SourceModel).order_by(SourceModel.id).all()
-            return [r.to_pydantic() for r in results]
+            rows = session.query(*columns).order_by(SourceModel.id).all()
+            texts = self.blobs.load(session, _blob_refs(rows))
+            task_ids: Dict[int, List[int]] = {}
+            for source_id, task_id in session.query(
+                task_source_association.c.source_id, task_source_association.c.task_id
+            ).order_by(task_source_association.c.source_id, task_source_association.c.task_id):
+                task_ids.setdefault(source_id, []).append(task_id)
+        return [_source_from_row(row, texts, task_ids=task_ids.get(row.id, [])) for row in rows]
 
     def get_source_by_url(self, url: str) -> Optional[Source]:
         """Get a source by URL"""
         with self.get_sync_session() as session:
-            result = session.query(SourceModel).filter(
+            row = session.query(*_source_columns(True), SourceModel.extracted_content).filter(
                 SourceModel.url == url
             ).first()
-            return result.to_pydantic() if result else None
-
+            if row is None:
+                return None
+            texts = self.blobs.load(session, _blob_refs([row]))
+            task_ids = [task_id for (task_id,) in session.query(task_source_association.c.task_id).filter(
+                task_source_association.c.source_id == row.id
+            ).order_by(task_source_association.c.task_id)]
+        return _source_from_row(row, texts, task_ids=task_ids)
+
+    def get_fresh_sources(self, urls: List[str], max_age_hours: float) -> Dict[str, Source]:
+        """Return {url: Source} for stored pages fetched within ``max_age_hours``.
+
+        One query per 500 URLs. Only sources with stored full content are
+        returned; task links are not loaded.
+        """
+        urls = list(dict.fromkeys(u for u in urls if u))
+        if not urls or max_age_hours <= 0:
+            return {}
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=max_age_hours)
+        fresh: Dict[str, Source] = {}
+        with self.get_sync_session() as session:
+            for i in range(0, len(urls), 500):
+                rows = session.query(*_source_columns(True)).filter(
+                    SourceModel.url.in_(urls[i:i + 500]),
+                    SourceModel.accessed_at >= cutoff,
+                    or_(
+                        SourceModel.full_content_hash.isnot(None),
+                        and_(SourceModel.full_content.isnot(None), SourceModel.full_content != ""),
+                    ),
+                ).all()
+                texts = self.blobs.load(session, _blob_refs(rows))
+                for row in rows:
+                    fresh[row.url] = _source_from_row(row, texts)
+        return fresh
+
+    @writes
     def update_source_extraction(self, task_id: int, source_id: int, extracted_content: str):
         """Update extracted content for a task-source association row."""
+        self.update_extractions_bulk(task_id, {source_id: extracted_content})
+
+    @writes
+    def update_extractions_bulk(self, task_id: int, extractions: Dict[int, str]) -> None:
+        """Update extracted content for several of a task's sources ({source_id: text})."""
+        if not extractions:
+            return
+        assoc = task_source_association.c
         with self.get_sync_session() as session:
+            # Each source's notes from every task, to re-index them as one row
+            rows = session.query(assoc.source_id, assoc.task_id, *_NOTES_COLUMNS).filter(
+                assoc.source_id.in_(list(extractions))
+            ).order_by(assoc.source_id, assoc.task_id).all()
+            texts = self.blobs.load(session, _blob_refs(rows))
+            notes: Dict[int, List[Tuple[int, Optional[str]]]] = {}
+            for row in rows:
+                notes.setdefault(row.source_id, []).append(
+                    (row.task_id, _row_text(row, "extracted_content", texts))
+                )
+
+            refs = self._put_texts(session, list(extractions.values()))
             session.execute(
                 task_source_association.update().where(
                     task_source_association.c.task_id == task_id,
-                    task_source_association.c.source_id == source_id,
-                ).values(extracted_content=extracted_content)
+                    task_source_association.c.source_id == bindparam("b_source_id"),
+                ).values(
+                    extracted_content=bindparam("b_extracted"),
+                    extracted_hash=bindparam("b_hash"),
+                ),
+                [
+                    {"b_source_id": source_id, "b_extracted": None if ref else content, "b_hash": ref}
+                    for (source_id, content), ref in zip(extractions.items(), refs)
+                ],
             )
+            reindex_notes(session, [
+                (
+                    source_id,
+                    join_notes(n for _, n in notes.get(source_id, [])),
+                    join_notes(content if t == task_id else n for t, n in notes.get(source_id, [])),
+                )
+                for source_id, content in extractions.items()
+            ])
             session.commit()
 
     def get_processed_urls_by_task(self, session_id: int) -> Dict[int, set[str]]:
@@ -681,7 +1219,9 @@ class DatabaseManager:
                 TaskModel.id,
                 SourceModel.url,
                 task_source_association.c.extracted_content,
+                task_source_association.c.extracted_hash,
                 SourceModel.full_content,
+                SourceModel.full_content_hash,
                 SourceModel.snippet,
             ).join(
                 task_source_association,
@@ -693,10 +1233,13 @@ class DatabaseManager:
                 TaskModel.session_id == session_id
             ).all()
 
-            for task_id, url, assoc_extracted, full_content, snippet in rows:
+            for task_id, url, assoc_extracted, extracted_hash, full_content, content_hash, snippet in rows:
                 if not url:
                     continue
+                # Blobs only ever hold non-blank text
                 if any([
+                    extracted_hash is not None,
+                    content_hash is not None,
                     bool((assoc_extracted or "").strip()),
                     bool((full_content or "").strip()),
                     bool((snippet or "").strip()),
@@ -719,10 +1262,256 @@ class DatabaseManager:
                 ).scalar() or 0
             return session.query(func.count(SourceModel.id)).scalar() or 0
 
+    # =========================================================================
+    # EXTRACTION CACHE OPERATIONS
+    # =========================================================================
+
+    def get_cached_extraction(
+        self,
+        content_hash: str,
+        topic_key: str,
+        prompt_version: str,
+        topic_terms: Optional[set] = None,
+        min_similarity: Optional[float] = None,
+    ) -> Optional[tuple]:
+        """Look up a cached extraction.
+
+        Tries the exact (content, topic, prompt) key first. When
+        ``topic_terms`` and ``min_similarity`` are given, falls back to the
+        entry for the same content and prompt whose topic terms have the
+        highest Jaccard similarity at or above ``min_similarity``.
+
+        Returns (extracted_content, "exact" | "near") or None.
+        """
+        with self.get_sync_session() as session:
+            base = session.query(ExtractionCacheModel).filter(
+                ExtractionCacheModel.content_hash == content_hash,
+                ExtractionCacheModel.prompt_version == prompt_version,
+            )
+            match, kind = base.filter(ExtractionCacheModel.topic_key == topic_key).first(), "exact"
+
+            if match is None and topic_terms and min_similarity is not None:
+                best = 0.0
+                for row in base.all():
+                    terms = set(row.topic_terms.split())
+                    union = topic_terms | terms
+                    similarity = len(topic_terms & terms) / len(union) if union else 0.0
+                    if similarity >= min_similarity and similarity > best:
+                        match, kind, best = row, "near", similarity
+
+            if match is None:
+                return None
+            match_id, content = match.id, match.extracted_content
+        self._record_cache_hit(match_id)
+        return content, kind
+
+    @writes
+    def _record_cache_hit(self, entry_id: int) -> None:
+        with self.get_sync_session() as session:
+            session.query(ExtractionCacheModel).filter(
+                ExtractionCacheModel.id == entry_id
+            ).update({
+                ExtractionCacheModel.hit_count: func.coalesce(ExtractionCacheModel.hit_count, 0) + 1,
+                ExtractionCacheModel.last_used_at: datetime.now(timezone.utc),
+            }, synchronize_session=False)
+            session.commit()
+
+    @writes
+    def put_cached_extraction(
+        self,
+        content_hash: str,
+        topic_key: str,
+        prompt_version: str,
+        topic_terms: set,
+        extracted_content: str,
+    ) -> None:
+        """Store an extraction; an existing entry for the same key is replaced."""
+        with self.get_sync_session() as session:
+            now = datetime.now(timezone.utc)
+            stmt = sqlite_insert(ExtractionCacheModel).values(
+                content_hash=content_hash,
+                topic_key=topic_key,
+                prompt_version=prompt_version,
+                topic_terms=" ".join(sorted(topic_terms)),
+                extracted_content=extracted_content,
+                hit_count=0,
+                created_at=now,
+                last_used_at=now,
+            )
+            session.execute(stmt.on_conflict_do_update(
+                index_elements=["content_hash", "topic_key", "prompt_version"],
+                set_={
+                    "extracted_content": stmt.excluded.extracted_content,
+                    "topic_terms": stmt.excluded.topic_terms,
+                    "last_used_at": stmt.excluded.last_used_at,
+                },
+            ))
+            session.commit()
+
+    # =========================================================================
+    # TASK CHECKPOINT OPERATIONS
+    # =========================================================================
+
+    @writes
+    def save_task_checkpoint(self, task_id: int, step: str, payload: Any) -> None:
+        """Record a completed research step (JSON-serializable payload); replaces any previous one."""
+        with self.get_sync_session() as session:
+            stmt = sqlite_insert(TaskCheckpointModel).values(
+                task_id=task_id,
+                step=step,
+                payload_json=json.dumps(payload),
+                updated_at=datetime.now(timezone.utc),
+            )
+            session.execute(stmt.on_conflict_do_update(
+                index_elements=["task_id", "step"],
+                set_={
+                    "payload_json": stmt.excluded.payload_json,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            ))
+            session.commit()
+
+    def get_task_checkpoints(self, task_id: int) -> Dict[str, Any]:
+        """Return {step: payload} for every checkpointed step of a task."""
+        with self.get_sync_session() as session:
+            rows = session.query(TaskCheckpointModel).filter(
+                TaskCheckpointModel.task_id == task_id
+            ).all()
+            return {r.step: json.loads(r.payload_json) for r in rows}
+
+    @writes
+    def clear_task_checkpoints(self, task_id: int) -> int:
+        """Delete a task's checkpoints. Returns the number removed."""
+        with self.get_sync_session() as session:
+            removed = session.query(TaskCheckpointModel).filter(
+                TaskCheckpointModel.task_id == task_id
+            ).delete(synchronize_session=False)
+            session.commit()
+            return removed
+
+    # =========================================================================
+    # RUN QUEUE OPERATIONS
+    # =========================================================================
+
+    @writes
+    def enqueue_run(self, run: QueuedRun) -> QueuedRun:
+        """Add a run to the queue (status QUEUED)."""
+        with self.get_sync_session() as session:
+            db_run = RunQueueModel(**run.model_dump(exclude_none=True))
+            session.add(db_run)
+            session.commit()
+            session.refresh(db_run)
+            return db_run.to_pydantic()
+
+    def get_queued_run(self, run_id: str) -> Optional[QueuedRun]:
+        with self.get_sync_session() as session:
+            result = session.query(RunQueueModel).filter(RunQueueModel.id == run_id).first()
+            return result.to_pydantic() if result else None
+
+    def get_active_queued_runs(self) -> List[QueuedRun]:
+        """Queued and running entries, oldest first."""
+        with self.get_sync_session() as session:
+            rows = session.query(RunQueueModel).filter(
+                RunQueueModel.status.in_([QueueStatus.QUEUED.value, QueueStatus.RUNNING.value])
+            ).order_by(RunQueueModel.created_at.asc()).all()
+            return [r.to_pydantic() for r in rows]
+
+    def count_queued_runs(self) -> int:
+        with self.get_sync_session() as session:
+            return session.query(func.count(RunQueueModel.id)).filter(
+                RunQueueModel.status == QueueStatus.QUEUED.value
+            ).scalar() or 0
+
+    @writes
+    def update_queued_run(self, run_id: str, **kwargs) -> bool:
+        with self.get_sync_session() as session:
+            result = session.query(RunQueueModel).filter(
+                RunQueueModel.id == run_id
+            ).update(kwargs)
+            session.commit()
+            return result > 0
+
+    @writes
+    def claim_queued_run(self, run_id: str, owner: str) -> bool:
+        """Move a QUEUED entry to RUNNING under ``owner``.
+
+        A conditional UPDATE, so when several dispatchers share the
+        database exactly one of them wins the run.
+        """
+        now = datetime.now(timezone.utc)
+        with self.get_sync_session() as session:
+            won = session.query(RunQueueModel).filter(
+                RunQueueModel.id == run_id,
+                RunQueueModel.status == QueueStatus.QUEUED.value,
+            ).update({
+                RunQueueModel.status: QueueStatus.RUNNING.value,
+                RunQueueModel.owner: owner,
+                RunQueueModel.started_at: now,
+                RunQueueModel.heartbeat_at: now,
+            }, synchronize_session=False)
+            session.commit()
+            return won > 0
+
+    @writes
+    def cancel_queued_run(self, run_id: str) -> bool:
+        """Drop a run that has not been admitted yet. False if it already started."""
+        with self.get_sync_session() as session:
+            won = session.query(RunQueueModel).filter(
+                RunQueueModel.id == run_id,
+                RunQueueModel.status == QueueStatus.QUEUED.value,
+            ).update({
+                RunQueueModel.status: QueueStatus.CANCELLED.value,
+                RunQueueModel.ended_at: datetime.now(timezone.utc),
+            }, synchronize_session=False)
+            session.commit()
+            return won > 0
+
+    def finish_queued_run(self, run_id: str, status: str, session_id: int = None,
+                          error_message: str = None) -> bool:
+        values = {"status": status, "ended_at": datetime.now(timezone.utc)}
+        if session_id is not None:
+            values["session_id"] = session_id
+        if error_message is not None:
+            values["error_message"] = error_message
+        return self.update_queued_run(run_id, **values)
+
+    @writes
+    def renew_queued_runs(self, owner: str) -> int:
+        """Heartbeat every RUNNING entry admitted by ``owner``."""
+        with self.get_sync_session() as session:
+            renewed = session.query(RunQueueModel).filter(
+                RunQueueModel.owner == owner,
+                RunQueueModel.status == QueueStatus.RUNNING.value,
+            ).update({
+                RunQueueModel.heartbeat_at: datetime.now(timezone.utc),
+            }, synchronize_session=False)
+            session.commit()
+            return renewed
+
+    @writes
+    def interrupt_stale_queued_runs(self, stale_seconds: int) -> int:
+        """Mark RUNNING entries whose dispatcher stopped heartbeating as INTERRUPTED.
+
+        Their sessions can be resumed. Returns the number of entries marked.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=stale_seconds)
+        with self.get_sync_session() as session:
+            marked = session.query(RunQueueModel).filter(
+                RunQueueModel.status == QueueStatus.RUNNING.value,
+                RunQueueModel.heartbeat_at < cutoff,
+            ).update({
+                RunQueueModel.status: QueueStatus.INTERRUPTED.value,
+                RunQueueModel.ended_at: datetime.now(timezone.utc),
+                RunQueueModel.error_message: "Dispatcher stopped responding",
+            }, synchronize_session=False)
+            session.commit()
+            return marked
+
     # =========================================================================
     # GLOSSARY OPERATIONS
     # =========================================================================
 
+    @writes
     def add_glossary_term(self, term: GlossaryTerm, session_id: int = None) -> GlossaryTerm:
         """Add a glossary term"""
         with self.get_sync_session() as session:
@@ -764,14 +1553,34 @@ class DatabaseManager:
     # =========================================================================
 
     def add_run_event(self, **kwargs) -> None:
-        """Insert a run event (query, result, phase_changed, etc.)."""
+        """Record a run event (query, result, phase_changed, etc.).
+
+        Buffered for a batched write unless batching is off; events in
+        ``SYNC_EVENT_TYPES`` are written (with everything before them)
+        before this returns. ``created_at`` is the time of the call.
+        """
+        kwargs.setdefault("created_at", datetime.now(timezone.utc))
+        if self.event_writer is None:
+            self._write_run_events([kwargs])
+            return
+        self.event_writer.put(kwargs)
+        if kwargs.get("event_type") in SYNC_EVENT_TYPES:
+            self.event_writer.flush()
+
+    def flush_run_events(self) -> None:
+        """Write every buffered run event now."""
+        if self.event_writer is not None:
+            self.event_writer.flush()
+
+    @writes
+    def _write_run_events(self, rows: List[Dict[str, Any]]) -> None:
         with self.get_sync_session() as session:
-            event = RunEventModel(**kwargs)
-            session.add(event)
+            session.execute(insert(RunEventModel), rows)
             session.commit()
 
     def get_run_events(self, session_id: int) -> List[RunEventModel]:
         """Get all run events for a session, ordered by created_at."""
+        self.flush_run_events()
         with self.get_sync_session() as session:
             return session.query(RunEventModel).filter(
                 RunEventModel.session_id == session_id
@@ -788,6 +1597,7 @@ class DatabaseManager:
 
         Leverages the ix_run_events_timeline index for efficient paging.
         """
+        self.flush_run_events()
         with self.get_sync_session() as session:
             query = session.query(RunEventModel).filter(
                 RunEventModel.session_id == session_id
@@ -812,6 +1622,7 @@ class DatabaseManager:
         These are results that were quality-rejected during scraping/filtering.
         Returns list of dicts with url, title, snippet, quality_score, task_id, query_group.
         """
+        self.flush_run_events()
         with self.get_sync_session() as session:
             # Get all source URLs for this session
             source_urls = set()
@@ -850,6 +1661,7 @@ class DatabaseManager:
 
     def get_run_queries_by_task(self, session_id: int) -> Dict[int, List[Dict]]:
         """Return {task_id: [{query_text, query_group}, ...]} for query events in a session."""
+        self.flush_run_events()
         result: Dict[int, List[Dict]] = {}
         with self.get_sync_session() as session:
             events = session.query(RunEventModel).filter(
@@ -864,26 +1676,245 @@ class DatabaseManager:
                 })
         return result
 
+    # =========================================================================
+    # BLOB STORE
+    # =========================================================================
+
+    def _put_texts(self, session, texts: List[Optional[str]]) -> List[Optional[str]]:
+        """Blob hashes for ``texts`` (None: keep inline), storing new blobs in ``session``."""
+        if not self.blob_store:
+            return [None] * len(texts)
+        return self.blobs.put(session, texts)
+
+    def migrate_content_to_blobs(self, batch_size: int = 500) -> Dict[str, int]:
+        """Move inline page text and extracted notes into the blob store.
+
+        Converts rows written before the blob store (or with it turned off),
+        one transaction per batch so other writes interleave. Returns the
+        number of sources and notes moved.
+        """
+        moved = {"sources": 0, "notes": 0}
+        while n := self._move_source_content(batch_size):
+            moved["sources"] += n
+        while n := self._move_notes(batch_size):
+            moved["notes"] += n
+        return moved
+
+    @writes
+    def _move_source_content(self, batch_size: int) -> int:
+        with self.get_sync_session() as session:
+            rows = session.query(SourceModel.id, SourceModel.full_content).filter(
+                SourceModel.full_content_hash.is_(None),
+                func.trim(func.coalesce(SourceModel.full_content, "")) != "",
+            ).limit(batch_size).all()
+            if not rows:
+                return 0
+            refs = self.blobs.put(session, [content for _, content in rows])
+            session.execute(
+                SourceModel.__table__.update().where(
+                    SourceModel.id == bindparam("b_id")
+                ).values(full_content=None, full_content_hash=bindparam("b_hash")),
+                [{"b_id": source_id, "b_hash": ref} for (source_id, _), ref in zip(rows, refs)],
+            )
+            session.commit()
+            return len(rows)
+
+    @writes
+    def _move_notes(self, batch_size: int) -> int:
+        assoc = task_source_association.c
+        with self.get_sync_session() as session:
+            rows = session.query(assoc.task_id, assoc.source_id, assoc.extracted_content).filter(
+                assoc.extracted_hash.is_(None),
+                func.trim(func.coalesce(assoc.extracted_content, "")) != "",
+            ).limit(batch_size).all()
+            if not rows:
+                return 0
+            refs = self.blobs.put(session, [content for _, _, content in rows])
+            session.execute(
+                task_source_association.update().where(
+                    assoc.task_id == bindparam("b_task_id"),
+                    assoc.source_id == bindparam("b_source_id"),
+                ).values(extracted_content=None, extracted_hash=bindparam("b_hash")),
+                [
+                    {"b_task_id": task_id, "b_source_id": source_id, "b_hash": ref}
+                    for (task_id, source_id, _), ref in zip(rows, refs)
+                ],
+            )
+            session.commit()
+            return len(rows)
+
+    @writes
+    def prune_blobs(self) -> int:
+        """Delete blobs no row references any more (e.g. replaced page text)."""
+        with self.get_sync_session() as session:
+            referenced = select(SourceModel.full_content_hash).where(
+                SourceModel.full_content_hash.isnot(None)
+            ).union(
+                select(task_source_association.c.extracted_hash).where(
+                    task_source_association.c.extracted_hash.isnot(None)
+                )
+            )
+            deleted = session.query(BlobModel).filter(
+                BlobModel.hash.not_in(referenced)
+            ).delete(synchronize_session=False)
+            session.commit()
+            return deleted
+
+    @writes
+    def rebuild_corpus_index(self) -> None:
+        """Re-index the whole corpus from the stored text.
+
+        Picks up source and notes writes made outside DatabaseManager,
+        which do not update the full-text index.
+        """
+        with self.get_sync_session() as session:
+            for statement in CORPUS_REBUILD:
+                session.execute(text(statement))
+            session.commit()
+
+    @writes
+    def vacuum(self) -> None:
+        """Rebuild the database file to return freed pages to the filesystem."""
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text("VACUUM"))
+
+    # =========================================================================
+    # FULL-TEXT SEARCH
+    # =========================================================================
+
+    def search_corpus(
+        self, query: str, session_id: int = None, limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """Search gathered sources and synthesized sections, best match first.
+
+        Every word of ``query`` must appear: in a source's title, page text
+        or notes, or in a section. Each index is ranked by BM25, with title
+        matches weighted over notes and notes over page text; a source's
+        score adds up its page and notes matches. BM25 scores of sources
+        and sections are not comparable (different corpus statistics and
+        column weights), so each list is min-max scaled to a 0-1 ``score``
+        (higher is better) before the merge; the raw value is kept as
+        ``bm25``. Results carry a snippet with the matched words in
+        [brackets]. ``session_id`` limits results to that session's sources
+        and sections.
+        """
+        terms = match_terms(query)
+        if not terms or limit <= 0:
+            return []
+        params = {"match": " ".join(terms), "any": " OR ".join(terms),
+                  "session_id": session_id, "limit": limit}
+        params.update({f"t{i}": term for i, term in enumerate(terms)})
+        # Page text and notes are separate indexes; a source matches when
+        # each word is in one or the other
+        matched = " INTERSECT ".join(
+            f"""SELECT id FROM (
+                    SELECT rowid AS id FROM sources_fts WHERE sources_fts MATCH :t{i}
+                    UNION SELECT rowid FROM notes_fts WHERE notes_fts MATCH :t{i}
+                )"""
+            for i in range(len(terms))
+        )
+        source_scope = section_scope = ""
+        if session_id is not None:
+            source_scope = """
+                AND s.id IN (
+                    SELECT a.source_id FROM task_source_association a
+                    JOIN tasks t ON t.id = a.task_id
+                    WHERE t.session_id = :session_id
+                )"""
+            section_scope = "AND sec.session_id = :session_id"
+
+        with self.get_sync_session() as session:
+            sources = session.execute(text(f"""
+                WITH matched(id) AS ({matched}),
+                page AS (
+                    SELECT rowid AS id, bm25(sources_fts, 10.0, 1.0) AS rank,
+                           snippet(sources_fts, -1, '[', ']', '…', 16) AS snip
+                    FROM sources_fts
+                    WHERE sources_fts MATCH :any AND rowid IN (SELECT id FROM matched)
+                ),
+                notes AS (
+                    SELECT rowid AS id, bm25(notes_fts, 4.0) AS rank,
+                           snippet(notes_fts, 0, '[', ']', '…', 16) AS snip
+                    FROM notes_fts
+                    WHERE notes_fts MATCH :any AND rowid IN (SELECT id FROM matched)
+                )
+                SELECT s.id, s.title, s.url,
+                       CASE WHEN p.rank IS NULL OR n.rank < p.rank THEN n.snip ELSE p.snip END,
+                       COALESCE(p.rank, 0.0) + COALESCE(n.rank, 0.0) AS score
+                FROM matched m
+                JOIN sources s ON s.id = m.id
+                LEFT JOIN page p ON p.id = m.id
+                LEFT JOIN notes n ON n.id = m.id
+                WHERE 1 = 1 {source_scope}
+                ORDER BY score LIMIT :limit
+            """), params).all()
+            sections = session.execute(text(f"""
+                SELECT f.rowid, sec.title, sec.session_id,
+                       snippet(sections_fts, -1, '[', ']', '…', 16),
+                       bm25(sections_fts, 10.0, 1.0) AS score
+                FROM sections_fts f JOIN sections sec ON sec.id = f.rowid
+                WHERE sections_fts MATCH :match {section_scope}
+                ORDER BY score LIMIT :limit
+            """), params).all()
+
+        results = _scaled_scores([
+            {"kind": "source", "id": id_, "title": title, "url": url,
+             "session_id": None, "snippet": snip, "bm25": score}
+            for id_, title, url, snip, score in sources
+        ]) + _scaled_scores([
+            {"kind": "section", "id": id_, "title": title, "url": None,
+             "session_id": sid, "snippet": snip, "bm25": score}
+            for id_, title, sid, snip, score in sections
+        ])
+        results.sort(key=lambda r: -r["score"])
+        return results[:limit]
+
     # =========================================================================
     # STATISTICS
     # =========================================================================
 
     def get_statistics(self, session_id: int = None) -> Dict[str, Any]:
-        """Get research statistics, optionally scoped to a session"""
+        """Get research statistics, optionally scoped to a session.
+
+        A session's statistics are its trigger-maintained ``session_stats``
+        row; database-wide statistics are one aggregate query.
+        """
         if session_id is not None:
-            glossary_count = len(self.get_glossary_terms_for_session(session_id))
-        else:
-            glossary_count = len(self.get_all_glossary_terms())
+            return self.get_statistics_by_session([session_id])[session_id]
+        with self.get_sync_session() as session:
+            row = session.query(
+                func.count(TaskModel.id),
+                func.sum(case((TaskModel.status == TaskStatus.PENDING.value, 1), else_=0)),
+                func.sum(case((TaskModel.status == TaskStatus.COMPLETED.value, 1), else_=0)),
+                func.sum(case((TaskModel.status == TaskStatus.FAILED.value, 1), else_=0)),
+                func.sum(case(
+                    (TaskModel.status == TaskStatus.COMPLETED.value, TaskModel.word_count), else_=0
+                )),
+                select(func.count(SourceModel.id)).scalar_subquery(),
+                select(func.count(GlossaryModel.id)).scalar_subquery(),
+            ).one()
+        total, pending, completed, failed, words, sources, glossary = row
         return {
-            "total_tasks": self.get_task_count(session_id=session_id),
-            "pending_tasks": self.get_task_count(TaskStatus.PENDING, session_id=session_id),
-            "completed_tasks": self.get_task_count(TaskStatus.COMPLETED, session_id=session_id),
-            "failed_tasks": self.get_task_count(TaskStatus.FAILED, session_id=session_id),
-            "total_sources": self.get_source_count(session_id=session_id),
-            "total_words": self.get_total_word_count(session_id=session_id),
-            "glossary_terms": glossary_count
+            "total_tasks": total or 0,
+            "pending_tasks": pending or 0,
+            "completed_tasks": completed or 0,
+            "failed_tasks": failed or 0,
+            "total_sources": sources or 0,
+            "total_words": words or 0,
+            "glossary_terms": glossary or 0,
         }
 
+    def get_statistics_by_session(self, session_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Statistics for several sessions in one query, keyed by session ID."""
+        with self.get_sync_session() as session:
+            rows = session.query(SessionStatsModel).filter(
+                SessionStatsModel.session_id.in_(session_ids)
+            ).all()
+            found = {r.session_id: r.to_dict() for r in rows}
+        # Sessions without tasks or terms have no counters row yet
+        empty = dict.fromkeys(SessionStatsModel().to_dict(), 0)
+        return {sid: found.get(sid, dict(empty)) for sid in session_ids}
+
     # =========================================================================
     # SESSION LISTING & SOURCE SCOPING
     # =========================================================================
@@ -904,35 +1935,41 @@ class DatabaseManager:
             ).first()
             return result.to_pydantic() if result else None
 
-    def get_sources_for_task(self, task_id: int) -> List[Source]:
+    def get_session_durations(self, limit: int = 20) -> List[float]:
+        """Run time in seconds of the most recently completed sessions."""
+        with self.get_sync_session() as session:
+            rows = session.query(SessionModel).filter(
+                SessionModel.status == 'completed',
+                SessionModel.ended_at != None,  # noqa: E711
+            ).order_by(SessionModel.ended_at.desc()).limit(limit).all()
+            return [
+                (r.ended_at - r.started_at).total_seconds()
+                for r in rows
+                if r.started_at and r.ended_at >= r.started_at
+            ]
+
+    def get_sources_for_task(self, task_id: int, include_content: bool = True) -> List[Source]:
         """Get sources linked to a specific task, ordered by presentation position."""
+        columns = _source_columns(include_content)
+        if include_content:
+            columns += _NOTES_COLUMNS
         with self.get_sync_session() as session:
-            rows = session.query(
-                SourceModel,
-                task_source_association.c.extracted_content,
-            ).join(
+            rows = session.query(*columns).join(
                 task_source_association,
                 SourceModel.id == task_source_association.c.source_id
             ).filter(
                 task_source_association.c.task_id == task_id
             ).order_by(task_source_association.c.position).all()
+            texts = self.blobs.load(session, _blob_refs(rows))
+        return [_source_from_row(row, texts, task_ids=[task_id]) for row in rows]
 
-            sources: List[Source] = []
-            for source_model, assoc_extracted in rows:
-                src = source_model.to_pydantic()
-                src.task_ids = [task_id]
-                src.extracted_content = assoc_extracted
-                sources.append(src)
-            return sources
-
-    def get_sources_for_session(self, session_id: int) -> List[Source]:
+    def get_sources_for_session(self, session_id: int, include_content: bool = True) -> List[Source]:
         """Get sources linked to tasks in a specific session"""
+        columns = _source_columns(include_content) + (task_source_association.c.task_id,)
+        if include_content:
+            columns += _NOTES_COLUMNS
         with self.get_sync_session() as session:
-            rows = session.query(
-                SourceModel,
-                task_source_association.c.task_id,
-                task_source_association.c.extracted_content,
-            ).join(
+            rows = session.query(*columns).join(
                 task_source_association,
                 SourceModel.id == task_source_association.c.source_id
             ).join(
@@ -941,21 +1978,15 @@ class DatabaseManager:
             ).filter(
                 TaskModel.session_id == session_id
             ).order_by(SourceModel.id, task_source_association.c.task_id).all()
-
-            by_source: Dict[int, Source] = {}
-            ordered_ids: List[int] = []
-            for source_model, task_id, assoc_extracted in rows:
-                if source_model.id not in by_source:
-                    src = source_model.to_pydantic()
-                    src.task_ids = []
-                    src.extracted_content = None
-                    by_source[source_model.id] = src
-                    ordered_ids.append(source_model.id)
-
-                src = by_source[source_model.id]
-                if task_id is not None and task_id not in src.task_ids:
-                    src.task_ids.append(task_id)
-                if not src.extracted_content and assoc_extracted:
-                    src.extracted_content = assoc_extracted
-
-            return [by_source[sid] for sid in ordered_ids]
+            texts = self.blobs.load(session, _blob_refs(rows))
+
+        by_source: Dict[int, Source] = {}
+        for row in rows:
+            src = by_source.get(row.id)
+            if src is None:
+                src = by_source[row.id] = _source_from_row(row, texts, task_ids=[])
+            if row.task_id not in src.task_ids:
+                src.task_ids.append(row.task_id)
+            if include_content and not src.extracted_content:
+                src.extracted_content = _row_text(row, "extracted_content", texts)
+        return list(by_source.values())
@@ -3,13 +3,13 @@ from datetime import datetime, timezone
 
 from sqlalchemy import (
     Column, Integer, String, Text, Float, Boolean,
-    DateTime, ForeignKey, Index, Table
+    DateTime, ForeignKey, Index, LargeBinary, Table
 )
 from sqlalchemy.orm import declarative_base, relationship, backref
 
 from src.config.types import (
     TaskStatus, SectionStatus, ResearchTask, ReportSection,
-    Source, GlossaryTerm, ResearchSession
+    GlossaryTerm, ResearchSession, QueuedRun
 )
 
 Base = declarative_base()
@@ -23,6 +23,9 @@ task_source_association = Table(
     Column('source_id', Integer, ForeignKey('sources.id'), primary_key=True),
     Column('position', Integer, default=0),
     Column('extracted_content', Text, nullable=True),
+    Column('extracted_hash', String(64), nullable=True),  # blobs.hash of the notes
+    # The primary key serves task -> sources; this serves source -> tasks
+    Index('ix_task_source_source', 'source_id', 'task_id'),
 )
 
 
@@ -44,9 +47,20 @@ class TaskModel(Base):
     citation_count = Column(Integer, default=0)
     is_gap_fill = Column(Boolean, default=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    started_at = Column(DateTime, nullable=True)
     completed_at = Column(DateTime, nullable=True)
     error_message = Column(Text, nullable=True)
     retry_count = Column(Integer, default=0)
+    lease_owner = Column(String(100), nullable=True)  # worker holding the claim
+    lease_expires_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Claim order within a session: get_next_task(s), per-status counts
+        Index('ix_tasks_session_next', 'session_id', 'status', priority.desc(), 'depth', 'id'),
+        Index('ix_tasks_status_completed', 'status', 'completed_at'),
+        Index('ix_tasks_section', 'section_id'),
+        Index('ix_tasks_lease_owner', 'lease_owner'),
+    )
 
     # Relationships
     children = relationship("TaskModel", backref=backref("parent", remote_side="TaskModel.id"), foreign_keys=[parent_id])
@@ -68,6 +82,7 @@ class TaskModel(Base):
             citation_count=self.citation_count,
             is_gap_fill=self.is_gap_fill or False,
             created_at=self.created_at,
+            started_at=self.started_at,
             completed_at=self.completed_at,
             error_message=self.error_message,
             retry_count=self.retry_count or 0
@@ -85,6 +100,7 @@ class SourceModel(Base):
     snippet = Column(Text, nullable=True)
     # Retained for debugging and potential future re-synthesis of sections
     full_content = Column(Text, nullable=True)
+    full_content_hash = Column(String(64), nullable=True)  # blobs.hash when stored as a blob
     extracted_content = Column(Text, nullable=True)
     quality_score = Column(Float, default=0.5)
     is_academic = Column(Boolean, default=False)
@@ -93,21 +109,6 @@ class SourceModel(Base):
     # Relationships
     tasks = relationship("TaskModel", secondary=task_source_association, back_populates="sources")
 
-    def to_pydantic(self) -> Source:
-        return Source(
-            id=self.id,
-            url=self.url,
-            title=self.title,
-            domain=self.domain,
-            snippet=self.snippet,
-            full_content=self.full_content,
-            extracted_content=self.extracted_content,
-            quality_score=self.quality_score,
-            is_academic=self.is_academic,
-            accessed_at=self.accessed_at,
-            task_ids=[t.id for t in self.tasks]
-        )
-
 
 class GlossaryModel(Base):
     """SQLAlchemy model for glossary terms"""
@@ -119,6 +120,10 @@ class GlossaryModel(Base):
     first_occurrence_task_id = Column(Integer, ForeignKey('tasks.id'), nullable=True)
     session_id = Column(Integer, ForeignKey('sessions.id'), nullable=True)
 
+    __table_args__ = (
+        Index('ix_glossary_session', 'session_id', 'term'),
+    )
+
     def to_pydantic(self) -> GlossaryTerm:
         return GlossaryTerm(
             id=self.id,
@@ -153,6 +158,50 @@ class RunEventModel(Base):
     )
 
 
+class ExtractionCacheModel(Base):
+    """Reusable per-source LLM extractions, shared across tasks and sessions.
+
+    Keyed by the hash of the content sent to the extractor, a fingerprint
+    of the normalized task topic/description and the extraction prompt
+    version. ``topic_terms`` keeps the normalized term set for near-topic
+    matching.
+    """
+    __tablename__ = 'extraction_cache'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    content_hash = Column(String(64), nullable=False)
+    topic_key = Column(String(64), nullable=False)
+    prompt_version = Column(String(64), nullable=False)
+    topic_terms = Column(Text, nullable=False, default='')
+    extracted_content = Column(Text, nullable=False)
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    last_used_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        Index('ux_extraction_cache_key', 'content_hash', 'topic_key', 'prompt_version', unique=True),
+    )
+
+
+class TaskCheckpointModel(Base):
+    """Completed steps of an unfinished research task (queries, one row per
+    query's search results, the gathered and gap-fill source IDs, draft), so
+    a retry or resume continues from the first incomplete step. Cleared when
+    the task completes.
+    """
+    __tablename__ = 'task_checkpoints'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    task_id = Column(Integer, ForeignKey('tasks.id'), nullable=False)
+    step = Column(String(50), nullable=False)
+    payload_json = Column(Text, nullable=False)
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+    __table_args__ = (
+        Index('ux_task_checkpoints_step', 'task_id', 'step', unique=True),
+    )
+
+
 class SectionModel(Base):
     """SQLAlchemy model for report sections"""
     __tablename__ = 'sections'
@@ -170,6 +219,10 @@ class SectionModel(Base):
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     synthesized_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        Index('ix_sections_session', 'session_id', 'position'),
+    )
+
     def to_pydantic(self) -> ReportSection:
         return ReportSection(
             id=self.id,
@@ -207,6 +260,12 @@ class SessionModel(Base):
     refined_brief = Column(Text, nullable=True)
     refinement_qa = Column(Text, nullable=True)
     cancel_requested_at = Column(DateTime, nullable=True)
+    executor = Column(String(20), nullable=True)  # research.executor the run was started with
+
+    __table_args__ = (
+        Index('ix_sessions_status_started', 'status', 'started_at'),
+        Index('ix_sessions_started', 'started_at'),
+    )
 
     def to_pydantic(self) -> ResearchSession:
         return ResearchSession(
@@ -226,4 +285,103 @@ class SessionModel(Base):
             refined_brief=self.refined_brief,
             refinement_qa=self.refinement_qa,
             cancel_requested_at=self.cancel_requested_at,
+            executor=self.executor,
+        )
+
+
+class SessionStatsModel(Base):
+    """Running per-session totals behind ``get_statistics``.
+
+    Maintained by SQLite triggers on tasks, task_source_association and
+    glossary (see ``session_stats.py``), inside the transaction of the write
+    that changes them, so reading a session's statistics is one row lookup.
+    """
+    __tablename__ = 'session_stats'
+
+    session_id = Column(Integer, ForeignKey('sessions.id'), primary_key=True)
+    total_tasks = Column(Integer, nullable=False, default=0, server_default='0')
+    pending_tasks = Column(Integer, nullable=False, default=0, server_default='0')
+    completed_tasks = Column(Integer, nullable=False, default=0, server_default='0')
+    failed_tasks = Column(Integer, nullable=False, default=0, server_default='0')
+    total_words = Column(Integer, nullable=False, default=0, server_default='0')
+    total_sources = Column(Integer, nullable=False, default=0, server_default='0')
+    glossary_terms = Column(Integer, nullable=False, default=0, server_default='0')
+
+    def to_dict(self) -> dict:
+        return {
+            "total_tasks": self.total_tasks,
+            "pending_tasks": self.pending_tasks,
+            "completed_tasks": self.completed_tasks,
+            "failed_tasks": self.failed_tasks,
+            "total_sources": self.total_sources,
+            "total_words": self.total_words,
+            "glossary_terms": self.glossary_terms,
+        }
+
+
+class BlobModel(Base):
+    """Compressed text stored once per distinct content (see ``blobs.py``)."""
+    __tablename__ = 'blobs'
+
+    hash = Column(String(64), primary_key=True)  # SHA-256 of the UTF-8 text
+    codec = Column(String(10), nullable=False)
+    size = Column(Integer, nullable=False)  # uncompressed bytes
+    data = Column(LargeBinary, nullable=False)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+
+class RunQueueModel(Base):
+    """Research runs waiting for (or holding) a run slot.
+
+    Durable, so queued runs survive a restart and several processes sharing
+    the database admit from one queue. ``heartbeat_at`` is renewed by the
+    admitting dispatcher while the run executes.
+    """
+    __tablename__ = 'run_queue'
+
+    id = Column(String(32), primary_key=True)
+    query = Column(Text, nullable=False)
+    user = Column(String(100), nullable=False, default='anonymous')
+    priority = Column(Integer, default=0)
+    mode = Column(String(50), nullable=True)
+    overrides_json = Column(Text, nullable=True)
+    refined_brief = Column(Text, nullable=True)
+    refinement_qa = Column(Text, nullable=True)
+    est_llm_calls = Column(Integer, default=0)
+    est_search_calls = Column(Integer, default=0)
+    est_cost = Column(Float, default=0.0)
+    status = Column(String(20), default='queued')
+    session_id = Column(Integer, ForeignKey('sessions.id'), nullable=True)
+    owner = Column(String(100), nullable=True)
+    error_message = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    started_at = Column(DateTime, nullable=True)
+    ended_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('ix_run_queue_status', 'status', 'created_at'),
+    )
+
+    def to_pydantic(self) -> QueuedRun:
+        return QueuedRun(
+            id=self.id,
+            query=self.query,
+            user=self.user,
+            priority=self.priority or 0,
+            mode=self.mode,
+            overrides_json=self.overrides_json,
+            refined_brief=self.refined_brief,
+            refinement_qa=self.refinement_qa,
+            est_llm_calls=self.est_llm_calls or 0,
+            est_search_calls=self.est_search_calls or 0,
+            est_cost=self.est_cost or 0.0,
+            status=self.status,
+            session_id=self.session_id,
+            owner=self.owner,
+            error_message=self.error_message,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            ended_at=self.ended_at,
+            heartbeat_at=self.heartbeat_at,
         )
@@ -0,0 +1,154 @@
+"""Triggers that keep the ``session_stats`` counters current.
+
+Session statistics used to be recomputed on every call: per-status task
+counts, a distinct-source join, a word sum and a glossary listing. The
+orchestrator asks after every research loop and the dashboard on every
+poll. Instead each session has one ``session_stats`` row, and these
+triggers adjust it whenever a task is added, changes status, word count or
+session, a source is linked to or unlinked from a session's task, or a
+glossary term is added or removed. Triggers run inside the writing
+statement's transaction, so the counters commit or roll back with the
+change and cover every write path, including bulk updates.
+
+Counted the same way as the queries they replace: words are summed over
+completed tasks only, and a source linked to several tasks of one session
+counts once. Moving a task to another session moves its task counters but
+not its sources; no code path does that.
+"""
+
+# Change in each counter when a task row enters (+) or leaves (-) a session
+_TASK_COUNTERS = """
+    total_tasks = total_tasks {op} 1,
+    pending_tasks = pending_tasks {op} ({row}.status IS 'pending'),
+    completed_tasks = completed_tasks {op} ({row}.status IS 'completed'),
+    failed_tasks = failed_tasks {op} ({row}.status IS 'failed'),
+    total_words = total_words {op} CASE WHEN {row}.status IS 'completed'
+                                        THEN COALESCE({row}.word_count, 0) ELSE 0 END
+"""
+
+
+def _ensure_row(session_expr: str) -> str:
+    return (
+        f"INSERT OR IGNORE INTO session_stats (session_id) "
+        f"SELECT {session_expr} WHERE {session_expr} IS NOT NULL;"
+    )
+
+
+def _add_task(row: str) -> str:
+    return (
+        f"{_ensure_row(f'{row}.session_id')}\n"
+        f"UPDATE session_stats SET {_TASK_COUNTERS.format(op='+', row=row)}"
+        f"WHERE session_id = {row}.session_id;"
+    )
+
+
+def _remove_task(row: str) -> str:
+    return (
+        f"UPDATE session_stats SET {_TASK_COUNTERS.format(op='-', row=row)}"
+        f"WHERE session_id = {row}.session_id;"
+    )
+
+
+# Sessions that still link source ``src`` through a task other than ``task``
+_OTHER_LINK = """
+    SELECT 1 FROM task_source_association a JOIN tasks t ON t.id = a.task_id
+    WHERE a.source_id = {src} AND a.task_id != {task}
+      AND t.session_id = session_stats.session_id
+"""
+
+
+SESSION_STATS_TRIGGERS = {
+    "trg_session_stats_task_insert": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_session_stats_task_insert
+        AFTER INSERT ON tasks
+        BEGIN
+            {_add_task('NEW')}
+        END
+    """,
+    "trg_session_stats_task_update": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_session_stats_task_update
+        AFTER UPDATE OF status, word_count, session_id ON tasks
+        WHEN OLD.status IS NOT NEW.status
+          OR OLD.word_count IS NOT NEW.word_count
+          OR OLD.session_id IS NOT NEW.session_id
+        BEGIN
+            {_remove_task('OLD')}
+            {_add_task('NEW')}
+        END
+    """,
+    "trg_session_stats_task_delete": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_session_stats_task_delete
+        AFTER DELETE ON tasks
+        BEGIN
+            {_remove_task('OLD')}
+        END
+    """,
+    "trg_session_stats_source_link": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_session_stats_source_link
+        AFTER INSERT ON task_source_association
+        BEGIN
+            UPDATE session_stats SET total_sources = total_sources + 1
+            WHERE session_id = (SELECT session_id FROM tasks WHERE id = NEW.task_id)
+              AND NOT EXISTS ({_OTHER_LINK.format(src='NEW.source_id', task='NEW.task_id')});
+        END
+    """,
+    "trg_session_stats_source_unlink": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_session_stats_source_unlink
+        AFTER DELETE ON task_source_association
+        BEGIN
+            UPDATE session_stats SET total_sources = total_sources - 1
+            WHERE session_id = (SELECT session_id FROM tasks WHERE id = OLD.task_id)
+              AND NOT EXISTS ({_OTHER_LINK.format(src='OLD.source_id', task='OLD.task_id')});
+        END
+    """,
+    "trg_session_stats_glossary_insert": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_session_stats_glossary_insert
+        AFTER INSERT ON glossary
+        BEGIN
+            {_ensure_row('NEW.session_id')}
+            UPDATE session_stats SET glossary_terms = glossary_terms + 1
+            WHERE session_id = NEW.session_id;
+        END
+    """,
+    "trg_session_stats_glossary_update": f"""
+        CREATE TRIGGER IF NOT EXISTS trg_session_stats_glossary_update
+        AFTER UPDATE OF session_id ON glossary
+        WHEN OLD.session_id IS NOT NEW.session_id
+        BEGIN
+            UPDATE session_stats SET glossary_terms = glossary_terms - 1
+            WHERE session_id = OLD.session_id;
+            {_ensure_row('NEW.session_id')}
+            UPDATE session_stats SET glossary_terms = glossary_terms + 1
+            WHERE session_id = NEW.session_id;
+        END
+    """,
+    "trg_session_stats_glossary_delete": """
+        CREATE TRIGGER IF NOT EXISTS trg_session_stats_glossary_delete
+        AFTER DELETE ON glossary
+        BEGIN
+            UPDATE session_stats SET glossary_terms = glossary_terms - 1
+            WHERE session_id = OLD.session_id;
+        END
+    """,
+}
+
+# Recomputes every session's counters from the base tables; run once when
+# the triggers are first installed on a database that already has data.
+SESSION_STATS_BACKFILL = """
+    INSERT OR REPLACE INTO session_stats (
+        session_id, total_tasks, pending_tasks, completed_tasks, failed_tasks,
+        total_words, total_sources, glossary_terms
+    )
+    SELECT
+        s.id,
+        (SELECT COUNT(*) FROM tasks t WHERE t.session_id = s.id),
+        (SELECT COUNT(*) FROM tasks t WHERE t.session_id = s.id AND t.status = 'pending'),
+        (SELECT COUNT(*) FROM tasks t WHERE t.session_id = s.id AND t.status = 'completed'),
+        (SELECT COUNT(*) FROM tasks t WHERE t.session_id = s.id AND t.status = 'failed'),
+        (SELECT COALESCE(SUM(t.word_count), 0) FROM tasks t
+          WHERE t.session_id = s.id AND t.status = 'completed'),
+        (SELECT COUNT(DISTINCT a.source_id) FROM task_source_association a
+          JOIN tasks t ON t.id = a.task_id WHERE t.session_id = s.id),
+        (SELECT COUNT(*) FROM glossary g WHERE g.session_id = s.id)
+    FROM sessions s
+"""
@@ -0,0 +1,82 @@
+"""Single-writer execution for the SQLite database.
+
+SQLite allows one writer at a time. When many threads write through their
+own connections they race for the file lock, back off, and under load
+fail with "database is locked". ``SerialWriter`` instead runs every write
+operation on one dedicated thread, taking them in arrival order from a
+queue, so writes never contend with each other and readers (on their own
+read-only WAL connections) never wait on them.
+
+``DatabaseManager`` methods that modify the database are marked with
+``@writes``; a call from any other thread is queued and the caller blocks
+until its write has committed (or raised). Writes made from the writer
+thread itself, e.g. one write method calling another, run inline.
+
+The writer thread exits after a few idle seconds and is restarted by the
+next write.
+"""
+import contextvars
+import functools
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Callable
+
+# Writer thread exits after this long without writes
+_IDLE_EXIT_SECONDS = 5.0
+
+
+class SerialWriter:
+    """Executes submitted callables one at a time on a dedicated thread."""
+
+    def __init__(self, name: str = "db-writer"):
+        self.name = name
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def in_writer(self) -> bool:
+        """True when called from the writer thread."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """Run ``fn`` on the writer thread and return its result."""
+        if self.in_writer():
+            return fn(*args, **kwargs)
+        future: Future = Future()
+        self._queue.put((contextvars.copy_context(), fn, args, kwargs, future))
+        self._ensure_thread()
+        return future.result()
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                ctx, fn, args, kwargs, future = self._queue.get(timeout=_IDLE_EXIT_SECONDS)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(ctx.run(fn, *args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+def writes(method: Callable) -> Callable:
+    """Mark a ``DatabaseManager`` method as a write: it runs on the manager's writer."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.writer is None:
+            return self._write_inline(method, self, *args, **kwargs)
+        return self.writer.call(method, self, *args, **kwargs)
+    return wrapper
@@ -0,0 +1,167 @@
+"""Process-wide registry of named, bounded thread pools.
+
+Every layer of the pipeline submits work to one of a few shared pools
+instead of creating its own ``ThreadPoolExecutor``:
+
+    run   - whole research runs started by the service (bounds concurrent runs)
+    task  - whole research tasks (the research loop)
+    io    - web searches and page scrapes
+    llm   - LLM calls (extraction, planning, synthesis, summaries)
+    cpu   - local CPU-bound work (report format compilation)
+
+Pool sizes come from ``config.executors`` when a pool is first used, so the
+process thread count is bounded by their sum regardless of nesting depth.
+
+A submission made from a worker thread of the *same* pool runs inline in
+the caller ("caller-runs"), so a worker waiting on work it submitted can
+never deadlock a saturated pool. Submissions copy the caller's
+``contextvars`` context into the worker.
+"""
+import atexit
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, NamedTuple
+
+from src.config.settings import get_config
+from src.config.logger import get_logger
+
+logger = get_logger(__name__)
+
+POOL_NAMES = ("run", "task", "io", "llm", "cpu")
+
+_worker_pool = threading.local()  # .name = pool the current thread works for
+
+
+class ExecutorStats(NamedTuple):
+    """Point-in-time metrics for one pool."""
+    name: str
+    max_workers: int
+    active: int  # tasks currently running on a worker
+    queued: int  # submitted but not yet started (queue depth)
+    peak_queued: int
+    submitted: int
+    completed: int
+    caller_runs: int  # nested submissions run inline by the caller
+
+
+class BoundedExecutor:
+    """A named ``ThreadPoolExecutor`` with queue-depth metrics and caller-runs nesting."""
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max(1, int(max_workers))
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=f"{name}-pool",
+        )
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._started = 0
+        self._completed = 0
+        self._caller_runs = 0
+        self._cancelled = 0
+        self._peak_queued = 0
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Schedule ``fn(*args, **kwargs)`` and return its Future."""
+        if getattr(_worker_pool, "name", None) == self.name:
+            return self._run_inline(fn, args, kwargs)
+
+        ctx = contextvars.copy_context()
+        with self._lock:
+            self._submitted += 1
+            self._peak_queued = max(self._peak_queued, self._queued())
+        future = self._pool.submit(self._run_worker, ctx, fn, args, kwargs)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _queued(self) -> int:
+        return self._submitted - self._started - self._cancelled
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._cancelled += 1
+
+    def _run_inline(self, fn: Callable, args: tuple, kwargs: dict) -> Future:
+        with self._lock:
+            self._caller_runs += 1
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+    def _run_worker(self, ctx: contextvars.Context, fn: Callable, args: tuple, kwargs: dict):
+        with self._lock:
+            self._started += 1
+        _worker_pool.name = self.name
+        try:
+            return ctx.run(fn, *args, **kwargs)
+        finally:
+            _worker_pool.name = None
+            with self._lock:
+                self._completed += 1
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            return ExecutorStats(
+                name=self.name,
+                max_workers=self.max_workers,
+                active=self._started - self._completed,
+                queued=self._queued(),
+                peak_queued=self._peak_queued,
+                submitted=self._submitted,
+                completed=self._completed,
+                caller_runs=self._caller_runs,
+            )
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+_executors: Dict[str, BoundedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(name: str) -> BoundedExecutor:
+    """Return the shared pool ``name`` (one of POOL_NAMES), creating it on first use."""
+    if name not in POOL_NAMES:
+        raise KeyError(f"Unknown executor {name!r}. Available: {list(POOL_NAMES)}")
+    executor = _executors.get(name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(name)
+            if executor is None:
+                workers = getattr(get_config().executors, f"{name}_workers")
+                executor = BoundedExecutor(name, workers)
+                _executors[name] = executor
+                logger.debug(f"Created {name!r} executor with {executor.max_workers} workers")
+    return executor
+
+
+def get_executor_stats() -> Dict[str, ExecutorStats]:
+    """Metrics for every pool created so far."""
+    with _executors_lock:
+        executors = list(_executors.values())
+    return {e.name: e.stats() for e in executors}
+
+
+def cancel_pending(futures) -> int:
+    """Cancel futures that have not started yet. Returns how many were cancelled."""
+    return sum(1 for f in list(futures) if f.cancel())
+
+
+def shutdown_executors(wait: bool = True, cancel_futures: bool = True) -> None:
+    """Shut down every pool. Pools are recreated (with current config) on next use."""
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+atexit.register(shutdown_executors, wait=False)
@@ -4,14 +4,18 @@ Uses OpenAI API with support for direct API key or OAuth2 token auth.
 """
 import json
 import os
+import socket
 import threading
-import time
+import weakref
 from typing import Optional, List, Dict, Any
 
-from tenacity import retry, stop_after_attempt, wait_exponential
+import httpx
+from tenacity import retry, retry_if_not_exception_type, stop_after_attempt, wait_exponential
 
 from src.config.settings import get_config, get_env_settings
+from src.infra.cancellation import CancellationToken, RunCancelled, cancellable_sleep, current_token
 from src.infra.oauth import fetch_oauth_token
+from src.infra.rate_limit import FairRateLimiter
 from src.infra.security import configure_rbc_security_certs
 from src.config.logger import get_logger
 
@@ -97,6 +101,10 @@ class TokenTracker:
                 "calls": self._calls,
             }
 
+    def estimate_cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
+        """Price of a call in USD, without recording it."""
+        return self._cost_for_model(model, prompt_tokens, completion_tokens)
+
     def _cost_for_model(self, model: str, prompt_tokens: int, completion_tokens: int) -> float:
         pricing_map = self._get_pricing()
         # Exact match first
@@ -129,23 +137,8 @@ def get_token_tracker() -> TokenTracker:
 # RATE LIMITER
 # =============================================================================
 
-class LLMRateLimiter:
-    """Rate limiter for LLM API calls"""
-
-    def __init__(self, calls_per_minute: int):
-        self.calls_per_minute = calls_per_minute
-        self.interval = 60.0 / calls_per_minute
-        self.last_call = 0.0
-        self._lock = threading.Lock()
-
-    def wait(self):
-        """Wait if necessary to respect rate limit"""
-        with self._lock:
-            now = time.time()
-            elapsed = now - self.last_call
-            if elapsed < self.interval:
-                time.sleep(self.interval - elapsed)
-            self.last_call = time.time()
+class LLMRateLimiter(FairRateLimiter):
+    """Rate limiter for LLM API calls, shared fairly between concurrent runs"""
 
 
 _llm_limiter: Optional[LLMRateLimiter] = None
@@ -163,6 +156,71 @@ def get_llm_limiter() -> LLMRateLimiter:
 # OPENAI CLIENT
 # =============================================================================
 
+class _AbortableHttpClient(httpx.Client):
+    """An HTTP client whose open connections can be torn down from another
+    thread.
+
+    Closing a socket does not wake a thread blocked reading from it, so
+    ``abort`` shuts every open connection's socket down; pending reads then
+    fail at once and surface as RunCancelled. Depending on its version the
+    SDK may retry that or wrap it in APIConnectionError, so callers treat
+    any failure on a cancelled run as the cancellation.
+    """
+
+    def __init__(self):
+        super().__init__(follow_redirects=True)
+        self._abort_lock = threading.Lock()
+        self._sockets: "weakref.WeakSet[socket.socket]" = weakref.WeakSet()
+        self._aborted = False
+
+    def abort(self) -> None:
+        with self._abort_lock:
+            self._aborted = True
+            sockets = list(self._sockets)
+        for sock in sockets:
+            _shutdown(sock)
+
+    def _trace(self, event: str, info: Dict[str, Any]) -> None:
+        # httpcore reports each new pooled connection before sending on it
+        if event != "connection.connect_tcp.complete":
+            return
+        sock = info["return_value"].get_extra_info("socket")
+        if sock is None:
+            return
+        with self._abort_lock:
+            self._sockets.add(sock)
+            aborted = self._aborted
+        if aborted:
+            _shutdown(sock)
+
+    def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        if self._aborted:
+            raise RunCancelled("LLM request aborted")
+        request.extensions["trace"] = self._trace
+        try:
+            return super().send(request, **kwargs)
+        except httpx.TransportError as e:
+            if self._aborted:
+                raise RunCancelled("LLM request aborted") from e
+            raise
+
+
+def _shutdown(sock: socket.socket) -> None:
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass  # already closed
+
+
+# Cancellation is not an API failure: never retry it, and wake from
+# back-off as soon as the run is cancelled.
+_llm_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    retry=retry_if_not_exception_type(RunCancelled),
+    sleep=cancellable_sleep,
+)
+
 class OpenAIClient:
     """Client for OpenAI API (supports direct API key and OAuth2 token auth)"""
 
@@ -183,6 +241,60 @@ class OpenAIClient:
         except ImportError:
             raise ImportError("Please install openai: pip install openai")
 
+        # Per-run SDK clients, each over a connection pool the run can abort
+        self._run_clients: "weakref.WeakKeyDictionary[CancellationToken, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._run_clients_lock = threading.Lock()
+
+    @staticmethod
+    def _wait_turn() -> None:
+        """Rate-limit the next call, bailing out if the run was cancelled."""
+        token = current_token()
+        if token is not None:
+            token.raise_if_cancelled()
+        get_llm_limiter().wait()
+        if token is not None:
+            token.raise_if_cancelled()
+
+    def _client_for(self, token: CancellationToken) -> Any:
+        """The run's SDK client, created on its first call and reused after.
+
+        Its connections are pooled across the run's calls and shut down by
+        the token on cancel; the pool is closed once the run's token is gone.
+        """
+        with self._run_clients_lock:
+            client = self._run_clients.get(token)
+            if client is None:
+                http_client = _AbortableHttpClient()
+                client = self.client.with_options(http_client=http_client)
+                self._run_clients[token] = client
+                token.on_cancel(http_client.abort)
+                weakref.finalize(token, http_client.close)
+            return client
+
+    def _create(self, kwargs: Dict[str, Any]) -> Any:
+        """Run ``chat.completions.create``, aborting it on cancellation.
+
+        Inside a cancellation scope the call goes through the run's own
+        client (see ``_client_for``), whose connections the token shuts down
+        on cancel: the request ends at once instead of holding a socket and
+        quota until ``llm.request_timeout``. Whatever error the SDK then
+        raises is reported as RunCancelled, which ``_llm_retry`` does not
+        retry.
+        """
+        kwargs.setdefault("timeout", get_config().llm.request_timeout)
+        token = current_token()
+        if token is None:
+            return self.client.chat.completions.create(**kwargs)
+
+        token.raise_if_cancelled()
+        try:
+            return self._client_for(token).chat.completions.create(**kwargs)
+        except Exception:
+            token.raise_if_cancelled()
+            raise
+
     @staticmethod
     def _extract_content_text(response: Any) -> str:
         """Extract text content from a chat-completions response choice."""
@@ -211,7 +323,7 @@ class OpenAIClient:
 
         return str(content)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @_llm_retry
     def complete(
         self,
         prompt: str,
@@ -225,7 +337,7 @@ class OpenAIClient:
         model = model or config.llm.models.researcher
 
         # Apply rate limiting
-        get_llm_limiter().wait()
+        self._wait_turn()
 
         logger.debug(f"OpenAI completion with model: {model}")
 
@@ -255,7 +367,7 @@ class OpenAIClient:
             kwargs["response_format"] = {"type": "json_object"}
 
         try:
-            response = self.client.chat.completions.create(**kwargs)
+            response = self._create(kwargs)
             if response.usage:
                 get_token_tracker().record(
                     model,
@@ -271,11 +383,13 @@ class OpenAIClient:
                     finish_reason,
                 )
             return text
+        except RunCancelled:
+            raise
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @_llm_retry
     def complete_with_messages(
         self,
         messages: List[Dict[str, str]],
@@ -289,7 +403,7 @@ class OpenAIClient:
         model = model or config.llm.models.researcher
 
         # Apply rate limiting
-        get_llm_limiter().wait()
+        self._wait_turn()
 
         full_messages = []
         if system:
@@ -314,7 +428,7 @@ class OpenAIClient:
             kwargs["response_format"] = {"type": "json_object"}
 
         try:
-            response = self.client.chat.completions.create(**kwargs)
+            response = self._create(kwargs)
             if response.usage:
                 get_token_tracker().record(
                     model,
@@ -330,11 +444,13 @@ class OpenAIClient:
                     finish_reason,
                 )
             return text
+        except RunCancelled:
+            raise
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
             raise
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    @_llm_retry
     def complete_with_function(
         self,
         prompt: str,
@@ -351,7 +467,7 @@ class OpenAIClient:
         config = get_config()
         model = model or config.llm.models.researcher
 
-        get_llm_limiter().wait()
+        self._wait_turn()
 
         messages = []
         if system:
@@ -388,7 +504,7 @@ class OpenAIClient:
             kwargs["max_tokens"] = max_tokens
 
         try:
-            response = self.client.chat.completions.create(**kwargs)
+            response = self._create(kwargs)
             if response.usage:
                 get_token_tracker().record(
                     model,
@@ -434,6 +550,8 @@ class OpenAIClient:
                 model, function_name, finish_reason,
             )
             return None
+        except RunCancelled:
+            raise
         except Exception as e:
             logger.error(f"OpenAI API error (function call): {e}")
             raise
@@ -0,0 +1,69 @@
+"""Rate limiting shared fairly between concurrent research runs.
+
+The LLM, search and scrape limiters are process-wide: every run in the
+process draws from the same quota. A plain "one call per interval" lock
+hands slots to whichever thread grabs the lock first, so a run with many
+threads in flight starves one with few. ``FairRateLimiter`` queues callers
+per run (identified by the run's cancellation token) and grants slots to the
+waiting runs in rotation.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+
+from src.infra.cancellation import current_token
+
+# Calls made outside any run share one queue
+_NO_RUN = object()
+
+# Upper bound on a waiter's sleep, so a cancelled run stops waiting promptly
+_POLL_SECONDS = 0.5
+
+
+class FairRateLimiter:
+    """Spaces calls ``60 / calls_per_minute`` seconds apart, round-robin across runs.
+
+    Within a run calls are served in arrival order. Waiting does not hold
+    the limiter's lock, and a waiter whose run is cancelled raises
+    RunCancelled instead of consuming a slot.
+    """
+
+    def __init__(self, calls_per_minute: int):
+        self.calls_per_minute = calls_per_minute
+        self.interval = 60.0 / calls_per_minute
+        self.last_call = 0.0  # time.monotonic() of the last granted slot
+        self._cond = threading.Condition()
+        self._waiting: "OrderedDict[object, deque]" = OrderedDict()  # run -> tickets, in turn order
+
+    def wait(self):
+        """Block until this caller's run is granted the next slot."""
+        token = current_token()
+        run = token if token is not None else _NO_RUN
+        ticket = object()
+        with self._cond:
+            self._waiting.setdefault(run, deque()).append(ticket)
+            try:
+                while True:
+                    if token is not None:
+                        token.raise_if_cancelled()
+                    my_turn = next(iter(self._waiting)) is run and self._waiting[run][0] is ticket
+                    delay = self.last_call + self.interval - time.monotonic()
+                    if my_turn and delay <= 0:
+                        break
+                    self._cond.wait(min(delay, _POLL_SECONDS) if my_turn else _POLL_SECONDS)
+            except BaseException:
+                self._release(run, ticket, granted=False)
+                raise
+            self._release(run, ticket, granted=True)
+            self.last_call = time.monotonic()
+
+    def _release(self, run, ticket, granted: bool) -> None:
+        """Drop ``ticket``; a run granted a slot goes to the back of the rotation."""
+        queue = self._waiting[run]
+        queue.remove(ticket)
+        if queue:
+            if granted:
+                self._waiting.move_to_end(run)
+        else:
+            del self._waiting[run]
+        self._cond.notify_all()
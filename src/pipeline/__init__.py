@@ -2,3 +2,4 @@
 from .orchestrator import ResearchOrchestrator  # noqa: F401
 from .compiler import ReportCompiler  # noqa: F401
 from .service import ResearchService, get_service  # noqa: F401
+from .worker import ResearchWorker  # noqa: F401
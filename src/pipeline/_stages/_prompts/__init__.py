@@ -36,11 +36,13 @@ _EXPECTED_SCHEMA: dict[str, dict[str, list[str] | None]] = {
     "research_topic": {
         "generate_queries": ["system", "user_json", "user_text", "tool"],
         "extract_source": ["system", "user"],
+        "extract_sources_batch": ["system", "user", "source", "tool"],
         "identify_gaps": ["system", "user"],
         "synthesize_notes": ["system", "user"],
     },
     "review_gaps": {
         "analyze_gaps": ["system", "user"],
+        "analyze_section_gaps": ["system", "user"],
     },
     "synthesize_sections": {
         "style_guidance": None,  # not a prompt set, just a data dict
@@ -1,14 +1,17 @@
 """PlannerAgent — creates the initial research plan via deep pre-planning."""
 import json
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import as_completed
 from typing import List
 
 from src.config.settings import get_config
 from src.config.types import Source
 from src.infra.llm import get_llm_client
-from src.pipeline._tools import web_search, extract_source_info, is_blocked_source
+from src.pipeline._tools import (
+    web_search, extract_source_info, is_blocked_source, rank_search_results,
+)
 from src.infra._database import get_database
+from src.infra.executors import get_executor
 from src.config.logger import get_logger, print_search, print_scrape
 
 from src.pipeline._stages._prompts import get_prompt_set
@@ -119,10 +122,12 @@ class PlannerAgent:
                 )
         return hits
 
-    def _scrape_pre_plan_result(self, result: dict, session_id: int = None) -> Source:
+    def _scrape_pre_plan_result(self, result: dict, session_id: int = None,
+                                known_source: Source = None) -> Source:
         """Scrape a single search result and return a Source object. Thread-safe.
 
-        Returns None if scraping fails or quality is too low.
+        ``known_source`` is a fresh stored copy of the page, reused instead of
+        fetching. Returns None if scraping fails or quality is too low.
         """
         url = result.get("url", "")
         if not url:
@@ -141,8 +146,9 @@ class PlannerAgent:
             return None
 
         try:
-            print_scrape(url)
-            source = extract_source_info(url, result)
+            if known_source is None:
+                print_scrape(url)
+            source = extract_source_info(url, result, known_source=known_source)
             if source.quality_score < self.config.quality.min_source_quality:
                 logger.info(f"[pre-plan] Skipping low-quality source: {url}")
                 return None
@@ -186,7 +192,7 @@ class PlannerAgent:
 
         4-phase pipeline:
         1. Search: Run diverse queries in parallel -> deduplicated results
-        2. Scrape: Scrape top results in parallel -> Source objects
+        2. Scrape: Rank results by batch quality score, scrape the best in parallel
         3. Analyze: LLM analysis on each scraped page -> rich entity/subtopic data
         4. Format: Build rich context string for the planner
 
@@ -199,20 +205,20 @@ class PlannerAgent:
         seen_urls = set()
         results = []
 
-        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
-            futures = [
-                executor.submit(self._run_single_pre_search, q, session_id)
-                for q in queries
-            ]
-            for future in as_completed(futures):
-                try:
-                    for hit in future.result():
-                        url = hit.get("url", "")
-                        if url and url not in seen_urls:
-                            seen_urls.add(url)
-                            results.append(hit)
-                except Exception as e:
-                    logger.warning(f"Pre-planning search failed: {e}")
+        executor = get_executor("io")
+        futures = [
+            executor.submit(self._run_single_pre_search, q, session_id)
+            for q in queries
+        ]
+        for future in as_completed(futures):
+            try:
+                for hit in future.result():
+                    url = hit.get("url", "")
+                    if url and url not in seen_urls:
+                        seen_urls.add(url)
+                        results.append(hit)
+            except Exception as e:
+                logger.warning(f"Pre-planning search failed: {e}")
 
         if not results:
             logger.warning("Pre-planning search returned no results")
@@ -220,22 +226,33 @@ class PlannerAgent:
 
         logger.info(f"Pre-planning search found {len(results)} unique results")
 
-        # Phase 2: Scrape top results in parallel (cap at 30)
-        scrape_targets = results[:30]
+        # Phase 2: Rank by batch quality score, then scrape the top 30 in parallel
+        scrape_targets = rank_search_results(
+            results, query=query,
+            min_quality=self.config.quality.min_source_quality,
+        )[:30]
         sources = []
 
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [
-                executor.submit(self._scrape_pre_plan_result, r, session_id)
-                for r in scrape_targets
-            ]
-            for future in as_completed(futures):
-                try:
-                    source = future.result()
-                    if source is not None:
-                        sources.append(source)
-                except Exception as e:
-                    logger.warning(f"Pre-plan scrape error: {e}")
+        # Pages fetched recently (by any task or session) are reused, not re-fetched
+        fresh = self.db.get_fresh_sources(
+            [r.get("url", "") for r in scrape_targets],
+            self.config.scraping.source_freshness_hours,
+        )
+        if fresh:
+            logger.info(f"Pre-planning reusing {len(fresh)} stored pages")
+
+        executor = get_executor("io")
+        futures = [
+            executor.submit(self._scrape_pre_plan_result, r, session_id, fresh.get(r.get("url", "")))
+            for r in scrape_targets
+        ]
+        for future in as_completed(futures):
+            try:
+                source = future.result()
+                if source is not None:
+                    sources.append(source)
+            except Exception as e:
+                logger.warning(f"Pre-plan scrape error: {e}")
 
         logger.info(f"Pre-planning scraped {len(sources)} pages successfully")
 
@@ -247,19 +264,19 @@ class PlannerAgent:
         # Phase 3: Analyze each scraped page in parallel
         analyses = []
 
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {
-                executor.submit(self._analyze_pre_plan_page, src, query): src
-                for src in sources
-            }
-            for future in as_completed(futures):
-                src = futures[future]
-                try:
-                    analysis = future.result()
-                    if analysis is not None:
-                        analyses.append((src, analysis))
-                except Exception as e:
-                    logger.warning(f"Pre-plan analysis error: {e}")
+        executor = get_executor("llm")
+        futures = {
+            executor.submit(self._analyze_pre_plan_page, src, query): src
+            for src in sources
+        }
+        for future in as_completed(futures):
+            src = futures[future]
+            try:
+                analysis = future.result()
+                if analysis is not None:
+                    analyses.append((src, analysis))
+            except Exception as e:
+                logger.warning(f"Pre-plan analysis error: {e}")
 
         logger.info(f"Pre-planning analyzed {len(analyses)} pages")
 
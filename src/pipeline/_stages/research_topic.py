@@ -1,24 +1,60 @@
 """ResearcherAgent — deep research on individual topics."""
+import hashlib
 import json
 import re
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import FIRST_COMPLETED, Future, as_completed, wait
+from typing import List, Dict, Any, Optional, Tuple
 
 from src.config.settings import get_config
 from src.config.types import ResearchTask, TaskStatus, Source
 from src.infra.llm import get_llm_client
 from src.pipeline._tools import (
-    web_search, extract_source_info, is_blocked_source,
+    web_search, extract_source_info, is_blocked_source, rank_search_results,
+    fuse_search_results,
     truncate_to_tokens,
 )
 from src.infra._database import get_database
+from src.infra.cancellation import RunCancelled, check_cancelled
+from src.infra.executors import cancel_pending, get_executor
 from src.config.logger import get_logger, print_search, print_scrape
 
 from src.pipeline._stages._prompts import get_prompt_set
 
 logger = get_logger(__name__)
 
+# How often the source pipeline re-checks for cancellation while waiting
+_CANCEL_POLL_SECONDS = 1.0
+
+# Checkpoint step of one query's search results: "search_results:<query index>"
+_SEARCH_STEP = "search_results"
+
+_TOPIC_STOPWORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'of', 'in', 'on', 'for', 'to', 'with',
+    'by', 'from', 'at', 'as', 'is', 'are', 'its', 'their', 'this', 'that',
+})
+
+
+def _topic_terms(task_topic: str, task_description: str) -> set:
+    """Normalized term set of a task topic + description (for cache keys)."""
+    words = re.findall(r'[a-z0-9]{2,}', f"{task_topic} {task_description}".lower())
+    return {w for w in words if w not in _TOPIC_STOPWORDS}
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8', errors='replace')).hexdigest()
+
+
+def _source_block(number: int, source: Source, body: str) -> str:
+    """One numbered source as it appears in a research prompt."""
+    return (
+        f"### Source {number}: {source.title}\n"
+        f"URL: {source.url}\n"
+        f"Domain: {source.domain}\n"
+        f"{'[Academic Source]' if source.is_academic else ''}\n\n"
+        f"{body}"
+    )
+
 
 class ResearcherAgent:
     """Agent responsible for deep research on individual topics"""
@@ -41,6 +77,10 @@ class ResearcherAgent:
         """
         Perform deep research on a single task
         Returns: (content, new_tasks, glossary_terms)
+
+        Each completed step is checkpointed against the task (see
+        ``_checkpoint``), so a retry or resume continues from the first
+        incomplete step instead of redoing searches, scrapes and extractions.
         """
         logger.info(f"Researching: {task.topic}")
 
@@ -48,15 +88,31 @@ class ResearcherAgent:
         self.db.update_task(task.id, status=TaskStatus.IN_PROGRESS)
 
         try:
+            checkpoints = self._load_checkpoints(task, session_id)
+            if "draft" in checkpoints:
+                draft = checkpoints["draft"]
+                return draft["content"], draft["new_tasks"], draft["glossary_terms"]
+
             # Step 1: Generate search queries
-            queries = self._generate_queries(task, overall_query=overall_query)
+            queries = checkpoints.get("queries")
+            if not queries:
+                queries = self._generate_queries(task, overall_query=overall_query)
+                self._checkpoint(task, "queries", queries)
 
             # Step 2: Execute searches and gather content
-            search_context, initial_source_count = self._execute_searches(
-                queries, task.id, session_id=session_id,
-                task_topic=task.topic, task_description=task.description,
-                overall_query=overall_query,
-            )
+            if "sources" in checkpoints:
+                search_context = self._restore_search_context(task.id, checkpoints["sources"]["sources"])
+                initial_source_count = checkpoints["sources"]["source_count"]
+            else:
+                search_context, initial_source_count, source_refs = self._execute_searches(
+                    queries, task.id, session_id=session_id,
+                    task_topic=task.topic, task_description=task.description,
+                    overall_query=overall_query,
+                )
+                # Context text is rebuilt from the source store on resume
+                self._checkpoint(task, "sources", {
+                    "sources": source_refs, "source_count": initial_source_count,
+                })
 
             # Handle empty search results
             has_sources = bool(search_context and search_context.strip())
@@ -73,24 +129,36 @@ class ResearcherAgent:
             gap_fill_queries_count = self.config.search.gap_fill_queries
             if has_sources and gap_fill_queries_count > 0:
                 try:
-                    gap_queries = self._identify_gaps(task, search_context, overall_query)
+                    gap_queries = checkpoints.get("gap_queries")
+                    if gap_queries is None:
+                        gap_queries = self._identify_gaps(task, search_context, overall_query)
+                        self._checkpoint(task, "gap_queries", gap_queries)
                     if gap_queries:
-                        # Collect URLs already seen so gap-fill doesn't re-scrape them
-                        existing_sources = self.db.get_sources_for_task(task.id)
-                        existing_urls = {s.url for s in existing_sources}
-                        gap_context = self._execute_gap_fill_searches(
-                            gap_queries, task.id, existing_urls, session_id,
-                            source_number_offset=initial_source_count
-                        )
+                        if "gap_context" in checkpoints:
+                            gap_context = self._restore_gap_context(
+                                task.id, checkpoints["gap_context"]["sources"]
+                            )
+                        else:
+                            # Collect URLs already seen so gap-fill doesn't re-scrape them
+                            existing_sources = self.db.get_sources_for_task(task.id, include_content=False)
+                            existing_urls = {s.url for s in existing_sources}
+                            gap_context, gap_refs = self._execute_gap_fill_searches(
+                                gap_queries, task.id, existing_urls, session_id,
+                                source_number_offset=initial_source_count
+                            )
+                            self._checkpoint(task, "gap_context", {"sources": gap_refs})
                         if gap_context:
                             search_context += (
                                 "\n\n---\n\n## Additional Sources (Gap-Fill)\n\n"
                                 + gap_context
                             )
+                except RunCancelled:
+                    raise
                 except Exception as e:
                     logger.warning(f"Gap-fill failed for task {task.id}: {e}")
 
             # Step 4: Synthesize and write
+            check_cancelled()
             content, new_tasks, glossary_terms = self._synthesize(
                 task, search_context, overall_query, other_sections, session_id=session_id
             )
@@ -102,12 +170,51 @@ class ResearcherAgent:
                     logger.warning(f"Stripped phantom citations from sourceless task {task.id}")
                     content = stripped
 
+            self._checkpoint(task, "draft", {
+                "content": content, "new_tasks": new_tasks, "glossary_terms": glossary_terms,
+            })
             return content, new_tasks, glossary_terms
 
+        except RunCancelled:
+            logger.info(f"Research cancelled for task {task.id}")
+            raise
         except Exception as e:
             logger.error(f"Research failed for task {task.id}: {e}")
             raise
 
+    def _load_checkpoints(self, task: ResearchTask, session_id: int = None) -> Dict[str, Any]:
+        """Steps a previous attempt at this task already completed."""
+        if task.id is None or not self.config.research.checkpoint_steps:
+            return {}
+        try:
+            checkpoints = self.db.get_task_checkpoints(task.id)
+        except Exception as e:
+            logger.warning(f"Could not load checkpoints for task {task.id}: {e}")
+            return {}
+        if checkpoints:
+            logger.info(f"Resuming task {task.id} from checkpoints: {sorted(checkpoints)}")
+            self.db.add_run_event(
+                session_id=session_id, task_id=task.id,
+                event_type="task_resumed", severity="info",
+                payload_json=json.dumps({"steps": sorted(checkpoints)}),
+            )
+        return checkpoints
+
+    def _checkpoint(self, task: ResearchTask, step: str, payload: Any) -> None:
+        """Persist a completed step; failures only cost the ability to resume.
+
+        Raises RunCancelled instead when the run was cancelled: a step cut
+        short falls back to degraded output (fallback queries, no gaps) that
+        must not be replayed on resume.
+        """
+        check_cancelled()
+        if task.id is None or not self.config.research.checkpoint_steps:
+            return
+        try:
+            self.db.save_task_checkpoint(task.id, step, payload)
+        except Exception as e:
+            logger.warning(f"Could not checkpoint step {step!r} for task {task.id}: {e}")
+
     def _generate_queries(self, task: ResearchTask, overall_query: str = "") -> List[str]:
         """Generate search queries for the task.
 
@@ -360,149 +467,579 @@ class ResearcherAgent:
             logger.warning(f"Source extraction failed for {source.url}: {e}")
             return ""
 
-    def _execute_searches(
+    def _scrape_candidate(self, result: dict, known_source: Source = None) -> Source:
+        """Scrape one search result. Thread-safe. Returns None if unusable.
+
+        ``known_source`` is a fresh stored copy of the page; when given it is
+        reused instead of fetching.
+        """
+        url = result.get('url', '')
+        if known_source is None:
+            print_scrape(url)
+        source = extract_source_info(url, result, known_source=known_source)
+        logger.info(f"Source: {url[:60]} quality={source.quality_score} content_len={len(source.full_content or '')}")
+
+        if source.quality_score < self.config.quality.min_source_quality:
+            logger.info(f"Skipping low-quality source: {url}")
+            return None
+        if not (source.full_content or source.snippet):
+            return None
+        return source
+
+    def _stream_sources(
         self, queries: List[str], task_id: int, session_id: int = None,
         task_topic: str = "", task_description: str = "", overall_query: str = "",
-    ) -> Tuple[str, int]:
-        """Execute searches in parallel, extract per-source content, and aggregate results.
+    ) -> Tuple[List[tuple], Dict[int, str]]:
+        """Search, scrape and extract as one overlapped pipeline.
+
+        Work flows through the shared ``io`` and ``llm`` pools without phase
+        barriers:
+
+        - each query's best ``min_sources_per_query`` candidates are sent to
+          scraping as soon as that query returns;
+        - once every query has returned, the fused ranking tops the scrape
+          queue up to ``max_sources_per_task`` (failed scrapes are replaced
+          from the reserves);
+        - every successfully scraped source goes straight to LLM extraction
+          (or the extraction cache, see ``_extract_with_cache``). With
+          ``extraction.batch_enabled`` sources are instead packed into
+          shared extraction calls up to ``batch_max_tokens`` /
+          ``batch_max_sources`` (see ``_pack_max_sources``); a partial batch
+          is flushed as soon as no further sources can arrive.
+
+        Citation positions do not depend on completion order. After the
+        pipeline drains, the kept sources are ordered by the coverage floor
+        (query order, then each query's own ranking) followed by the fused
+        ranking, and only then persisted with positions 0..N-1.
+
+        Returns (saved_sources, extraction_results) where saved_sources is a
+        list of (position, Source, source id) and extraction_results maps
+        position -> extracted text. Sources and their extractions are each
+        stored in one transaction.
+        """
+        search_cfg = self.config.search
+        min_quality = self.config.quality.min_source_quality
+        min_tavily = getattr(search_cfg, 'min_tavily_score', 0.3)
+        max_sources = search_cfg.max_sources_per_task or len(queries) * search_cfg.results_per_query
+        floor_per_query = search_cfg.min_sources_per_query
 
-        Each query contributes up to ``results_per_query`` sources so that every
-        query is represented in the final context.
+        query_results: Dict[int, List[dict]] = {}
+        query_ranked: Dict[int, List[dict]] = {}  # per-query pre-scrape ranking
+        fused_order: List[dict] = []  # set once all searches have returned
+        scrape_requested: Dict[str, int] = {}  # url -> query index that requested it
+        scrape_failed: set = set()
+        scraped: Dict[str, Source] = {}
+        extracted: Dict[str, str] = {}
+        fresh: Dict[str, Source] = {}  # stored pages within the freshness window
+        freshness_hours = self.config.scraping.source_freshness_hours
+        cache_outcomes: Dict[str, int] = {}
+        ext_cfg = self.config.extraction
+        batching = ext_cfg.batch_enabled and bool(task_topic)
+        batch: List[Tuple[str, Source]] = []
+        batch_tokens = 0
+
+        search_pool = scrape_pool = get_executor("io")
+        extract_pool = get_executor("llm")
+        pending: Dict[Any, tuple] = {}
+
+        def active() -> int:
+            return len(scrape_requested) - len(scrape_failed)
+
+        def submit_scrape(result: dict, qi: int) -> bool:
+            url = result.get('url', '')
+            if not url or url in scrape_requested or active() >= max_sources:
+                return False
+            scrape_requested[url] = qi
+            pending[scrape_pool.submit(self._scrape_candidate, result, fresh.get(url))] = ("scrape", url)
+            return True
+
+        def fill_floor(qi: int) -> None:
+            # Keep floor_per_query live (requested, not failed) scrapes for this query
+            live = sum(1 for u, q in scrape_requested.items() if q == qi and u not in scrape_failed)
+            for result in query_ranked.get(qi, []):
+                if live >= floor_per_query:
+                    break
+                if submit_scrape(result, qi):
+                    live += 1
 
-        Returns (context_string, source_count).
-        """
-        results_per_query = self.config.search.results_per_query
+        def top_up() -> None:
+            for result in fused_order:
+                if active() >= max_sources:
+                    break
+                submit_scrape(result, -1)
+
+        def flush_batch() -> None:
+            nonlocal batch_tokens
+            if not batch:
+                return
+            urls = tuple(url for url, _ in batch)
+            pending[extract_pool.submit(
+                self._extract_batch_with_cache, [src for _, src in batch],
+                task_topic, task_description, overall_query,
+            )] = ("extract_batch", urls)
+            batch.clear()
+            batch_tokens = 0
+
+        def record_extraction(url: str, text: str, outcome: str) -> None:
+            cache_outcomes[outcome] = cache_outcomes.get(outcome, 0) + 1
+            if text:
+                extracted[url] = text
+
+        # Search results of an earlier attempt at this task (see research_task)
+        checkpointing = task_id is not None and self.config.research.checkpoint_steps
+        searched: Dict[int, List[dict]] = {}
+        if checkpointing:
+            try:
+                searched = self._load_search_checkpoints(task_id, queries)
+            except Exception as e:
+                logger.warning(f"Could not load search checkpoint for task {task_id}: {e}")
+
+        try:
+            for qi, q in enumerate(queries):
+                if qi in searched:
+                    future = Future()
+                    future.set_result(searched[qi])
+                else:
+                    future = search_pool.submit(self._search_single_query, q, task_id, session_id)
+                pending[future] = ("search", qi)
+
+            while pending:
+                done, _ = wait(list(pending), timeout=_CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+                check_cancelled()
+                for future in done:
+                    kind, key = pending.pop(future)
+
+                    if kind == "search":
+                        try:
+                            query_results[key] = future.result()
+                        except Exception as e:
+                            logger.warning(f"Search query {key} failed: {e}")
+                            query_results[key] = []
+                        if checkpointing and key not in searched and query_results[key]:
+                            searched[key] = query_results[key]
+                            self._checkpoint_search_results(task_id, key, queries[key], query_results[key])
+                        if freshness_hours > 0:
+                            try:
+                                fresh.update(self.db.get_fresh_sources(
+                                    [r.get('url', '') for r in query_results[key]], freshness_hours,
+                                ))
+                            except Exception as e:
+                                logger.warning(f"Fresh source lookup failed: {e}")
+                        query_ranked[key] = [
+                            r for r in rank_search_results(
+                                query_results[key], query=queries[key], min_quality=min_quality,
+                            )
+                            if not is_blocked_source(r.get('url', ''))
+                            and r.get('score', 1.0) >= min_tavily
+                        ]
+                        fill_floor(key)
+                        if len(query_results) == len(queries):
+                            total_raw = sum(len(r) for r in query_results.values())
+                            logger.info(f"Total raw results across {len(queries)} queries: {total_raw}")
+                            fused_order = [
+                                c.result for c in fuse_search_results(
+                                    query_results, queries,
+                                    top_k=max_sources, min_per_query=0,
+                                    rrf_k=search_cfg.rrf_k,
+                                    min_tavily=min_tavily, min_quality=min_quality,
+                                )
+                            ]
+                            top_up()
+
+                    elif kind == "scrape":
+                        try:
+                            source = future.result()
+                        except Exception as e:
+                            logger.warning(f"Failed to extract from {key}: {e}")
+                            source = None
+                        if source is None:
+                            scrape_failed.add(key)
+                            qi = scrape_requested[key]
+                            if qi >= 0 and not fused_order:
+                                fill_floor(qi)
+                            else:
+                                top_up()
+                            continue
+                        scraped[key] = source
+                        if batching:
+                            content = source.full_content or source.snippet or ""
+                            tokens = min(len(content), self.config.scraping.max_content_length) // 4  # ~4 chars/token
+                            if batch and batch_tokens + tokens > ext_cfg.batch_max_tokens:
+                                flush_batch()
+                            batch.append((key, source))
+                            batch_tokens += tokens
+                            if len(batch) >= self._pack_max_sources():
+                                flush_batch()
+                        elif task_topic:
+                            pending[extract_pool.submit(
+                                self._extract_with_cache, source,
+                                task_topic, task_description, overall_query,
+                            )] = ("extract", key)
+
+                    elif kind == "extract":
+                        try:
+                            record_extraction(key, *future.result())
+                        except Exception as e:
+                            logger.warning(f"Extraction future failed for {key}: {e}")
+
+                    else:  # extract_batch
+                        try:
+                            for url, (text, outcome) in zip(key, future.result()):
+                                record_extraction(url, text, outcome)
+                        except Exception as e:
+                            logger.warning(f"Packed extraction future failed for {len(key)} sources: {e}")
+
+                # No more sources can arrive: extract the partial batch now
+                if batch and not any(k in ("search", "scrape") for k, _ in pending.values()):
+                    flush_batch()
+        finally:
+            # Only reached with work pending on error or cancellation; drop what has not started
+            cancel_pending(pending)
+
+        # Deterministic citation order: coverage floor in query order, then fused rank
+        ordered: List[str] = []
+        for qi in sorted(query_ranked):
+            picked = 0
+            for result in query_ranked[qi]:
+                if picked >= floor_per_query:
+                    break
+                url = result.get('url', '')
+                if url in scraped and url not in ordered:
+                    ordered.append(url)
+                    picked += 1
+        for result in fused_order:
+            url = result.get('url', '')
+            if url in scraped and url not in ordered:
+                ordered.append(url)
+        ordered = ordered[:max_sources]
+
+        saved_sources = []
+        extraction_results: Dict[int, str] = {}
+        source_ids = self._save_sources(
+            task_id, [(scraped[url], pos) for pos, url in enumerate(ordered)]
+        )
+        extractions: Dict[int, str] = {}
+        for pos, (url, source_id) in enumerate(zip(ordered, source_ids)):
+            if source_id is None:
+                continue
+            saved_sources.append((pos, scraped[url], source_id))
+            text = extracted.get(url)
+            if text:
+                extraction_results[pos] = text
+                extractions[source_id] = text
+        try:
+            self.db.update_extractions_bulk(task_id, extractions)
+        except Exception as e:
+            logger.warning(f"Failed to save extractions for {len(extractions)} sources: {e}")
+
+        lookups = sum(n for kind, n in cache_outcomes.items() if kind != "disabled")
+        if lookups:
+            hits = cache_outcomes.get("exact", 0) + cache_outcomes.get("near", 0)
+            self.db.add_run_event(
+                session_id=session_id, task_id=task_id,
+                event_type="extraction_cache", severity="info",
+                payload_json=json.dumps({
+                    "exact_hits": cache_outcomes.get("exact", 0),
+                    "near_hits": cache_outcomes.get("near", 0),
+                    "misses": cache_outcomes.get("miss", 0),
+                    "hit_rate": round(hits / lookups, 3),
+                }),
+            )
+
+        reused = sum(1 for url in scrape_requested if url in fresh)
         logger.info(
-            f"Executing searches with {len(queries)} queries, "
-            f"{results_per_query} results per query"
+            f"Kept {len(saved_sources)}/{max_sources} sources "
+            f"({len(scrape_requested)} scraped, {reused} reused from store, "
+            f"{len(scrape_failed)} rejected)"
         )
+        return saved_sources, extraction_results
 
-        # Phase 1: Run all search queries in parallel, track per-query results
-        query_results: Dict[int, List[dict]] = {}
+    def _save_sources(self, task_id: int, sources: List[Tuple[Source, int]]) -> List[Optional[int]]:
+        """Save (source, position) pairs in one transaction, one by one if that fails.
 
-        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
-            futures = {
-                executor.submit(self._search_single_query, q, task_id, session_id): i
-                for i, q in enumerate(queries)
-            }
-            for future in as_completed(futures):
-                qi = futures[future]
-                try:
-                    query_results[qi] = future.result()
-                except Exception as e:
-                    logger.warning(f"Search query {qi} failed: {e}")
-                    query_results[qi] = []
+        Returns source IDs in input order, None for sources that could not
+        be saved, so a failed bulk write loses at most the offending rows.
+        """
+        if not sources:
+            return []
+        try:
+            return self.db.add_sources_bulk(task_id, sources)
+        except RunCancelled:
+            raise
+        except Exception as e:
+            logger.warning(f"Bulk save of {len(sources)} sources failed, saving one by one: {e}")
+        source_ids: List[Optional[int]] = []
+        for source, position in sources:
+            try:
+                source_ids.append(self.db.add_source(source, task_id=task_id, position=position).id)
+            except RunCancelled:
+                raise
+            except Exception as e:
+                logger.warning(f"Failed to save source {source.url}: {e}")
+                source_ids.append(None)
+        return source_ids
 
-        total_raw = sum(len(r) for r in query_results.values())
-        logger.info(f"Total raw results across {len(queries)} queries: {total_raw}")
+    def _checkpoint_search_results(self, task_id: int, index: int, query: str, results: List[dict]) -> None:
+        """Checkpoint one query's results in its own row, written once."""
+        check_cancelled()
+        try:
+            self.db.save_task_checkpoint(task_id, f"{_SEARCH_STEP}:{index}", {
+                "query": query, "results": results,
+            })
+        except Exception as e:
+            logger.warning(f"Could not checkpoint search results for task {task_id}: {e}")
+
+    def _load_search_checkpoints(self, task_id: int, queries: List[str]) -> Dict[int, List[dict]]:
+        """{query index: results} checkpointed for the same query text."""
+        searched: Dict[int, List[dict]] = {}
+        for step, payload in self.db.get_task_checkpoints(task_id).items():
+            prefix, _, index = step.partition(":")
+            if prefix != _SEARCH_STEP or not index.isdigit():
+                continue
+            qi = int(index)
+            if qi < len(queries) and payload.get("query") == queries[qi]:
+                searched[qi] = payload["results"]
+        return searched
+
+    def _extraction_cache_key(
+        self, source: Source, task_topic: str, task_description: str, prompt_name: str,
+    ) -> Optional[tuple]:
+        """Cache key for one source: (content_hash, topic_key, prompt_version, terms).
+
+        Keys combine the hash of the content sent to the extractor, a
+        fingerprint of the normalized topic/description and the extraction
+        prompt version (prompt text + analyzer model), so edits to the prompt
+        or model invalidate old entries. Returns None for empty content.
+        """
+        content = (source.full_content or source.snippet or "")[:self.config.scraping.max_content_length]
+        if not content.strip():
+            return None
+        ps = get_prompt_set("research_topic", prompt_name)
+        prompt_version = _sha256(
+            ps["system"] + ps["user"] + ps.get("source", "") + self.config.llm.models.analyzer
+        )
+        terms = _topic_terms(task_topic, task_description)
+        return _sha256(content), _sha256(" ".join(sorted(terms))), prompt_version, terms
 
-        # Phase 2: For each query (in order), scrape up to results_per_query sources.
-        # URLs are deduped across queries so the same page isn't scraped twice.
-        saved_sources = []  # list of (position, Source pydantic object with id)
-        seen_urls: set = set()
-        source_counter = 0
-        min_tavily = getattr(self.config.search, 'min_tavily_score', 0.3)
+    def _lookup_extraction(self, key: tuple, url: str) -> Optional[tuple]:
+        """Return (text, "exact" | "near") from the extraction cache, or None."""
+        ext_cfg = self.config.extraction
+        content_hash, topic_key, prompt_version, terms = key
+        try:
+            cached = self.db.get_cached_extraction(
+                content_hash, topic_key, prompt_version,
+                topic_terms=terms if ext_cfg.near_topic_reuse else None,
+                min_similarity=ext_cfg.near_topic_min_similarity if ext_cfg.near_topic_reuse else None,
+            )
+        except Exception as e:
+            logger.warning(f"Extraction cache lookup failed for {url}: {e}")
+            return None
+        if cached:
+            logger.info(f"Extraction cache {cached[1]} hit: {url[:60]}")
+        return cached
+
+    def _store_extraction(self, key: tuple, url: str, extracted: str) -> None:
+        content_hash, topic_key, prompt_version, terms = key
+        try:
+            self.db.put_cached_extraction(content_hash, topic_key, prompt_version, terms, extracted)
+        except Exception as e:
+            logger.warning(f"Failed to cache extraction for {url}: {e}")
 
-        for qi in sorted(query_results.keys()):
-            results = query_results[qi]
-            query_source_count = 0
+    def _extract_with_cache(
+        self, source: Source, task_topic: str, task_description: str, overall_query: str,
+    ) -> Tuple[str, str]:
+        """Extract a source, reusing a stored extraction when one matches. Thread-safe.
 
-            for result in results:
-                if query_source_count >= results_per_query:
-                    break
+        Returns (extracted_text, outcome) where outcome is one of
+        "exact", "near", "miss" or "disabled".
+        """
+        if not self.config.extraction.cache_enabled:
+            return self._extract_source_content(source, task_topic, task_description, overall_query), "disabled"
+
+        key = self._extraction_cache_key(source, task_topic, task_description, "extract_source")
+        if key is None:
+            return "", "miss"
+        cached = self._lookup_extraction(key, source.url)
+        if cached:
+            return cached
+
+        extracted = self._extract_source_content(source, task_topic, task_description, overall_query)
+        if extracted:
+            self._store_extraction(key, source.url, extracted)
+        return extracted, "miss"
+
+    def _pack_max_sources(self) -> int:
+        """Sources per packed extraction call.
+
+        ``batch_max_sources``, lowered so that the per-source analyzer
+        output budget times the pack size fits ``batch_max_output_tokens``.
+        """
+        ext_cfg = self.config.extraction
+        per_source = max(1, self.config.llm.max_tokens.analyzer)
+        return max(1, min(ext_cfg.batch_max_sources, ext_cfg.batch_max_output_tokens // per_source))
 
-                url = result.get('url', '')
-                if not url or url in seen_urls:
-                    continue
-                seen_urls.add(url)  # mark seen regardless of outcome
+    def _extract_sources_packed(
+        self, sources: List[Source], task_topic: str, task_description: str, overall_query: str,
+    ) -> List[str]:
+        """Extract several sources with one structured analyzer call. Thread-safe.
 
-                if is_blocked_source(url):
-                    logger.info(f"Blocked source (skipping): {url}")
-                    continue
+        Sources are packed into a single ``extract_sources_batch`` prompt and
+        the per-source notes come back through a tool call. Sources missing
+        from (or empty in) the response, or all of them when the call or
+        parsing fails, fall back to single ``_extract_source_content`` calls.
+        The call's ``max_tokens`` never exceeds ``batch_max_output_tokens``.
 
-                tavily_score = result.get('score', 1.0)
-                if tavily_score < min_tavily:
-                    logger.info(f"Low Tavily score ({tavily_score:.2f}), skipping: {url}")
-                    continue
+        Returns extracted texts in the same order as ``sources``.
+        """
+        if len(sources) == 1:
+            return [self._extract_source_content(sources[0], task_topic, task_description, overall_query)]
 
-                try:
-                    print_scrape(url)
-                    source = extract_source_info(url, result)
-                    logger.info(f"Source: {url[:60]} quality={source.quality_score} content_len={len(source.full_content or '')}")
+        ps = get_prompt_set("research_topic", "extract_sources_batch")
+        tool_def = ps["tool"]
+        max_len = self.config.scraping.max_content_length
+        sources_block = "\n".join(
+            ps["source"].format(
+                source_id=i + 1,
+                title=src.title,
+                url=src.url,
+                content_trimmed=(src.full_content or src.snippet or "")[:max_len],
+            )
+            for i, src in enumerate(sources)
+        )
+        prompt = ps["user"].format(
+            overall_query=overall_query,
+            task_topic=task_topic,
+            task_description=task_description,
+            sources_block=sources_block,
+        )
 
-                    if source.quality_score < self.config.quality.min_source_quality:
-                        logger.info(f"Skipping low-quality source: {url}")
-                        continue
+        notes: Dict[int, str] = {}
+        try:
+            payload = self.client.complete_with_function(
+                prompt=prompt,
+                system=ps["system"],
+                function_name=tool_def["name"],
+                function_description=tool_def["description"],
+                function_parameters=tool_def["parameters"],
+                max_tokens=min(
+                    self.config.llm.max_tokens.analyzer * len(sources),
+                    self.config.extraction.batch_max_output_tokens,
+                ),
+                temperature=self.config.llm.temperature.analyzer,
+                model=self.config.llm.models.analyzer,
+            )
+            for item in (payload or {}).get("extractions", []):
+                sid = int(item.get("source_id", 0))
+                text = (item.get("notes") or "").strip()
+                if 1 <= sid <= len(sources) and text:
+                    notes[sid - 1] = text
+        except Exception as e:
+            logger.warning(f"Packed extraction of {len(sources)} sources failed; falling back: {e}")
+
+        if len(notes) < len(sources):
+            logger.info(f"Packed extraction returned {len(notes)}/{len(sources)} sources; extracting the rest singly")
+        return [
+            notes[i] if i in notes
+            else self._extract_source_content(src, task_topic, task_description, overall_query)
+            for i, src in enumerate(sources)
+        ]
 
-                    content = source.full_content or source.snippet or ""
-                    if content:
-                        db_source = self.db.add_source(source, task_id, position=source_counter)
-                        saved_sources.append((source_counter, source, db_source))
-                        source_counter += 1
-                        query_source_count += 1
+    def _extract_batch_with_cache(
+        self, sources: List[Source], task_topic: str, task_description: str, overall_query: str,
+    ) -> List[Tuple[str, str]]:
+        """Cache-aware packed extraction. Thread-safe.
 
-                except Exception as e:
-                    logger.warning(f"Failed to extract from {url}: {e}")
+        Cache hits are served directly; the remaining sources share one
+        packed call. Returns (extracted_text, outcome) per source, in order.
+        """
+        use_cache = self.config.extraction.cache_enabled
+        results: List[Optional[Tuple[str, str]]] = [None] * len(sources)
+        keys: Dict[int, tuple] = {}
+
+        if use_cache:
+            for i, src in enumerate(sources):
+                key = self._extraction_cache_key(src, task_topic, task_description, "extract_sources_batch")
+                if key is None:
+                    results[i] = ("", "miss")
                     continue
+                keys[i] = key
+                cached = self._lookup_extraction(key, src.url)
+                if cached:
+                    results[i] = cached
+
+        todo = [i for i, r in enumerate(results) if r is None]
+        if todo:
+            texts = self._extract_sources_packed(
+                [sources[i] for i in todo], task_topic, task_description, overall_query,
+            )
+            for i, text in zip(todo, texts):
+                text = text.strip() if text else ""
+                if use_cache and text and i in keys:
+                    self._store_extraction(keys[i], sources[i].url, text)
+                results[i] = (text, "miss" if use_cache else "disabled")
+        return results
+
+    def _execute_searches(
+        self, queries: List[str], task_id: int, session_id: int = None,
+        task_topic: str = "", task_description: str = "", overall_query: str = "",
+    ) -> Tuple[str, int, List[list]]:
+        """Search, scrape and extract sources, then aggregate them into context.
+
+        Results from all queries are fused and only the top
+        ``max_sources_per_task`` candidates are scraped and extracted, with
+        ``min_sources_per_query`` reserved for each query so that every query
+        is represented in the final context. See ``_stream_sources`` for the
+        overlapped pipeline.
+
+        Returns (context_string, source_count, [[position, source_id], ...]).
+        """
+        results_per_query = self.config.search.results_per_query
+        logger.info(
+            f"Executing searches with {len(queries)} queries, "
+            f"{results_per_query} results per query"
+        )
 
-            logger.info(f"Query {qi}: kept {query_source_count}/{results_per_query} sources")
-
-        # Phase 3: Run LLM extraction on each source in parallel
-        extraction_results = {}  # position -> extracted_content
-        if saved_sources and task_topic:
-            with ThreadPoolExecutor(max_workers=min(len(saved_sources), 4)) as executor:
-                future_map = {
-                    executor.submit(
-                        self._extract_source_content, src, task_topic, task_description, overall_query
-                    ): pos
-                    for pos, src, db_src in saved_sources
-                }
-                for future in as_completed(future_map):
-                    pos = future_map[future]
-                    try:
-                        extracted = future.result()
-                        if extracted:
-                            extraction_results[pos] = extracted
-                    except Exception as e:
-                        logger.warning(f"Extraction future failed for position {pos}: {e}")
-
-            # Persist extracted content to DB
-            for pos, src, db_src in saved_sources:
-                extracted = extraction_results.get(pos)
-                if extracted and db_src.id:
-                    try:
-                        self.db.update_source_extraction(task_id, db_src.id, extracted)
-                    except Exception as e:
-                        logger.warning(f"Failed to save extraction for source {db_src.id}: {e}")
-
-        # Phase 4: Build context string from extracted content (or fall back to raw)
+        saved_sources, extraction_results = self._stream_sources(
+            queries, task_id, session_id=session_id,
+            task_topic=task_topic, task_description=task_description,
+            overall_query=overall_query,
+        )
+        context = self._build_search_context(saved_sources, extraction_results)
+        refs = [[pos, source_id] for pos, _src, source_id in saved_sources]
+        return context, len(saved_sources), refs
+
+    def _build_search_context(self, saved_sources: List[tuple], extraction_results: Dict[int, str]) -> str:
+        """Context string from extracted content, falling back to raw page text."""
         context_parts = []
-        for pos, src, db_src in saved_sources:
-            extracted = extraction_results.get(pos)
-            if extracted:
-                context_parts.append(
-                    f"\n### Source {pos + 1}: {src.title}\n"
-                    f"URL: {src.url}\n"
-                    f"Domain: {src.domain}\n"
-                    f"{'[Academic Source]' if src.is_academic else ''}\n\n"
-                    f"{extracted}\n"
-                )
-            else:
-                # Fall back to raw content
-                content = src.full_content or src.snippet or ""
-                max_len = self.config.scraping.max_content_length
-                content_str = content[:max_len]
-                if len(content) > max_len:
-                    content_str += "\n[... content truncated ...]"
-                context_parts.append(
-                    f"\n### Source {pos + 1}: {src.title}\n"
-                    f"URL: {src.url}\n"
-                    f"Domain: {src.domain}\n"
-                    f"{'[Academic Source]' if src.is_academic else ''}\n\n"
-                    f"{content_str}\n"
-                )
+        for pos, src, _source_id in saved_sources:
+            body = extraction_results.get(pos) or self._truncate_content(src.full_content or src.snippet or "")
+            context_parts.append(f"\n{_source_block(pos + 1, src, body)}\n")
+        return "\n\n---\n\n".join(context_parts)
 
-        return "\n\n---\n\n".join(context_parts), source_counter
+    def _restore_search_context(self, task_id: int, refs: List[list]) -> str:
+        """Rebuild a checkpointed search context from the stored sources and notes."""
+        stored = {src.id: src for src in self.db.get_sources_for_task(task_id)}
+        saved_sources = [(pos, stored[sid], sid) for pos, sid in refs if sid in stored]
+        extraction_results = {
+            pos: src.extracted_content for pos, src, _ in saved_sources if src.extracted_content
+        }
+        return self._build_search_context(saved_sources, extraction_results)
+
+    def _restore_gap_context(self, task_id: int, refs: List[list]) -> str:
+        """Rebuild a checkpointed gap-fill context from the stored sources."""
+        stored = {src.id: src for src in self.db.get_sources_for_task(task_id)}
+        return "\n\n---\n\n".join(
+            _source_block(num, stored[sid], self._truncate_content(
+                stored[sid].full_content or stored[sid].snippet or ""
+            ))
+            for num, sid in refs if sid in stored
+        )
+
+    def _truncate_content(self, content: str) -> str:
+        max_len = self.config.scraping.max_content_length
+        if len(content) > max_len:
+            return content[:max_len] + "\n[... content truncated ...]"
+        return content
 
     def _identify_gaps(
         self, task: ResearchTask, search_context: str, overall_query: str
@@ -561,47 +1098,68 @@ class ResearcherAgent:
         existing_urls: set,
         session_id: int = None,
         source_number_offset: int = 0,
-    ) -> str:
+    ) -> Tuple[str, List[list]]:
         """Execute gap-fill search queries, scrape new results, and return context.
 
         Skips URLs already seen in the initial search. Saves sources with position
         offset of 100 to keep gap-fill citations after initial sources.
+
+        Returns (context_string, [[source_number, source_id], ...]).
         """
         max_results = self.config.search.gap_fill_max_results
         if max_results <= 0:
-            return ""
+            return "", []
 
         # Run all gap-fill searches in parallel
         all_results = []
         seen_urls = set(existing_urls)
 
-        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
-            futures = [
-                executor.submit(self._search_single_query, q, task_id, session_id)
-                for q in queries
-            ]
+        executor = get_executor("io")
+        futures = [
+            executor.submit(self._search_single_query, q, task_id, session_id)
+            for q in queries
+        ]
+        try:
             for future in as_completed(futures):
+                check_cancelled()
                 try:
                     for r in future.result():
                         url = r.get("url", "")
                         if url and url not in seen_urls:
                             seen_urls.add(url)
                             all_results.append(r)
+                except RunCancelled:
+                    raise
                 except Exception as e:
                     logger.warning(f"Gap-fill search failed: {e}")
+        finally:
+            cancel_pending(futures)
 
         if not all_results:
             logger.info(f"Gap-fill searches returned no new results for task {task_id}")
-            return ""
+            return "", []
 
         logger.info(f"Gap-fill found {len(all_results)} new results for task {task_id}")
 
         # Scrape and build context
         context_parts = []
+        gap_sources: List[Tuple[Source, int]] = []
+        source_numbers: List[int] = []
         sources_added = 0
         min_tavily = getattr(self.config.search, 'min_tavily_score', 0.3)
 
-        for result in all_results[: max_results * 2]:
+        ranked = rank_search_results(
+            all_results, query=" ".join(queries),
+            min_quality=self.config.quality.min_source_quality,
+        )
+
+        candidates = ranked[: max_results * 2]
+        fresh = self.db.get_fresh_sources(
+            [r.get("url", "") for r in candidates],
+            self.config.scraping.source_freshness_hours,
+        )
+
+        for result in candidates:
             url = result.get("url", "")
             if not url:
                 continue
@@ -617,39 +1175,36 @@ class ResearcherAgent:
                 logger.info(f"Gap-fill low Tavily score ({tavily_score:.2f}): {url}")
                 continue
 
+            check_cancelled()
             try:
-                print_scrape(url)
-                source = extract_source_info(url, result)
+                if url not in fresh:
+                    print_scrape(url)
+                source = extract_source_info(url, result, known_source=fresh.get(url))
                 if source.quality_score < self.config.quality.min_source_quality:
                     continue
 
                 content = source.full_content or source.snippet or ""
-                max_len = self.config.scraping.max_content_length
                 if content:
                     # Save source only when it will appear in the prompt
                     # Position offset 100+ so gap-fill citations sort after initial sources
-                    self.db.add_source(source, task_id, position=100 + sources_added)
+                    gap_sources.append((source, 100 + sources_added))
 
                     sources_added += 1
                     source_num = source_number_offset + sources_added
-                    content_str = content[:max_len]
-                    if len(content) > max_len:
-                        content_str += "\n[... content truncated ...]"
-                    context_parts.append(
-                        f"### Source {source_num}: {source.title}\n"
-                        f"URL: {source.url}\n"
-                        f"Domain: {source.domain}\n"
-                        f"{'[Academic Source]' if source.is_academic else ''}\n\n"
-                        f"{content_str}"
-                    )
+                    source_numbers.append(source_num)
+                    context_parts.append(_source_block(source_num, source, self._truncate_content(content)))
                     if sources_added >= max_results:
                         break
+            except RunCancelled:
+                raise
             except Exception as e:
                 logger.warning(f"Gap-fill scrape failed for {url}: {e}")
                 continue
 
+        source_ids = self._save_sources(task_id, gap_sources)
         logger.info(f"Gap-fill added {sources_added} new sources for task {task_id}")
-        return "\n\n---\n\n".join(context_parts)
+        refs = [[num, sid] for num, sid in zip(source_numbers, source_ids) if sid is not None]
+        return "\n\n---\n\n".join(context_parts), refs
 
     def _synthesize(
         self,
@@ -1,4 +1,5 @@
-"""GapAnalysisAgent — identifies gaps after initial research completes."""
+"""GapAnalysisAgent — identifies gaps in a section before it is synthesized,
+and across the report after initial research completes."""
 import json
 from typing import List, Dict
 
@@ -7,6 +8,7 @@ from src.config.types import ResearchTask, ReportSection, TaskStatus, SectionSta
 from src.infra.llm import get_llm_client
 from src.pipeline._tools import read_file, generate_file_path
 from src.infra._database import get_database
+from src.infra.cancellation import RunCancelled
 from src.config.logger import get_logger
 
 from src.pipeline._stages._prompts import get_prompt_set
@@ -43,21 +45,14 @@ class GapAnalysisAgent:
         logger.info("Running comprehensive gap analysis...")
 
         # Build section summaries from completed task notes
-        section_summaries = []
-        for section in sections:
-            tasks = self.db.get_tasks_for_section(section.id)
-            completed = [t for t in tasks if t.status == "completed"]
-            notes = []
-            for t in completed:
-                content = read_file(t.file_path)
-                if content:
-                    words = content.split()
-                    notes.append(f"**{t.topic}**: " + " ".join(words[:200]))
-            section_summaries.append({
+        section_summaries = [
+            {
                 "title": section.title,
                 "description": section.description,
-                "research_notes": "\n".join(notes) if notes else "(no research completed)"
-            })
+                "research_notes": self._section_notes(section),
+            }
+            for section in sections
+        ]
 
         # Build prompt
         outline_text = "\n".join(
@@ -95,6 +90,88 @@ class GapAnalysisAgent:
             logger.warning(f"Gap analysis failed: {e}")
             return {"new_tasks": 0, "new_sections": 0}
 
+    def analyze_section_gaps(
+        self,
+        query: str,
+        section: ReportSection,
+        session_id: int,
+        max_tasks: int,
+    ) -> int:
+        """Check one section's finished research for gaps before synthesis.
+
+        Only the section's own task notes are reviewed, and only tasks for
+        that section are added (at most ``max_tasks``). Returns the number
+        of new tasks; 0 means the section can be synthesized.
+        """
+        if max_tasks <= 0:
+            return 0
+
+        ps = get_prompt_set("review_gaps", "analyze_section_gaps")
+        prompt = ps["user"].format(
+            query=query,
+            section_title=section.title,
+            section_description=section.description,
+            research_notes=self._section_notes(section),
+            max_tasks=max_tasks,
+        )
+
+        try:
+            response = self.client.complete(
+                prompt=prompt,
+                system=ps["system"],
+                max_tokens=self.config.llm.max_tokens.analyzer,
+                temperature=self.config.llm.temperature.analyzer,
+                json_mode=True,
+                model=self.config.llm.models.analyzer
+            )
+            suggested = json.loads(response).get("suggested_tasks", [])[:max_tasks]
+        except RunCancelled:
+            raise
+        except Exception as e:
+            logger.warning(f"Section gap check failed for '{section.title}': {e}")
+            return 0
+
+        if not suggested:
+            return 0
+        output_dir = f"{self.config.output.directory}/session_{session_id}"
+        task_index = self.db.get_task_count(session_id=session_id)
+        for task_data in suggested:
+            task_index += 1
+            self.db.add_task(self._gap_task(section.id, task_data, output_dir, task_index), session_id)
+        self.db.update_session(session_id, total_tasks=self.db.get_task_count(session_id=session_id))
+
+        logger.info(f"Section gap check added {len(suggested)} tasks to '{section.title}'")
+        return len(suggested)
+
+    def _section_notes(self, section: ReportSection) -> str:
+        """First 200 words of each completed task's notes in ``section``."""
+        notes = []
+        for t in self.db.get_tasks_for_section(section.id):
+            if t.status != TaskStatus.COMPLETED.value:
+                continue
+            content = read_file(t.file_path)
+            if content:
+                words = content.split()
+                notes.append(f"**{t.topic}**: " + " ".join(words[:200]))
+        return "\n".join(notes) if notes else "(no research completed)"
+
+    @staticmethod
+    def _gap_task(section_id: int, task_data: dict, output_dir: str, task_index: int) -> ResearchTask:
+        return ResearchTask(
+            section_id=section_id,
+            topic=task_data.get("topic", "Gap-fill task"),
+            description=task_data.get("description", ""),
+            file_path=generate_file_path(
+                task_data.get("topic", "gap-fill"),
+                output_dir,
+                task_index
+            ),
+            priority=task_data.get("priority", 5),
+            depth=0,
+            is_gap_fill=True,
+            status=TaskStatus.PENDING
+        )
+
     def _process_gaps(
         self,
         data: dict,
@@ -103,7 +180,7 @@ class GapAnalysisAgent:
         session_id: int
     ) -> dict:
         """Process gap analysis results: create tasks and sections in DB."""
-        output_dir = self.config.output.directory
+        output_dir = f"{self.config.output.directory}/session_{session_id}"
         existing_count = self.db.get_task_count(session_id=session_id)
         task_index = existing_count
         total_new_tasks = 0
@@ -125,21 +202,7 @@ class GapAnalysisAgent:
                 if total_new_tasks >= max_gap_tasks:
                     break
                 task_index += 1
-                task = ResearchTask(
-                    section_id=section.id,
-                    topic=task_data.get("topic", "Gap-fill task"),
-                    description=task_data.get("description", ""),
-                    file_path=generate_file_path(
-                        task_data.get("topic", "gap-fill"),
-                        output_dir,
-                        task_index
-                    ),
-                    priority=task_data.get("priority", 5),
-                    depth=0,
-                    is_gap_fill=True,
-                    status=TaskStatus.PENDING
-                )
-                self.db.add_task(task, session_id)
+                self.db.add_task(self._gap_task(section.id, task_data, output_dir, task_index), session_id)
                 total_new_tasks += 1
 
         # Process new sections
@@ -163,21 +226,9 @@ class GapAnalysisAgent:
                 if total_new_tasks >= max_gap_tasks:
                     break
                 task_index += 1
-                task = ResearchTask(
-                    section_id=saved_section.id,
-                    topic=task_data.get("topic", "Gap-fill task"),
-                    description=task_data.get("description", ""),
-                    file_path=generate_file_path(
-                        task_data.get("topic", "gap-fill"),
-                        output_dir,
-                        task_index
-                    ),
-                    priority=task_data.get("priority", 5),
-                    depth=0,
-                    is_gap_fill=True,
-                    status=TaskStatus.PENDING
+                self.db.add_task(
+                    self._gap_task(saved_section.id, task_data, output_dir, task_index), session_id
                 )
-                self.db.add_task(task, session_id)
                 total_new_tasks += 1
 
         # Update session task count
@@ -17,12 +17,28 @@ from .quality import (
     HIGH_QUALITY_DOMAINS,
     BLOCKED_DOMAINS,
     BLOCKED_URL_PATTERNS,
+    DomainSuffixIndex,
+    UrlClassification,
     get_domain,
+    classify_url,
+    reload_domain_lists,
     is_academic_source,
+    is_high_quality_source,
     is_blocked_source,
     is_junk_content,
     content_relevance_score,
     calculate_quality_score,
+    bm25_scores,
+    BatchScore,
+    score_sources_batch,
+    rank_search_results,
+)
+
+# ranking.py
+from .ranking import (
+    FUSION_WEIGHTS,
+    FusedCandidate,
+    fuse_search_results,
 )
 
 # search.py
@@ -1,9 +1,18 @@
 """Source quality scoring and domain classification."""
+import os
 import re
-from typing import List
+import threading
+import time
+from functools import lru_cache
+from typing import List, Iterable, NamedTuple, Optional
 from urllib.parse import urlparse
 
+import numpy as np
+import yaml
+
+from src.config.settings import get_config
 from src.config.logger import get_logger
+from .text import strip_image_data
 
 logger = get_logger(__name__)
 
@@ -64,6 +73,176 @@ _STOPWORDS = frozenset({
 })
 
 
+# =============================================================================
+# DOMAIN INDEX
+# =============================================================================
+
+class DomainSuffixIndex:
+    """Reversed-label trie for domain-suffix membership.
+
+    ``"ac.uk"`` is stored as ``uk -> ac``; a lookup walks the labels of the
+    queried domain right-to-left, so the cost is O(labels) no matter how many
+    suffixes are indexed.
+    """
+
+    _END = ""  # terminal marker (never a valid DNS label)
+
+    def __init__(self, domains: Iterable[str] = ()):
+        self._root: dict = {}
+        self._size = 0
+        for domain in domains:
+            self.add(domain)
+
+    def add(self, domain: str) -> None:
+        labels = [label for label in domain.lower().strip().strip(".").split(".") if label]
+        if not labels:
+            return
+        node = self._root
+        for label in reversed(labels):
+            node = node.setdefault(label, {})
+        if self._END not in node:
+            node[self._END] = True
+            self._size += 1
+
+    def matches(self, domain: str) -> bool:
+        """True if *domain* equals, or is a subdomain of, an indexed suffix."""
+        node = self._root
+        for label in reversed(domain.split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class _DomainLists:
+    """Compiled domain indexes and URL-pattern regex for one list version."""
+
+    def __init__(
+        self,
+        academic: Iterable[str],
+        high_quality: Iterable[str],
+        blocked: Iterable[str],
+        url_patterns: Iterable[str],
+        source: Optional[str] = None,
+        mtime: Optional[float] = None,
+    ):
+        self.academic = DomainSuffixIndex(academic)
+        self.high_quality = DomainSuffixIndex(high_quality)
+        self.blocked = DomainSuffixIndex(blocked)
+        patterns = [p for p in url_patterns if p]
+        # One alternation instead of N separate searches per URL
+        self.blocked_url_re = (
+            re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+            if patterns else None
+        )
+        self.source = source
+        self.mtime = mtime
+        self.checked_at = time.monotonic()
+
+
+def _builtin_lists(source: Optional[str] = None, mtime: Optional[float] = None,
+                   extra: Optional[dict] = None, replace: bool = False) -> _DomainLists:
+    """Build a snapshot from the built-in lists, optionally merged with *extra*."""
+    extra = extra or {}
+
+    def _merge(builtin, key):
+        values = [str(v) for v in (extra.get(key) or [])]
+        return values if replace else list(builtin) + values
+
+    return _DomainLists(
+        academic=_merge(ACADEMIC_DOMAINS, "academic_domains"),
+        high_quality=_merge(HIGH_QUALITY_DOMAINS, "high_quality_domains"),
+        blocked=_merge(BLOCKED_DOMAINS, "blocked_domains"),
+        url_patterns=_merge((p.pattern for p in BLOCKED_URL_PATTERNS), "blocked_url_patterns"),
+        source=source,
+        mtime=mtime,
+    )
+
+
+def _load_lists_file(path: str) -> _DomainLists:
+    """Load domain lists from a YAML file.
+
+    Recognised keys: ``academic_domains``, ``high_quality_domains``,
+    ``blocked_domains``, ``blocked_url_patterns`` (regex strings).  Entries
+    are merged with the built-in lists unless ``replace: true`` is set.
+    """
+    mtime = os.path.getmtime(path)
+    with open(path, "r") as f:
+        data = yaml.safe_load(f) or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Domain list file {path} must be a YAML mapping")
+    return _builtin_lists(
+        source=path, mtime=mtime, extra=data, replace=bool(data.get("replace", False)),
+    )
+
+
+_lists: Optional[_DomainLists] = None
+_lists_lock = threading.Lock()
+
+
+def _build_lists(path: Optional[str], previous: Optional[_DomainLists]) -> _DomainLists:
+    if path is None:
+        return _builtin_lists()
+    try:
+        lists = _load_lists_file(path)
+        logger.info(f"Loaded domain lists from {path}")
+        return lists
+    except Exception as e:
+        logger.warning(f"Failed to load domain lists from {path}: {e}")
+        if previous is not None and previous.source == path:
+            return previous  # keep serving the last good lists
+        return _builtin_lists(source=path)
+
+
+def _get_domain_lists() -> _DomainLists:
+    """Return the active lists, hot-reloading the external file when it changes."""
+    global _lists
+    quality = get_config().quality
+    path = quality.domain_lists_file or None
+    interval = quality.domain_lists_reload_seconds
+
+    current = _lists
+    if current is not None and current.source == path and (
+        path is None or time.monotonic() - current.checked_at < interval
+    ):
+        return current
+
+    with _lists_lock:
+        current = _lists
+        if current is not None and current.source == path:
+            if path is None or time.monotonic() - current.checked_at < interval:
+                return current
+            current.checked_at = time.monotonic()
+            try:
+                if os.path.getmtime(path) == current.mtime:
+                    return current
+            except OSError:
+                return current
+        _lists = _build_lists(path, current)
+        _classify_url.cache_clear()
+        return _lists
+
+
+def reload_domain_lists() -> None:
+    """Drop the compiled lists so they are rebuilt on the next lookup."""
+    global _lists
+    with _lists_lock:
+        _lists = None
+        _classify_url.cache_clear()
+
+
+class UrlClassification(NamedTuple):
+    domain: str
+    is_academic: bool
+    is_high_quality: bool
+    is_blocked: bool
+
+
 def get_domain(url: str) -> str:
     """Extract domain from URL"""
     try:
@@ -77,40 +256,38 @@ def get_domain(url: str) -> str:
         return ""
 
 
-def is_academic_source(url: str) -> bool:
-    """Check if URL is from an academic source"""
+@lru_cache(maxsize=8192)
+def _classify_url(url: str, lists: _DomainLists) -> UrlClassification:
     domain = get_domain(url)
+    blocked = lists.blocked.matches(domain) or bool(
+        lists.blocked_url_re and lists.blocked_url_re.search(url)
+    )
+    return UrlClassification(
+        domain=domain,
+        is_academic=lists.academic.matches(domain),
+        is_high_quality=lists.high_quality.matches(domain),
+        is_blocked=blocked,
+    )
 
-    # Check exact domain
-    if domain in ACADEMIC_DOMAINS:
-        return True
 
-    # Check domain endings
-    for academic in ACADEMIC_DOMAINS:
-        if domain.endswith('.' + academic) or domain == academic:
-            return True
+def classify_url(url: str) -> UrlClassification:
+    """Classify a URL against the domain lists (memoized per URL)."""
+    return _classify_url(url, _get_domain_lists())
 
-    return False
 
+def is_academic_source(url: str) -> bool:
+    """Check if URL is from an academic source"""
+    return classify_url(url).is_academic
 
-def is_blocked_source(url: str) -> bool:
-    """Check if a URL matches the domain blocklist or blocked URL patterns."""
-    domain = get_domain(url)
 
-    # Check exact domain and parent domains
-    if domain in BLOCKED_DOMAINS:
-        return True
-    # e.g. "www.scribd.com" -> check "scribd.com"
-    for blocked in BLOCKED_DOMAINS:
-        if domain.endswith('.' + blocked):
-            return True
+def is_high_quality_source(url: str) -> bool:
+    """Check if URL is on (or a subdomain of) a high-quality domain."""
+    return classify_url(url).is_high_quality
 
-    # Check URL patterns
-    for pattern in BLOCKED_URL_PATTERNS:
-        if pattern.search(url):
-            return True
 
-    return False
+def is_blocked_source(url: str) -> bool:
+    """Check if a URL matches the domain blocklist or blocked URL patterns."""
+    return classify_url(url).is_blocked
 
 
 def is_junk_content(content: str, min_avg_line_length: int = 15) -> bool:
@@ -162,22 +339,16 @@ def _extract_query_terms(query: str) -> List[str]:
     return [w for w in words if w not in _STOPWORDS]
 
 
-def calculate_quality_score(url: str, title: str, content: str, query: str = None) -> float:
-    """Calculate a quality score for a source (0-1)"""
-    # Blocked sources get zero immediately
-    if is_blocked_source(url):
-        logger.debug(f"Blocked source: {url}")
-        return 0.0
-
+def _base_quality_score(url: str, info: UrlClassification, title: str, content: str) -> float:
+    """Domain, length, title and junk factors shared by the single and batch scorers."""
     score = 0.5  # Base score
-    domain = get_domain(url)
 
     # Academic bonus
-    if is_academic_source(url):
+    if info.is_academic:
         score += 0.3
 
     # High-quality domain bonus
-    if domain in HIGH_QUALITY_DOMAINS:
+    if info.is_high_quality:
         score += 0.2
 
     # Content length factor (longer = potentially more comprehensive)
@@ -200,16 +371,135 @@ def calculate_quality_score(url: str, title: str, content: str, query: str = Non
         logger.debug(f"Junk content detected: {url}")
         score -= 0.4
 
+    return score
+
+
+def _relevance_penalty(relevance: float) -> float:
+    """Score adjustment for a 0-1 relevance value."""
+    if relevance == 0.0:
+        # No query terms found — likely irrelevant
+        return -0.2
+    if relevance < 0.2:
+        return -0.1
+    return 0.0
+
+
+def calculate_quality_score(url: str, title: str, content: str, query: str = None) -> float:
+    """Calculate a quality score for a source (0-1)"""
+    info = classify_url(url)
+
+    # Blocked sources get zero immediately
+    if info.is_blocked:
+        logger.debug(f"Blocked source: {url}")
+        return 0.0
+
+    score = _base_quality_score(url, info, title, content)
+
     # Content-relevance penalty when query context is available
     if query and content:
         terms = _extract_query_terms(query)
         if terms:
-            relevance = content_relevance_score(content, terms)
-            if relevance == 0.0:
-                # No query terms found in first 2000 chars — likely irrelevant
-                score -= 0.2
-            elif relevance < 0.2:
-                score -= 0.1
+            score += _relevance_penalty(content_relevance_score(content, terms))
 
     # Cap score at 1.0
     return min(max(score, 0.0), 1.0)
+
+
+_TOKEN_RE = re.compile(r'[a-z]{2,}')
+
+
+def bm25_scores(documents: List[str], query_terms: List[str],
+                k1: float = 1.5, b: float = 0.75) -> np.ndarray:
+    """Okapi BM25 score of each document against ``query_terms``.
+
+    Each document is tokenized once; the term-frequency matrix is
+    (documents x unique query terms) and scoring is fully vectorized.
+    """
+    terms = list(dict.fromkeys(query_terms))
+    if not documents or not terms:
+        return np.zeros(len(documents))
+
+    column = {term: j for j, term in enumerate(terms)}
+    tf = np.zeros((len(documents), len(terms)))
+    doc_len = np.zeros(len(documents))
+
+    for i, doc in enumerate(documents):
+        tokens = _TOKEN_RE.findall(doc.lower()) if doc else []
+        doc_len[i] = len(tokens)
+        for token in tokens:
+            j = column.get(token)
+            if j is not None:
+                tf[i, j] += 1
+
+    n_docs = len(documents)
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log((n_docs - df + 0.5) / (df + 0.5) + 1.0)
+    avg_len = doc_len.mean() or 1.0
+    norm = k1 * (1.0 - b + b * doc_len / avg_len)
+    return ((tf * (k1 + 1.0)) / (tf + norm[:, None] + 1e-9)) @ idf
+
+
+class BatchScore(NamedTuple):
+    """One search result's scores from ``score_sources_batch``."""
+    score: float  # including BM25 relevance relative to the batch; for ordering
+    base: float   # domain/length/title/junk factors only; absolute
+
+
+def score_sources_batch(results: List[dict], query: str = None) -> List[BatchScore]:
+    """Quality-score a whole set of search results in one pass (0-1 each).
+
+    Applies the same domain/length/title/junk factors as
+    ``calculate_quality_score`` to each result's ``raw_content`` (falling
+    back to ``snippet``), but replaces the first-2000-characters term check
+    with BM25 over the full content, normalized against the best result in
+    the set. ``score`` is therefore only comparable within the set;
+    ``base`` leaves relevance out and can be compared against a fixed
+    threshold. Returns scores in the same order as ``results``.
+    """
+    if not results:
+        return []
+
+    contents = [
+        strip_image_data(r['raw_content']) if r.get('raw_content') else r.get('snippet') or ''
+        for r in results
+    ]
+    terms = _extract_query_terms(query) if query else []
+    relevance = bm25_scores(contents, terms) if terms else None
+    if relevance is not None and relevance.max() > 0:
+        relevance = relevance / relevance.max()
+
+    scores = []
+    for i, (result, content) in enumerate(zip(results, contents)):
+        url = result.get('url', '')
+        info = classify_url(url)
+        if info.is_blocked:
+            scores.append(BatchScore(0.0, 0.0))
+            continue
+
+        base = _base_quality_score(url, info, result.get('title', ''), content)
+        score = base
+        if relevance is not None and content:
+            score += _relevance_penalty(float(relevance[i]))
+        scores.append(BatchScore(min(max(score, 0.0), 1.0), min(max(base, 0.0), 1.0)))
+
+    return scores
+
+
+def rank_search_results(results: List[dict], query: str = None,
+                        min_quality: float = None) -> List[dict]:
+    """Order search results best-first by ``score_sources_batch``.
+
+    The batch score's relevance part is relative to the best result in the
+    set, so it is used for ordering only. Results that already carry full
+    page content (``raw_content``) are dropped when their absolute base
+    score is below ``min_quality``; scraping would not change it.
+    Snippet-only results are kept for the post-scrape check.
+    """
+    ranked = []
+    for result, scored in zip(results, score_sources_batch(results, query)):
+        if min_quality is not None and result.get('raw_content') and scored.base < min_quality:
+            logger.info(f"Low pre-scrape quality ({scored.base:.2f}), skipping: {result.get('url', '')}")
+            continue
+        ranked.append((scored.score, result))
+    ranked.sort(key=lambda pair: pair[0], reverse=True)
+    return [result for _, result in ranked]
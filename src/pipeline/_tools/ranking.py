@@ -0,0 +1,148 @@
+"""Cross-query candidate fusion for pre-scrape source selection."""
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+
+from src.config.logger import get_logger
+from .quality import (
+    _extract_query_terms,
+    bm25_scores,
+    classify_url,
+    score_sources_batch,
+)
+
+logger = get_logger(__name__)
+
+
+# Relative weight of each signal in the fused score (all signals are 0-1)
+FUSION_WEIGHTS = {
+    'rrf': 0.4,       # reciprocal rank fusion across queries
+    'tavily': 0.2,    # search engine relevance score
+    'quality': 0.25,  # domain prior + content factors (score_sources_batch)
+    'snippet': 0.15,  # BM25 of the snippet against all query terms
+}
+
+
+class FusedCandidate(NamedTuple):
+    """A deduplicated search result with its fused ranking score."""
+    result: dict
+    score: float
+    query_index: int  # query where this URL ranked best
+    query_indices: tuple  # every query that returned this URL
+
+
+def _normalize(values: np.ndarray) -> np.ndarray:
+    top = values.max() if values.size else 0.0
+    return values / top if top > 0 else values
+
+
+def fuse_search_results(
+    query_results: Dict[int, List[dict]],
+    queries: List[str],
+    top_k: int,
+    min_per_query: int = 1,
+    rrf_k: int = 60,
+    min_tavily: float = 0.0,
+    min_quality: float = None,
+) -> List[FusedCandidate]:
+    """Merge every query's results into one ranked candidate list.
+
+    URLs are deduplicated across queries and scored with a weighted blend of
+    reciprocal rank fusion (a URL returned by several queries ranks higher),
+    the Tavily score, the batch quality score and snippet relevance.
+    Blocked URLs, results below ``min_tavily`` and results whose full content
+    already has an absolute base quality below ``min_quality`` are dropped.
+
+    The returned order is the scrape order: first up to ``min_per_query``
+    best candidates for each query (the coverage floor), then the remaining
+    candidates by fused score. Callers scrape in order until ``top_k``
+    sources are kept, so entries past the first ``top_k`` act as reserves
+    for pages that fail to scrape.
+    """
+    rrf: Dict[str, float] = {}
+    best_rank: Dict[str, tuple] = {}
+    seen_in: Dict[str, list] = {}
+    by_url: Dict[str, dict] = {}
+
+    for qi in sorted(query_results):
+        for rank, result in enumerate(query_results[qi]):
+            url = result.get('url', '')
+            if not url:
+                continue
+            rrf[url] = rrf.get(url, 0.0) + 1.0 / (rrf_k + rank + 1)
+            seen_in.setdefault(url, [])
+            if qi not in seen_in[url]:
+                seen_in[url].append(qi)
+            if url not in best_rank or rank < best_rank[url][0]:
+                best_rank[url] = (rank, qi)
+            # Keep the richest copy of a result (raw_content, highest score)
+            kept = by_url.get(url)
+            if kept is None or (
+                (bool(result.get('raw_content')), result.get('score', 0.0))
+                > (bool(kept.get('raw_content')), kept.get('score', 0.0))
+            ):
+                by_url[url] = result
+
+    candidates = []
+    for url, result in by_url.items():
+        if classify_url(url).is_blocked:
+            logger.info(f"Blocked source (skipping): {url}")
+            continue
+        tavily_score = result.get('score', 1.0)
+        if tavily_score < min_tavily:
+            logger.info(f"Low Tavily score ({tavily_score:.2f}), skipping: {url}")
+            continue
+        candidates.append(result)
+
+    if not candidates:
+        return []
+
+    combined_query = " ".join(queries)
+    batch = score_sources_batch(candidates, combined_query)
+    quality = np.array([s.score for s in batch])
+    terms = _extract_query_terms(combined_query)
+    snippet = _normalize(bm25_scores([r.get('snippet', '') for r in candidates], terms))
+    fusion = _normalize(np.array([rrf[r['url']] for r in candidates]))
+    tavily = np.array([min(max(r.get('score', 1.0), 0.0), 1.0) for r in candidates])
+
+    fused = (
+        FUSION_WEIGHTS['rrf'] * fusion
+        + FUSION_WEIGHTS['tavily'] * tavily
+        + FUSION_WEIGHTS['quality'] * quality
+        + FUSION_WEIGHTS['snippet'] * snippet
+    )
+
+    ranked = []
+    for i, result in enumerate(candidates):
+        url = result['url']
+        # The batch score's relevance is relative to the set; filter on the
+        # absolute base score, as rank_search_results does
+        if min_quality is not None and batch[i].base < min_quality and result.get('raw_content'):
+            logger.info(f"Low pre-scrape quality ({batch[i].base:.2f}), skipping: {url}")
+            continue
+        ranked.append(FusedCandidate(
+            result=result,
+            score=float(fused[i]),
+            query_index=best_rank[url][1],
+            query_indices=tuple(seen_in[url]),
+        ))
+    ranked.sort(key=lambda c: c.score, reverse=True)
+
+    # Coverage floor: each query's best candidates go first
+    floor, chosen = [], set()
+    for qi in sorted(query_results):
+        picked = 0
+        for cand in ranked:
+            if picked >= min_per_query:
+                break
+            if qi in cand.query_indices and cand.result['url'] not in chosen:
+                floor.append(cand)
+                chosen.add(cand.result['url'])
+                picked += 1
+
+    rest = [c for c in ranked if c.result['url'] not in chosen]
+    logger.info(
+        f"Fused {sum(len(r) for r in query_results.values())} results into "
+        f"{len(ranked)} candidates (top_k={top_k}, floor={len(floor)})"
+    )
+    return floor + rest
@@ -2,7 +2,7 @@
 import random
 import ipaddress
 from datetime import datetime, timezone
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
@@ -12,6 +12,7 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 from src.config.settings import get_config
 from src.config.types import Source
 from src.config.logger import get_logger
+from src.infra.cancellation import RunCancelled, cancellable_sleep, check_cancelled
 from src.pipeline._tools.text import strip_image_data
 from src.pipeline._tools.quality import get_domain, is_academic_source, is_blocked_source, calculate_quality_score
 from src.pipeline._tools.search import get_scrape_limiter
@@ -48,10 +49,24 @@ def _validate_url(url: str) -> None:
         pass  # DNS resolution failed — let requests handle it
 
 
+def _read_body(response: requests.Response, chunk_size: int = 65536) -> bytes:
+    """Read a streamed response body, checking for cancellation between chunks.
+
+    Each read is bounded by ``scraping.timeout``, so a cancelled run stops
+    downloading within one chunk rather than after the whole page.
+    """
+    chunks = []
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        check_cancelled()
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type((requests.RequestException, ConnectionError))
+    retry=retry_if_exception_type((requests.RequestException, ConnectionError)),
+    sleep=cancellable_sleep,
 )
 def scrape_url(url: str) -> Tuple[str, str]:
     """
@@ -64,7 +79,9 @@ def scrape_url(url: str) -> Tuple[str, str]:
     _validate_url(url)
 
     # Apply rate limiting
+    check_cancelled()
     get_scrape_limiter().wait()
+    check_cancelled()
 
     logger.debug(f"Scraping: {url}")
 
@@ -84,15 +101,19 @@ def scrape_url(url: str) -> Tuple[str, str]:
             url,
             headers=headers,
             timeout=config.scraping.timeout,
-            allow_redirects=True
+            allow_redirects=True,
+            stream=True,
         )
-        response.raise_for_status()
+        with response:
+            response.raise_for_status()
+            body = _read_body(response)
+        html = body.decode(response.encoding or "utf-8", errors="replace")
 
         # Try trafilatura first (better extraction) — pass already-fetched HTML
         try:
             import trafilatura
             content = trafilatura.extract(
-                response.text,
+                html,
                 include_comments=False,
                 include_tables=True,
                 no_fallback=False
@@ -100,7 +121,7 @@ def scrape_url(url: str) -> Tuple[str, str]:
             if content and len(content) > 200:
                 content = strip_image_data(content)
                 # Get title separately
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(body, 'html.parser')
                 title = (soup.title.string or "") if soup.title else ""
                 return title.strip(), content[:config.scraping.max_content_length]
         except ImportError:
@@ -109,7 +130,7 @@ def scrape_url(url: str) -> Tuple[str, str]:
             logger.debug(f"Trafilatura extraction failed: {e}")
 
         # Fallback to BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(body, 'html.parser')
 
         # Get title
         title = ""
@@ -149,18 +170,32 @@ def scrape_url(url: str) -> Tuple[str, str]:
     except requests.RequestException as e:
         logger.warning(f"Failed to scrape {url}: {e}")
         raise
+    except RunCancelled:
+        raise
     except Exception as e:
         logger.error(f"Unexpected error scraping {url}: {e}")
         return "", ""
 
 
-def extract_source_info(url: str, search_result: Dict[str, Any] = None, query: str = None) -> Source:
+def extract_source_info(url: str, search_result: Dict[str, Any] = None, query: str = None,
+                        known_source: Optional[Source] = None) -> Source:
     """
     Extract full source information from a URL
-    Uses raw_content from Tavily if available, falls back to scraping
+    Uses raw_content from Tavily if available, falls back to scraping.
+    If ``known_source`` (a fresh stored copy of the page) is given, its
+    content, title and quality score are reused without fetching.
     """
     domain = get_domain(url)
 
+    if known_source is not None and known_source.full_content:
+        logger.debug(f"Reusing stored content for {url[:50]}...")
+        snippet = search_result.get('snippet', '') if search_result else ''
+        return known_source.model_copy(update={
+            'id': None,
+            'snippet': snippet or known_source.snippet,
+            'task_ids': [],
+        })
+
     # Early exit for blocked sources — skip scraping entirely
     if is_blocked_source(url):
         logger.info(f"Blocked source (skipping scrape): {url}")
@@ -190,6 +225,8 @@ def extract_source_info(url: str, search_result: Dict[str, Any] = None, query: s
             if scraped_title and not title:
                 title = scraped_title
             full_content = scraped_content
+        except RunCancelled:
+            raise
         except Exception as e:
             logger.warning(f"Could not scrape {url}: {e}")
 
@@ -1,10 +1,10 @@
 """Web search and rate limiting."""
-import time
-import threading
 from typing import Optional, List, Dict, Any
 
 from src.config.settings import get_config, get_env_settings
 from src.config.logger import get_logger
+from src.infra.cancellation import RunCancelled, check_cancelled
+from src.infra.rate_limit import FairRateLimiter
 
 logger = get_logger(__name__)
 
@@ -13,23 +13,8 @@ logger = get_logger(__name__)
 # RATE LIMITING
 # =============================================================================
 
-class RateLimiter:
-    """Simple rate limiter for API calls"""
-
-    def __init__(self, calls_per_minute: int):
-        self.calls_per_minute = calls_per_minute
-        self.interval = 60.0 / calls_per_minute
-        self.last_call = 0.0
-        self._lock = threading.Lock()
-
-    def wait(self):
-        """Wait if necessary to respect rate limit"""
-        with self._lock:
-            now = time.time()
-            elapsed = now - self.last_call
-            if elapsed < self.interval:
-                time.sleep(self.interval - elapsed)
-            self.last_call = time.time()
+class RateLimiter(FairRateLimiter):
+    """Simple rate limiter for API calls, shared fairly between concurrent runs"""
 
 
 # Rate limiters
@@ -70,7 +55,9 @@ def search_tavily(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
         client = TavilyClient(api_key=settings.tavily_api_key)
 
         # Apply rate limiting
+        check_cancelled()
         get_search_limiter().wait()
+        check_cancelled()
 
         logger.debug(f"Searching Tavily: {query}")
 
@@ -93,8 +80,12 @@ def search_tavily(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
                 'score': r.get('score', 0.5)
             })
 
+        # The Tavily call itself cannot be interrupted; drop its results
+        check_cancelled()
         return results
 
+    except RunCancelled:
+        raise
     except Exception as e:
         logger.error(f"Tavily search error: {e}")
         return []
@@ -14,6 +14,7 @@ from markupsafe import Markup
 from src.config.settings import get_config
 from src.config.types import Source, GlossaryTerm
 from src.infra._database import get_database
+from src.infra.executors import get_executor
 from src.pipeline._tools import read_file, ensure_directory, count_words
 from src.config.logger import get_logger, print_success, print_info
 
@@ -476,7 +477,7 @@ class ReportCompiler:
             output_dir = ensure_directory(base_output_dir)
         report_name = self.config.output.report_name
 
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from concurrent.futures import as_completed
 
         formats = list(self.config.output.formats)
 
@@ -518,22 +519,22 @@ class ReportCompiler:
                             pass
             return results
 
-        with ThreadPoolExecutor(max_workers=2) as fmt_exec:
-            futures = []
-            if "markdown" in formats:
-                futures.append(fmt_exec.submit(_compile_md))
-            if "html" in formats or "pdf" in formats:
-                futures.append(fmt_exec.submit(_compile_html_pdf))
-
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    if isinstance(result, tuple):
-                        output_files[result[0]] = result[1]
-                    elif isinstance(result, dict):
-                        output_files.update(result)
-                except Exception as e:
-                    logger.error(f"Format compilation failed: {e}")
+        fmt_exec = get_executor("cpu")
+        futures = []
+        if "markdown" in formats:
+            futures.append(fmt_exec.submit(_compile_md))
+        if "html" in formats or "pdf" in formats:
+            futures.append(fmt_exec.submit(_compile_html_pdf))
+
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+                if isinstance(result, tuple):
+                    output_files[result[0]] = result[1]
+                elif isinstance(result, dict):
+                    output_files.update(result)
+            except Exception as e:
+                logger.error(f"Format compilation failed: {e}")
         
         print_success(f"Report compiled: {', '.join(output_files.keys())}")
         return output_files
@@ -558,7 +559,7 @@ class ReportCompiler:
 
             if section:
                 # Section-based: get sources from all tasks in this section
-                section_sources = self.db.get_sources_for_section(section.id)
+                section_sources = self.db.get_sources_for_section(section.id, include_content=False)
                 local_to_global: Dict[int, int] = {}
                 for local_idx, source in enumerate(section_sources, 1):
                     if source.url not in url_to_global:
@@ -570,7 +571,7 @@ class ReportCompiler:
                 updated_chapters.append({"section": section, "content": remapped_content})
             elif task:
                 # Task-based (backward compatibility)
-                task_sources = self.db.get_sources_for_task(task.id)
+                task_sources = self.db.get_sources_for_task(task.id, include_content=False)
                 local_to_global: Dict[int, int] = {}
                 for local_idx, source in enumerate(task_sources, 1):
                     if source.url not in url_to_global:
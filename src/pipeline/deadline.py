@@ -0,0 +1,172 @@
+"""
+Deadline planner — graceful degradation as ``research.max_runtime_hours`` nears.
+
+The planner forecasts the time still needed from rates observed during the
+run (research task and section synthesis durations) and compares it with
+the time left. As the slack shrinks it escalates through degradation
+levels, each cutting cost further:
+
+    1  drop per-task gap-fill searches and sub-task recursion; skip the
+       cross-section gap analysis phase
+    2  also halve ``results_per_query`` / ``max_sources_per_task``
+    3  start no new research tasks; the remaining time is reserved for
+       in-flight tasks, section synthesis and compilation
+
+Levels only ever go up. Cuts are applied as config overrides for the rest
+of the run (restored by ``restore``) and every escalation is emitted as a
+``deadline_degradation`` run event.
+"""
+import json
+from datetime import datetime, timedelta
+from statistics import mean
+from typing import List, NamedTuple, Optional
+
+from src.config.settings import get_config, set_config, apply_overrides
+from src.config.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DeadlineForecast(NamedTuple):
+    """One evaluation of the plan against the deadline."""
+    level: int
+    time_left: float  # seconds until the deadline
+    research_seconds: float  # forecast for remaining + in-flight tasks
+    reserve_seconds: float  # synthesis + compilation reserve
+
+    @property
+    def stop_research(self) -> bool:
+        return self.level >= 3
+
+
+class DeadlinePlanner:
+    """Forecasts remaining work and degrades the run to finish before its deadline."""
+
+    def __init__(self, db, session_id: int, start_time: datetime, max_runtime_hours: float):
+        self.db = db
+        self.session_id = session_id
+        self.deadline = start_time + timedelta(hours=max_runtime_hours)
+        self.level = 0
+        self._base_config = None
+        self._task_seconds: List[float] = []
+        self._synthesis_seconds: List[float] = []
+
+    @property
+    def config(self):
+        return get_config()
+
+    def record_task(self, seconds: float) -> None:
+        if seconds > 0:
+            self._task_seconds.append(seconds)
+
+    def record_synthesis(self, seconds: float) -> None:
+        if seconds > 0:
+            self._synthesis_seconds.append(seconds)
+
+    def time_left(self) -> float:
+        return (self.deadline - datetime.now()).total_seconds()
+
+    def _task_estimate(self) -> float:
+        if self._task_seconds:
+            return mean(self._task_seconds[-20:])
+        try:
+            history = [s for _, s in self.db.get_task_durations(limit=50)]
+        except Exception:
+            history = []
+        return mean(history) if history else self.config.deadline.default_task_seconds
+
+    def _synthesis_estimate(self) -> float:
+        if self._synthesis_seconds:
+            return mean(self._synthesis_seconds[-10:])
+        return self.config.deadline.default_synthesis_seconds
+
+    def forecast(self, pending: int, in_flight: int, sections_left: int,
+                 concurrency: int) -> DeadlineForecast:
+        """Forecast the remaining time and return the level it calls for."""
+        cfg = self.config.deadline
+        task_s = self._task_estimate()
+        synth_parallel = max(1, self.config.executors.llm_workers)
+        reserve = (
+            cfg.compile_reserve_seconds
+            + self._synthesis_estimate() * -(-sections_left // synth_parallel)
+        )
+        # In-flight tasks are on average half done
+        research = (pending + in_flight * 0.5) * task_s / max(1, concurrency)
+        time_left = self.time_left()
+        margin = cfg.safety_factor
+
+        if time_left <= (reserve + (task_s if in_flight else 0)) * margin:
+            level = 3
+        elif (research + reserve) * margin > time_left * 1.5:
+            level = 2
+        elif (research + reserve) * margin > time_left:
+            level = 1
+        else:
+            level = 0
+        return DeadlineForecast(max(level, self.level), time_left, research, reserve)
+
+    def evaluate(self, pending: int, in_flight: int, sections_left: int,
+                 concurrency: int, phase: str = None) -> DeadlineForecast:
+        """Forecast and escalate degradation if the deadline is at risk."""
+        forecast = self.forecast(pending, in_flight, sections_left, concurrency)
+        if forecast.level > self.level:
+            self._escalate(forecast, phase)
+        return forecast
+
+    def _overrides(self, level: int) -> dict:
+        base = self._base_config or get_config()
+        overrides = {}
+        if level >= 1:
+            overrides["search.gap_fill_queries"] = 0
+            overrides["research.enable_recursion"] = False
+        if level >= 2:
+            overrides["search.results_per_query"] = max(1, base.search.results_per_query // 2)
+            if base.search.max_sources_per_task:
+                overrides["search.max_sources_per_task"] = max(1, base.search.max_sources_per_task // 2)
+        return overrides
+
+    def _escalate(self, forecast: DeadlineForecast, phase: Optional[str]) -> None:
+        old_level, self.level = self.level, forecast.level
+        if self._base_config is None:
+            self._base_config = get_config()
+        overrides = self._overrides(self.level)
+        if overrides:
+            set_config(apply_overrides(self._base_config, overrides))
+
+        actions = {
+            1: "drop gap-fill queries, skip recursion and gap analysis",
+            2: "halve results per query",
+            3: "stop starting research tasks; reserve time for synthesis",
+        }
+        taken = [actions[lvl] for lvl in range(old_level + 1, self.level + 1)]
+        logger.warning(
+            f"Deadline degradation level {old_level} -> {self.level} "
+            f"({forecast.time_left:.0f}s left, forecast {forecast.research_seconds:.0f}s research "
+            f"+ {forecast.reserve_seconds:.0f}s reserve): {'; '.join(taken)}"
+        )
+        self.db.add_run_event(
+            session_id=self.session_id,
+            task_id=None,
+            event_type="deadline_degradation",
+            phase=phase,
+            severity="warning",
+            payload_json=json.dumps({
+                "old_level": old_level,
+                "level": self.level,
+                "actions": taken,
+                "overrides": overrides,
+                "time_left_s": round(forecast.time_left, 1),
+                "research_forecast_s": round(forecast.research_seconds, 1),
+                "reserve_s": round(forecast.reserve_seconds, 1),
+            }),
+        )
+
+    @property
+    def allow_gap_analysis(self) -> bool:
+        return self.level == 0
+
+    def restore(self) -> None:
+        """Undo the config overrides applied for this run."""
+        if self._base_config is not None:
+            set_config(self._base_config)
+            self._base_config = None
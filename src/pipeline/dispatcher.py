@@ -0,0 +1,319 @@
+"""
+Run dispatcher — admits queued research runs as capacity frees up.
+
+Background runs (web dashboard, MCP server) are not started directly. They
+are written to the durable ``run_queue`` table, with an estimate of the LLM
+and search calls they will make and what they will cost, and the
+dispatcher admits them while
+
+    - a run slot is free (``executors.run_workers`` runs at once, counted
+      across every process sharing the database), and
+    - the calls still owed by the admitted runs plus the candidate's fit in
+      ``queue.budget_minutes`` of the LLM and search rate limits. A run is
+      always admitted when nothing else is running, so one larger than the
+      budget still runs alone.
+
+Queued runs are ordered by priority, then users in turn (a user's n-th
+waiting run goes behind every other user's earlier ones, counting the runs
+each user already has running), then submission time. The head of the
+line is never overtaken, so small runs cannot starve a large one.
+Positions and ETAs are reported from the same order.
+
+The dispatcher heartbeats the runs it admitted; entries left running by a
+dispatcher that died are marked interrupted after ``queue.stale_seconds``.
+"""
+import heapq
+import math
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from statistics import mean
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from src.config.settings import Config, get_config
+from src.config.types import QueuedRun, QueueStatus, TaskStatus
+from src.infra._database import get_database
+from src.infra.llm import get_token_tracker
+from src.config.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Average tokens per LLM call, for the cost estimate
+_PROMPT_TOKENS_PER_CALL = 3000
+_COMPLETION_TOKENS_PER_CALL = 700
+
+# LLM calls outside research tasks and section synthesis: pre-planning,
+# outline, task planning, gap analysis, summary and conclusion
+_FIXED_LLM_CALLS = 6
+
+
+class RunEstimate(NamedTuple):
+    """Expected size of a run, from its config."""
+    tasks: int
+    llm_calls: int
+    search_calls: int
+    cost: float  # USD
+
+
+def estimate_run(config: Config) -> RunEstimate:
+    """Estimate a run's research tasks, LLM/search calls and cost from its config.
+
+    Assumes every initial task spawns a follow-up (when recursion is on)
+    and gap filling uses its whole allowance, capped by
+    ``research.max_total_tasks``.
+    """
+    research, search = config.research, config.search
+    tasks = research.min_initial_tasks
+    if research.enable_recursion and research.max_recursion_depth > 0:
+        tasks *= 2
+    if config.gap_analysis.enabled:
+        tasks += config.gap_analysis.max_gap_fill_tasks
+    tasks = max(1, min(tasks, research.max_total_tasks))
+    sections = math.ceil(tasks / max(1, research.tasks_per_section))
+
+    sources = search.max_sources_per_task or search.queries_per_task * search.results_per_query
+    extraction_calls = sources
+    if config.extraction.batch_enabled:
+        extraction_calls = math.ceil(sources / max(1, config.extraction.batch_max_sources))
+    task_llm_calls = tasks * (2 + extraction_calls)  # query generation, extractions, draft
+    run_llm_calls = _FIXED_LLM_CALLS + sections  # plus one synthesis per section
+    search_calls = search.pre_plan_queries + tasks * (search.queries_per_task + search.gap_fill_queries)
+
+    tracker = get_token_tracker()
+    per_call = {
+        model: tracker.estimate_cost(model, _PROMPT_TOKENS_PER_CALL, _COMPLETION_TOKENS_PER_CALL)
+        for model in {config.llm.models.researcher, config.llm.models.synthesizer}
+    }
+    cost = (
+        task_llm_calls * per_call[config.llm.models.researcher]
+        + run_llm_calls * per_call[config.llm.models.synthesizer]
+    )
+    return RunEstimate(tasks, task_llm_calls + run_llm_calls, search_calls, round(cost, 4))
+
+
+def order_queue(queued: List[QueuedRun], running: List[QueuedRun] = ()) -> List[QueuedRun]:
+    """Admission order: priority desc, then users in turn, then submission time."""
+    turn = Counter(r.user for r in running)
+    keyed = []
+    for run in sorted(queued, key=lambda r: (r.created_at, r.id)):
+        keyed.append(((-run.priority, turn[run.user], run.created_at, run.id), run))
+        turn[run.user] += 1
+    return [run for _, run in sorted(keyed, key=lambda k: k[0])]
+
+
+def _utcnow() -> datetime:
+    # Timestamps are stored as naive UTC
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def queue_entry(run: QueuedRun, **extra) -> dict:
+    """JSON-friendly view of a queue entry."""
+    entry = {
+        "run_id": run.id,
+        "query": run.query,
+        "user": run.user,
+        "priority": run.priority,
+        "status": run.status,
+        "session_id": run.session_id,
+        "estimated": {
+            "llm_calls": run.est_llm_calls,
+            "search_calls": run.est_search_calls,
+            "cost": run.est_cost,
+        },
+        "submitted_at": run.created_at.isoformat() if run.created_at else None,
+        "started_at": run.started_at.isoformat() if run.started_at else None,
+    }
+    entry.update(extra)
+    return entry
+
+
+class RunDispatcher:
+    """Admits queued runs into free run slots (one dispatcher per process).
+
+    ``launch(run)`` starts an admitted run in the background;
+    ``session_ids()`` maps the run ids this process is executing to their
+    session ids (None until the session exists), recorded on the entries.
+    """
+
+    def __init__(self, launch: Callable[[QueuedRun], None],
+                 session_ids: Callable[[], Dict[str, Optional[int]]],
+                 owner: str = None):
+        from src.pipeline.worker import default_worker_id
+
+        self.launch = launch
+        self.session_ids = session_ids
+        self.owner = owner or default_worker_id()
+        self.db = get_database()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._recorded: Dict[str, int] = {}  # run_id -> session_id written to the queue
+
+    @property
+    def config(self):
+        return get_config()
+
+    # ------------------------------------------------------------------
+    # Admission
+    # ------------------------------------------------------------------
+
+    def dispatch(self) -> List[str]:
+        """Admit every queued run that fits now. Returns the admitted run ids."""
+        config = self.config
+        admitted = []
+        with self._lock:
+            self._sync_running()
+            running, queued = self._split(self.db.get_active_queued_runs())
+            slots = config.executors.run_workers - len(running)
+            owed_llm, owed_search = self._owed(running)
+            llm_budget = config.rate_limits.llm_calls_per_minute * config.queue.budget_minutes
+            search_budget = config.rate_limits.search_calls_per_minute * config.queue.budget_minutes
+
+            for run in order_queue(queued, running):
+                if slots <= 0:
+                    break
+                fits = (
+                    owed_llm + run.est_llm_calls <= llm_budget
+                    and owed_search + run.est_search_calls <= search_budget
+                )
+                if running and not fits:
+                    break
+                if not self.db.claim_queued_run(run.id, self.owner):
+                    continue  # admitted by another process
+                running.append(run)
+                slots -= 1
+                owed_llm += run.est_llm_calls
+                owed_search += run.est_search_calls
+                try:
+                    self.launch(run)
+                except Exception as e:
+                    logger.exception(f"Failed to launch queued run {run.id}: {e}")
+                    self.db.finish_queued_run(run.id, QueueStatus.FAILED.value, error_message=str(e))
+                    continue
+                logger.info(f"Admitted queued run {run.id} ({run.user}): {run.query[:60]}")
+                admitted.append(run.id)
+        return admitted
+
+    @staticmethod
+    def _split(runs: List[QueuedRun]) -> Tuple[List[QueuedRun], List[QueuedRun]]:
+        running = [r for r in runs if r.status == QueueStatus.RUNNING.value]
+        queued = [r for r in runs if r.status == QueueStatus.QUEUED.value]
+        return running, queued
+
+    def _sync_running(self) -> None:
+        """Heartbeat our runs, record their sessions, expire dead dispatchers' runs."""
+        self.db.renew_queued_runs(self.owner)
+        for run_id, session_id in self.session_ids().items():
+            if session_id is not None and self._recorded.get(run_id) != session_id:
+                self.db.update_queued_run(run_id, session_id=session_id)
+                self._recorded[run_id] = session_id
+        interrupted = self.db.interrupt_stale_queued_runs(self.config.queue.stale_seconds)
+        if interrupted:
+            logger.warning(f"Marked {interrupted} queued run(s) interrupted: dispatcher stopped responding")
+
+    def _progress(self, run: QueuedRun) -> float:
+        """Fraction of a running run's tasks that are done (0 before planning)."""
+        if run.session_id is None:
+            return 0.0
+        total = self.db.get_task_count(session_id=run.session_id)
+        if not total:
+            return 0.0
+        done = (
+            self.db.get_task_count(TaskStatus.COMPLETED, session_id=run.session_id)
+            + self.db.get_task_count(TaskStatus.FAILED, session_id=run.session_id)
+        )
+        return min(1.0, done / total)
+
+    def _owed(self, running: List[QueuedRun]) -> Tuple[float, float]:
+        """LLM and search calls the running runs are still expected to make."""
+        llm = search = 0.0
+        for run in running:
+            left = 1.0 - self._progress(run)
+            llm += run.est_llm_calls * left
+            search += run.est_search_calls * left
+        return llm, search
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def average_run_seconds(self) -> float:
+        durations = self.db.get_session_durations(limit=20)
+        return mean(durations) if durations else float(self.config.queue.default_run_seconds)
+
+    def snapshot(self) -> dict:
+        """Running and queued entries; queued ones carry ``position`` and ``eta_seconds``.
+
+        The ETA assumes every run takes as long as recent runs did on
+        average and that the budget never holds a run back. It is None
+        when no run slot is configured and none is running, as nothing
+        would ever start.
+        """
+        running, queued = self._split(self.db.get_active_queued_runs())
+        slots = self.config.executors.run_workers
+        avg = self.average_run_seconds()
+        now = _utcnow()
+
+        free_at = [
+            max(0.0, avg - (now - r.started_at).total_seconds()) if r.started_at else avg
+            for r in running
+        ]
+        free_at += [0.0] * max(0, slots - len(running))
+        heapq.heapify(free_at)
+        waiting = []
+        for position, run in enumerate(order_queue(queued, running), 1):
+            if not free_at:
+                waiting.append(queue_entry(run, position=position, eta_seconds=None))
+                continue
+            start = heapq.heappop(free_at)
+            heapq.heappush(free_at, start + avg)
+            waiting.append(queue_entry(run, position=position, eta_seconds=int(start)))
+
+        return {
+            "slots": slots,
+            "running": [queue_entry(r) for r in running],
+            "queued": waiting,
+        }
+
+    def entry(self, run_id: str) -> Optional[dict]:
+        """One entry, with position and ETA while queued."""
+        snapshot = self.snapshot()
+        for entry in snapshot["queued"] + snapshot["running"]:
+            if entry["run_id"] == run_id:
+                return entry
+        run = self.db.get_queued_run(run_id)
+        return queue_entry(run) if run else None
+
+    # ------------------------------------------------------------------
+    # Background loop
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the admission loop (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="run-dispatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def wake(self) -> None:
+        """Re-run admission now (a run finished or was cancelled)."""
+        self._wake.set()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.dispatch()
+            except Exception as e:
+                logger.warning(f"Run dispatch failed: {e}")
+            self._wake.wait(self.config.queue.poll_seconds)
@@ -6,22 +6,27 @@ Coordinates the entire research process using a 7-phase pipeline:
   Phase 3: Task Planning per Section
   Phase 4: Research Execution
   Phase 5: Gap Analysis & Fill
-  Phase 6: Section Synthesis
+  Phase 6: Section Synthesis (sections not already synthesized during Phase 4)
   Phase 7: Report Compilation
 """
 import signal
-from concurrent.futures import ThreadPoolExecutor, wait, as_completed, FIRST_COMPLETED
+from concurrent.futures import wait, as_completed, FIRST_COMPLETED
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 
 from src.config.settings import get_config
 from src.config.types import TaskStatus, SectionStatus, ResearchTask, GlossaryTerm
 from src.infra._database import get_database
+from src.infra.cancellation import CancellationToken, RunCancelled, cancellation_scope
+from src.infra.executors import cancel_pending, get_executor, get_executor_stats
 from src.pipeline._stages import (
     PlannerAgent, ResearcherAgent, EditorAgent,
     OutlineDesignerAgent, SectionTaskPlannerAgent, GapAnalysisAgent, SynthesisAgent,
 )
 from src.pipeline.compiler import ReportCompiler
+from src.pipeline.deadline import DeadlinePlanner
+from src.pipeline.scheduling import claim_next_tasks, get_policy
+from src.pipeline.worker import default_worker_id
 from src.pipeline._tools import save_markdown, read_file, count_words, count_citations, ensure_directory, generate_file_path
 from src.config.logger import (
     get_logger, console, print_header, print_success, print_error,
@@ -57,6 +62,20 @@ class ResearchOrchestrator:
         self._cancel_requested = False
         self.phase: str = "idle"
 
+        # Pipelined synthesis: in-flight section futures and, per section,
+        # the completed task ids its current synthesis was built from.
+        self._synth_futures: dict = {}  # future -> section_id
+        self._synthesized_tasks: dict = {}  # section_id -> frozenset of task ids
+        self._section_gap_checked: set = set()  # sections whose pre-synthesis gap check ran
+
+        # Lease owner for tasks claimed by this process's research loop
+        self.lease_owner = default_worker_id()
+
+        self.deadline: Optional[DeadlinePlanner] = None
+
+        # Cancels the in-flight work of the current run (see ``cancel``)
+        self._cancel_token = CancellationToken()
+
         # Setup signal handlers for graceful shutdown (only from main thread)
         if register_signals:
             signal.signal(signal.SIGINT, self._handle_shutdown)
@@ -67,10 +86,26 @@ class ResearchOrchestrator:
         return get_config()
 
     def _handle_shutdown(self, signum, frame):
-        """Handle shutdown signals gracefully"""
-        print_warning("\nShutdown signal received. Completing current task...")
+        """Handle shutdown signals gracefully; a second signal aborts in-flight work."""
+        if not self.is_running:
+            print_warning("\nSecond shutdown signal received. Aborting in-flight tasks...")
+            self._cancel_token.cancel("shutdown signal")
+            return
+        print_warning("\nShutdown signal received. Completing current task... (again to abort)")
         self.is_running = False
 
+    def cancel(self, reason: str = "cancelled by user"):
+        """Cancel the run: start no new work and abandon in-flight work.
+
+        Unlike a graceful stop (``is_running = False``), running tasks do
+        not finish: their searches, scrapes and LLM calls raise RunCancelled
+        at the next check (within seconds), the tasks return to PENDING for
+        a later resume and the completed work is compiled.
+        """
+        self._cancel_requested = True
+        self.is_running = False
+        self._cancel_token.cancel(reason)
+
     def _set_phase(self, new_phase: str):
         """Set phase and emit a phase_changed run event."""
         import json as _json
@@ -100,9 +135,18 @@ class ResearchOrchestrator:
         Returns:
             Dict with output file paths and statistics
         """
+        # Everything the run submits inherits the token through the
+        # executors' context copy, so ``cancel`` reaches every worker.
+        self._cancel_token = CancellationToken()
+        with cancellation_scope(self._cancel_token):
+            return self._run(query, resume, refined_brief, refinement_qa)
+
+    def _run(self, query: str, resume: bool, refined_brief: str, refinement_qa: str) -> dict:
+        """Pipeline body of ``run``, executed inside the run's cancellation scope."""
         self.query = refined_brief or query
         self.start_time = datetime.now()
         self.is_running = True
+        self.deadline = None
 
         print_header(
             "Deep Research Agent",
@@ -124,6 +168,10 @@ class ResearchOrchestrator:
                     refinement_qa=refinement_qa)
 
             self.session_id = session.id
+            if self.config.research.max_runtime_hours and self.config.deadline.enabled:
+                self.deadline = DeadlinePlanner(
+                    self.db, session.id, self.start_time, self.config.research.max_runtime_hours
+                )
 
             # Check if session already has sections (resume case)
             existing_sections = self.db.get_all_sections(session_id=self.session_id)
@@ -161,16 +209,16 @@ class ResearchOrchestrator:
                     )
 
                 total_created = 0
-                with ThreadPoolExecutor(max_workers=min(len(sections), 4)) as plan_exec:
-                    futures = {plan_exec.submit(_plan_section, s): s for s in sections}
-                    for future in as_completed(futures):
-                        try:
-                            sec, tasks = future.result()
-                            total_created += len(tasks)
-                            print_info(f"  {sec.title}: {len(tasks)} tasks")
-                        except Exception as e:
-                            sec = futures[future]
-                            logger.error(f"Task planning failed for '{sec.title}': {e}")
+                plan_exec = get_executor("llm")
+                futures = {plan_exec.submit(_plan_section, s): s for s in sections}
+                for future in as_completed(futures):
+                    try:
+                        sec, tasks = future.result()
+                        total_created += len(tasks)
+                        print_info(f"  {sec.title}: {len(tasks)} tasks")
+                    except Exception as e:
+                        sec = futures[future]
+                        logger.error(f"Task planning failed for '{sec.title}': {e}")
 
                 # Show task overview
                 all_tasks = self.db.get_all_tasks(session_id=self.session_id)
@@ -195,7 +243,11 @@ class ResearchOrchestrator:
             print_info("Phase 5: Gap analysis...")
             # Reload sections in case they were modified
             sections = self.db.get_all_sections(session_id=self.session_id)
-            gap_result = self.gap_analyst.analyze_gaps(self.query, sections, self.session_id)
+            if self.deadline and not self.deadline.allow_gap_analysis:
+                print_warning("Skipping gap analysis to meet the runtime deadline")
+                gap_result = {"new_tasks": 0}
+            else:
+                gap_result = self.gap_analyst.analyze_gaps(self.query, sections, self.session_id)
             if gap_result.get("new_tasks", 0) > 0:
                 print_info(f"Gap analysis created {gap_result['new_tasks']} new tasks, "
                           f"{gap_result.get('new_sections', 0)} new sections")
@@ -213,6 +265,9 @@ class ResearchOrchestrator:
             sections = self.db.get_all_sections(session_id=self.session_id)
             self._synthesize_all_sections(self.query, sections)
 
+            if not self.is_running:
+                return self._emergency_compile()
+
             # Phase 7: Compile
             self._set_phase("compiling")
             print_info("Phase 7: Compiling final report...")
@@ -226,18 +281,26 @@ class ResearchOrchestrator:
             print_warning("\nInterrupted by user.")
             return self._emergency_compile()
 
+        except RunCancelled:
+            print_warning("Research cancelled.")
+            return self._emergency_compile()
+
         except Exception as e:
             logger.exception(f"Research failed: {e}")
             print_error(f"Research failed: {e}")
             return self._emergency_compile()
 
+        finally:
+            if self.deadline:
+                self.deadline.restore()
+
     def _initialize_session(self, query: str, refined_brief: str = None,
                             refinement_qa: str = None):
         """Initialize a new research session"""
         print_info("Initializing new research session...")
 
         # Create session in database
-        session = self.db.create_session(query)
+        session = self.db.create_session(query, executor=self.config.research.executor)
 
         # Store refinement data if provided
         if refined_brief or refinement_qa:
@@ -261,7 +324,11 @@ class ResearchOrchestrator:
         if not session:
             recent = self.db.get_most_recent_session()
             if recent:
-                pending = self.db.get_task_count(TaskStatus.PENDING, session_id=recent.id)
+                # In-progress tasks of a finished session were orphaned by a crash
+                pending = (
+                    self.db.get_task_count(TaskStatus.PENDING, session_id=recent.id)
+                    + self.db.get_task_count(TaskStatus.IN_PROGRESS, session_id=recent.id)
+                )
                 if pending > 0:
                     self.db.update_session(recent.id, status="running", ended_at=None)
                     session = self.db.get_session_by_id(recent.id)
@@ -270,6 +337,12 @@ class ResearchOrchestrator:
             print_info(f"Resuming session #{session.id}")
             print_info(f"Query: {session.query[:100]}...")
 
+            # Tasks the previous process was running when it died (including
+            # claims made without a lease) go back to the queue.
+            self.session_id = session.id
+            self.db.update_session(session.id, executor=self.config.research.executor)
+            self._reclaim_orphaned_tasks(include_unleased=True)
+
             stats = self.db.get_statistics(session_id=session.id)
             print_statistics_table(stats)
 
@@ -278,6 +351,14 @@ class ResearchOrchestrator:
 
         return None
 
+    @staticmethod
+    def _other_sections(task, all_tasks) -> List[str]:
+        """Sibling-task summary passed to the researcher to avoid overlap."""
+        return [
+            f"{t.topic} ({'done' if t.status == 'completed' else 'pending'})"
+            for t in all_tasks if t.id != task.id
+        ]
+
     def _execute_single_task(self, task, other_sections):
         """Execute a single research task. Thread-safe — called from worker threads."""
         print_task_start(task.topic, task.id)
@@ -310,8 +391,63 @@ class ResearchOrchestrator:
             'glossary_terms': glossary_terms,
         }
 
+    def _apply_task_result(self, result: dict):
+        """Persist the follow-ups of a finished task (sub-tasks, glossary terms)."""
+        if result['new_tasks']:
+            self._add_recursive_tasks(result['new_tasks'])
+        if result['glossary_terms']:
+            self._add_glossary_terms(result['glossary_terms'], result['task_id'])
+
+    def _deadline_reached(self, in_flight: int, concurrency: int) -> bool:
+        """Ask the deadline planner whether to keep starting research tasks.
+
+        Below the last degradation level the planner only trims per-task
+        cost; at it, research stops so synthesis and compilation still fit.
+        """
+        if not self.deadline:
+            return False
+        sections_left = sum(
+            1 for s in self.db.get_all_sections(session_id=self.session_id)
+            if s.status != SectionStatus.COMPLETE.value
+        )
+        forecast = self.deadline.evaluate(
+            pending=self.db.get_task_count(TaskStatus.PENDING, session_id=self.session_id),
+            in_flight=in_flight,
+            sections_left=sections_left,
+            concurrency=concurrency,
+            phase=self.phase,
+        )
+        if forecast.stop_research:
+            print_warning(
+                f"Runtime deadline near ({forecast.time_left:.0f}s left): "
+                f"no new research tasks, reserving time for synthesis"
+            )
+            return True
+        return False
+
+    def _reclaim_orphaned_tasks(self, include_unleased: bool = False) -> int:
+        """Re-queue tasks whose lease expired (owner crashed or hung)."""
+        reclaimed = self.db.reclaim_expired_tasks(
+            self.session_id, max_retries=2, include_unleased=include_unleased
+        )
+        if reclaimed:
+            import json as _json
+            print_warning(f"Reclaimed {reclaimed} orphaned in-progress task(s)")
+            self.db.add_run_event(
+                session_id=self.session_id,
+                task_id=None,
+                event_type="tasks_reclaimed",
+                phase=self.phase,
+                severity="warning",
+                payload_json=_json.dumps({"count": reclaimed}),
+            )
+        return reclaimed
+
     def _run_research_loop(self):
         """Execute the main research loop with parallel task execution."""
+        if self.config.research.executor == "workers":
+            return self._wait_for_workers()
+
         print_info("Starting research loop...")
 
         loop_count = 0
@@ -320,6 +456,12 @@ class ResearchOrchestrator:
         max_loops = float('inf') if self.config.research.max_loops < 0 else self.config.research.max_loops
         max_runtime = timedelta(hours=self.config.research.max_runtime_hours) if self.config.research.max_runtime_hours else None
         max_workers = self.config.research.max_concurrent_tasks
+        lease_seconds = self.config.workers.lease_seconds
+        heartbeat_every = timedelta(seconds=self.config.workers.heartbeat_seconds)
+        last_heartbeat = datetime.now()
+        policy = get_policy(db=self.db)
+
+        self._reclaim_orphaned_tasks()
 
         with create_progress_bar() as progress:
             total_tasks = self.db.get_task_count(session_id=self.session_id)
@@ -328,92 +470,184 @@ class ResearchOrchestrator:
                 total=total_tasks
             )
 
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                active = {}  # future -> task
-
-                while self.is_running:
-                    # Check termination conditions
-                    if loop_count >= max_loops:
-                        print_info(f"Reached maximum loop count ({max_loops})")
-                        break
-
-                    if max_runtime and (datetime.now() - self.start_time) > max_runtime:
-                        print_info(f"Reached maximum runtime ({self.config.research.max_runtime_hours}h)")
-                        break
-
-                    # Fill available executor slots with new tasks
-                    slots = max_workers - len(active)
-                    if slots > 0:
-                        new_tasks = self.db.get_next_tasks(slots, session_id=self.session_id)
-                        if new_tasks:
-                            all_tasks = self.db.get_all_tasks(session_id=self.session_id)
-                            for task in new_tasks:
-                                other_sections = [
-                                    f"{t.topic} ({'done' if t.status == 'completed' else 'pending'})"
-                                    for t in all_tasks if t.id != task.id
-                                ]
-                                future = executor.submit(
-                                    self._execute_single_task, task, other_sections
-                                )
-                                active[future] = task
-
-                    if not active:
-                        # No running tasks and none to claim — check for retryable failures
-                        retried = self.db.retry_failed_tasks(self.session_id, max_retries=2)
-                        if retried > 0:
-                            print_info(f"Retrying {retried} previously failed task(s)...")
-                            continue
-
-                        failed = self.db.get_task_count(TaskStatus.FAILED, session_id=self.session_id)
-                        if failed > 0:
-                            print_warning(f"No pending tasks remain; {failed} task(s) failed after retries.")
-                        else:
-                            print_success("All tasks completed!")
-                        break
-
-                    # Wait for at least one task to finish (timeout lets us re-check is_running)
-                    done, _ = wait(active.keys(), return_when=FIRST_COMPLETED, timeout=2.0)
-
-                    if not done:
+            executor = get_executor("task")
+            active = {}  # future -> task
+
+            while self.is_running:
+                # Check termination conditions
+                if loop_count >= max_loops:
+                    print_info(f"Reached maximum loop count ({max_loops})")
+                    break
+
+                if self._deadline_reached(len(active), max_workers):
+                    break
+                if not self.deadline and max_runtime and (datetime.now() - self.start_time) > max_runtime:
+                    print_info(f"Reached maximum runtime ({self.config.research.max_runtime_hours}h)")
+                    break
+
+                # Heartbeat: keep leases of in-flight tasks alive
+                if active and datetime.now() - last_heartbeat >= heartbeat_every:
+                    self.db.renew_task_leases(self.lease_owner, lease_seconds)
+                    last_heartbeat = datetime.now()
+
+                # Fill available executor slots with new tasks
+                slots = max_workers - len(active)
+                if slots > 0:
+                    new_tasks = claim_next_tasks(
+                        self.db, policy, slots, self.session_id,
+                        owner=self.lease_owner, lease_seconds=lease_seconds,
+                    )
+                    if new_tasks:
+                        all_tasks = self.db.get_all_tasks(session_id=self.session_id)
+                        for task in new_tasks:
+                            future = executor.submit(
+                                self._execute_single_task, task,
+                                self._other_sections(task, all_tasks),
+                            )
+                            active[future] = task
+
+                if not active:
+                    # A section gap check in flight may still add tasks
+                    if self._synth_futures:
+                        self._collect_section_syntheses(block=True)
+                        continue
+                    # No running tasks and none to claim — check for retryable failures
+                    retried = self.db.retry_failed_tasks(self.session_id, max_retries=2)
+                    if retried > 0:
+                        print_info(f"Retrying {retried} previously failed task(s)...")
+                        continue
+
+                    failed = self.db.get_task_count(TaskStatus.FAILED, session_id=self.session_id)
+                    if failed > 0:
+                        print_warning(f"No pending tasks remain; {failed} task(s) failed after retries.")
+                    else:
+                        print_success("All tasks completed!")
+                    break
+
+                # Wait for at least one task to finish (timeout lets us re-check is_running)
+                done, _ = wait(active.keys(), return_when=FIRST_COMPLETED, timeout=2.0)
+
+                self._collect_section_syntheses()
+                if not done:
+                    continue
+
+                for future in done:
+                    task = active.pop(future)
+                    if self.deadline and task.started_at:
+                        self.deadline.record_task(
+                            (datetime.now(timezone.utc).replace(tzinfo=None) - task.started_at).total_seconds()
+                        )
+                    try:
+                        self._apply_task_result(future.result())
+
+                        loop_count += 1
+                        consecutive_failures = 0
+
+                    except RunCancelled:
+                        # Abandoned, not failed: keep it for a resume
+                        self.db.release_task(task.id)
                         continue
 
-                    for future in done:
-                        task = active.pop(future)
-                        try:
-                            result = future.result()
-
-                            if result['new_tasks']:
-                                self._add_recursive_tasks(result['new_tasks'])
-                            if result['glossary_terms']:
-                                self._add_glossary_terms(result['glossary_terms'], result['task_id'])
-
-                            loop_count += 1
-                            consecutive_failures = 0
-
-                        except Exception as e:
-                            logger.error(f"Task {task.id} failed: {e}")
-                            self.db.mark_task_failed(task.id, str(e))
-                            consecutive_failures += 1
-                            if consecutive_failures >= max_consecutive_failures:
-                                print_error(
-                                    f"Aborting: {consecutive_failures} consecutive "
-                                    f"task failures. Last error: {e}"
-                                )
-                                # Cancel queued (not-yet-started) futures
-                                for f in list(active):
-                                    f.cancel()
-                                active.clear()
-                                self.is_running = False
-                                break
-
-                        # Update progress
-                        completed = self.db.get_task_count(TaskStatus.COMPLETED, session_id=self.session_id)
-                        total = self.db.get_task_count(session_id=self.session_id)
-                        progress.update(progress_id, completed=completed, total=total)
+                    except Exception as e:
+                        logger.error(f"Task {task.id} failed: {e}")
+                        self.db.mark_task_failed(task.id, str(e))
+                        consecutive_failures += 1
+                        if consecutive_failures >= max_consecutive_failures:
+                            print_error(
+                                f"Aborting: {consecutive_failures} consecutive "
+                                f"task failures. Last error: {e}"
+                            )
+                            # Cancel queued (not-yet-started) futures
+                            for f in list(active):
+                                f.cancel()
+                            active.clear()
+                            self.is_running = False
+                            break
+
+                    if self.config.research.pipelined_synthesis and self.is_running:
+                        self._maybe_start_section_synthesis(task.section_id)
+
+                    # Update progress
+                    completed = self.db.get_task_count(TaskStatus.COMPLETED, session_id=self.session_id)
+                    total = self.db.get_task_count(session_id=self.session_id)
+                    progress.update(progress_id, completed=completed, total=total)
+
+            # Tasks still in flight finish before the next phase (within
+            # seconds once cancelled); on shutdown the ones that have not
+            # started yet are dropped and returned to the queue.
+            if not self.is_running:
+                for future in [f for f in active if f.cancel()]:
+                    self.db.release_task(active.pop(future).id)
+                cancel_pending(self._synth_futures)
+            wait(list(active))
+            for future, task in active.items():
+                if isinstance(future.exception(), RunCancelled):
+                    self.db.release_task(task.id)
+            self._collect_section_syntheses(block=True)
 
         # Final progress update
         stats = self.db.get_statistics(session_id=self.session_id)
         print_statistics_table(stats)
+        for pool in get_executor_stats().values():
+            logger.info(
+                f"Executor {pool.name}: {pool.completed} done, peak queue {pool.peak_queued}, "
+                f"{pool.caller_runs} caller-runs ({pool.max_workers} workers)"
+            )
+
+    def _wait_for_workers(self):
+        """Coordinator side of ``research.executor: workers``.
+
+        Tasks are claimed and run by ``research-worker`` processes sharing
+        the database; this only reclaims expired leases, re-queues retryable
+        failures, starts section synthesis as sections finish and returns
+        once no task is pending or in progress.
+        """
+        print_info("Waiting for research workers to complete tasks...")
+        max_runtime = timedelta(hours=self.config.research.max_runtime_hours) if self.config.research.max_runtime_hours else None
+        poll = self.config.workers.poll_seconds
+        seen = set()  # (task id, status, retry_count) already handled
+
+        while self.is_running:
+            in_flight = self.db.get_task_count(TaskStatus.IN_PROGRESS, session_id=self.session_id)
+            if self._deadline_reached(in_flight, self.config.workers.concurrency):
+                break
+            if not self.deadline and max_runtime and (datetime.now() - self.start_time) > max_runtime:
+                print_info(f"Reached maximum runtime ({self.config.research.max_runtime_hours}h)")
+                break
+
+            self._reclaim_orphaned_tasks()
+
+            tasks = self.db.get_all_tasks(session_id=self.session_id)
+            for task in tasks:
+                key = (task.id, task.status, task.retry_count)
+                if task.status in (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value) and key not in seen:
+                    seen.add(key)
+                    if self.config.research.pipelined_synthesis:
+                        self._maybe_start_section_synthesis(task.section_id)
+            self._collect_section_syntheses()
+
+            if not any(t.status in (TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value) for t in tasks):
+                # A section gap check in flight may still add tasks
+                if self._synth_futures:
+                    self._collect_section_syntheses(block=True)
+                    continue
+                retried = self.db.retry_failed_tasks(self.session_id, max_retries=2)
+                if retried > 0:
+                    print_info(f"Retrying {retried} previously failed task(s)...")
+                    continue
+                failed = sum(1 for t in tasks if t.status == TaskStatus.FAILED.value)
+                if failed > 0:
+                    print_warning(f"No pending tasks remain; {failed} task(s) failed after retries.")
+                else:
+                    print_success("All tasks completed!")
+                break
+
+            self._cancel_token.wait(poll)
+
+        if not self.is_running:
+            cancel_pending(self._synth_futures)
+        self._collect_section_syntheses(block=True)
+        print_statistics_table(self.db.get_statistics(session_id=self.session_id))
 
     def _add_recursive_tasks(self, new_tasks: List[dict]):
         """Add new tasks discovered during research"""
@@ -438,7 +672,7 @@ class ResearchOrchestrator:
                 description=task_data.get("description", ""),
                 file_path=generate_file_path(
                     task_data["topic"],
-                    self.config.output.directory,
+                    f"{self.config.output.directory}/session_{self.session_id}",
                     file_index
                 ),
                 priority=task_data.get("priority", 5),
@@ -466,66 +700,165 @@ class ResearchOrchestrator:
             )
             self.db.add_glossary_term(term, session_id=self.session_id)
 
-    def _synthesize_all_sections(self, query: str, sections: list):
-        """Synthesize all sections in parallel, providing adjacent context."""
-
-        # Pre-compute adjacent context from descriptions (always available,
-        # no dependency on other sections' synthesis output).
-        def _build_adjacent(i):
-            adjacent = {"previous": "", "next": ""}
-            if i > 0:
-                prev = sections[i - 1]
-                adjacent["previous"] = f"**{prev.title}**: {prev.description}"
-            if i < len(sections) - 1:
-                nxt = sections[i + 1]
-                adjacent["next"] = f"**{nxt.title}**: {nxt.description}"
+    def _section_ready(self, tasks: List[ResearchTask]) -> bool:
+        """A section is ready for synthesis once none of its tasks can still change.
+
+        Pending/in-progress tasks and failures with retries left block it;
+        at least one task must have completed.
+        """
+        for t in tasks:
+            if t.status in (TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value):
+                return False
+            if t.status == TaskStatus.FAILED.value and (t.retry_count or 0) < 2:
+                return False
+        return any(t.status == TaskStatus.COMPLETED.value for t in tasks)
+
+    def _needs_synthesis(self, section, tasks: List[ResearchTask]) -> bool:
+        """True unless the section was already synthesized from exactly these tasks."""
+        completed = frozenset(t.id for t in tasks if t.status == TaskStatus.COMPLETED.value)
+        if section.id in self._synthesized_tasks:
+            return self._synthesized_tasks[section.id] != completed
+        return section.status != SectionStatus.COMPLETE.value
+
+    def _maybe_start_section_synthesis(self, section_id: Optional[int]):
+        """Submit a section for synthesis as soon as its own tasks are done.
+
+        Called from the research loop after every finished task so synthesis
+        of finished sections overlaps with research on the others.
+        """
+        if section_id is None or section_id in self._synth_futures.values():
+            return
+        tasks = self.db.get_tasks_for_section(section_id)
+        if not self._section_ready(tasks):
+            return
+        sections = self.db.get_all_sections(session_id=self.session_id)
+        section = next((s for s in sections if s.id == section_id), None)
+        if section is None or not self._needs_synthesis(section, tasks):
+            return
+        if self._wants_section_gap_check(section):
+            self._section_gap_checked.add(section.id)
+            print_info(f"  Section '{section.title}' research complete, checking for gaps")
+            future = get_executor("llm").submit(self._check_section_gaps, section, sections)
+        else:
+            print_info(f"  Section '{section.title}' research complete, synthesizing early")
+            future = get_executor("llm").submit(
+                self._synthesize_section, section, sections, self.query
+            )
+        self._synth_futures[future] = section_id
+
+    def _wants_section_gap_check(self, section) -> bool:
+        """One gap check per section, skipped when the deadline rules out gap analysis."""
+        if not self.config.gap_analysis.section_checks or section.id in self._section_gap_checked:
+            return False
+        return not (self.deadline and not self.deadline.allow_gap_analysis)
+
+    def _check_section_gaps(self, section, sections: list) -> Optional[str]:
+        """Gap-check a finished section, then synthesize it if nothing was added.
+
+        Follow-up tasks put the section back behind its readiness gate; it
+        is synthesized once they finish. Thread-safe — runs on the llm pool.
+        """
+        if not self.is_running:
+            return None
+        capacity = self.config.research.max_total_tasks - self.db.get_task_count(session_id=self.session_id)
+        added = self.gap_analyst.analyze_section_gaps(
+            self.query, section, self.session_id,
+            max_tasks=min(self.config.gap_analysis.max_tasks_per_section, capacity),
+        )
+        if added:
+            print_info(f"  Section '{section.title}': {added} follow-up task(s) before synthesis")
+            return None
+        return self._synthesize_section(section, sections, self.query)
+
+    def _collect_section_syntheses(self, block: bool = False):
+        """Drain finished early-synthesis futures (all of them when ``block``)."""
+        if not self._synth_futures:
+            return
+        if block:
+            wait(list(self._synth_futures))
+        for future in [f for f in self._synth_futures if f.done()]:
+            section_id = self._synth_futures.pop(future)
+            if future.cancelled():
+                continue
+            try:
+                future.result()
+            except RunCancelled:
+                logger.info(f"Synthesis cancelled for section {section_id}")
+            except Exception as e:
+                logger.error(f"Synthesis failed for section {section_id}: {e}")
+
+    @staticmethod
+    def _build_adjacent(section, sections: list) -> dict:
+        """Adjacent context from outline descriptions (no dependency on other sections' synthesis)."""
+        adjacent = {"previous": "", "next": ""}
+        i = next((k for k, s in enumerate(sections) if s.id == section.id), None)
+        if i is None:
             return adjacent
+        if i > 0:
+            prev = sections[i - 1]
+            adjacent["previous"] = f"**{prev.title}**: {prev.description}"
+        if i < len(sections) - 1:
+            nxt = sections[i + 1]
+            adjacent["next"] = f"**{nxt.title}**: {nxt.description}"
+        return adjacent
+
+    def _synthesize_section(self, section, sections: list, query: str) -> Optional[str]:
+        """Synthesize one section and persist it. Thread-safe — runs on the llm pool."""
+        if not self.is_running:
+            return None
+        completed = frozenset(
+            t.id for t in self.db.get_tasks_for_section(section.id)
+            if t.status == TaskStatus.COMPLETED.value
+        )
+        print_info(f"  Synthesizing: {section.title}")
+        started = datetime.now()
+        content = self.synthesizer.synthesize_section(
+            section, query, sections, self._build_adjacent(section, sections), self.session_id
+        )
+        if self.deadline:
+            self.deadline.record_synthesis((datetime.now() - started).total_seconds())
+        if not content:
+            return None
+        word_count = count_words(content)
+        citation_count = count_citations(content)
+        self.db.mark_section_synthesized(section.id, content, word_count, citation_count)
+        section.synthesized_content = content
+        self._synthesized_tasks[section.id] = completed
+        print_info(f"    {section.title}: {word_count} words, {citation_count} citations")
+        return content
+
+    def _synthesize_all_sections(self, query: str, sections: list):
+        """Synthesize every section that still needs it, in parallel.
 
-        # Filter to sections that need synthesis
+        With pipelined synthesis most sections are already done by the time
+        this runs; only sections that were never ready, failed, or gained
+        tasks afterwards (recursion, gap fill) are synthesized here.
+        """
         to_synthesize = []
-        for i, section in enumerate(sections):
-            if section.status == SectionStatus.COMPLETE.value or section.status == "complete":
+        for section in sections:
+            tasks = self.db.get_tasks_for_section(section.id)
+            if not self._needs_synthesis(section, tasks):
                 print_info(f"  Section '{section.title}' already synthesized, skipping")
                 continue
-            tasks = self.db.get_tasks_for_section(section.id)
-            completed = [t for t in tasks if t.status == "completed"]
-            if not completed:
+            if not any(t.status == TaskStatus.COMPLETED.value for t in tasks):
                 print_warning(f"  Section '{section.title}' has no completed tasks, skipping")
                 continue
-            to_synthesize.append((i, section))
+            to_synthesize.append(section)
 
         if not to_synthesize:
             print_success("Section synthesis complete (nothing to do)")
             return
 
-        def _synthesize_one(idx_section):
-            i, section = idx_section
-            if not self.is_running:
-                return section, None
-            adjacent = _build_adjacent(i)
-            print_info(f"  Synthesizing: {section.title}")
-            content = self.synthesizer.synthesize_section(
-                section, query, sections, adjacent, self.session_id
-            )
-            return section, content
-
-        max_workers = min(len(to_synthesize), 4)
-        with ThreadPoolExecutor(max_workers=max_workers) as synth_exec:
-            futures = {synth_exec.submit(_synthesize_one, item): item for item in to_synthesize}
-            for future in as_completed(futures):
-                try:
-                    section, content = future.result()
-                    if content:
-                        word_count = count_words(content)
-                        citation_count = count_citations(content)
-                        self.db.mark_section_synthesized(
-                            section.id, content, word_count, citation_count
-                        )
-                        section.synthesized_content = content
-                        print_info(f"    {section.title}: {word_count} words, {citation_count} citations")
-                except Exception as e:
-                    item = futures[future]
-                    logger.error(f"Synthesis failed for '{item[1].title}': {e}")
+        synth_exec = get_executor("llm")
+        futures = {
+            synth_exec.submit(self._synthesize_section, section, sections, query): section
+            for section in to_synthesize
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Synthesis failed for '{futures[future].title}': {e}")
 
         print_success("Section synthesis complete")
 
@@ -582,40 +915,40 @@ class ResearchOrchestrator:
             f"{s.position}. {s.title}" for s in sections if s.synthesized_content
         )
 
-        with ThreadPoolExecutor(max_workers=2) as comp_executor:
-            futures = {}
-
-            if self.config.output.include_summary:
-                self.db.add_run_event(
-                    session_id=self.session_id, task_id=None,
-                    event_type="agent_action", query_group="exec_summary",
-                    query_text="Generating executive summary",
-                )
-                futures[comp_executor.submit(
-                    self.editor.generate_executive_summary,
-                    self.query, section_summaries, report_structure
-                )] = 'summary'
+        comp_executor = get_executor("llm")
+        futures = {}
 
+        if self.config.output.include_summary:
             self.db.add_run_event(
                 session_id=self.session_id, task_id=None,
-                event_type="agent_action", query_group="conclusion",
-                query_text="Generating conclusion",
+                event_type="agent_action", query_group="exec_summary",
+                query_text="Generating executive summary",
             )
             futures[comp_executor.submit(
-                self.editor.generate_conclusion,
-                self.query, section_summaries, total_words, report_structure
-            )] = 'conclusion'
-
-            for future in as_completed(futures):
-                label = futures[future]
-                try:
-                    result = future.result()
-                    if label == 'summary':
-                        executive_summary = result
-                    else:
-                        conclusion = result
-                except Exception as e:
-                    logger.warning(f"Failed to generate {label}: {e}")
+                self.editor.generate_executive_summary,
+                self.query, section_summaries, report_structure
+            )] = 'summary'
+
+        self.db.add_run_event(
+            session_id=self.session_id, task_id=None,
+            event_type="agent_action", query_group="conclusion",
+            query_text="Generating conclusion",
+        )
+        futures[comp_executor.submit(
+            self.editor.generate_conclusion,
+            self.query, section_summaries, total_words, report_structure
+        )] = 'conclusion'
+
+        for future in as_completed(futures):
+            label = futures[future]
+            try:
+                result = future.result()
+                if label == 'summary':
+                    executive_summary = result
+                else:
+                    conclusion = result
+            except Exception as e:
+                logger.warning(f"Failed to generate {label}: {e}")
 
         # Calculate duration
         duration_seconds = (datetime.now() - self.start_time).total_seconds()
@@ -665,29 +998,29 @@ class ResearchOrchestrator:
         conclusion = None
         total_words = sum(count_words(ch["content"]) for ch in chapters)
 
-        with ThreadPoolExecutor(max_workers=2) as comp_executor:
-            futures = {}
-            if self.config.output.include_summary and section_summaries:
-                futures[comp_executor.submit(
-                    self.editor.generate_executive_summary,
-                    self.query, section_summaries, ""
-                )] = 'summary'
-            if section_summaries:
-                futures[comp_executor.submit(
-                    self.editor.generate_conclusion,
-                    self.query, section_summaries, total_words, ""
-                )] = 'conclusion'
-
-            for future in as_completed(futures):
-                label = futures[future]
-                try:
-                    result = future.result()
-                    if label == 'summary':
-                        executive_summary = result
-                    else:
-                        conclusion = result
-                except Exception as e:
-                    logger.warning(f"Failed to generate {label}: {e}")
+        comp_executor = get_executor("llm")
+        futures = {}
+        if self.config.output.include_summary and section_summaries:
+            futures[comp_executor.submit(
+                self.editor.generate_executive_summary,
+                self.query, section_summaries, ""
+            )] = 'summary'
+        if section_summaries:
+            futures[comp_executor.submit(
+                self.editor.generate_conclusion,
+                self.query, section_summaries, total_words, ""
+            )] = 'conclusion'
+
+        for future in as_completed(futures):
+            label = futures[future]
+            try:
+                result = future.result()
+                if label == 'summary':
+                    executive_summary = result
+                else:
+                    conclusion = result
+            except Exception as e:
+                logger.warning(f"Failed to generate {label}: {e}")
 
         duration_seconds = (datetime.now() - self.start_time).total_seconds()
 
@@ -0,0 +1,183 @@
+"""
+Task scheduling policies for the research loop and research workers.
+
+A policy orders a session's PENDING tasks; the claimer then claims them in
+that order (``DatabaseManager.get_next_tasks(candidate_ids=...)``), still
+with one conditional UPDATE per task so concurrent claimers stay safe.
+
+    priority            priority desc, depth asc, id asc (the database order)
+    shortest_job_first  weighted shortest expected job first, from the run
+                        times of recently completed tasks
+    section_completion  tasks of the sections closest to done first, so the
+                        pipelined synthesizer can start on them sooner
+    round_robin         interleave sections so all of them progress evenly
+
+Select one with ``research.scheduling_policy``. Add a policy by subclassing
+``SchedulingPolicy`` and calling ``register_policy``.
+"""
+import threading
+import time
+from statistics import median
+from typing import Dict, List, Optional, Type
+
+from src.config.settings import get_config
+from src.config.types import ResearchTask, TaskStatus
+from src.config.logger import get_logger
+
+logger = get_logger(__name__)
+
+_OPEN = (TaskStatus.PENDING.value, TaskStatus.IN_PROGRESS.value)
+
+
+def _priority_key(task: ResearchTask) -> tuple:
+    return (-(task.priority or 0), task.depth or 0, task.id or 0)
+
+
+class SchedulingPolicy:
+    """Orders pending tasks; the first ones are claimed next."""
+
+    name = "priority"
+
+    def __init__(self, db=None):
+        self.db = db
+
+    def order(self, pending: List[ResearchTask], all_tasks: List[ResearchTask]) -> List[ResearchTask]:
+        return sorted(pending, key=_priority_key)
+
+
+class PriorityPolicy(SchedulingPolicy):
+    """The database's own order: priority desc, depth asc, id asc."""
+
+    name = "priority"
+
+
+class ShortestJobFirstPolicy(SchedulingPolicy):
+    """Weighted shortest expected job first (expected seconds / priority).
+
+    A task's cost is estimated from its description length (more to cover,
+    more queries and sources) and calibrated against the measured run time
+    of recently completed tasks of the same kind (gap-fill or not,
+    top-level or sub-task). Without history the uncalibrated cost is used,
+    which still ranks cheap tasks first.
+    """
+
+    name = "shortest_job_first"
+    refresh_seconds = 60.0
+
+    def __init__(self, db=None):
+        super().__init__(db)
+        self._rates: Dict[tuple, float] = {}
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bucket(task: ResearchTask) -> tuple:
+        return (bool(task.is_gap_fill), (task.depth or 0) > 0)
+
+    @staticmethod
+    def _cost_units(task: ResearchTask) -> float:
+        return 1.0 + len(task.description or "") / 500.0
+
+    def _refresh(self) -> None:
+        with self._lock:
+            if self.db is None or time.monotonic() - self._loaded_at < self.refresh_seconds:
+                return
+            self._loaded_at = time.monotonic()
+            try:
+                history = self.db.get_task_durations()
+            except Exception as e:
+                logger.warning(f"Could not load task timings: {e}")
+                return
+            samples: Dict[tuple, List[float]] = {}
+            for task, seconds in history:
+                rate = seconds / self._cost_units(task)
+                samples.setdefault(self._bucket(task), []).append(rate)
+                samples.setdefault(None, []).append(rate)
+            self._rates = {bucket: median(rates) for bucket, rates in samples.items()}
+
+    def expected_seconds(self, task: ResearchTask) -> float:
+        rate = self._rates.get(self._bucket(task), self._rates.get(None, 1.0))
+        return rate * self._cost_units(task)
+
+    def order(self, pending: List[ResearchTask], all_tasks: List[ResearchTask]) -> List[ResearchTask]:
+        self._refresh()
+        return sorted(pending, key=lambda t: (
+            self.expected_seconds(t) / max(t.priority or 1, 1), _priority_key(t),
+        ))
+
+
+class SectionCompletionPolicy(SchedulingPolicy):
+    """Tasks of the sections with the fewest open tasks first."""
+
+    name = "section_completion"
+
+    def order(self, pending: List[ResearchTask], all_tasks: List[ResearchTask]) -> List[ResearchTask]:
+        remaining: Dict[Optional[int], int] = {}
+        for t in all_tasks:
+            if t.status in _OPEN:
+                remaining[t.section_id] = remaining.get(t.section_id, 0) + 1
+        return sorted(pending, key=lambda t: (
+            t.section_id is None,  # section-less tasks feed no synthesis
+            remaining.get(t.section_id, 0),
+            t.section_id or 0,
+            _priority_key(t),
+        ))
+
+
+class RoundRobinPolicy(SchedulingPolicy):
+    """One task per section in turn; sections with work in flight wait their turn."""
+
+    name = "round_robin"
+
+    def order(self, pending: List[ResearchTask], all_tasks: List[ResearchTask]) -> List[ResearchTask]:
+        running: Dict[Optional[int], int] = {}
+        for t in all_tasks:
+            if t.status == TaskStatus.IN_PROGRESS.value:
+                running[t.section_id] = running.get(t.section_id, 0) + 1
+        by_section: Dict[Optional[int], List[ResearchTask]] = {}
+        for t in sorted(pending, key=_priority_key):
+            by_section.setdefault(t.section_id, []).append(t)
+        keyed = []
+        for section_id, tasks in by_section.items():
+            for rank, t in enumerate(tasks):
+                keyed.append(((running.get(section_id, 0) + rank, section_id is None, section_id or 0), t))
+        return [t for _, t in sorted(keyed, key=lambda kt: kt[0])]
+
+
+_POLICIES: Dict[str, Type[SchedulingPolicy]] = {}
+
+
+def register_policy(cls: Type[SchedulingPolicy]) -> Type[SchedulingPolicy]:
+    """Make a policy selectable by its ``name`` in ``research.scheduling_policy``."""
+    _POLICIES[cls.name] = cls
+    return cls
+
+
+for _cls in (PriorityPolicy, ShortestJobFirstPolicy, SectionCompletionPolicy, RoundRobinPolicy):
+    register_policy(_cls)
+
+
+def get_policy(name: str = None, db=None) -> SchedulingPolicy:
+    """Instantiate the policy ``name`` (default: ``research.scheduling_policy``)."""
+    name = name or get_config().research.scheduling_policy
+    if name not in _POLICIES:
+        raise KeyError(f"Unknown scheduling policy {name!r}. Available: {sorted(_POLICIES)}")
+    return _POLICIES[name](db)
+
+
+def claim_next_tasks(db, policy: SchedulingPolicy, count: int, session_id: int,
+                     owner: str = None, lease_seconds: int = None) -> List[ResearchTask]:
+    """Claim up to ``count`` pending tasks of a session in ``policy`` order."""
+    if count <= 0:
+        return []
+    if type(policy) is PriorityPolicy:
+        return db.get_next_tasks(count, session_id=session_id, owner=owner, lease_seconds=lease_seconds)
+    all_tasks = db.get_all_tasks(session_id=session_id)
+    pending = [t for t in all_tasks if t.status == TaskStatus.PENDING.value]
+    if not pending:
+        return []
+    ordered = policy.order(pending, all_tasks)
+    return db.get_next_tasks(
+        count, session_id=session_id, owner=owner, lease_seconds=lease_seconds,
+        candidate_ids=[t.id for t in ordered],
+    )
@@ -3,30 +3,77 @@ ResearchService — facade for research run lifecycle.
 
 Single API for CLI, web, and future MCP adapters.  Owns background-thread
 management so that callers never construct orchestrators directly.
+
+Several runs can execute at once. Background runs are submitted to the
+durable run queue and admitted by a ``RunDispatcher`` as run slots and
+rate-limit budget free up (see ``src.pipeline.dispatcher``); admitted runs
+execute on the shared ``run`` pool and are tracked in a registry of
+``RunHandle``s. Blocking (CLI) runs bypass the queue. Each run executes
+inside a ``config_scope`` holding its own config (global config + preset +
+explicit overrides), so runs never see each other's settings. All runs
+share the process-wide LLM/search/scrape rate limiters, which grant slots
+to the waiting runs in turn (see ``src.infra.rate_limit``).
 """
 import base64
 import io
 import json
 import threading
+import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 
-from src.config.settings import get_config, set_config, apply_overrides
+from src.config.settings import Config, get_config, config_scope, apply_overrides
 from src.config.presets import RESEARCH_PRESETS
+from src.config.types import QueuedRun
 from src.infra._database import get_database
+from src.infra.executors import get_executor
 from src.infra.llm import get_token_tracker
+from src.pipeline.dispatcher import RunDispatcher, estimate_run
 from src.config.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+class RunHandle:
+    """A run tracked by the service: queued, running, or just finished."""
+
+    def __init__(self, query: str, config: Config, run_id: Optional[str] = None):
+        self.run_id = run_id or uuid.uuid4().hex[:12]
+        self.query = query
+        self.config = config
+        self.status = "queued"  # queued | running | finished | failed | cancelled
+        self.submitted_at = datetime.now()
+        self.orchestrator = None  # ResearchOrchestrator, once running
+        self.future = None  # background runs only
+
+    @property
+    def session_id(self) -> Optional[int]:
+        return self.orchestrator.session_id if self.orchestrator is not None else None
+
+    @property
+    def phase(self) -> str:
+        return self.orchestrator.phase if self.orchestrator is not None else self.status
+
+    def to_dict(self) -> dict:
+        return {
+            "run_id": self.run_id,
+            "session_id": self.session_id,
+            "query": self.query,
+            "status": self.status,
+            "phase": self.phase,
+            "submitted_at": self.submitted_at.isoformat(),
+        }
+
+
 class ResearchService:
     """Facade for research run lifecycle."""
 
     def __init__(self):
         self._lock = threading.Lock()
-        self._thread: Optional[threading.Thread] = None
+        self._runs: Dict[str, RunHandle] = {}  # run_id -> active (queued or running) run
+        # Most recently started run; the target of calls that name no session
         self._orchestrator = None  # ResearchOrchestrator | None
+        self._dispatcher: Optional[RunDispatcher] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -41,6 +88,8 @@ class ResearchService:
         refinement_qa: Optional[str] = None,
         resume: bool = False,
         blocking: bool = False,
+        user: Optional[str] = None,
+        priority: int = 0,
     ) -> dict:
         """Start a research run.
 
@@ -52,35 +101,87 @@ class ResearchService:
             refinement_qa: JSON string of Q&A pairs from refinement.
             resume: Resume an existing session instead of starting fresh.
             blocking: If True, run synchronously and return the result dict.
+            user: Submitting user, for fair queueing between users.
+            priority: Queue priority; higher is admitted first.
 
         Returns:
-            ``{"status": "started"}`` for background runs, or the full
-            result dict (output_files, statistics, duration) for blocking runs.
+            For background runs, the run's queue entry: ``status`` is
+            "started" if it was admitted at once, otherwise "queued" with
+            its ``position`` and ``eta_seconds``. For blocking runs, the
+            full result dict (output_files, statistics, duration).
         """
-        # Merge preset overrides + explicit overrides
-        merged_overrides = self._merge_overrides(mode, overrides)
+        # Merge preset overrides + explicit overrides into this run's own config
+        config = self._run_config(mode, overrides)
 
         if blocking:
             return self._run_blocking(
-                query,
-                merged_overrides=merged_overrides,
+                RunHandle(query, config),
                 refined_brief=refined_brief,
                 refinement_qa=refinement_qa,
                 resume=resume,
             )
 
-        return self._run_background(
-            query,
-            merged_overrides=merged_overrides,
+        estimate = estimate_run(config)
+        run = get_database().enqueue_run(QueuedRun(
+            id=uuid.uuid4().hex[:12],
+            query=query,
+            user=user or "anonymous",
+            priority=priority,
+            mode=mode,
+            overrides_json=json.dumps(overrides) if overrides else None,
             refined_brief=refined_brief,
             refinement_qa=refinement_qa,
-        )
+            est_llm_calls=estimate.llm_calls,
+            est_search_calls=estimate.search_calls,
+            est_cost=estimate.cost,
+        ))
+        dispatcher = self.start_dispatcher()
+        dispatcher.dispatch()
+        entry = dispatcher.entry(run.id) or {"run_id": run.id, "status": "queued"}
+        if entry["status"] != "queued":
+            entry["status"] = "started"
+        return entry
 
     def is_running(self) -> bool:
+        """True while any run is queued or executing."""
         with self._lock:
-            return self._thread is not None and self._thread.is_alive()
+            if self._runs:
+                return True
+        return get_database().count_queued_runs() > 0
 
-    def get_current_phase(self) -> str:
+    def list_runs(self) -> List[dict]:
+        """Runs executing in this process (oldest first), then queued runs in admission order."""
+        with self._lock:
+            handles = sorted(self._runs.values(), key=lambda h: h.submitted_at)
+        return [h.to_dict() for h in handles] + self.get_queue()["queued"]
+
+    def get_queue(self) -> dict:
+        """The run queue: run slots, running entries, and queued entries with position and ETA."""
+        return self.dispatcher().snapshot()
+
+    def get_queue_entry(self, run_id: str) -> Optional[dict]:
+        return self.dispatcher().entry(run_id)
+
+    def dispatcher(self) -> RunDispatcher:
+        with self._lock:
+            if self._dispatcher is None:
+                self._dispatcher = RunDispatcher(self._launch, self._session_ids)
+            return self._dispatcher
+
+    def start_dispatcher(self) -> RunDispatcher:
+        """Start admitting queued runs in the background (idempotent)."""
+        dispatcher = self.dispatcher()
+        dispatcher.start()
+        return dispatcher
+
+    def stop_dispatcher(self) -> None:
+        if self._dispatcher is not None:
+            self._dispatcher.stop()
+
+    def get_current_phase(self, session_id: Optional[int] = None) -> str:
+        if session_id is not None:
+            handle = self._find_run(session_id)
+            return handle.phase if handle else "idle"
         if self._orchestrator is not None:
             return self._orchestrator.phase
         return "idle"
@@ -96,17 +197,33 @@ class ResearchService:
         return {
             "session_id": session.id,
             "status": session.status,
-            "phase": self.get_current_phase(),
-            "running": self.is_running(),
+            "phase": self.get_current_phase(session.id),
+            "running": self._find_run(session.id) is not None,
             "statistics": stats,
             "costs": get_token_tracker().get_stats(),
         }
 
-    def cancel_run(self) -> dict:
-        if self._orchestrator is not None:
-            self._orchestrator._cancel_requested = True
-            self._orchestrator.is_running = False
-            session_id = self._orchestrator.session_id
+    def cancel_run(self, session_id: Optional[int] = None, run_id: Optional[str] = None) -> dict:
+        """Cancel a run by session or run id (default: the most recently started run).
+
+        A queued run is dropped before it starts.
+        """
+        orchestrator = self._orchestrator
+        if session_id is not None or run_id is not None:
+            handle = self._find_run(session_id, run_id)
+            if handle is None:
+                if run_id is not None and get_database().cancel_queued_run(run_id):
+                    return {"status": "cancelled", "run_id": run_id}
+                return {"status": "not_running"}
+            if handle.future is not None and handle.future.cancel():
+                self._unregister(handle, "cancelled")
+                self._run_finished(handle)
+                return {"status": "cancelled", "run_id": handle.run_id}
+            orchestrator = handle.orchestrator
+
+        if orchestrator is not None:
+            orchestrator.cancel()
+            session_id = orchestrator.session_id
             if session_id is not None:
                 from datetime import datetime, timezone
                 import json
@@ -116,11 +233,11 @@ class ResearchService:
                 db.add_run_event(
                     session_id=session_id,
                     event_type="cancellation_requested",
-                    phase=self._orchestrator.phase,
+                    phase=orchestrator.phase,
                     severity="warning",
                     payload_json=json.dumps({
                         "cancelled_at": now.isoformat(),
-                        "phase": self._orchestrator.phase,
+                        "phase": orchestrator.phase,
                     }),
                 )
             return {"status": "cancelling"}
@@ -236,6 +353,14 @@ class ResearchService:
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _run_config(self, mode: Optional[str], overrides: Optional[dict]) -> Config:
+        """Global config + preset + explicit overrides."""
+        merged_overrides = self._merge_overrides(mode, overrides)
+        config = get_config()
+        if merged_overrides:
+            config = apply_overrides(config, merged_overrides)
+        return config
+
     @staticmethod
     def _merge_overrides(mode: Optional[str], overrides: Optional[dict]) -> Optional[dict]:
         merged: dict = {}
@@ -254,68 +379,104 @@ class ResearchService:
             return session
         return db.get_most_recent_session()
 
-    def _run_blocking(self, query, merged_overrides, refined_brief, refinement_qa, resume):
-        from src.pipeline import ResearchOrchestrator
+    def _find_run(self, session_id: Optional[int] = None,
+                  run_id: Optional[str] = None) -> Optional[RunHandle]:
+        with self._lock:
+            if run_id is not None:
+                return self._runs.get(run_id)
+            for handle in self._runs.values():
+                if handle.session_id == session_id:
+                    return handle
+        return None
+
+    def _register(self, handle: RunHandle) -> None:
+        with self._lock:
+            self._runs[handle.run_id] = handle
 
-        original = get_config()
-        if merged_overrides:
-            overridden = apply_overrides(original, merged_overrides)
-            set_config(overridden)
+    def _unregister(self, handle: RunHandle, status: str) -> None:
+        with self._lock:
+            handle.status = status
+            self._runs.pop(handle.run_id, None)
+            if self._orchestrator is not None and self._orchestrator is handle.orchestrator:
+                running = [h for h in self._runs.values() if h.orchestrator is not None]
+                self._orchestrator = running[-1].orchestrator if running else None
+
+    def _execute(self, handle: RunHandle, refined_brief, refinement_qa,
+                 resume: bool = False, register_signals: bool = False) -> dict:
+        """Run ``handle`` to completion in the calling thread, under its own config."""
+        from src.pipeline import ResearchOrchestrator
 
-        orchestrator = ResearchOrchestrator(register_signals=True)
-        self._orchestrator = orchestrator
+        status = "failed"
         try:
-            result = orchestrator.run(
-                query,
-                resume=resume,
-                refined_brief=refined_brief,
-                refinement_qa=refinement_qa,
-            )
+            with config_scope(handle.config):
+                orchestrator = ResearchOrchestrator(register_signals=register_signals)
+                with self._lock:
+                    handle.orchestrator = orchestrator
+                    handle.status = "running"
+                    self._orchestrator = orchestrator
+                result = orchestrator.run(
+                    handle.query,
+                    resume=resume,
+                    refined_brief=refined_brief,
+                    refinement_qa=refinement_qa,
+                )
+            status = "cancelled" if orchestrator._cancel_requested else "finished"
             return result
         finally:
-            self._orchestrator = None
-            if merged_overrides:
-                set_config(original)
+            self._unregister(handle, status)
+
+    def _run_blocking(self, handle: RunHandle, refined_brief, refinement_qa, resume):
+        self._register(handle)
+        return self._execute(
+            handle, refined_brief, refinement_qa, resume=resume, register_signals=True,
+        )
 
-    def _run_background(self, query, merged_overrides, refined_brief, refinement_qa):
+    def _session_ids(self) -> Dict[str, Optional[int]]:
         with self._lock:
-            if self._thread is not None and self._thread.is_alive():
-                return {"status": "already_running"}
+            return {h.run_id: h.session_id for h in self._runs.values()}
 
-            def _worker():
-                # Suppress Rich console output so it doesn't garble uvicorn's terminal.
-                import src.config.logger as _logger_mod
-                _logger_mod.console = type(_logger_mod.console)(file=io.StringIO())
+    def _launch(self, run: QueuedRun) -> None:
+        """Start a run admitted by the dispatcher."""
+        overrides = json.loads(run.overrides_json) if run.overrides_json else None
+        handle = RunHandle(run.query, self._run_config(run.mode, overrides), run_id=run.id)
+        self._run_background(handle, run.refined_brief, run.refinement_qa)
 
-                # Enable RBC SSL certs if available (needed in worker thread)
-                from src.infra.security import configure_rbc_security_certs
-                configure_rbc_security_certs()
+    def _run_finished(self, handle: RunHandle) -> None:
+        """Close a background run's queue entry and let the next one in."""
+        try:
+            get_database().finish_queued_run(
+                handle.run_id, handle.status, session_id=handle.session_id,
+            )
+        except Exception as e:
+            logger.warning(f"Could not close queue entry {handle.run_id}: {e}")
+        if self._dispatcher is not None:
+            self._dispatcher.wake()
+
+    def _run_background(self, handle: RunHandle, refined_brief, refinement_qa):
+        def _worker():
+            # Suppress Rich console output so it doesn't garble uvicorn's terminal.
+            import src.config.logger as _logger_mod
+            if not isinstance(_logger_mod.console.file, io.StringIO):
+                _logger_mod.console = type(_logger_mod.console)(file=io.StringIO())
 
-                from src.pipeline import ResearchOrchestrator
+            # Enable RBC SSL certs if available (needed in worker thread)
+            from src.infra.security import configure_rbc_security_certs
+            configure_rbc_security_certs()
 
-                original = get_config()
-                if merged_overrides:
-                    overridden = apply_overrides(original, merged_overrides)
-                    set_config(overridden)
+            try:
+                self._execute(handle, refined_brief, refinement_qa)
+            except Exception as e:
+                logger.exception("Background research worker failed: %s", e)
+            finally:
+                self._run_finished(handle)
 
-                orchestrator = ResearchOrchestrator(register_signals=False)
-                self._orchestrator = orchestrator
-                try:
-                    orchestrator.run(
-                        query,
-                        refined_brief=refined_brief,
-                        refinement_qa=refinement_qa,
-                    )
-                except Exception as e:
-                    logger.exception("Background research worker failed: %s", e)
-                finally:
-                    self._orchestrator = None
-                    if merged_overrides:
-                        set_config(original)
-
-            self._thread = threading.Thread(target=_worker, daemon=True)
-            self._thread.start()
-            return {"status": "started"}
+        pool = get_executor("run")
+        with self._lock:
+            busy = sum(1 for h in self._runs.values() if h.future is not None)
+            self._runs[handle.run_id] = handle
+            handle.future = pool.submit(_worker)
+        status = "started" if busy < pool.max_workers else "queued"
+        return {"status": status, "run_id": handle.run_id}
 
 
 # ---------------------------------------------------------------------------
@@ -339,4 +500,6 @@ def reset_service() -> None:
     """Reset the singleton (for testing)."""
     global _service
     with _service_lock:
+        if _service is not None:
+            _service.stop_dispatcher()
         _service = None
@@ -0,0 +1,192 @@
+"""
+Research worker — runs research tasks claimed from the shared database.
+
+With ``research.executor: workers`` the coordinator (ResearchOrchestrator)
+only plans, synthesizes and compiles. Any number of ``research-worker``
+processes, on this host or others pointing at the same database, claim
+PENDING tasks under a lease, run them and renew the lease from a
+heartbeat thread. A worker that dies stops renewing; its tasks are
+returned to PENDING by ``DatabaseManager.reclaim_expired_tasks`` once the
+lease expires.
+
+Each session's tasks run under that session's cancellation token. When the
+session is cancelled (``cancel_requested_at`` set) the token is cancelled,
+in-flight tasks abort within seconds and go back to PENDING.
+"""
+import os
+import socket
+import threading
+import uuid
+from concurrent.futures import wait, FIRST_COMPLETED
+from datetime import datetime
+from typing import Optional
+
+from src.config.settings import get_config
+from src.config.types import TaskStatus
+from src.infra._database import get_database
+from src.infra.cancellation import CancellationToken, RunCancelled, cancellation_scope
+from src.infra.executors import get_executor
+from src.pipeline.scheduling import claim_next_tasks, get_policy
+from src.config.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def default_worker_id() -> str:
+    """Identity recorded as the lease owner: host, pid and a random suffix."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class ResearchWorker:
+    """Claims and executes research tasks until stopped (or idle)."""
+
+    def __init__(self, session_id: Optional[int] = None, concurrency: int = None,
+                 worker_id: str = None, exit_when_idle: bool = True):
+        self.db = get_database()
+        self.session_id = session_id  # None = follow the current running worker-mode session
+        self.concurrency = concurrency or self.config.workers.concurrency
+        self.worker_id = worker_id or default_worker_id()
+        self.exit_when_idle = exit_when_idle
+        self.completed = 0
+        self.failed = 0
+        self._stop = threading.Event()
+        self._heartbeat_stop = threading.Event()
+        self._orchestrators = {}  # session_id -> ResearchOrchestrator
+        self._tokens = {}  # session_id -> CancellationToken
+
+    @property
+    def config(self):
+        return get_config()
+
+    def stop(self):
+        """Ask the worker to stop claiming; running tasks finish first."""
+        self._stop.set()
+
+    def _resolve_session(self):
+        if self.session_id is not None:
+            return self.db.get_session_by_id(self.session_id)
+        # Runs with the local executor research their own tasks
+        return self.db.get_current_session(executor="workers")
+
+    def _orchestrator_for(self, session):
+        """Task-execution context for a session (agents, query, follow-up persistence)."""
+        orch = self._orchestrators.get(session.id)
+        if orch is None:
+            from src.pipeline.orchestrator import ResearchOrchestrator
+            orch = ResearchOrchestrator(register_signals=False)
+            orch.session_id = session.id
+            orch.query = session.refined_brief or session.query  # as the coordinator plans with
+            orch.start_time = datetime.now()
+            orch.is_running = True
+            self._orchestrators[session.id] = orch
+        return orch
+
+    def _token_for(self, session_id: int) -> CancellationToken:
+        token = self._tokens.get(session_id)
+        if token is None:
+            token = self._tokens[session_id] = CancellationToken()
+        return token
+
+    def _finish(self, future, task, orch) -> None:
+        """Record the outcome of one task future."""
+        try:
+            orch._apply_task_result(future.result())
+            self.completed += 1
+        except RunCancelled:
+            logger.info(f"Worker {self.worker_id}: task {task.id} cancelled")
+            self.db.release_task(task.id)
+        except Exception as e:
+            logger.error(f"Worker {self.worker_id}: task {task.id} failed: {e}")
+            self.db.mark_task_failed(task.id, str(e))
+            self.failed += 1
+
+    def _heartbeat(self):
+        interval = max(1.0, float(self.config.workers.heartbeat_seconds))
+        while not self._heartbeat_stop.wait(interval):
+            try:
+                self.db.renew_task_leases(self.worker_id, self.config.workers.lease_seconds)
+            except Exception as e:
+                logger.warning(f"Worker {self.worker_id}: lease renewal failed: {e}")
+
+    def _has_open_tasks(self, session_id: int) -> bool:
+        return (
+            self.db.get_task_count(TaskStatus.PENDING, session_id=session_id)
+            + self.db.get_task_count(TaskStatus.IN_PROGRESS, session_id=session_id)
+        ) > 0
+
+    def run(self) -> int:
+        """Claim and execute tasks until stopped. Returns the number completed.
+
+        With ``exit_when_idle`` the worker returns once its session has no
+        pending or in-progress tasks (or no running session exists);
+        otherwise it keeps polling for new work.
+        """
+        logger.info(f"Research worker {self.worker_id} started (concurrency={self.concurrency})")
+        heartbeat = threading.Thread(
+            target=self._heartbeat, name=f"heartbeat-{self.worker_id}", daemon=True
+        )
+        heartbeat.start()
+
+        executor = get_executor("task")
+        poll = self.config.workers.poll_seconds
+        policy = get_policy(db=self.db)
+        active = {}  # future -> (task, orchestrator)
+
+        try:
+            while not self._stop.is_set():
+                session = self._resolve_session()
+                if session is not None and session.cancel_requested_at is not None:
+                    token = self._tokens.get(session.id)
+                    if token is not None and not token.is_cancelled:
+                        logger.info(f"Worker {self.worker_id}: session {session.id} cancelled")
+                        token.cancel("session cancelled")
+                runnable = (
+                    session is not None
+                    and session.status == "running"
+                    and session.cancel_requested_at is None
+                )
+                if runnable:
+                    self.db.reclaim_expired_tasks(session.id, max_retries=2)
+                    slots = self.concurrency - len(active)
+                    if slots > 0:
+                        orch = self._orchestrator_for(session)
+                        claimed = claim_next_tasks(
+                            self.db, policy, slots, session.id,
+                            owner=self.worker_id,
+                            lease_seconds=self.config.workers.lease_seconds,
+                        )
+                        all_tasks = self.db.get_all_tasks(session_id=session.id) if claimed else []
+                        with cancellation_scope(self._token_for(session.id)):
+                            for task in claimed:
+                                future = executor.submit(
+                                    orch._execute_single_task, task,
+                                    orch._other_sections(task, all_tasks),
+                                )
+                                active[future] = (task, orch)
+
+                if not active:
+                    if self.exit_when_idle and (not runnable or not self._has_open_tasks(session.id)):
+                        break
+                    self._stop.wait(poll)
+                    continue
+
+                done, _ = wait(active.keys(), return_when=FIRST_COMPLETED, timeout=poll)
+                for future in done:
+                    task, orch = active.pop(future)
+                    self._finish(future, task, orch)
+        finally:
+            # Unstarted tasks go back to the queue; started ones finish.
+            for future in [f for f in active if f.cancel()]:
+                task, _ = active.pop(future)
+                self.db.release_task(task.id)
+            wait(list(active))
+            for future, (task, orch) in active.items():
+                self._finish(future, task, orch)
+            self._heartbeat_stop.set()
+            heartbeat.join(timeout=1.0)
+
+        logger.info(
+            f"Research worker {self.worker_id} stopped: "
+            f"{self.completed} completed, {self.failed} failed"
+        )
+        return self.completed
@@ -51,6 +51,7 @@ def isolated_environment(tmp_path):
     config.research.max_concurrent_tasks = 1
     config.research.tasks_per_section = 2
     config.gap_analysis.enabled = False
+    config.gap_analysis.section_checks = False
 
     set_config(config)
 
@@ -65,10 +66,9 @@ def isolated_environment(tmp_path):
     yield config
 
     # Teardown: reset singletons
+    svc_mod.reset_service()  # also stops its run dispatcher
     with db_mod._db_lock:
         db_mod._db = None
-    with svc_mod._service_lock:
-        svc_mod._service = None
     set_config(Config())  # restore pristine defaults
 
 
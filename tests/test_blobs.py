@@ -0,0 +1,112 @@
+"""
+Tests for src.infra._database.blobs — compressed, content-addressed text
+storage for page content and extracted notes.
+"""
+import pytest
+from sqlalchemy import func, text
+
+from src.config.types import ResearchTask, Source
+from src.infra._database import BlobModel, SourceModel, blobs
+from src.infra._database.blobs import BlobStore, content_hash
+
+
+def _blob_count(db):
+    with db.get_sync_session() as session:
+        return session.query(func.count(BlobModel.hash)).scalar()
+
+
+def _task(db, name="T"):
+    session = db.create_session("Q")
+    return db.add_task(ResearchTask(topic=name, description="D", file_path=f"/tmp/{name}.md"),
+                       session_id=session.id)
+
+
+class TestBlobStore:
+    def test_round_trip(self):
+        store = BlobStore("zlib")
+        text = "solar storage " * 500
+        row = store.encode(text)
+        assert row["hash"] == content_hash(text)
+        assert row["size"] == len(text) and len(row["data"]) < row["size"]
+        assert BlobStore.decode(row["codec"], row["data"]) == text
+
+    def test_zstd_falls_back_to_zlib_when_not_installed(self, monkeypatch):
+        monkeypatch.setattr(blobs, "zstandard", None)
+        assert BlobStore("zstd").codec == "zlib"
+        with pytest.raises(RuntimeError, match="zstandard"):
+            BlobStore.decode("zstd", b"")
+
+    def test_unknown_codec_is_rejected(self):
+        with pytest.raises(ValueError, match="database.blob_codec"):
+            BlobStore("lz4")
+
+
+class TestDatabaseBlobs:
+    def test_page_text_is_stored_once_and_read_back(self, db):
+        page = "shared page body " * 200
+        task = _task(db)
+        db.add_sources_bulk(task.id, [
+            (Source(url="https://a.example", title="A", domain="a.example", full_content=page), 0),
+            (Source(url="https://mirror.example", title="M", domain="mirror.example", full_content=page), 1),
+        ])
+
+        assert _blob_count(db) == 1
+        with db.get_sync_session() as session:
+            assert session.query(SourceModel.full_content).filter(
+                SourceModel.full_content.isnot(None)
+            ).count() == 0
+        assert [s.full_content for s in db.get_sources_for_task(task.id)] == [page, page]
+        assert db.get_source_by_url("https://a.example").full_content == page
+        assert db.get_fresh_sources(["https://a.example"], 24)["https://a.example"].full_content == page
+
+    def test_notes_are_stored_as_blobs(self, db):
+        task = _task(db)
+        [source_id] = db.add_sources_bulk(task.id, [
+            (Source(url="https://a.example", title="A", domain="a.example"), 0)
+        ])
+        db.update_source_extraction(task.id, source_id, "key findings")
+        assert _blob_count(db) == 1
+        [source] = db.get_sources_for_session(task.session_id)
+        assert source.extracted_content == "key findings"
+        assert db.get_processed_urls_by_task(task.session_id) == {task.id: {"https://a.example"}}
+
+    def test_unchanged_refetch_keeps_the_stored_copy(self, db):
+        source = Source(url="https://a.example", title="A", domain="a.example", full_content="body")
+        db.add_source(source)
+        db.add_source(source)
+        assert _blob_count(db) == 1
+        assert db.get_source_by_url("https://a.example").full_content == "body"
+
+    def test_inline_rows_are_migrated(self, db):
+        db.blob_store = False
+        task = _task(db)
+        [source_id] = db.add_sources_bulk(task.id, [
+            (Source(url="https://a.example", title="A", domain="a.example", full_content="page"), 0),
+        ])
+        db.update_source_extraction(task.id, source_id, "notes")
+        assert _blob_count(db) == 0
+
+        db.blob_store = True
+        assert db.migrate_content_to_blobs(batch_size=1) == {"sources": 1, "notes": 1}
+        assert _blob_count(db) == 2
+        [source] = db.get_sources_for_task(task.id)
+        assert (source.full_content, source.extracted_content) == ("page", "notes")
+        assert db.migrate_content_to_blobs() == {"sources": 0, "notes": 0}
+
+    def test_replaced_page_text_is_pruned(self, db):
+        db.add_source(Source(url="https://a.example", title="A", domain="a.example", full_content="old"))
+        db.add_source(Source(url="https://a.example", title="A", domain="a.example", full_content="new"))
+        assert _blob_count(db) == 2
+        assert db.prune_blobs() == 1
+        assert db.get_source_by_url("https://a.example").full_content == "new"
+
+    def test_missing_blob_does_not_break_listings(self, db):
+        task = _task(db)
+        db.add_sources_bulk(task.id, [
+            (Source(url="https://a.example", title="A", domain="a.example", full_content="page"), 0),
+        ])
+        with db.engine.begin() as conn:
+            conn.execute(text("DELETE FROM blobs"))
+        [source] = db.get_sources_for_task(task.id)
+        assert source.full_content is None
+        assert db.get_source_by_url("https://a.example").title == "A"
@@ -0,0 +1,202 @@
+"""
+Tests for src.infra.cancellation — cancellation tokens, their propagation
+into executor threads, and how the LLM client and scraper honour them.
+"""
+import json
+import socket
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infra.cancellation import (
+    CancellationToken,
+    RunCancelled,
+    cancellable_sleep,
+    cancellation_scope,
+    check_cancelled,
+    current_token,
+)
+from src.infra.executors import get_executor
+
+
+class TestCancellationToken:
+    def test_cancel_runs_callbacks_once(self):
+        token = CancellationToken()
+        calls = []
+        token.on_cancel(lambda: calls.append("a"))
+        remove = token.on_cancel(lambda: calls.append("b"))
+        remove()
+
+        token.cancel("stop")
+        token.cancel("again")
+
+        assert calls == ["a"]
+        assert token.reason == "stop"
+        with pytest.raises(RunCancelled):
+            token.raise_if_cancelled()
+
+    def test_callback_registered_after_cancel_runs_immediately(self):
+        token = CancellationToken()
+        token.cancel()
+        calls = []
+        token.on_cancel(lambda: calls.append(1))
+        assert calls == [1]
+
+    def test_check_outside_scope_is_a_no_op(self):
+        assert current_token() is None
+        check_cancelled()
+
+    def test_token_propagates_to_executor_threads(self):
+        token = CancellationToken()
+        with cancellation_scope(token):
+            future = get_executor("io").submit(current_token)
+        assert future.result(timeout=5) is token
+        assert current_token() is None
+
+    def test_cancellable_sleep_wakes_on_cancel(self):
+        token = CancellationToken()
+        threading.Timer(0.1, token.cancel).start()
+        started = time.monotonic()
+        with cancellation_scope(token), pytest.raises(RunCancelled):
+            cancellable_sleep(30)
+        assert time.monotonic() - started < 5
+
+
+class TestLLMClientCancellation:
+    def _client(self, create):
+        from src.infra.llm import OpenAIClient
+
+        client = OpenAIClient.__new__(OpenAIClient)
+        client.client = MagicMock()
+        client.client.chat.completions.create.side_effect = create
+        return client
+
+    @staticmethod
+    def _server(handle):
+        """A local server that passes each accepted connection to ``handle``."""
+        server = socket.create_server(("127.0.0.1", 0))
+        accepted = []
+
+        def _serve():
+            while True:
+                try:
+                    conn = server.accept()[0]
+                except OSError:
+                    return
+                accepted.append(conn)
+                threading.Thread(target=handle, args=(conn,), daemon=True).start()
+
+        threading.Thread(target=_serve, daemon=True).start()
+        return server, accepted
+
+    @staticmethod
+    def _live_client(monkeypatch, server):
+        from src.infra.llm import OpenAIClient
+
+        monkeypatch.setenv("OPENAI_API_KEY", "test")
+        monkeypatch.setenv("AZURE_BASE_URL", f"http://127.0.0.1:{server.getsockname()[1]}/v1")
+        return OpenAIClient()
+
+    def test_in_flight_call_is_aborted_on_cancel(self, test_config, monkeypatch):
+        # A server that reads the request and never answers
+        def _read_until_closed(conn):
+            received = b""
+            while chunk := conn.recv(65536):
+                received += chunk
+            closed.append(received)
+
+        closed = []
+        server, accepted = self._server(_read_until_closed)
+        client = self._live_client(monkeypatch, server)
+        token = CancellationToken()
+        threading.Timer(0.2, token.cancel).start()
+        started = time.monotonic()
+        try:
+            with cancellation_scope(token), pytest.raises(RunCancelled):
+                client.complete("prompt", model="gpt-4o-mini")
+            assert time.monotonic() - started < 5
+
+            # Not retried, and the connection is gone rather than left open
+            deadline = time.monotonic() + 5
+            while not closed and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(accepted) == 1
+            assert closed[0].startswith(b"POST /v1/chat/completions")
+        finally:
+            for conn in accepted:
+                conn.close()
+            server.close()
+
+    def test_calls_in_a_run_share_a_connection(self, test_config, monkeypatch):
+        body = json.dumps({
+            "id": "c", "object": "chat.completion", "created": 0, "model": "gpt-4o-mini",
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": "ok"}}],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }).encode()
+
+        def _answer(conn):
+            stream = conn.makefile("rb")
+            while True:
+                headers = {}
+                while (line := stream.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if not line:
+                    return
+                stream.read(int(headers.get("content-length", 0)))
+                conn.sendall(b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+                             b"content-length: %d\r\n\r\n" % len(body) + body)
+
+        server, accepted = self._server(_answer)
+        client = self._live_client(monkeypatch, server)
+        try:
+            with cancellation_scope(CancellationToken()), patch("src.infra.llm.get_llm_limiter"):
+                assert client.complete("one", model="gpt-4o-mini") == "ok"
+                assert client.complete("two", model="gpt-4o-mini") == "ok"
+            assert len(accepted) == 1
+        finally:
+            for conn in accepted:
+                conn.close()
+            server.close()
+
+    def test_cancelled_run_makes_no_call(self, test_config):
+        client = self._client(lambda **kw: None)
+        token = CancellationToken()
+        token.cancel()
+        with cancellation_scope(token), pytest.raises(RunCancelled):
+            client.complete("prompt", model="gpt-4o-mini")
+        client.client.chat.completions.create.assert_not_called()
+
+
+class TestScrapeCancellation:
+    def test_body_read_stops_between_chunks(self):
+        from src.pipeline._tools.scrape import _read_body
+
+        token = CancellationToken()
+        read = []
+
+        def _chunks(chunk_size):
+            for i in range(10):
+                read.append(i)
+                if i == 1:
+                    token.cancel()
+                yield b"x" * 10
+
+        response = MagicMock()
+        response.iter_content.side_effect = _chunks
+        with cancellation_scope(token), pytest.raises(RunCancelled):
+            _read_body(response)
+        assert read == [0, 1]
+
+    def test_cancellation_is_not_swallowed_as_scrape_failure(self, test_config):
+        from src.pipeline._tools.scrape import extract_source_info
+
+        token = CancellationToken()
+        token.cancel()
+        with cancellation_scope(token), \
+                patch("src.pipeline._tools.scrape._validate_url"), \
+                pytest.raises(RunCancelled):
+            extract_source_info("https://example.com/page")
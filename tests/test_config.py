@@ -114,3 +114,26 @@ class TestPresets:
             # apply_overrides should not raise
             result = apply_overrides(base, preset["overrides"])
             assert isinstance(result, Config), f"Preset '{name}' produced invalid config"
+
+
+class TestConfigScope:
+    def test_scope_isolates_run_config(self, test_config):
+        from src.config.settings import config_scope, get_config, set_config
+
+        run_config = apply_overrides(test_config, {"research.max_total_tasks": 3})
+        with config_scope(run_config):
+            assert get_config().research.max_total_tasks == 3
+            # set_config inside a run replaces only the run's config
+            set_config(apply_overrides(run_config, {"research.max_total_tasks": 2}))
+            assert get_config().research.max_total_tasks == 2
+        assert get_config() is test_config
+        assert test_config.research.max_total_tasks == 10
+
+    def test_scope_is_shared_with_executor_threads(self, test_config):
+        from src.config.settings import config_scope, get_config, set_config
+        from src.infra.executors import get_executor
+
+        with config_scope(test_config):
+            set_config(apply_overrides(test_config, {"research.max_total_tasks": 4}))
+            seen = get_executor("io").submit(lambda: get_config().research.max_total_tasks)
+            assert seen.result(timeout=5) == 4
@@ -266,6 +266,136 @@ class TestSourceCRUD:
         assert found is not None
         assert found.title == "Unique"
 
+    def test_get_fresh_sources(self, db):
+        from sqlalchemy import text
+        db.add_source(Source(url="https://fresh.example", title="F", domain="fresh.example",
+                             full_content="body", quality_score=0.7))
+        db.add_source(Source(url="https://stale.example", title="S", domain="stale.example",
+                             full_content="body"))
+        db.add_source(Source(url="https://empty.example", title="E", domain="empty.example"))
+        with db.engine.connect() as conn:
+            conn.execute(text(
+                "UPDATE sources SET accessed_at = '2000-01-01 00:00:00' WHERE url = 'https://stale.example'"
+            ))
+            conn.commit()
+
+        fresh = db.get_fresh_sources(
+            ["https://fresh.example", "https://stale.example", "https://empty.example", "https://new.example"],
+            max_age_hours=24,
+        )
+        assert list(fresh) == ["https://fresh.example"]
+        assert fresh["https://fresh.example"].full_content == "body"
+        assert fresh["https://fresh.example"].quality_score == 0.7
+        assert db.get_fresh_sources(["https://fresh.example"], max_age_hours=0) == {}
+
+    def test_refetched_source_refreshes_stored_copy(self, db):
+        db.add_source(Source(url="https://page.example", title="Old", domain="page.example", full_content="old"))
+        db.add_source(Source(url="https://page.example", title="New", domain="page.example", full_content="new"))
+        found = db.get_source_by_url("https://page.example")
+        assert (found.title, found.full_content) == ("New", "new")
+
+    def test_refetch_with_unchanged_content_renews_freshness(self, db):
+        from sqlalchemy import text
+        source = Source(url="https://page.example", title="P", domain="page.example",
+                        full_content="same", quality_score=0.5)
+        db.add_source(source)
+        with db.engine.begin() as conn:
+            conn.execute(text(
+                "UPDATE sources SET accessed_at = '2000-01-01 00:00:00' WHERE url = 'https://page.example'"
+            ))
+        assert db.get_fresh_sources(["https://page.example"], 24) == {}
+
+        db.add_source(source.model_copy(update={"quality_score": 0.9}))
+        fresh = db.get_fresh_sources(["https://page.example"], 24)
+        assert fresh["https://page.example"].quality_score == 0.9
+
+    def test_reused_copy_keeps_freshness(self, db):
+        db.add_source(Source(url="https://page.example", title="P", domain="page.example",
+                             full_content="same"))
+        stored = db.get_source_by_url("https://page.example")
+        db.add_source(stored.model_copy(update={"id": None, "quality_score": 0.1}))
+        again = db.get_source_by_url("https://page.example")
+        assert (again.accessed_at, again.quality_score) == (stored.accessed_at, stored.quality_score)
+
+    def test_add_sources_bulk(self, db):
+        session = db.create_session("Q")
+        task = db.add_task(
+            ResearchTask(topic="T", description="D", file_path="/tmp/t.md"),
+            session_id=session.id,
+        )
+        stored = db.add_source(Source(url="https://b.example", title="B", domain="b.example",
+                                      full_content="stored"))
+        ids = db.add_sources_bulk(task.id, [
+            (Source(url="https://a.example", title="A", domain="a.example", full_content="a"), 0),
+            (Source(url="https://b.example", title="", domain="b.example"), 1),
+        ])
+        assert ids[1] == stored.id
+        # Reused stored copy is left untouched
+        assert db.get_source_by_url("https://b.example").full_content == "stored"
+        assert [s.id for s in db.get_sources_for_task(task.id)] == ids
+
+        # Re-adding reorders the existing links instead of duplicating them
+        db.add_sources_bulk(task.id, [
+            (Source(url="https://b.example", title="B", domain="b.example"), 0),
+            (Source(url="https://a.example", title="A", domain="a.example"), 1),
+        ])
+        assert [s.id for s in db.get_sources_for_task(task.id)] == ids[::-1]
+
+    def test_update_extractions_bulk(self, db):
+        task = db.add_task(ResearchTask(topic="T", description="D", file_path="/tmp/t.md"))
+        ids = db.add_sources_bulk(task.id, [
+            (Source(url=f"https://{i}.example", title="S", domain="example"), i) for i in range(3)
+        ])
+        db.update_extractions_bulk(task.id, {ids[0]: "notes 0", ids[2]: "notes 2"})
+        extracted = [s.extracted_content for s in db.get_sources_for_task(task.id)]
+        assert extracted == ["notes 0", None, "notes 2"]
+
+    def test_source_listings_do_not_query_per_source(self, db):
+        from sqlalchemy import event
+
+        session = db.create_session("Q")
+        tasks = db.add_tasks_bulk([
+            ResearchTask(topic=f"T{i}", description="D", file_path=f"/tmp/{i}.md") for i in range(2)
+        ], session_id=session.id)
+        for task in tasks:
+            db.add_sources_bulk(task.id, [
+                (Source(url=f"https://{i}.example", title="S", domain="example", full_content="x" * 1000), i)
+                for i in range(10)
+            ])
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])  # noqa: E731
+        event.listen(db.read_engine, "before_cursor_execute", listener)
+        try:
+            by_session = db.get_sources_for_session(session.id)
+            all_sources = db.get_all_sources()
+            by_task = db.get_sources_for_task(tasks[0].id)
+        finally:
+            event.remove(db.read_engine, "before_cursor_execute", listener)
+
+        # session, all sources + their links, task; plus one blob lookup each
+        assert len(statements) == 7
+        assert len(by_session) == len(all_sources) == 10
+        assert all(s.task_ids == [t.id for t in tasks] for s in by_session + all_sources)
+        assert [s.task_ids for s in by_task] == [[tasks[0].id]] * 10
+
+    def test_source_listings_without_content(self, db):
+        task = db.add_task(ResearchTask(topic="T", description="D", file_path="/tmp/t.md"),
+                           session_id=db.create_session("Q").id)
+        [source_id] = db.add_sources_bulk(task.id, [
+            (Source(url="https://a.example", title="A", domain="a.example", full_content="page"), 0)
+        ])
+        db.update_extractions_bulk(task.id, {source_id: "notes"})
+
+        [full] = db.get_sources_for_task(task.id)
+        [light] = db.get_sources_for_task(task.id, include_content=False)
+        assert (full.full_content, full.extracted_content) == ("page", "notes")
+        assert (light.full_content, light.extracted_content) == (None, None)
+        assert light.model_dump(exclude={"full_content", "extracted_content"}) == \
+            full.model_dump(exclude={"full_content", "extracted_content"})
+        assert db.get_sources_for_session(task.session_id, include_content=False)[0].full_content is None
+        assert db.get_all_sources(include_content=False)[0].full_content is None
+
     def test_get_sources_for_session(self, populated_db):
         from src.infra._database import get_database as _get_db
         db = _get_db()
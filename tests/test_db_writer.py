@@ -0,0 +1,97 @@
+"""
+Tests for the single-writer database layer — serialized writes on one
+thread, read-only query connections and configurable pragmas.
+"""
+import threading
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from src.config.types import ResearchTask, TaskStatus
+from src.infra._database import DatabaseManager
+from src.infra._database.writer import SerialWriter
+
+
+class TestSerialWriter:
+    def test_calls_run_on_one_thread_in_order(self):
+        writer = SerialWriter()
+        seen = []
+
+        def _record(i):
+            seen.append((i, threading.current_thread().name))
+            return i * 2
+
+        assert [writer.call(_record, i) for i in range(3)] == [0, 2, 4]
+        assert [i for i, _ in seen] == [0, 1, 2]
+        assert {name for _, name in seen} == {"db-writer"}
+
+    def test_exceptions_reach_the_caller(self):
+        writer = SerialWriter()
+
+        def _boom():
+            raise ValueError("constraint failed")
+
+        with pytest.raises(ValueError, match="constraint failed"):
+            writer.call(_boom)
+
+    def test_nested_calls_run_inline(self):
+        writer = SerialWriter()
+        assert writer.call(lambda: writer.call(lambda: "inner")) == "inner"
+
+
+class TestDatabaseManager:
+    def test_concurrent_writers_do_not_collide(self, db):
+        session = db.create_session("q")
+        errors = []
+
+        def _work(n):
+            try:
+                for i in range(10):
+                    task = db.add_task(ResearchTask(
+                        topic=f"t{n}-{i}", description="d", file_path=f"/tmp/{n}-{i}.md",
+                    ), session_id=session.id)
+                    db.update_task(task.id, status=TaskStatus.COMPLETED.value)
+                    db.get_statistics(session_id=session.id)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=_work, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        assert db.get_task_count(TaskStatus.COMPLETED, session_id=session.id) == 80
+
+    def test_queries_use_read_only_connections(self, db):
+        with db.get_sync_session() as session:
+            with pytest.raises(OperationalError, match="readonly"):
+                session.execute(text("INSERT INTO sessions (query) VALUES ('x')"))
+
+    def test_pragmas_apply_to_read_and_write_connections(self, test_config):
+        test_config.database.synchronous = "full"
+        test_config.database.busy_timeout_ms = 1234
+        db = DatabaseManager()
+        for engine in (db.engine, db.read_engine):
+            with engine.connect() as conn:
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 2  # FULL
+                assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        with db.read_engine.connect() as conn:
+            assert conn.execute(text("PRAGMA query_only")).scalar() == 1
+        db.close()
+
+    def test_invalid_synchronous_mode_is_rejected(self, test_config):
+        test_config.database.synchronous = "SOMETIMES"
+        with pytest.raises(ValueError, match="database.synchronous"):
+            DatabaseManager()
+
+    def test_inline_writes_without_the_writer_thread(self, test_config):
+        test_config.database.single_writer = False
+        db = DatabaseManager()
+        assert db.writer is None
+        session = db.create_session("q")
+        db.update_session(session.id, status="completed")
+        assert db.get_session_by_id(session.id).status == "completed"
+        db.close()
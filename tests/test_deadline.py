@@ -0,0 +1,65 @@
+"""
+Tests for src.pipeline.deadline — deadline forecasting and graceful
+degradation.
+"""
+import json
+from datetime import datetime, timedelta
+
+from src.config.settings import get_config
+from src.pipeline.deadline import DeadlinePlanner
+
+
+def _planner(db, minutes_left):
+    session = db.create_session("q")
+    start = datetime.now() - timedelta(hours=1) + timedelta(minutes=minutes_left)
+    return DeadlinePlanner(db, session.id, start, max_runtime_hours=1), session
+
+
+class TestForecast:
+    def test_plenty_of_time(self, db):
+        planner, _ = _planner(db, 60)
+        planner.record_task(60)
+        assert planner.forecast(pending=5, in_flight=1, sections_left=3, concurrency=3).level == 0
+
+    def test_levels_rise_with_workload(self, db):
+        planner, _ = _planner(db, 30)
+        planner.record_task(300)
+        planner.record_synthesis(60)
+        assert planner.forecast(pending=6, in_flight=0, sections_left=2, concurrency=1).level == 1
+        assert planner.forecast(pending=20, in_flight=0, sections_left=2, concurrency=1).level == 2
+
+    def test_reserve_for_synthesis_stops_research(self, db):
+        planner, _ = _planner(db, 4)
+        planner.record_synthesis(120)
+        forecast = planner.forecast(pending=1, in_flight=1, sections_left=2, concurrency=1)
+        assert forecast.stop_research
+
+
+class TestDegradation:
+    def test_escalation_applies_overrides_and_emits_event(self, db, test_config):
+        test_config.search.results_per_query = 6
+        test_config.search.gap_fill_queries = 2
+        planner, session = _planner(db, 30)
+        planner.record_task(300)
+
+        planner.evaluate(pending=20, in_flight=0, sections_left=2, concurrency=1, phase="researching")
+
+        cfg = get_config()
+        assert cfg.search.gap_fill_queries == 0
+        assert cfg.research.enable_recursion is False
+        assert cfg.search.results_per_query == 3
+        assert not planner.allow_gap_analysis
+
+        events = [e for e in db.get_run_events(session.id) if e.event_type == "deadline_degradation"]
+        assert len(events) == 1
+        assert json.loads(events[0].payload_json)["level"] == 2
+
+        planner.restore()
+        assert get_config().search.results_per_query == 6
+
+    def test_level_never_decreases(self, db):
+        planner, _ = _planner(db, 30)
+        planner.record_task(300)
+        planner.evaluate(pending=20, in_flight=0, sections_left=2, concurrency=1)
+        assert planner.evaluate(pending=0, in_flight=0, sections_left=0, concurrency=1).level == 2
+        planner.restore()
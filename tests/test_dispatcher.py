@@ -0,0 +1,154 @@
+"""
+Tests for src.pipeline.dispatcher — the durable run queue: estimates,
+fair admission order, slot and budget admission, positions/ETAs and
+recovery of runs left behind by a dead dispatcher.
+"""
+from datetime import datetime, timedelta
+
+from src.config.types import QueuedRun, QueueStatus
+from src.pipeline.dispatcher import RunDispatcher, estimate_run, order_queue
+
+
+def _enqueue(db, run_id, user="alice", priority=0, llm=100, search=50, age=0):
+    return db.enqueue_run(QueuedRun(
+        id=run_id, query=f"query {run_id}", user=user, priority=priority,
+        est_llm_calls=llm, est_search_calls=search,
+        created_at=datetime.utcnow() - timedelta(seconds=age),
+    ))
+
+
+def _dispatcher(launched=None, sessions=None):
+    launched = [] if launched is None else launched
+    return RunDispatcher(
+        launch=lambda run: launched.append(run.id),
+        session_ids=lambda: dict(sessions or {}),
+        owner="test-dispatcher",
+    )
+
+
+class TestEstimate:
+    def test_scales_with_run_size(self, test_config):
+        small = estimate_run(test_config)
+        test_config.research.min_initial_tasks = 40
+        test_config.research.max_total_tasks = 200
+        large = estimate_run(test_config)
+        assert large.tasks > small.tasks
+        assert large.llm_calls > small.llm_calls
+        assert large.search_calls > small.search_calls
+        assert large.cost > small.cost > 0
+
+
+class TestOrdering:
+    def test_priority_then_users_in_turn(self, db):
+        for i, user in enumerate(["alice", "alice", "alice", "bob"]):
+            _enqueue(db, f"r{i}", user=user, age=100 - i)
+        _enqueue(db, "urgent", user="carol", priority=5)
+
+        order = [r.id for r in order_queue(db.get_active_queued_runs())]
+        # bob's first run overtakes alice's second and third
+        assert order == ["urgent", "r0", "r3", "r1", "r2"]
+
+    def test_running_runs_count_against_their_user(self, db):
+        _enqueue(db, "a", user="alice", age=10)
+        _enqueue(db, "b", user="bob", age=5)
+        running = [QueuedRun(id="x", query="q", user="alice", status=QueueStatus.RUNNING)]
+        assert [r.id for r in order_queue(db.get_active_queued_runs(), running)] == ["b", "a"]
+
+
+class TestAdmission:
+    def test_admits_up_to_the_free_slots(self, db, test_config):
+        test_config.executors.run_workers = 2
+        for i in range(4):
+            _enqueue(db, f"r{i}", age=10 - i)
+        launched = []
+        dispatcher = _dispatcher(launched)
+
+        assert dispatcher.dispatch() == ["r0", "r1"]
+        assert dispatcher.dispatch() == []
+        db.finish_queued_run("r0", QueueStatus.FINISHED.value)
+        assert dispatcher.dispatch() == ["r2"]
+        assert launched == ["r0", "r1", "r2"]
+        assert db.get_queued_run("r1").owner == "test-dispatcher"
+
+    def test_budget_holds_back_runs_but_a_lone_run_always_starts(self, db, test_config):
+        test_config.rate_limits.llm_calls_per_minute = 10
+        test_config.queue.budget_minutes = 10  # 100 LLM calls
+        _enqueue(db, "big", llm=500, age=10)
+        _enqueue(db, "small", llm=10, age=5)
+        dispatcher = _dispatcher()
+
+        assert dispatcher.dispatch() == ["big"]
+        # The head of the line is not overtaken while the budget is spent
+        _enqueue(db, "next", llm=90, age=1)
+        assert dispatcher.dispatch() == []
+        db.finish_queued_run("big", QueueStatus.FINISHED.value)
+        assert dispatcher.dispatch() == ["small", "next"]
+
+    def test_failed_launch_is_recorded(self, db):
+        _enqueue(db, "r0")
+
+        def _boom(run):
+            raise RuntimeError("bad overrides")
+
+        dispatcher = RunDispatcher(launch=_boom, session_ids=dict, owner="test-dispatcher")
+        assert dispatcher.dispatch() == []
+        run = db.get_queued_run("r0")
+        assert run.status == QueueStatus.FAILED.value
+        assert "bad overrides" in run.error_message
+
+    def test_records_session_ids_of_running_runs(self, db, populated_db):
+        _enqueue(db, "r0")
+        dispatcher = _dispatcher(sessions={"r0": populated_db.session.id})
+        dispatcher.dispatch()
+        dispatcher.dispatch()
+        assert db.get_queued_run("r0").session_id == populated_db.session.id
+
+
+class TestReporting:
+    def test_positions_and_etas(self, db, test_config):
+        test_config.executors.run_workers = 1
+        test_config.queue.default_run_seconds = 600
+        for i in range(3):
+            _enqueue(db, f"r{i}", age=10 - i)
+        dispatcher = _dispatcher()
+        dispatcher.dispatch()
+
+        snapshot = dispatcher.snapshot()
+        assert [e["run_id"] for e in snapshot["running"]] == ["r0"]
+        queued = snapshot["queued"]
+        assert [(e["run_id"], e["position"]) for e in queued] == [("r1", 1), ("r2", 2)]
+        assert 590 <= queued[0]["eta_seconds"] <= 600
+        assert queued[1]["eta_seconds"] == queued[0]["eta_seconds"] + 600
+        assert dispatcher.entry("r2")["position"] == 2
+
+    def test_no_slots_leaves_eta_unknown(self, db, test_config):
+        test_config.executors.run_workers = 0
+        _enqueue(db, "r0")
+        queued = _dispatcher().snapshot()["queued"]
+        assert [(e["run_id"], e["position"], e["eta_seconds"]) for e in queued] == [("r0", 1, None)]
+
+    def test_finished_entry_is_still_reported(self, db):
+        _enqueue(db, "r0")
+        db.cancel_queued_run("r0")
+        assert _dispatcher().entry("r0")["status"] == QueueStatus.CANCELLED.value
+
+
+class TestDurability:
+    def test_queue_survives_a_new_dispatcher(self, db, test_config):
+        test_config.executors.run_workers = 1
+        _enqueue(db, "r0", age=10)
+        _enqueue(db, "r1", age=5)
+        _dispatcher().dispatch()
+        db.finish_queued_run("r0", QueueStatus.FINISHED.value)
+
+        # e.g. after a restart
+        assert _dispatcher().dispatch() == ["r1"]
+
+    def test_runs_of_a_dead_dispatcher_are_interrupted(self, db, test_config):
+        _enqueue(db, "r0")
+        _dispatcher().dispatch()
+        db.update_queued_run("r0", heartbeat_at=datetime.utcnow() - timedelta(hours=1))
+
+        other = RunDispatcher(launch=lambda run: None, session_ids=dict, owner="other")
+        other.dispatch()
+        assert db.get_queued_run("r0").status == QueueStatus.INTERRUPTED.value
@@ -0,0 +1,103 @@
+"""
+Tests for src.infra._database.event_writer — batched run-event writes,
+flush barriers, backpressure, and the DatabaseManager integration.
+"""
+import threading
+import time
+
+from sqlalchemy import func
+
+from src.infra._database import RunEventModel
+from src.infra._database.event_writer import RunEventWriter
+
+
+def _stored_events(db, session_id):
+    """Count events straight from the table, without flushing the buffer."""
+    with db.get_sync_session() as session:
+        return session.query(func.count(RunEventModel.id)).filter(
+            RunEventModel.session_id == session_id
+        ).scalar()
+
+
+class TestRunEventWriter:
+    def test_events_are_written_in_batches(self):
+        batches = []
+        writer = RunEventWriter(lambda rows: batches.append(list(rows)),
+                                batch_size=10, flush_seconds=5)
+        for i in range(25):
+            writer.put({"i": i})
+        assert writer.flush(timeout=5)
+
+        assert [len(b) for b in batches] == [10, 10, 5]
+        assert [row["i"] for b in batches for row in b] == list(range(25))
+
+    def test_partial_batch_is_written_after_the_flush_interval(self):
+        written = threading.Event()
+        writer = RunEventWriter(lambda rows: written.set(), batch_size=100, flush_seconds=0.05)
+        writer.put({"i": 0})
+        assert written.wait(2)
+
+    def test_full_buffer_blocks_emitters(self):
+        release = threading.Event()
+        writer = RunEventWriter(lambda rows: release.wait(5), batch_size=1,
+                                flush_seconds=0, max_queue=2)
+        writer.put({"i": 0})  # taken by the writer, which then blocks
+        time.sleep(0.1)
+        writer.put({"i": 1})
+        writer.put({"i": 2})
+
+        blocked = threading.Thread(target=writer.put, args=({"i": 3},))
+        blocked.start()
+        blocked.join(0.2)
+        assert blocked.is_alive()  # backpressure
+
+        release.set()
+        blocked.join(5)
+        assert not blocked.is_alive()
+        assert writer.flush(timeout=5)
+        assert writer.written == 4
+
+    def test_failed_batch_is_dropped_not_fatal(self):
+        calls = []
+
+        def _write(rows):
+            calls.append(len(rows))
+            if len(calls) <= 2:
+                raise RuntimeError("database is locked")
+
+        writer = RunEventWriter(_write, batch_size=1, flush_seconds=0)
+        writer.put({"i": 0})
+        writer.put({"i": 1})
+        assert writer.flush(timeout=5)
+        assert writer.dropped == 1 and writer.written == 1
+
+
+class TestDatabaseIntegration:
+    def test_events_are_buffered_until_read(self, db):
+        session = db.create_session("q")
+        db.event_writer.flush_seconds = 60
+        db.event_writer.batch_size = 1000
+        for i in range(5):
+            db.add_run_event(session_id=session.id, event_type="query", query_text=f"q{i}")
+
+        assert _stored_events(db, session.id) == 0
+        events = db.get_run_events(session.id)  # reads flush first
+        assert [e.query_text for e in events] == [f"q{i}" for i in range(5)]
+
+    def test_phase_change_is_written_before_returning(self, db):
+        session = db.create_session("q")
+        db.event_writer.flush_seconds = 60
+        db.event_writer.batch_size = 1000
+        db.add_run_event(session_id=session.id, event_type="query", query_text="q")
+        db.add_run_event(session_id=session.id, event_type="phase_changed", phase="synthesizing")
+        assert _stored_events(db, session.id) == 2
+
+    def test_batching_can_be_disabled(self, test_config):
+        from src.infra._database import DatabaseManager
+
+        test_config.database.event_batching = False
+        db = DatabaseManager()
+        session = db.create_session("q")
+        db.add_run_event(session_id=session.id, event_type="query", query_text="q")
+        assert db.event_writer is None
+        assert _stored_events(db, session.id) == 1
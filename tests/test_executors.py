@@ -0,0 +1,84 @@
+"""
+Tests for src.infra.executors — shared bounded pools, caller-runs
+nesting, context propagation and metrics.
+"""
+import contextvars
+import threading
+import time
+
+import pytest
+
+from src.infra.executors import (
+    BoundedExecutor,
+    cancel_pending,
+    get_executor,
+    get_executor_stats,
+    shutdown_executors,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_executors():
+    shutdown_executors()
+    yield
+    shutdown_executors()
+
+
+class TestRegistry:
+    def test_pools_are_shared_and_sized_from_config(self, test_config):
+        test_config.executors.io_workers = 3
+        assert get_executor("io") is get_executor("io")
+        assert get_executor("io").max_workers == 3
+
+    def test_unknown_pool(self):
+        with pytest.raises(KeyError):
+            get_executor("gpu")
+
+    def test_shutdown_recreates_on_next_use(self):
+        first = get_executor("cpu")
+        shutdown_executors()
+        assert get_executor("cpu") is not first
+        assert get_executor("cpu").submit(lambda: 1).result() == 1
+
+
+class TestBoundedExecutor:
+    def test_nested_submit_to_same_pool_runs_inline(self):
+        pool = BoundedExecutor("t", 1)
+
+        def outer():
+            # With one worker this would deadlock without caller-runs
+            return pool.submit(lambda: threading.current_thread().name).result(timeout=2)
+
+        inner_thread = pool.submit(outer).result(timeout=5)
+        assert inner_thread.startswith("t-pool")
+        assert pool.stats().caller_runs == 1
+        pool.shutdown()
+
+    def test_context_is_propagated(self):
+        var = contextvars.ContextVar("run_id", default=None)
+        pool = BoundedExecutor("t", 2)
+        var.set("run-42")
+        assert pool.submit(var.get).result() == "run-42"
+        pool.shutdown()
+
+    def test_queue_depth_metrics(self):
+        pool = BoundedExecutor("t", 1)
+        gate = threading.Event()
+        futures = [pool.submit(gate.wait) for _ in range(4)]
+        time.sleep(0.05)
+        stats = pool.stats()
+        assert stats.active == 1
+        assert stats.queued == 3
+        assert stats.peak_queued >= 3
+
+        assert cancel_pending(futures) == 3
+        assert pool.stats().queued == 0
+        gate.set()
+        futures[0].result(timeout=2)
+        pool.shutdown()
+        assert pool.stats().completed == 1
+
+    def test_stats_registry(self):
+        get_executor("llm").submit(lambda: None).result()
+        stats = get_executor_stats()
+        assert stats["llm"].completed == 1
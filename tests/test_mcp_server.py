@@ -5,8 +5,8 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
 from src.adapters.mcp import (
-    research_presets, research_status, research_start, research_cancel,
-    research_events, research_result,
+    research_presets, research_status, research_start, research_cancel, research_queue,
+    research_events, research_result, research_search,
     resource_runs, resource_run_status, resource_run_events,
     resource_run_tasks, resource_run_sources, resource_run_sections,
     resource_run_artifacts, resource_run_costs,
@@ -96,15 +96,21 @@ class TestResearchStart:
         result = research_start(query="   ")
         assert result["status"] == "error"
 
-    def test_already_running(self):
-        with patch.object(get_service(), "start_run", return_value={"status": "already_running"}):
+    def test_busy_service_queues_with_position(self):
+        queued = {"status": "queued", "run_id": "abc123", "position": 2, "eta_seconds": 600}
+        with patch.object(get_service(), "start_run", return_value=queued):
             result = research_start(query="Another query")
-        assert result["status"] == "already_running"
+        assert result["status"] == "queued"
+        assert result["queue_id"] == "abc123"
+        assert result["position"] == 2
+        assert result["eta_seconds"] == 600
 
     def test_preset_passed_to_service(self):
         with patch.object(get_service(), "start_run", return_value={"status": "started"}) as mock:
             research_start(query="Test query", preset="quick")
-            mock.assert_called_once_with("Test query", mode="quick", blocking=False)
+            mock.assert_called_once_with(
+                "Test query", mode="quick", blocking=False, user=None, priority=0,
+            )
 
     def test_start_returns_started_with_run_id(self, db):
         with patch.object(get_service(), "_run_background", return_value={"status": "started"}):
@@ -112,6 +118,16 @@ class TestResearchStart:
         assert result["status"] == "started"
 
 
+class TestResearchQueue:
+    def test_unknown_entry(self):
+        assert research_queue(queue_id="missing")["status"] == "not_found"
+
+    def test_lists_queue(self, test_config):
+        result = research_queue()
+        assert result["queued"] == [] and result["running"] == []
+        assert result["slots"] == test_config.executors.run_workers
+
+
 class TestResearchCancel:
     def test_cancel_not_running(self):
         result = research_cancel()
@@ -242,6 +258,17 @@ class TestCancellationBehavior:
             service._orchestrator = None
 
 
+class TestResearchSearch:
+    def test_empty_query_returns_error(self):
+        assert research_search("  ")["status"] == "error"
+
+    def test_returns_ranked_results(self, populated_db):
+        result = research_search("AI safety", run_id=populated_db.session.id)
+        assert result["query"] == "AI safety"
+        hits = {(r["kind"], r["title"]) for r in result["results"]}
+        assert hits == {("section", "Introduction to AI Safety"), ("source", "AI Safety Overview")}
+
+
 class TestResearchEvents:
     def test_no_session_returns_no_session(self):
         result = research_events()
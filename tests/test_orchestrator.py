@@ -266,6 +266,164 @@ class TestOrchestratorPipeline:
         assert stats["total_tasks"] == 4
         assert stats["completed_tasks"] == 4
 
+    def test_sections_synthesized_during_research(self, orchestrator_mocks, test_config, tmp_path):
+        """With pipelined synthesis each section is synthesized once, while research runs."""
+        from src.pipeline import ResearchOrchestrator
+
+        test_config.output.directory = str(tmp_path / "report")
+        orch = ResearchOrchestrator(register_signals=False)
+        phases = []
+        synth_mock = orchestrator_mocks[5]
+        synth_mock.side_effect = lambda *a, **k: (
+            phases.append(orch.phase) or _mock_synthesize_section(*a, **k)
+        )
+        orch.run("What is AI safety?")
+
+        assert synth_mock.call_count == 2
+        assert phases == ["researching", "researching"]
+
+    def test_gap_fill_resynthesizes_section(self, orchestrator_mocks, test_config, tmp_path):
+        """A section that gains tasks after early synthesis is synthesized again."""
+        from src.pipeline import ResearchOrchestrator
+
+        def _add_gap_task(query, sections, session_id):
+            get_database().add_task(ResearchTask(
+                topic="Gap fill", description="Missing angle",
+                file_path=str(tmp_path / "gap.md"), section_id=sections[0].id,
+            ), session_id)
+            return {"new_tasks": 1, "new_sections": 0}
+
+        orchestrator_mocks[4].side_effect = _add_gap_task
+        test_config.output.directory = str(tmp_path / "report")
+        orch = ResearchOrchestrator(register_signals=False)
+        orch.run("What is AI safety?")
+
+        titles = [c.args[0].title for c in orchestrator_mocks[5].call_args_list]
+        assert sorted(titles) == ["Background", "Background", "Core Analysis"]
+
+    def test_section_gap_check_runs_before_synthesis(self, orchestrator_mocks, test_config, tmp_path):
+        """A section's own gap check can add tasks; it is synthesized once they finish."""
+        from src.pipeline import ResearchOrchestrator
+
+        test_config.gap_analysis.section_checks = True
+        test_config.output.directory = str(tmp_path / "report")
+        checked = []
+
+        def _check(query, section, session_id, max_tasks):
+            checked.append(section.title)
+            if section.title != "Background":
+                return 0
+            get_database().add_task(ResearchTask(
+                topic="Follow-up", description="Missing angle",
+                file_path=str(tmp_path / "follow-up.md"), section_id=section.id,
+            ), session_id)
+            return 1
+
+        orch = ResearchOrchestrator(register_signals=False)
+        synthesized = []
+        orchestrator_mocks[5].side_effect = lambda section, *a, **k: (
+            synthesized.append(
+                (section.title, len(get_database().get_tasks_for_section(section.id)))
+            ) or _mock_synthesize_section(section, *a, **k)
+        )
+        with patch("src.pipeline._stages.GapAnalysisAgent.analyze_section_gaps",
+                   side_effect=_check):
+            result = orch.run("What is AI safety?")
+
+        assert sorted(checked) == ["Background", "Core Analysis"]
+        # Each section synthesized once; Background only after its follow-up task
+        assert sorted(synthesized) == [("Background", 3), ("Core Analysis", 2)]
+        assert result["statistics"]["completed_tasks"] == 5
+
+    def test_barrier_mode_synthesizes_after_research(self, orchestrator_mocks, test_config, tmp_path):
+        """Disabling pipelined synthesis restores the Phase 6 barrier."""
+        from src.pipeline import ResearchOrchestrator
+
+        test_config.research.pipelined_synthesis = False
+        test_config.output.directory = str(tmp_path / "report")
+        orch = ResearchOrchestrator(register_signals=False)
+        phases = []
+        orchestrator_mocks[5].side_effect = lambda *a, **k: (
+            phases.append(orch.phase) or _mock_synthesize_section(*a, **k)
+        )
+        orch.run("What is AI safety?")
+
+        assert phases == ["synthesizing", "synthesizing"]
+
+    def test_workers_mode_coordinator_only_waits(self, orchestrator_mocks, test_config, tmp_path):
+        """With research.executor=workers tasks are run by a separate worker."""
+        import threading
+        from src.pipeline import ResearchOrchestrator, ResearchWorker
+
+        test_config.research.executor = "workers"
+        test_config.workers.poll_seconds = 0.05
+        test_config.output.directory = str(tmp_path / "report")
+        worker = ResearchWorker(exit_when_idle=False)
+        thread = threading.Thread(target=worker.run, daemon=True)
+        thread.start()
+        try:
+            orch = ResearchOrchestrator(register_signals=False)
+            result = orch.run("What is AI safety?")
+        finally:
+            worker.stop()
+            thread.join(timeout=10)
+
+        assert worker.completed == 4
+        assert result["statistics"]["completed_tasks"] == 4
+
+    def test_deadline_stops_research_without_emergency_compile(self, orchestrator_mocks, test_config, tmp_path):
+        """When only the synthesis reserve is left, research stops but the report is still compiled."""
+        from src.pipeline import ResearchOrchestrator
+
+        test_config.deadline.compile_reserve_seconds = 4000  # more than max_runtime_hours=1
+        test_config.output.directory = str(tmp_path / "report")
+        orch = ResearchOrchestrator(register_signals=False)
+        result = orch.run("What is AI safety?")
+
+        db = get_database()
+        events = [e.event_type for e in db.get_run_events(orch.session_id)]
+        assert "deadline_degradation" in events
+        assert result["statistics"]["completed_tasks"] == 0
+        assert orch.phase == "complete"
+        assert result["output_files"]
+
+    def test_cancel_aborts_in_flight_tasks(self, orchestrator_mocks, test_config, tmp_path):
+        """cancel() stops running tasks within seconds and leaves them pending for resume."""
+        import threading
+        import time
+        from src.infra.cancellation import check_cancelled, current_token
+        from src.pipeline import ResearchOrchestrator
+
+        test_config.output.directory = str(tmp_path / "report")
+        test_config.research.max_concurrent_tasks = 4
+        orch = ResearchOrchestrator(register_signals=False)
+
+        cancel_timer = threading.Timer(0.3, orch.cancel)
+        started = []
+        lock = threading.Lock()
+
+        def _slow_research(task, overall_query="", other_sections=None, session_id=None):
+            with lock:
+                started.append(task.id)
+                if len(started) == 1:
+                    cancel_timer.start()
+            current_token().wait(30)  # stands in for a long LLM call
+            check_cancelled()
+            return _mock_research_task(task)
+
+        orchestrator_mocks[3].side_effect = _slow_research
+        t0 = time.monotonic()
+        result = orch.run("What is AI safety?")
+
+        assert time.monotonic() - t0 < 10
+        assert len(started) == 4  # all four were in flight when cancelled
+        db = get_database()
+        tasks = db.get_all_tasks(session_id=orch.session_id)
+        assert {t.status for t in tasks} == {TaskStatus.PENDING.value}
+        assert all(not t.retry_count for t in tasks)
+        assert db.get_session_by_id(orch.session_id).status == "cancelled"
+        assert result["statistics"]["completed_tasks"] == 0
+
 
 class TestOrchestratorSessionManagement:
     """Test session initialization and resume logic."""
@@ -290,3 +448,25 @@ class TestOrchestratorSessionManagement:
         db = get_database()
         fetched = db.get_session_by_id(session.id)
         assert fetched.refined_brief == "Enhanced query with context"
+
+    def test_resume_reclaims_orphaned_in_progress_tasks(self, test_config, tmp_path):
+        """Tasks left IN_PROGRESS by a crashed process are re-queued on resume."""
+        from src.pipeline import ResearchOrchestrator
+
+        db = get_database()
+        session = db.create_session("Crashed query")
+        db.add_tasks_bulk([
+            ResearchTask(topic=f"T{i}", description="d", file_path=str(tmp_path / f"t{i}.md"))
+            for i in range(2)
+        ], session_id=session.id)
+        db.get_next_tasks(2, session_id=session.id)  # claimed without a lease
+        db.update_session(session.id, status="failed")
+
+        orch = ResearchOrchestrator(register_signals=False)
+        with patch("src.pipeline.orchestrator.print_statistics_table"):
+            resumed = orch._resume_session()
+
+        assert resumed.id == session.id
+        tasks = db.get_all_tasks(session_id=session.id)
+        assert [t.status for t in tasks] == [TaskStatus.PENDING, TaskStatus.PENDING]
+        assert [t.retry_count for t in tasks] == [1, 1]
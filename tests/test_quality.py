@@ -0,0 +1,175 @@
+"""
+Tests for src.pipeline._tools.quality — domain classification and
+source quality scoring.
+"""
+import os
+import time
+
+import pytest
+
+from src.pipeline._tools.quality import (
+    DomainSuffixIndex,
+    bm25_scores,
+    calculate_quality_score,
+    classify_url,
+    is_academic_source,
+    is_blocked_source,
+    is_high_quality_source,
+    rank_search_results,
+    reload_domain_lists,
+    score_sources_batch,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_domain_lists():
+    reload_domain_lists()
+    yield
+    reload_domain_lists()
+
+
+class TestDomainSuffixIndex:
+    def test_exact_and_subdomain_match(self):
+        index = DomainSuffixIndex(["ac.uk", "arxiv.org"])
+        assert index.matches("arxiv.org")
+        assert index.matches("export.arxiv.org")
+        assert index.matches("ox.ac.uk")
+        assert len(index) == 2
+
+    def test_no_partial_label_match(self):
+        index = DomainSuffixIndex(["arxiv.org"])
+        assert not index.matches("notarxiv.org")
+        assert not index.matches("org")
+        assert not index.matches("")
+
+
+class TestClassification:
+    def test_academic(self):
+        assert is_academic_source("https://www.cs.stanford.edu/paper")
+        assert is_academic_source("https://arxiv.org/abs/1234")
+        assert not is_academic_source("https://example.com/")
+
+    def test_blocked_domain(self):
+        assert is_blocked_source("https://www.scribd.com/doc/1")
+        assert is_blocked_source("https://es.scribd.com/doc/1")
+
+    def test_blocked_url_patterns(self):
+        assert is_blocked_source("https://example.com/files/data.csv")
+        assert is_blocked_source("https://example.com/x/zxcvbn/words")
+        assert is_blocked_source("https://example.com/vocab_en.txt?dl=1")
+        assert not is_blocked_source("https://example.com/article")
+
+    def test_high_quality_subdomain(self):
+        assert is_high_quality_source("https://en.wikipedia.org/wiki/AI")
+        assert not is_high_quality_source("https://example.com/")
+
+    def test_classification_is_memoized(self):
+        url = "https://nature.com/articles/x"
+        assert classify_url(url) is classify_url(url)
+
+
+class TestDomainListsFile:
+    def test_external_file_extends_builtins(self, test_config, tmp_path):
+        lists_file = tmp_path / "domains.yaml"
+        lists_file.write_text(
+            "blocked_domains: [spam.example]\n"
+            "blocked_url_patterns: ['/print/']\n"
+        )
+        test_config.quality.domain_lists_file = str(lists_file)
+
+        assert is_blocked_source("https://a.spam.example/post")
+        assert is_blocked_source("https://news.example.com/print/42")
+        assert is_blocked_source("https://scribd.com/doc")  # built-in still applies
+
+    def test_hot_reload_on_change(self, test_config, tmp_path):
+        lists_file = tmp_path / "domains.yaml"
+        lists_file.write_text("blocked_domains: [first.example]\n")
+        test_config.quality.domain_lists_file = str(lists_file)
+        test_config.quality.domain_lists_reload_seconds = 0
+
+        assert is_blocked_source("https://first.example/")
+        assert not is_blocked_source("https://second.example/")
+
+        lists_file.write_text("blocked_domains: [second.example]\n")
+        stat = os.stat(lists_file)
+        os.utime(lists_file, (stat.st_atime, stat.st_mtime + 5))
+        time.sleep(0.01)
+
+        assert is_blocked_source("https://second.example/")
+        assert not is_blocked_source("https://first.example/")
+
+    def test_replace_drops_builtins(self, test_config, tmp_path):
+        lists_file = tmp_path / "domains.yaml"
+        lists_file.write_text("replace: true\nacademic_domains: [uni.example]\n")
+        test_config.quality.domain_lists_file = str(lists_file)
+
+        assert is_academic_source("https://uni.example/")
+        assert not is_academic_source("https://arxiv.org/abs/1")
+
+    def test_invalid_file_falls_back_to_builtins(self, test_config, tmp_path):
+        lists_file = tmp_path / "domains.yaml"
+        lists_file.write_text("- not\n- a mapping\n")
+        test_config.quality.domain_lists_file = str(lists_file)
+
+        assert is_blocked_source("https://scribd.com/doc")
+
+
+class TestQualityScore:
+    def test_blocked_scores_zero(self):
+        assert calculate_quality_score("https://scribd.com/x", "Title", "x" * 3000) == 0.0
+
+    def test_academic_bonus(self):
+        plain = calculate_quality_score("https://example.com/a", "Short", "word " * 600)
+        academic = calculate_quality_score("https://arxiv.org/a", "Short", "word " * 600)
+        assert academic > plain
+
+
+class TestBatchScoring:
+    def test_bm25_prefers_term_dense_document(self):
+        docs = ["solar panels " * 50, "wind turbines " * 50 + "solar", "cooking recipes"]
+        scores = bm25_scores(docs, ["solar", "panels"])
+        assert scores[0] > scores[1] > scores[2] == 0.0
+
+    def test_bm25_uses_full_content(self):
+        late_match = "filler text here " * 500 + "quantum entanglement"
+        assert bm25_scores([late_match, "nothing"], ["quantum"])[0] > 0
+
+    def test_batch_matches_single_scorer_without_query(self):
+        results = [
+            {"url": "https://arxiv.org/abs/1", "title": "A reasonably long paper title", "raw_content": "word " * 1200},
+            {"url": "https://example.com/a", "title": "Short", "snippet": "tiny"},
+            {"url": "https://scribd.com/doc", "title": "Blocked", "raw_content": "x" * 3000},
+        ]
+        expected = [
+            calculate_quality_score(r["url"], r["title"], r.get("raw_content") or r.get("snippet"))
+            for r in results
+        ]
+        scores = score_sources_batch(results)
+        assert [s.score for s in scores] == pytest.approx(expected)
+        assert [s.base for s in scores] == pytest.approx(expected)
+
+    def test_irrelevant_content_penalized(self):
+        results = [
+            {"url": "https://a.example/", "title": "t", "raw_content": "battery chemistry " * 200},
+            {"url": "https://b.example/", "title": "t", "raw_content": "gardening tips " * 200},
+        ]
+        relevant, irrelevant = score_sources_batch(results, "battery chemistry")
+        assert relevant.score > irrelevant.score
+        # The absolute base score leaves batch-relative relevance out
+        assert relevant.base == irrelevant.base
+
+    def test_rank_orders_and_drops_low_quality_raw_content(self):
+        results = [
+            {"url": "https://b.example/", "title": "t", "raw_content": "gardening tips " * 200},
+            {"url": "https://a.example/", "title": "t", "raw_content": "battery chemistry " * 200},
+            {"url": "https://c.example/", "title": "t", "snippet": "battery"},
+            {"url": "https://d.example/", "title": "t", "raw_content": "battery chemistry"},
+        ]
+        ranked = rank_search_results(results, "battery chemistry", min_quality=0.5)
+        urls = [r["url"] for r in ranked]
+        assert urls[0] == "https://a.example/"
+        # Least relevant of the batch is ordered last but not dropped; only a
+        # page whose own score is below the threshold is
+        assert urls.index("https://b.example/") > urls.index("https://a.example/")
+        assert "https://d.example/" not in urls
+        assert "https://c.example/" in urls  # snippet-only kept for post-scrape check
@@ -0,0 +1,148 @@
+"""
+Query-plan regression tests for DatabaseManager reads.
+
+Every read method is run against a small populated database while its
+SELECT statements are captured, and each statement's EXPLAIN QUERY PLAN is
+checked for full table scans of the hot tables. A new read that filters or
+joins on an unindexed column fails here before it slows down a large run.
+"""
+import re
+
+import pytest
+from sqlalchemy import event, text
+
+from src.config.types import GlossaryTerm, ReportSection, ResearchTask, Source, TaskStatus
+from src.infra._database import DatabaseManager
+
+# Tables that grow with every run; a plain "SCAN" of one reads every row
+HOT_TABLES = ("tasks", "sources", "task_source_association")
+_FULL_SCAN = re.compile(r"^SCAN (%s)\b" % "|".join(HOT_TABLES))
+
+# Reads that list a whole table on purpose
+ALLOWED_SCANS = {
+    "get_all_sources": {"sources", "task_source_association"},
+}
+
+# Every read method, with arguments built from the populated ids
+READS = {
+    "get_current_session": lambda ids: (),
+    "get_session_by_id": lambda ids: (ids["session"],),
+    "get_next_task": lambda ids: (ids["session"],),
+    "get_task_by_id": lambda ids: (ids["task"],),
+    "get_all_tasks": lambda ids: (TaskStatus.PENDING, ids["session"]),
+    "get_task_count": lambda ids: (TaskStatus.COMPLETED, ids["session"]),
+    "get_total_word_count": lambda ids: (ids["session"],),
+    "get_in_progress_task": lambda ids: (ids["session"],),
+    "get_in_progress_tasks": lambda ids: (ids["session"],),
+    "get_task_durations": lambda ids: (),
+    "get_recent_completed_tasks": lambda ids: (5, ids["session"]),
+    "get_all_sections": lambda ids: (ids["session"],),
+    "get_tasks_for_section": lambda ids: (ids["section"],),
+    "get_sources_for_section": lambda ids: (ids["section"],),
+    "get_all_sources": lambda ids: (),
+    "get_source_by_url": lambda ids: ("https://example.com/0",),
+    "get_fresh_sources": lambda ids: (["https://example.com/0"], 24),
+    "get_processed_urls_by_task": lambda ids: (ids["session"],),
+    "get_source_count": lambda ids: (ids["session"],),
+    "get_cached_extraction": lambda ids: ("hash", "topic", "v1"),
+    "get_task_checkpoints": lambda ids: (ids["task"],),
+    "get_queued_run": lambda ids: ("missing",),
+    "get_active_queued_runs": lambda ids: (),
+    "count_queued_runs": lambda ids: (),
+    "get_all_glossary_terms": lambda ids: (),
+    "get_glossary_terms_for_session": lambda ids: (ids["session"],),
+    "get_run_events": lambda ids: (ids["session"],),
+    "get_run_events_paginated": lambda ids: (ids["session"],),
+    "get_rejected_results": lambda ids: (ids["session"],),
+    "get_run_queries_by_task": lambda ids: (ids["session"],),
+    "get_statistics": lambda ids: (ids["session"],),
+    "get_statistics_by_session": lambda ids: ([ids["session"]],),
+    "get_all_sessions": lambda ids: (),
+    "get_most_recent_session": lambda ids: (),
+    "get_session_durations": lambda ids: (),
+    "get_sources_for_task": lambda ids: (ids["task"],),
+    "get_sources_for_session": lambda ids: (ids["session"],),
+    "search_corpus": lambda ids: ("s", ids["session"]),
+}
+
+
+def _read_methods():
+    """Public read methods; write methods carry ``__wrapped__`` from ``@writes``."""
+    names = set()
+    for name in dir(DatabaseManager):
+        attr = getattr(DatabaseManager, name)
+        if name.startswith(("get_", "count_", "search_")) and callable(attr) and not hasattr(attr, "__wrapped__"):
+            names.add(name)
+    return names - {"get_sync_session"}
+
+
+@pytest.fixture
+def populated(db):
+    session = db.create_session("q")
+    section = db.add_section(ReportSection(title="s", description="d", position=0), session_id=session.id)
+    tasks = db.add_tasks_bulk([
+        ResearchTask(topic=f"t{i}", description="d", file_path=f"/tmp/{i}.md", section_id=section.id)
+        for i in range(3)
+    ], session_id=session.id)
+    for i, task in enumerate(tasks):
+        db.add_source(Source(url=f"https://example.com/{i}", title="s", domain="example.com"),
+                      task_id=task.id, position=i)
+    db.mark_task_complete(tasks[0].id, word_count=10)
+    db.add_glossary_term(GlossaryTerm(term="term", definition="d"), session_id=session.id)
+    db.add_run_event(session_id=session.id, task_id=tasks[0].id, event_type="query", query_text="q")
+    return db, {"session": session.id, "section": section.id, "task": tasks[0].id}
+
+
+def _plans(db, method, args):
+    """EXPLAIN QUERY PLAN details for each SELECT the read issues."""
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(db.read_engine, "before_cursor_execute", _capture)
+    try:
+        getattr(db, method)(*args)
+    finally:
+        event.remove(db.read_engine, "before_cursor_execute", _capture)
+
+    raw = db.read_engine.raw_connection()
+    try:
+        return [
+            [row[3] for row in raw.cursor().execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+            for sql, params in statements
+        ]
+    finally:
+        raw.close()
+
+
+def test_every_read_is_covered():
+    assert _read_methods() == set(READS)
+
+
+@pytest.mark.parametrize("method", sorted(READS))
+def test_read_avoids_full_scans(populated, method):
+    db, ids = populated
+    allowed = ALLOWED_SCANS.get(method, set())
+    scans = [
+        detail
+        for plan in _plans(db, method, READS[method](ids))
+        for detail in plan
+        if (m := _FULL_SCAN.match(detail)) and m.group(1) not in allowed
+    ]
+    assert scans == [], f"{method} scans a hot table: {scans}"
+
+
+def test_indexes_are_added_to_existing_databases(test_config):
+    db = DatabaseManager()
+    with db.engine.begin() as conn:
+        conn.execute(text("DROP INDEX ix_tasks_session_next"))
+        conn.execute(text("DROP INDEX ix_task_source_source"))
+    db.close()
+
+    db = DatabaseManager()
+    with db.engine.connect() as conn:
+        names = {row[0] for row in conn.execute(text("SELECT name FROM sqlite_master WHERE type='index'"))}
+    db.close()
+    assert {"ix_tasks_session_next", "ix_task_source_source"} <= names
@@ -0,0 +1,64 @@
+"""
+Tests for src.pipeline._tools.ranking — cross-query candidate fusion.
+"""
+from src.pipeline._tools.ranking import fuse_search_results
+
+
+def _hit(url, score=0.8, snippet="", raw="word " * 600, title="A descriptive page title here"):
+    return {"url": url, "title": title, "snippet": snippet, "raw_content": raw, "score": score}
+
+
+class TestFuseSearchResults:
+    def test_url_from_many_queries_ranks_first(self):
+        query_results = {
+            0: [_hit("https://a.example/"), _hit("https://shared.example/")],
+            1: [_hit("https://b.example/"), _hit("https://shared.example/")],
+            2: [_hit("https://c.example/"), _hit("https://shared.example/")],
+        }
+        fused = fuse_search_results(query_results, ["q one", "q two", "q three"],
+                                    top_k=3, min_per_query=0)
+        assert fused[0].result["url"] == "https://shared.example/"
+        assert fused[0].query_indices == (0, 1, 2)
+        assert len({c.result["url"] for c in fused}) == len(fused) == 4
+
+    def test_coverage_floor_puts_each_query_first(self):
+        query_results = {
+            0: [_hit(f"https://strong{i}.example/", score=0.95) for i in range(4)],
+            1: [_hit("https://weak.example/", score=0.35)],
+        }
+        fused = fuse_search_results(query_results, ["alpha", "beta"], top_k=2, min_per_query=1)
+        head = [c.result["url"] for c in fused[:2]]
+        assert "https://weak.example/" in head
+
+    def test_filters_blocked_and_low_tavily(self):
+        query_results = {0: [
+            _hit("https://scribd.com/doc"),
+            _hit("https://low.example/", score=0.05),
+            _hit("https://ok.example/"),
+        ]}
+        fused = fuse_search_results(query_results, ["query"], top_k=3, min_tavily=0.1)
+        assert [c.result["url"] for c in fused] == ["https://ok.example/"]
+
+    def test_snippet_relevance_breaks_ties(self):
+        query_results = {0: [
+            _hit("https://off.example/", snippet="unrelated cooking recipe"),
+            _hit("https://on.example/", snippet="lithium battery recycling methods"),
+        ]}
+        fused = fuse_search_results(query_results, ["lithium battery recycling"],
+                                    top_k=1, min_per_query=0)
+        assert fused[0].result["url"] == "https://on.example/"
+
+    def test_min_quality_is_absolute_not_batch_relative(self):
+        # Neither page mentions the query terms, so batch-relative relevance
+        # would mark both irrelevant and push them under the threshold
+        single = fuse_search_results({0: [_hit("https://only.example/")]}, ["quantum sensors"],
+                                     top_k=1, min_quality=0.4)
+        assert [c.result["url"] for c in single] == ["https://only.example/"]
+
+        query_results = {0: [
+            _hit("https://weak.example/"),
+            _hit("https://weaker.example/", title="Short"),
+            _hit("https://stub.example/", raw="word " * 20),
+        ]}
+        fused = fuse_search_results(query_results, ["quantum sensors"], top_k=3, min_quality=0.5)
+        assert {c.result["url"] for c in fused} == {"https://weak.example/", "https://weaker.example/"}
@@ -0,0 +1,54 @@
+"""
+Tests for src.infra.rate_limit — slot spacing, round-robin between runs
+and cancellation while waiting.
+"""
+import threading
+import time
+
+import pytest
+
+from src.infra.cancellation import CancellationToken, RunCancelled, cancellation_scope
+from src.infra.rate_limit import FairRateLimiter
+
+
+def _call(limiter, token, run, log):
+    with cancellation_scope(token):
+        limiter.wait()
+    log.append(run)
+
+
+class TestFairRateLimiter:
+    def test_calls_are_spaced_by_interval(self):
+        limiter = FairRateLimiter(calls_per_minute=1200)  # 50 ms
+        started = time.monotonic()
+        for _ in range(4):
+            limiter.wait()
+        assert time.monotonic() - started >= 0.15
+
+    def test_waiting_runs_are_served_in_turn(self):
+        limiter = FairRateLimiter(calls_per_minute=600)  # 100 ms
+        limiter.wait()  # the next slot is 100 ms away, so everyone queues
+        busy, quiet = CancellationToken(), CancellationToken()
+        log = []
+        threads = [threading.Thread(target=_call, args=(limiter, busy, "busy", log)) for _ in range(4)]
+        for t in threads:
+            t.start()
+        time.sleep(0.03)
+        late = threading.Thread(target=_call, args=(limiter, quiet, "quiet", log))
+        late.start()
+        for t in threads + [late]:
+            t.join(timeout=5)
+
+        # The quiet run waits for one busy call, not for all four
+        assert log.index("quiet") <= 1
+
+    def test_cancelled_waiter_gives_up_its_turn(self):
+        limiter = FairRateLimiter(calls_per_minute=6)  # 10 s
+        limiter.wait()
+        token = CancellationToken()
+        threading.Timer(0.1, token.cancel).start()
+        started = time.monotonic()
+        with cancellation_scope(token), pytest.raises(RunCancelled):
+            limiter.wait()
+        assert time.monotonic() - started < 2
+        assert not limiter._waiting
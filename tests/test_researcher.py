@@ -0,0 +1,338 @@
+"""
+Tests for src.pipeline._stages.ResearcherAgent — source gathering
+with mocked search and LLM extraction.
+"""
+import json
+import random
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.config.types import ResearchTask
+
+
+def _hit(url, score=0.8):
+    return {
+        "url": url, "title": "A descriptive page title here",
+        "snippet": "solar energy storage", "raw_content": f"{url} " + "solar energy storage " * 300,
+        "score": score,
+    }
+
+
+QUERY_RESULTS = {
+    "solar alpha": [_hit("https://a1.example/"), _hit("https://shared.example/"), _hit("https://a2.example/")],
+    "solar beta": [_hit("https://b1.example/"), _hit("https://shared.example/")],
+    "solar gamma": [_hit("https://c1.example/"), _hit("https://scribd.com/doc")],
+}
+
+
+@pytest.fixture
+def researcher(db):
+    from src.pipeline._stages import ResearcherAgent
+    return ResearcherAgent()
+
+
+@pytest.fixture
+def task(db):
+    session = db.create_session("solar")
+    return db.add_tasks_bulk([
+        ResearchTask(topic="Solar storage", description="d", file_path="/tmp/t.md", priority=5),
+    ], session_id=session.id)[0]
+
+
+def _slow_search(query, task_id, session_id=None):
+    time.sleep(random.uniform(0, 0.05))
+    return QUERY_RESULTS[query]
+
+
+def _slow_extract(source, *args):
+    time.sleep(random.uniform(0, 0.05))
+    return f"extracted {source.url}"
+
+
+class TestStreamSources:
+    def test_positions_independent_of_completion_order(self, researcher, task, test_config):
+        test_config.search.max_sources_per_task = 4
+        orders = set()
+        for _ in range(5):
+            with patch.object(researcher, "_search_single_query", side_effect=_slow_search), \
+                 patch.object(researcher, "_extract_source_content", side_effect=_slow_extract):
+                saved, extracted = researcher._stream_sources(
+                    list(QUERY_RESULTS), task.id, task_topic="Solar storage",
+                )
+            orders.add(tuple(src.url for _, src, _ in saved))
+            assert [pos for pos, _, _ in saved] == list(range(len(saved)))
+            assert extracted == {pos: f"extracted {src.url}" for pos, src, _ in saved}
+
+        assert len(orders) == 1
+        urls = orders.pop()
+        assert len(urls) == 4
+        # Coverage floor: each query's best candidate leads, in query order
+        assert urls[:3] == ("https://a1.example/", "https://b1.example/", "https://c1.example/")
+        assert "https://scribd.com/doc" not in urls
+
+    def test_failed_scrape_is_replaced(self, researcher, task, test_config):
+        test_config.search.max_sources_per_task = 3
+        real_scrape = researcher._scrape_candidate
+
+        def flaky(result, known_source=None):
+            if result["url"] == "https://b1.example/":
+                raise RuntimeError("boom")
+            return real_scrape(result, known_source)
+
+        with patch.object(researcher, "_search_single_query", side_effect=_slow_search), \
+             patch.object(researcher, "_extract_source_content", side_effect=_slow_extract), \
+             patch.object(researcher, "_scrape_candidate", side_effect=flaky):
+            saved, _ = researcher._stream_sources(list(QUERY_RESULTS), task.id, task_topic="t")
+
+        urls = [src.url for _, src, _ in saved]
+        assert len(urls) == 3
+        assert "https://b1.example/" not in urls
+        assert "https://shared.example/" in urls  # beta's next candidate
+
+
+    def test_failed_bulk_save_falls_back_to_single_saves(self, researcher, task, test_config):
+        test_config.search.max_sources_per_task = 3
+        real_save = researcher.db.add_sources_bulk
+
+        def bulk_fails(task_id, sources):
+            if len(sources) > 1 or sources[0][0].url == "https://b1.example/":
+                raise RuntimeError("database is locked")
+            return real_save(task_id, sources)
+
+        with patch.object(researcher, "_search_single_query", side_effect=_slow_search), \
+             patch.object(researcher, "_extract_source_content", side_effect=_slow_extract), \
+             patch.object(researcher.db, "add_sources_bulk", side_effect=bulk_fails):
+            saved, extracted = researcher._stream_sources(list(QUERY_RESULTS), task.id, task_topic="t")
+
+        assert [src.url for _, src, _ in saved] == ["https://a1.example/", "https://c1.example/"]
+        assert [pos for pos, _, _ in saved] == [0, 2]
+        assert set(extracted) == {0, 2}
+        assert [s.url for s in researcher.db.get_sources_for_task(task.id)] == [
+            "https://a1.example/", "https://c1.example/",
+        ]
+
+
+class TestExtractionCache:
+    def _run(self, researcher, task, topic="Solar storage", description="d"):
+        extract = patch.object(researcher, "_extract_source_content", side_effect=_slow_extract)
+        with patch.object(researcher, "_search_single_query", side_effect=_slow_search), extract as mock:
+            researcher._stream_sources(
+                list(QUERY_RESULTS), task.id, session_id=task.session_id,
+                task_topic=topic, task_description=description,
+            )
+        return mock.call_count
+
+    def _cache_events(self, db, session_id):
+        return [
+            json.loads(e.payload_json) for e in db.get_run_events(session_id)
+            if e.event_type == "extraction_cache"
+        ]
+
+    def test_exact_reuse_across_tasks(self, researcher, task, db, test_config):
+        test_config.search.max_sources_per_task = 3
+        assert self._run(researcher, task) == 3
+        assert self._run(researcher, task) == 0
+
+        first, second = self._cache_events(db, task.session_id)
+        assert first["misses"] == 3 and first["hit_rate"] == 0
+        assert second["exact_hits"] == 3 and second["hit_rate"] == 1.0
+
+    def test_topic_change_misses_unless_near_reuse(self, researcher, task, test_config):
+        test_config.search.max_sources_per_task = 3
+        self._run(researcher, task, topic="Solar storage costs", description="grid batteries")
+        assert self._run(researcher, task, topic="Solar storage costs", description="grid batteries lithium") == 3
+
+        test_config.extraction.near_topic_reuse = True
+        test_config.extraction.near_topic_min_similarity = 0.7
+        assert self._run(researcher, task, topic="Wind turbine upkeep", description="offshore") == 3
+        assert self._run(researcher, task, topic="Solar storage costs", description="the grid batteries") == 0
+
+    def test_disabled(self, researcher, task, test_config):
+        test_config.search.max_sources_per_task = 3
+        test_config.extraction.cache_enabled = False
+        assert self._run(researcher, task) == 3
+        assert self._run(researcher, task) == 3
+
+
+class TestPackedExtraction:
+    def _run(self, researcher, task, payload_fn, max_tokens=None):
+        calls = []
+
+        def complete_with_function(prompt, **kwargs):
+            calls.append(prompt)
+            if max_tokens is not None:
+                max_tokens.append(kwargs["max_tokens"])
+            return payload_fn(prompt)
+
+        with patch.object(researcher, "_search_single_query", side_effect=_slow_search), \
+             patch.object(researcher, "_extract_source_content", side_effect=_slow_extract) as single, \
+             patch.object(researcher.client, "complete_with_function", side_effect=complete_with_function):
+            saved, extracted = researcher._stream_sources(
+                list(QUERY_RESULTS), task.id, task_topic="Solar storage",
+            )
+        return saved, extracted, calls, single.call_count
+
+    def test_sources_packed_into_one_call(self, researcher, task, test_config):
+        test_config.search.max_sources_per_task = 4
+        test_config.extraction.batch_enabled = True
+        test_config.extraction.batch_max_sources = 10
+
+        def payload(prompt):
+            n = prompt.count("--- END SOURCE")
+            return {"extractions": [{"source_id": i, "notes": f"notes {i}"} for i in range(1, n + 1)]}
+
+        saved, extracted, calls, singles = self._run(researcher, task, payload)
+        assert len(saved) == 4
+        assert singles == 0
+        assert len(calls) < 4  # at least two sources shared a call
+        assert all(text.startswith("notes") for text in extracted.values())
+        assert len(extracted) == 4
+
+    def test_packs_fit_the_output_limit(self, researcher, task, test_config):
+        test_config.search.max_sources_per_task = 4
+        test_config.extraction.batch_enabled = True
+        test_config.extraction.batch_max_sources = 10
+        test_config.extraction.batch_max_output_tokens = 8000
+        test_config.llm.max_tokens.analyzer = 4000
+
+        def payload(prompt):
+            n = prompt.count("--- END SOURCE")
+            return {"extractions": [{"source_id": i, "notes": f"notes {i}"} for i in range(1, n + 1)]}
+
+        max_tokens = []
+        saved, extracted, calls, singles = self._run(researcher, task, payload, max_tokens)
+        assert len(saved) == 4 and singles == 0
+        assert all(c.count("--- END SOURCE") <= 2 for c in calls)
+        assert max_tokens and max(max_tokens) <= 8000
+
+    def test_missing_entries_fall_back_to_single_calls(self, researcher, task, test_config):
+        test_config.search.max_sources_per_task = 4
+        test_config.extraction.batch_enabled = True
+        test_config.extraction.batch_max_sources = 10
+        test_config.extraction.cache_enabled = False
+
+        saved, extracted, calls, singles = self._run(
+            researcher, task, lambda prompt: {"extractions": [{"source_id": 1, "notes": "only one"}]},
+        )
+        multi_source_calls = sum(1 for c in calls if c.count("--- END SOURCE") > 1)
+        assert multi_source_calls >= 1
+        assert singles == len(saved) - multi_source_calls  # one note per packed call
+        assert {pos for pos, _, _ in saved} == set(extracted)
+
+
+class TestFreshSourceReuse:
+    def test_stored_pages_are_not_refetched(self, researcher, task, db, test_config):
+        from src.config.types import Source
+        test_config.search.max_sources_per_task = 3
+        db.add_source(Source(
+            url="https://a1.example/", title="Stored title for a1 page", domain="a1.example",
+            full_content="stored solar storage body " * 200, quality_score=0.9,
+        ))
+
+        with patch.object(researcher, "_search_single_query", side_effect=_slow_search), \
+             patch.object(researcher, "_extract_source_content", side_effect=_slow_extract), \
+             patch("src.pipeline._stages.research_topic.print_scrape") as scraped:
+            saved, _ = researcher._stream_sources(list(QUERY_RESULTS), task.id, task_topic="t")
+
+        by_url = {src.url: src for _, src, _ in saved}
+        assert by_url["https://a1.example/"].full_content.startswith("stored")
+        assert by_url["https://a1.example/"].quality_score == 0.9
+        assert "https://a1.example/" not in [c.args[0] for c in scraped.call_args_list]
+
+    def test_freshness_window_disabled(self, researcher, task, db, test_config):
+        from src.config.types import Source
+        test_config.search.max_sources_per_task = 3
+        test_config.scraping.source_freshness_hours = 0
+        db.add_source(Source(
+            url="https://a1.example/", title="Stored", domain="a1.example",
+            full_content="stored body " * 200,
+        ))
+        with patch.object(researcher, "_search_single_query", side_effect=_slow_search), \
+             patch.object(researcher, "_extract_source_content", side_effect=_slow_extract):
+            saved, _ = researcher._stream_sources(list(QUERY_RESULTS), task.id, task_topic="t")
+        by_url = {src.url: src for _, src, _ in saved}
+        assert by_url["https://a1.example/"].full_content.startswith("https://a1.example/")
+
+
+class TestTaskCheckpoints:
+    def test_synthesis_failure_retry_skips_gathering(self, researcher, task, db, test_config):
+        test_config.search.max_sources_per_task = 3
+        test_config.search.gap_fill_queries = 0
+        synth_results = [RuntimeError("context too long"), ("notes", [], [])]
+
+        with patch.object(researcher, "_generate_queries", return_value=list(QUERY_RESULTS)) as gen, \
+             patch.object(researcher, "_search_single_query", side_effect=_slow_search) as search, \
+             patch.object(researcher, "_extract_source_content", side_effect=_slow_extract) as extract, \
+             patch.object(researcher, "_synthesize", side_effect=synth_results) as synth:
+            with pytest.raises(RuntimeError):
+                researcher.research_task(task, session_id=task.session_id)
+            assert set(db.get_task_checkpoints(task.id)) == {
+                "queries", "search_results:0", "search_results:1", "search_results:2", "sources",
+            }
+
+            content, _, _ = researcher.research_task(task, session_id=task.session_id)
+
+        assert content == "notes"
+        # The resumed draft sees the same context, rebuilt from the source store
+        first, retry = (c.args[1] for c in synth.call_args_list)
+        assert retry == first and "extracted https://a1.example/" in first
+        assert gen.call_count == 1
+        assert search.call_count == len(QUERY_RESULTS)
+        assert extract.call_count == 3
+
+        db.mark_task_complete(task.id)
+        assert db.get_task_checkpoints(task.id) == {}
+
+    def test_gap_context_is_rebuilt_on_retry(self, researcher, task, db, test_config):
+        test_config.search.max_sources_per_task = 2
+        test_config.search.gap_fill_queries = 1
+        test_config.search.gap_fill_max_results = 2
+        gap_results = {"solar gaps": [_hit("https://gap1.example/"), _hit("https://gap2.example/")]}
+
+        def search(query, task_id, session_id=None):
+            return gap_results.get(query) or _slow_search(query, task_id, session_id)
+
+        with patch.object(researcher, "_generate_queries", return_value=list(QUERY_RESULTS)), \
+             patch.object(researcher, "_identify_gaps", return_value=["solar gaps"]), \
+             patch.object(researcher, "_search_single_query", side_effect=search), \
+             patch.object(researcher, "_extract_source_content", side_effect=_slow_extract), \
+             patch.object(researcher, "_synthesize",
+                          side_effect=[RuntimeError("boom"), ("notes", [], [])]) as synth:
+            with pytest.raises(RuntimeError):
+                researcher.research_task(task, session_id=task.session_id)
+            assert db.get_task_checkpoints(task.id)["gap_context"]["sources"][0][0] == 3
+            researcher.research_task(task, session_id=task.session_id)
+
+        first, retry = (c.args[1] for c in synth.call_args_list)
+        assert retry == first
+        assert "### Source 3: A descriptive page title here\nURL: https://gap1.example/" in first
+
+    def test_checkpointed_search_results_are_not_repeated(self, researcher, task, db, test_config):
+        queries = list(QUERY_RESULTS)
+        for qi in (0, 1):
+            db.save_task_checkpoint(task.id, f"search_results:{qi}", {
+                "query": queries[qi], "results": QUERY_RESULTS[queries[qi]],
+            })
+        # A checkpoint for different query text is not reused
+        db.save_task_checkpoint(task.id, "search_results:2", {"query": "other", "results": []})
+
+        with patch.object(researcher, "_search_single_query", side_effect=_slow_search) as search, \
+             patch.object(researcher, "_extract_source_content", side_effect=_slow_extract), \
+             patch.object(db, "save_task_checkpoint", wraps=db.save_task_checkpoint) as save:
+            researcher._stream_sources(queries, task.id, task_topic="t")
+
+        assert [c.args[0] for c in search.call_args_list] == [queries[2]]
+        # Only the new query's results are written, in their own row
+        assert [c.args[1] for c in save.call_args_list] == ["search_results:2"]
+
+    def test_disabled(self, researcher, task, db, test_config):
+        test_config.research.checkpoint_steps = False
+        test_config.search.gap_fill_queries = 0
+        with patch.object(researcher, "_generate_queries", return_value=list(QUERY_RESULTS)), \
+             patch.object(researcher, "_search_single_query", side_effect=_slow_search), \
+             patch.object(researcher, "_extract_source_content", side_effect=_slow_extract), \
+             patch.object(researcher, "_synthesize", return_value=("notes", [], [])):
+            researcher.research_task(task, session_id=task.session_id)
+        assert db.get_task_checkpoints(task.id) == {}
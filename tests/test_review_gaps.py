@@ -0,0 +1,54 @@
+"""
+Tests for src.pipeline._stages.GapAnalysisAgent — the per-section gap check
+run before a section is synthesized.
+"""
+import json
+from unittest.mock import patch
+
+from src.config.types import ReportSection, ResearchTask, TaskStatus
+
+
+def _section_with_notes(db, tmp_path):
+    session = db.create_session("q")
+    section = db.add_section(ReportSection(title="Costs", description="Cost trends", position=0),
+                             session_id=session.id)
+    notes = tmp_path / "notes.md"
+    notes.write_text("Battery pack prices fell 90% since 2010.")
+    task = db.add_task(ResearchTask(topic="Prices", description="d", file_path=str(notes),
+                                    section_id=section.id), session_id=session.id)
+    db.mark_task_complete(task.id)
+    return session, section
+
+
+def _agent():
+    from src.pipeline._stages import GapAnalysisAgent
+    return GapAnalysisAgent()
+
+
+class TestSectionGapCheck:
+    def test_adds_capped_tasks_to_the_section(self, db, tmp_path, test_config):
+        session, section = _section_with_notes(db, tmp_path)
+        agent = _agent()
+        response = json.dumps({"gap_description": "no regional data", "suggested_tasks": [
+            {"topic": f"Region {i}", "description": "d"} for i in range(4)
+        ]})
+        with patch.object(agent.client, "complete", return_value=response) as complete:
+            added = agent.analyze_section_gaps("q", section, session.id, max_tasks=2)
+
+        assert added == 2
+        assert "Battery pack prices fell" in complete.call_args.kwargs["prompt"]
+        new = [t for t in db.get_tasks_for_section(section.id) if t.status == TaskStatus.PENDING.value]
+        assert [t.topic for t in new] == ["Region 0", "Region 1"]
+        assert all(t.is_gap_fill for t in new)
+
+    def test_no_gaps_or_failure_adds_nothing(self, db, tmp_path, test_config):
+        session, section = _section_with_notes(db, tmp_path)
+        agent = _agent()
+        with patch.object(agent.client, "complete", return_value='{"suggested_tasks": []}'):
+            assert agent.analyze_section_gaps("q", section, session.id, max_tasks=2) == 0
+        with patch.object(agent.client, "complete", return_value="not json"):
+            assert agent.analyze_section_gaps("q", section, session.id, max_tasks=2) == 0
+        with patch.object(agent.client, "complete") as complete:
+            assert agent.analyze_section_gaps("q", section, session.id, max_tasks=0) == 0
+        complete.assert_not_called()
+        assert len(db.get_tasks_for_section(section.id)) == 1
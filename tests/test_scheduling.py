@@ -0,0 +1,107 @@
+"""
+Tests for src.pipeline.scheduling — task ordering policies and
+policy-ordered claims.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.config.types import ResearchTask, TaskStatus
+from src.pipeline.scheduling import (
+    SchedulingPolicy,
+    claim_next_tasks,
+    get_policy,
+    register_policy,
+)
+
+
+def _task(id, section_id=None, priority=5, description="d", status=TaskStatus.PENDING, **kw):
+    return ResearchTask(
+        id=id, section_id=section_id, topic=f"T{id}", description=description,
+        file_path=f"/tmp/{id}.md", priority=priority, status=status, **kw,
+    )
+
+
+class TestPolicies:
+    def test_priority_order(self):
+        tasks = [_task(1, priority=3), _task(2, priority=8), _task(3, priority=8, depth=1)]
+        assert [t.id for t in get_policy("priority").order(tasks, tasks)] == [2, 3, 1]
+
+    def test_section_completion_prefers_nearly_done_sections(self):
+        tasks = [
+            _task(1, section_id=1), _task(2, section_id=1), _task(3, section_id=1),
+            _task(4, section_id=2), _task(5, section_id=2, status=TaskStatus.COMPLETED),
+            _task(6, section_id=None),
+        ]
+        pending = [t for t in tasks if t.status == TaskStatus.PENDING.value]
+        order = get_policy("section_completion").order(pending, tasks)
+        assert [t.id for t in order] == [4, 1, 2, 3, 6]
+
+    def test_round_robin_interleaves_sections(self):
+        tasks = [
+            _task(1, section_id=1), _task(2, section_id=1),
+            _task(3, section_id=2), _task(4, section_id=2),
+            _task(5, section_id=3, status=TaskStatus.IN_PROGRESS), _task(6, section_id=3),
+        ]
+        pending = [t for t in tasks if t.status == TaskStatus.PENDING.value]
+        order = get_policy("round_robin").order(pending, tasks)
+        assert [t.id for t in order] == [1, 3, 2, 4, 6]
+
+    def test_shortest_job_first_without_history_uses_cost_proxy(self, db):
+        tasks = [_task(1, description="x" * 3000), _task(2, description="short")]
+        assert [t.id for t in get_policy("shortest_job_first", db=db).order(tasks, tasks)] == [2, 1]
+
+    def test_shortest_job_first_learns_from_timings(self, db):
+        session = db.create_session("q")
+        done = db.add_tasks_bulk([
+            _task(None, description="d"), _task(None, description="d", is_gap_fill=True),
+        ], session_id=session.id)
+        start = datetime.now(timezone.utc)
+        for task, seconds in zip(done, (10, 1000)):
+            db.update_task(task.id, status=TaskStatus.COMPLETED.value, started_at=start,
+                           completed_at=start + timedelta(seconds=seconds))
+
+        # Gap-fill tasks have been 100x slower, which outweighs description length
+        tasks = [_task(1, description="d", is_gap_fill=True), _task(2, description="x" * 2000)]
+        order = get_policy("shortest_job_first", db=db).order(tasks, tasks)
+        assert [t.id for t in order] == [2, 1]
+
+    def test_unknown_policy(self):
+        with pytest.raises(KeyError):
+            get_policy("nope")
+
+    def test_register_custom_policy(self):
+        @register_policy
+        class Newest(SchedulingPolicy):
+            name = "newest_first"
+
+            def order(self, pending, all_tasks):
+                return sorted(pending, key=lambda t: -t.id)
+
+        tasks = [_task(1), _task(2)]
+        assert [t.id for t in get_policy("newest_first").order(tasks, tasks)] == [2, 1]
+
+
+class TestClaimNextTasks:
+    def test_claims_in_policy_order_and_records_start(self, db):
+        session = db.create_session("q")
+        tasks = db.add_tasks_bulk([
+            _task(None, section_id=None, description="x" * 4000),
+            _task(None, section_id=None, description="tiny"),
+        ], session_id=session.id)
+
+        claimed = claim_next_tasks(db, get_policy("shortest_job_first", db=db), 1, session.id)
+
+        assert [t.id for t in claimed] == [tasks[1].id]
+        assert claimed[0].started_at is not None
+        assert db.get_task_by_id(tasks[0].id).status == TaskStatus.PENDING
+
+    def test_candidates_from_another_session_are_not_claimed(self, db):
+        mine, other = db.create_session("q"), db.create_session("other")
+        [own] = db.add_tasks_bulk([_task(None)], session_id=mine.id)
+        [foreign] = db.add_tasks_bulk([_task(None)], session_id=other.id)
+
+        claimed = db.get_next_tasks(2, session_id=mine.id, candidate_ids=[foreign.id, own.id])
+
+        assert [t.id for t in claimed] == [own.id]
+        assert db.get_task_by_id(foreign.id).status == TaskStatus.PENDING
@@ -0,0 +1,209 @@
+"""
+Tests for src.infra._database.corpus_index — the FTS5 index over sources,
+extracted notes and synthesized sections, and DatabaseManager.search_corpus.
+"""
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import text
+
+from src.config.types import ReportSection, ResearchTask, Source
+from src.infra._database import DatabaseManager
+from src.infra._database.blobs import BlobStore
+from src.infra._database.corpus_index import match_expression
+
+
+def _task(db, session_id=None):
+    session_id = session_id or db.create_session("Q").id
+    return db.add_task(ResearchTask(topic="T", description="D", file_path="/tmp/t.md"),
+                       session_id=session_id)
+
+
+def _source(db, task, url, title, **fields):
+    [source_id] = db.add_sources_bulk(task.id, [
+        (Source(url=url, title=title, domain="example.com", **fields), 0)
+    ])
+    return source_id
+
+
+def _integrity_check(db):
+    with db.engine.begin() as conn:
+        for table in ("sources_fts", "notes_fts", "sections_fts"):
+            conn.execute(text(f"INSERT INTO {table} ({table}, rank) VALUES ('integrity-check', 1)"))
+
+
+def _urls(results):
+    return [r["url"] for r in results if r["kind"] == "source"]
+
+
+class TestMatchExpression:
+    def test_words_become_quoted_terms(self):
+        assert match_expression("solid-state batteries") == '"solid" "state" "batteries"'
+
+    def test_query_syntax_is_neutralised(self):
+        assert match_expression('title: NEAR("x') == '"title" "NEAR" "x"'
+        assert match_expression(" ?! ") is None
+
+
+class TestSearchCorpus:
+    def test_finds_title_page_text_and_notes(self, db):
+        task = _task(db)
+        _source(db, task, "https://a.example", "Sodium batteries")
+        _source(db, task, "https://b.example", "Grid report", full_content="pumped hydro storage " * 50)
+        source_id = _source(db, task, "https://c.example", "Misc")
+        db.update_source_extraction(task.id, source_id, "flywheel findings")
+
+        assert _urls(db.search_corpus("sodium")) == ["https://a.example"]
+        assert _urls(db.search_corpus("pumped hydro")) == ["https://b.example"]
+        [hit] = db.search_corpus("flywheel")
+        assert hit["url"] == "https://c.example" and hit["snippet"] == "[flywheel] findings"
+        assert db.search_corpus("sodium hydro") == []
+        _integrity_check(db)
+
+    def test_title_matches_rank_first(self, db):
+        task = _task(db)
+        _source(db, task, "https://body.example", "Other", full_content="perovskite cells and more " * 5)
+        _source(db, task, "https://title.example", "Perovskite cells")
+        assert _urls(db.search_corpus("perovskite")) == ["https://title.example", "https://body.example"]
+
+    def test_index_follows_updates(self, db):
+        task = _task(db)
+        source_id = _source(db, task, "https://a.example", "A", full_content="old words")
+        db.update_source_extraction(task.id, source_id, "first notes")
+        db.add_source(Source(url="https://a.example", title="A", domain="example.com", full_content="new words"))
+        db.update_source_extraction(task.id, source_id, "second notes")
+
+        assert db.search_corpus("old") == [] and db.search_corpus("first") == []
+        assert _urls(db.search_corpus("new second")) == ["https://a.example"]
+        _integrity_check(db)
+
+    def test_sections_are_searched(self, db):
+        session = db.create_session("Q")
+        section = db.add_section(ReportSection(title="Outlook", description="d", position=0),
+                                 session_id=session.id)
+        db.mark_section_synthesized(section.id, "Geothermal capacity will double.", word_count=5)
+        [hit] = db.search_corpus("geothermal")
+        assert (hit["kind"], hit["id"], hit["session_id"]) == ("section", section.id, session.id)
+        _integrity_check(db)
+
+    def test_best_of_each_kind_survives_the_merge(self, db):
+        task = _task(db)
+        for i in range(5):
+            _source(db, task, f"https://{i}.example", "Hydrogen " * (i + 1), full_content="hydrogen " * 20)
+        section = db.add_section(ReportSection(title="Outlook", description="d", position=0),
+                                 session_id=task.session_id)
+        db.mark_section_synthesized(section.id, "Hydrogen is one option among several.")
+
+        results = db.search_corpus("hydrogen", limit=2)
+        assert {r["kind"] for r in results} == {"source", "section"}
+        assert all(r["score"] == 1.0 for r in results)
+
+    def test_words_may_span_page_text_and_notes(self, db):
+        task = _task(db)
+        source_id = _source(db, task, "https://a.example", "Misc", full_content="compressed air storage")
+        db.update_source_extraction(task.id, source_id, "caverns in Texas")
+        [hit] = db.search_corpus("compressed caverns")
+        assert hit["url"] == "https://a.example"
+        assert db.search_corpus("compressed hydrogen") == []
+
+    def test_notes_writes_do_not_read_page_text(self, db):
+        task = _task(db)
+        page = "long page text " * 100
+        source_id = _source(db, task, "https://a.example", "A", full_content=page)
+        decoded = []
+        decode = BlobStore.decode
+
+        def _decode(codec, data):
+            decoded.append(decode(codec, data))
+            return decoded[-1]
+
+        with patch.object(BlobStore, "decode", side_effect=_decode):
+            db.update_source_extraction(task.id, source_id, "first notes")
+            db.update_source_extraction(task.id, source_id, "second notes")
+        assert page not in decoded
+        assert _urls(db.search_corpus("second")) == ["https://a.example"]
+        assert db.search_corpus("first") == []
+        _integrity_check(db)
+
+    def test_session_scope(self, db):
+        first, second = _task(db), _task(db)
+        _source(db, first, "https://a.example", "Tidal power")
+        _source(db, second, "https://b.example", "Tidal energy")
+        assert _urls(db.search_corpus("tidal", session_id=first.session_id)) == ["https://a.example"]
+        assert len(db.search_corpus("tidal")) == 2
+        assert len(db.search_corpus("tidal", limit=1)) == 1
+
+    def test_blob_migration_keeps_the_index(self, db):
+        db.blob_store = False
+        task = _task(db)
+        source_id = _source(db, task, "https://a.example", "A", full_content="inline page")
+        db.update_source_extraction(task.id, source_id, "inline notes")
+        db.blob_store = True
+        db.migrate_content_to_blobs()
+        assert _urls(db.search_corpus("inline page notes")) == ["https://a.example"]
+        _integrity_check(db)
+
+
+def test_existing_databases_are_indexed(test_config):
+    db = DatabaseManager()
+    task = _task(db)
+    _source(db, task, "https://a.example", "Wind turbines")
+    with db.engine.begin() as conn:
+        for name in ("sources_fts", "sections_fts"):
+            conn.execute(text(f"DROP TABLE {name}"))
+        conn.execute(text("DROP VIEW corpus_sources"))
+    db.close()
+
+    db = DatabaseManager()
+    assert _urls(db.search_corpus("wind")) == ["https://a.example"]
+    db.close()
+
+
+def test_writers_without_blob_text_can_write(test_config):
+    db = DatabaseManager()
+    task = _task(db)
+    source_id = _source(db, task, "https://a.example", "Wind turbines", full_content="offshore farms " * 50)
+    db.close()
+
+    # A plain connection, e.g. the sqlite3 shell, has no blob_text()
+    conn = sqlite3.connect(test_config.database.path)
+    conn.execute("UPDATE sources SET title = 'Tidal turbines' WHERE id = ?", (source_id,))
+    conn.execute("UPDATE task_source_association SET extracted_content = 'lagoon notes'")
+    conn.execute("INSERT INTO sources (url, title, domain) VALUES ('https://b.example', 'Tidal barrage', 'b')")
+    conn.commit()
+    conn.close()
+
+    db = DatabaseManager()
+    db.rebuild_corpus_index()
+    assert set(_urls(db.search_corpus("tidal"))) == {"https://a.example", "https://b.example"}
+    assert _urls(db.search_corpus("lagoon")) == ["https://a.example"]
+    assert db.search_corpus("wind") == []
+    _integrity_check(db)
+    db.close()
+
+
+def test_trigger_maintained_index_is_replaced(test_config):
+    db = DatabaseManager()
+    task = _task(db)
+    _source(db, task, "https://a.example", "Wind turbines")
+    with db.engine.begin() as conn:
+        conn.execute(text("DROP TABLE sources_fts"))
+        conn.execute(text(
+            "CREATE VIRTUAL TABLE sources_fts USING fts5(title, notes, content)"
+        ))
+        conn.execute(text(
+            "CREATE TRIGGER trg_corpus_source_insert AFTER INSERT ON sources "
+            "BEGIN SELECT blob_text(NULL, NULL); END"
+        ))
+    db.close()
+
+    db = DatabaseManager()
+    with db.engine.begin() as conn:
+        triggers = {row[0] for row in conn.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'trg_corpus_source%'"
+        ))}
+    assert triggers == set()
+    assert _urls(db.search_corpus("wind")) == ["https://a.example"]
+    _integrity_check(db)
+    db.close()
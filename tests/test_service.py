@@ -0,0 +1,102 @@
+"""
+Tests for src.pipeline.service — concurrent runs, per-run config
+isolation and the run registry.
+"""
+import itertools
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.config.settings import get_config
+from src.infra.executors import shutdown_executors
+from src.pipeline.service import get_service
+
+
+@pytest.fixture
+def blocked_runs():
+    """Patch ResearchOrchestrator.run to record its config and wait for release."""
+    release = threading.Event()
+    seen = {}
+    started = threading.Semaphore(0)
+    session_ids = itertools.count(1)
+
+    def _run(self, query, resume=False, refined_brief=None, refinement_qa=None):
+        self.session_id = next(session_ids)
+        seen[query] = get_config().research.max_total_tasks
+        started.release()
+        release.wait(10)
+        return {"query": query}
+
+    with patch("src.pipeline.orchestrator.ResearchOrchestrator.run", autospec=True, side_effect=_run):
+        yield seen, started, release
+    release.set()
+    shutdown_executors()
+
+
+class TestConcurrentRuns:
+    def test_runs_execute_concurrently_with_their_own_config(self, test_config, blocked_runs):
+        seen, started, release = blocked_runs
+        service = get_service()
+
+        a = service.start_run("A", overrides={"research.max_total_tasks": 3})
+        b = service.start_run("B", overrides={"research.max_total_tasks": 7})
+        assert started.acquire(timeout=5) and started.acquire(timeout=5)
+
+        assert a["status"] == b["status"] == "started"
+        assert seen == {"A": 3, "B": 7}
+        assert {r["status"] for r in service.list_runs()} == {"running"}
+        assert get_config().research.max_total_tasks == 10  # global config untouched
+
+        release.set()
+        shutdown_executors()  # waits for both runs
+        assert not service.is_running()
+
+    def test_runs_beyond_the_pool_are_queued(self, test_config, blocked_runs):
+        seen, started, release = blocked_runs
+        test_config.executors.run_workers = 1
+        service = get_service()
+
+        first = service.start_run("first")
+        second = service.start_run("second")
+        assert started.acquire(timeout=5)
+
+        assert first["status"] == "started"
+        assert second["status"] == "queued"
+        assert [r["status"] for r in service.list_runs()] == ["running", "queued"]
+
+        assert service.cancel_run(run_id=second["run_id"])["status"] == "cancelled"
+        assert [r["query"] for r in service.list_runs()] == ["first"]
+        release.set()
+        shutdown_executors()
+        assert "second" not in seen
+
+    def test_cancel_targets_the_named_session(self, test_config, blocked_runs):
+        seen, started, release = blocked_runs
+        service = get_service()
+        service.start_run("A")
+        service.start_run("B")
+        assert started.acquire(timeout=5) and started.acquire(timeout=5)
+
+        runs = {r["query"]: r for r in service.list_runs()}
+        assert service.cancel_run(session_id=runs["A"]["session_id"])["status"] == "cancelling"
+
+        handles = {h.query: h for h in service._runs.values()}
+        assert handles["A"].orchestrator._cancel_requested
+        assert not handles["B"].orchestrator._cancel_requested
+
+    def test_queued_run_starts_when_a_slot_frees(self, test_config, blocked_runs):
+        seen, started, release = blocked_runs
+        test_config.executors.run_workers = 1
+        service = get_service()
+        service.start_run("first", user="alice")
+        second = service.start_run("second", user="bob")
+        assert started.acquire(timeout=5)
+        assert second["status"] == "queued"
+        assert second["position"] == 1 and second["eta_seconds"] >= 0
+
+        release.set()
+        assert started.acquire(timeout=10)  # admitted once "first" finished
+        assert "second" in seen
+        shutdown_executors()
+        assert service.get_queue_entry(second["run_id"])["status"] == "finished"
@@ -0,0 +1,89 @@
+"""
+Tests for the trigger-maintained session_stats counters behind
+DatabaseManager.get_statistics.
+"""
+from sqlalchemy import text
+
+from src.config.types import GlossaryTerm, ResearchTask, Source, TaskStatus
+from src.infra._database import DatabaseManager
+
+
+def _recounted(db, session_id):
+    """Statistics recomputed from the base tables, as get_statistics used to."""
+    return {
+        "total_tasks": db.get_task_count(session_id=session_id),
+        "pending_tasks": db.get_task_count(TaskStatus.PENDING, session_id=session_id),
+        "completed_tasks": db.get_task_count(TaskStatus.COMPLETED, session_id=session_id),
+        "failed_tasks": db.get_task_count(TaskStatus.FAILED, session_id=session_id),
+        "total_sources": db.get_source_count(session_id=session_id),
+        "total_words": db.get_total_word_count(session_id=session_id),
+        "glossary_terms": len(db.get_glossary_terms_for_session(session_id)),
+    }
+
+
+def _run_session(db, query="q"):
+    session = db.create_session(query)
+    tasks = db.add_tasks_bulk([
+        ResearchTask(topic=f"t{i}", description="d", file_path=f"/tmp/{query}-{i}.md")
+        for i in range(4)
+    ], session_id=session.id)
+    db.get_next_tasks(count=3, session_id=session.id, owner="w")
+    db.mark_task_complete(tasks[0].id, word_count=120)
+    db.mark_task_complete(tasks[1].id, word_count=80)
+    db.mark_task_failed(tasks[2].id, "boom")
+    # One source shared by two tasks, one source on its own
+    db.add_source(Source(url=f"https://{query}.com/a", title="a", domain="a"), task_id=tasks[0].id)
+    db.add_source(Source(url=f"https://{query}.com/a", title="a", domain="a"), task_id=tasks[1].id)
+    db.add_source(Source(url=f"https://{query}.com/b", title="b", domain="b"), task_id=tasks[1].id)
+    db.add_glossary_term(GlossaryTerm(term=f"{query}-term", definition="d"), session_id=session.id)
+    return session, tasks
+
+
+class TestSessionStats:
+    def test_counters_match_the_base_tables(self, db):
+        session, _ = _run_session(db)
+        stats = db.get_statistics(session_id=session.id)
+        assert stats == _recounted(db, session.id)
+        assert stats["completed_tasks"] == 2
+        assert stats["total_words"] == 200
+        assert stats["total_sources"] == 2
+
+    def test_requeued_task_moves_back_to_pending(self, db):
+        session, tasks = _run_session(db)
+        db.update_task(tasks[2].id, status=TaskStatus.PENDING.value)
+        stats = db.get_statistics(session_id=session.id)
+        assert stats["failed_tasks"] == 0
+        assert stats == _recounted(db, session.id)
+
+    def test_sessions_are_counted_separately(self, db):
+        first, _ = _run_session(db, "one")
+        second, _ = _run_session(db, "two")
+        empty = db.create_session("three")
+
+        by_session = db.get_statistics_by_session([first.id, second.id, empty.id])
+        assert by_session[first.id] == _recounted(db, first.id)
+        assert by_session[second.id] == _recounted(db, second.id)
+        assert set(by_session[empty.id].values()) == {0}
+
+    def test_database_wide_statistics(self, db):
+        _run_session(db, "one")
+        _run_session(db, "two")
+        stats = db.get_statistics()
+        assert stats["total_tasks"] == 8
+        assert stats["completed_tasks"] == 4
+        assert stats["total_words"] == 400
+        assert stats["total_sources"] == 4
+        assert stats["glossary_terms"] == 2
+
+    def test_existing_database_is_backfilled(self, test_config):
+        db = DatabaseManager()
+        session, _ = _run_session(db)
+        expected = db.get_statistics(session_id=session.id)
+        with db.engine.begin() as conn:
+            conn.execute(text("DROP TRIGGER trg_session_stats_task_insert"))
+            conn.execute(text("DELETE FROM session_stats"))
+        db.close()
+
+        db = DatabaseManager()
+        assert db.get_statistics(session_id=session.id) == expected
+        db.close()
@@ -117,6 +117,12 @@ class TestAPIRoutes:
         data = resp.json()
         assert isinstance(data, list)
 
+    def test_api_search(self, client, populated_db):
+        resp = client.get(f"/api/search?q=alignment&session={populated_db.session.id}")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [r["url"] for r in data] == ["https://arxiv.org/paper123"]
+
     def test_api_glossary(self, client, populated_db):
         resp = client.get("/api/glossary")
         assert resp.status_code == 200
@@ -134,6 +140,26 @@ class TestAPIRoutes:
         resp = client.get("/api/costs")
         assert resp.status_code == 200
 
+    def test_api_research_start_reports_queue_position(self, client):
+        queued = {"status": "queued", "run_id": "abc123", "position": 3, "eta_seconds": 900}
+        with patch("src.adapters.web.app.start_research_background", return_value=queued) as mock:
+            resp = client.post(
+                "/api/research/start",
+                json={"query": "Test", "user": "ana", "priority": 2},
+            )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["status"] == "queued"
+        assert data["position"] == 3 and data["eta_seconds"] == 900
+        assert mock.call_args.kwargs["user"] == "ana"
+        assert mock.call_args.kwargs["priority"] == 2
+
+    def test_api_research_queue(self, client):
+        resp = client.get("/api/research/queue")
+        assert resp.status_code == 200
+        assert resp.json()["queued"] == []
+        assert client.get("/api/research/queue/missing").status_code == 404
+
 
 # =========================================================================
 # HTMX fragment routes
@@ -0,0 +1,149 @@
+"""
+Tests for src.pipeline.worker — leased task claims shared between
+processes, lease reclaim and the research-worker loop.
+"""
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from src.config.types import ResearchTask, TaskStatus
+from src.pipeline.worker import ResearchWorker
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+_CLAIM_SCRIPT = """
+import json, sys
+from src.infra._database.manager import DatabaseManager
+db = DatabaseManager(sys.argv[1])
+claimed = []
+while True:
+    tasks = db.get_next_tasks(2, session_id=int(sys.argv[2]), owner=sys.argv[3], lease_seconds=60)
+    if not tasks:
+        break
+    claimed.extend(t.id for t in tasks)
+print(json.dumps(claimed))
+"""
+
+
+def _add_tasks(db, session_id, n, tmp_path):
+    return db.add_tasks_bulk([
+        ResearchTask(topic=f"Topic {i}", description="d", file_path=str(tmp_path / f"t{i}.md"))
+        for i in range(n)
+    ], session_id=session_id)
+
+
+def _mock_research_task(task, overall_query="", other_sections=None, session_id=None):
+    return f"# Notes: {task.topic}\n\nFinding. [1]\n", [], []
+
+
+class TestLeasedClaims:
+    def test_processes_never_claim_the_same_task(self, test_config, tmp_path):
+        from src.infra._database import get_database
+
+        test_config.database.wal_mode = True
+        db = get_database()
+        session = db.create_session("q")
+        tasks = _add_tasks(db, session.id, 40, tmp_path)
+
+        procs = [
+            subprocess.Popen(
+                [sys.executable, "-c", _CLAIM_SCRIPT, db.db_path, str(session.id), f"w{i}"],
+                cwd=PROJECT_ROOT, stdout=subprocess.PIPE, text=True,
+            )
+            for i in range(4)
+        ]
+        claimed = []
+        for proc in procs:
+            out, _ = proc.communicate(timeout=60)
+            assert proc.returncode == 0
+            claimed.extend(json.loads(out.strip().splitlines()[-1]))
+
+        assert sorted(claimed) == sorted(t.id for t in tasks)
+        assert db.get_task_count(TaskStatus.IN_PROGRESS, session_id=session.id) == 40
+
+    def test_expired_lease_is_reclaimed(self, db, tmp_path):
+        session = db.create_session("q")
+        _add_tasks(db, session.id, 2, tmp_path)
+        expired = db.get_next_tasks(1, session_id=session.id, owner="dead", lease_seconds=-1)
+        db.get_next_tasks(1, session_id=session.id, owner="alive", lease_seconds=60)
+
+        assert db.reclaim_expired_tasks(session.id) == 1
+        task = db.get_task_by_id(expired[0].id)
+        assert task.status == TaskStatus.PENDING
+        assert task.retry_count == 1
+        assert db.get_task_count(TaskStatus.IN_PROGRESS, session_id=session.id) == 1
+
+    def test_reclaim_fails_task_after_max_retries(self, db, tmp_path):
+        session = db.create_session("q")
+        _add_tasks(db, session.id, 1, tmp_path)
+        task = db.get_next_tasks(1, session_id=session.id, owner="w1", lease_seconds=-1)[0]
+        db.update_task(task.id, retry_count=1)
+
+        assert db.reclaim_expired_tasks(session.id, max_retries=2) == 1
+        reclaimed = db.get_task_by_id(task.id)
+        assert reclaimed.status == TaskStatus.FAILED
+        assert "Lease expired" in reclaimed.error_message
+
+    def test_unleased_claims_only_reclaimed_on_request(self, db, tmp_path):
+        session = db.create_session("q")
+        _add_tasks(db, session.id, 1, tmp_path)
+        db.get_next_tasks(1, session_id=session.id)
+
+        assert db.reclaim_expired_tasks(session.id) == 0
+        assert db.reclaim_expired_tasks(session.id, include_unleased=True) == 1
+
+    def test_heartbeat_renewal_prevents_reclaim(self, db, tmp_path):
+        session = db.create_session("q")
+        _add_tasks(db, session.id, 1, tmp_path)
+        db.get_next_tasks(1, session_id=session.id, owner="w1", lease_seconds=-1)
+
+        assert db.renew_task_leases("w1", lease_seconds=60) == 1
+        assert db.reclaim_expired_tasks(session.id) == 0
+
+
+class TestResearchWorker:
+    def test_worker_completes_session_tasks(self, db, test_config, tmp_path):
+        test_config.workers.poll_seconds = 0.05
+        session = db.create_session("q")
+        _add_tasks(db, session.id, 3, tmp_path)
+
+        with patch("src.pipeline._stages.ResearcherAgent.research_task",
+                   side_effect=_mock_research_task):
+            worker = ResearchWorker(session_id=session.id, concurrency=2)
+            assert worker.run() == 3
+
+        tasks = db.get_all_tasks(session_id=session.id)
+        assert all(t.status == TaskStatus.COMPLETED for t in tasks)
+
+    def test_failed_task_is_recorded_and_released(self, db, test_config, tmp_path):
+        test_config.workers.poll_seconds = 0.05
+        session = db.create_session("q")
+        _add_tasks(db, session.id, 1, tmp_path)
+
+        with patch("src.pipeline._stages.ResearcherAgent.research_task",
+                   side_effect=RuntimeError("boom")):
+            worker = ResearchWorker(session_id=session.id)
+            worker.run()
+
+        assert worker.failed == 1
+        task = db.get_all_tasks(session_id=session.id)[0]
+        assert task.status == TaskStatus.FAILED
+        assert db.reclaim_expired_tasks(session.id) == 0
+
+    def test_follows_worker_mode_sessions_only(self, db, test_config, tmp_path):
+        test_config.workers.poll_seconds = 0.05
+        workers = db.create_session("q", executor="workers")
+        db.update_session(workers.id, refined_brief="refined q")
+        _add_tasks(db, workers.id, 1, tmp_path)
+        local = db.create_session("local q", executor="local")
+        _add_tasks(db, local.id, 1, tmp_path)
+
+        with patch("src.pipeline._stages.ResearcherAgent.research_task",
+                   side_effect=_mock_research_task) as research:
+            assert ResearchWorker().run() == 1
+
+        assert research.call_args.kwargs["overall_query"] == "refined q"
+        assert db.get_all_tasks(session_id=workers.id)[0].status == TaskStatus.COMPLETED
+        assert db.get_all_tasks(session_id=local.id)[0].status == TaskStatus.PENDING